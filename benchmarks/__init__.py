@@ -0,0 +1,11 @@
+"""
+Performance benchmarks for the service layer.
+
+Importing the package puts ``src`` on ``sys.path`` so the scripts can be run from
+the repository root with ``python -m benchmarks.<name>``.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
@@ -0,0 +1,113 @@
+"""
+Job ad listing throughput: threadpool + sync Session vs asyncio + AsyncSession.
+
+Loads a page of the job ad listing from a thread pool sized like Starlette's
+default (40 threads) with a sync Session, the way sync ``def`` endpoints run, and
+from concurrent asyncio tasks with an AsyncSession, the way the async endpoints
+run. The sides call ``job_ad_service.get_all`` and ``get_all_async``, which run
+the same statement with the same eager loading and create the same
+JobAdResponse items, so the difference is the concurrency model alone. Both paths use engines configured by
+the same DB_POOL_* settings. Reports throughput and latency percentiles per
+concurrency level.
+
+Usage:
+    python -m benchmarks.async_read_throughput
+"""
+
+import asyncio
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.schemas.common import FilterParams, JobAdSearchParams
+from app.services import job_ad_service
+from app.sql_app.database import AsyncSessionLocal, SessionLocal, async_engine
+from benchmarks.utils import print_table
+
+CONCURRENCY_LEVELS = (10, 50, 200, 500)
+REQUESTS_PER_LEVEL = 2000
+THREADPOOL_SIZE = 40
+
+FILTER_PARAMS = FilterParams(offset=0, limit=50)
+SEARCH_PARAMS = JobAdSearchParams()
+
+
+def _sync_request() -> float:
+    start = time.perf_counter()
+    with SessionLocal() as db:
+        job_ad_service.get_all(
+            filter_params=FILTER_PARAMS, search_params=SEARCH_PARAMS, db=db
+        )
+    return (time.perf_counter() - start) * 1000
+
+
+async def _async_request() -> float:
+    start = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        await job_ad_service.get_all_async(
+            filter_params=FILTER_PARAMS, search_params=SEARCH_PARAMS, db=db
+        )
+    return (time.perf_counter() - start) * 1000
+
+
+def _run_threadpool(concurrency: int) -> tuple[float, list[float]]:
+    # Requests beyond the thread count queue in the executor, like they queue on
+    # Starlette's capacity limiter; the latency includes that wait.
+    def _timed_request(submitted_at: float) -> float:
+        _sync_request()
+        return (time.perf_counter() - submitted_at) * 1000
+
+    start = time.perf_counter()
+    timings: list[float] = []
+    with ThreadPoolExecutor(max_workers=min(concurrency, THREADPOOL_SIZE)) as pool:
+        for batch_start in range(0, REQUESTS_PER_LEVEL, concurrency):
+            batch = min(concurrency, REQUESTS_PER_LEVEL - batch_start)
+            submitted_at = time.perf_counter()
+            futures = [pool.submit(_timed_request, submitted_at) for _ in range(batch)]
+            timings.extend(future.result() for future in futures)
+    return time.perf_counter() - start, timings
+
+
+async def _run_asyncio(concurrency: int) -> tuple[float, list[float]]:
+    start = time.perf_counter()
+    timings: list[float] = []
+    for batch_start in range(0, REQUESTS_PER_LEVEL, concurrency):
+        batch = min(concurrency, REQUESTS_PER_LEVEL - batch_start)
+        timings.extend(await asyncio.gather(*(_async_request() for _ in range(batch))))
+    return time.perf_counter() - start, timings
+
+
+def _summarize(mode: str, concurrency: int, elapsed: float, timings: list[float]):
+    timings.sort()
+    return {
+        "mode": mode,
+        "concurrency": concurrency,
+        "req_per_s": round(len(timings) / elapsed, 1),
+        "median_ms": round(statistics.median(timings), 2),
+        "p95_ms": round(timings[int(len(timings) * 0.95) - 1], 2),
+        "p99_ms": round(timings[int(len(timings) * 0.99) - 1], 2),
+    }
+
+
+async def _run_async_levels() -> list[dict]:
+    rows = []
+    for concurrency in CONCURRENCY_LEVELS:
+        elapsed, timings = await _run_asyncio(concurrency)
+        rows.append(_summarize("asyncio", concurrency, elapsed, timings))
+    await async_engine.dispose()
+    return rows
+
+
+def main() -> None:
+    _sync_request()
+    rows = []
+    for concurrency in CONCURRENCY_LEVELS:
+        elapsed, timings = _run_threadpool(concurrency)
+        rows.append(_summarize("threadpool", concurrency, elapsed, timings))
+    rows.extend(asyncio.run(_run_async_levels()))
+
+    print_table(f"Job ad listing page, {REQUESTS_PER_LEVEL} requests", rows)
+
+
+if __name__ == "__main__":
+    main()
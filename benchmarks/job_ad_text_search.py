@@ -0,0 +1,126 @@
+"""
+Job ad search: leading-wildcard ILIKE on the title vs full-text search.
+
+Inserts a large synthetic set of active job ads (inside a transaction that is
+rolled back at the end), then times a page of results for terms of different
+selectivity, once through the ``title`` filter (``ILIKE '%term%'``, a sequential
+scan) and once through the ``query`` filter (``websearch_to_tsquery`` against the
+GIN-indexed search vector, which also covers the description).
+
+Usage:
+    python -m benchmarks.job_ad_text_search
+"""
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.schemas.common import JobAdSearchParams
+from app.services.job_ad_service import _search_job_ads
+from app.sql_app.database import engine
+from app.sql_app.job_ad.job_ad import JobAd
+from app.sql_app.job_ad.job_ad_status import JobAdStatus
+from benchmarks.utils import measure, print_table
+
+SYNTHETIC_ROWS = 200_000
+PAGE_SIZE = 10
+# A word from most titles and two words that only appear in a few descriptions.
+TERMS = ("developer", "kubernetes", "cobol")
+
+_COMMON_WORDS = (
+    "developer engineer senior junior backend frontend team remote office "
+    "product platform data cloud mobile web"
+).split()
+_RARE_WORDS = "kubernetes terraform haskell erlang cobol".split()
+
+_INSERT_SYNTHETIC_JOB_ADS = text(
+    """
+    INSERT INTO job_ad (
+        company_id, category_id, location_id, title, description,
+        min_salary, max_salary, skill_level, status
+    )
+    SELECT
+        template.company_id,
+        template.category_id,
+        template.location_id,
+        (SELECT string_agg(word, ' ') FROM (
+            SELECT (:common)[1 + floor(random() * :common_count)::int] AS word
+            FROM generate_series(1, 4 + n % 2)
+        ) AS title_words),
+        (SELECT string_agg(word, ' ') FROM (
+            SELECT CASE WHEN random() < 0.002
+                THEN (:rare)[1 + floor(random() * :rare_count)::int]
+                ELSE (:common)[1 + floor(random() * :common_count)::int]
+            END AS word
+            FROM generate_series(1, 40 + n % 2)
+        ) AS description_words),
+        template.min_salary,
+        template.max_salary,
+        template.skill_level,
+        template.status
+    FROM job_ad AS template, generate_series(1, :rows) AS n
+    WHERE template.id = :template_id
+    """
+)
+
+
+def _load_page(db: Session, search_params: JobAdSearchParams) -> list[JobAd]:
+    return _search_job_ads(search_params=search_params, db=db).limit(PAGE_SIZE).all()
+
+
+def main() -> None:
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        db = Session(bind=connection)
+        try:
+            template = (
+                db.query(JobAd).filter(JobAd.status == JobAdStatus.ACTIVE).first()
+            )
+            if template is None:
+                raise SystemExit("The benchmark needs at least one active job ad")
+
+            connection.execute(
+                _INSERT_SYNTHETIC_JOB_ADS,
+                {
+                    "rows": SYNTHETIC_ROWS,
+                    "template_id": template.id,
+                    "common": _COMMON_WORDS,
+                    "common_count": len(_COMMON_WORDS),
+                    "rare": _RARE_WORDS,
+                    "rare_count": len(_RARE_WORDS),
+                },
+            )
+            connection.execute(text("ANALYZE job_ad"))
+
+            rows = []
+            for term in TERMS:
+                for mode, search_params in (
+                    ("ILIKE title", JobAdSearchParams(title=term)),
+                    ("full-text", JobAdSearchParams(query=term)),
+                    (
+                        "full-text by relevance",
+                        JobAdSearchParams(query=term, order_by="relevance"),
+                    ),
+                ):
+                    rows.append(
+                        {
+                            "term": term,
+                            "mode": mode,
+                            "results": len(_load_page(db, search_params)),
+                            **measure(
+                                lambda: _load_page(db, search_params),
+                                repeat=10,
+                            ),
+                        }
+                    )
+        finally:
+            db.close()
+            transaction.rollback()
+
+    print_table(
+        f"Job ad search over {SYNTHETIC_ROWS} synthetic job ads, page of {PAGE_SIZE}",
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Job application listing: lazy relationship loading vs JOB_APPLICATION_RESPONSE_OPTIONS.
+
+Builds JobApplicationResponse objects for pages of 10, 50 and 100 active job
+applications, once with plain lazy loading (the previous behaviour) and once with
+the eager loading profile, and reports latency and statement counts.
+
+Usage:
+    python -m benchmarks.job_application_listing
+"""
+
+from app.schemas.job_application import JobApplicationResponse
+from app.services.common import JOB_APPLICATION_RESPONSE_OPTIONS
+from app.sql_app.database import SessionLocal, engine
+from app.sql_app.job_application.job_application import JobApplication
+from app.sql_app.job_application.job_application_status import JobStatus
+from benchmarks.utils import count_queries, measure, print_table
+
+PAGE_SIZES = (10, 50, 100)
+
+
+def _load_page(page_size: int, eager: bool) -> list[JobApplicationResponse]:
+    with SessionLocal() as db:
+        query = db.query(JobApplication).filter(
+            JobApplication.status == JobStatus.ACTIVE
+        )
+        if eager:
+            query = query.options(*JOB_APPLICATION_RESPONSE_OPTIONS)
+        job_applications = (
+            query.order_by(JobApplication.created_at.desc()).limit(page_size).all()
+        )
+        return [JobApplicationResponse.create(ja) for ja in job_applications]
+
+
+def main() -> None:
+    rows = []
+    for page_size in PAGE_SIZES:
+        for eager in (False, True):
+            with count_queries(engine) as statements:
+                _load_page(page_size=page_size, eager=eager)
+            rows.append(
+                {
+                    "page_size": page_size,
+                    "loading": "eager" if eager else "lazy",
+                    "queries": len(statements),
+                    **measure(lambda: _load_page(page_size=page_size, eager=eager)),
+                }
+            )
+
+    print_table("JobApplicationResponse page build", rows)
+
+
+if __name__ == "__main__":
+    main()
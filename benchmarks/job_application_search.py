@@ -0,0 +1,150 @@
+"""
+Job application search: query plans and latency of the company-facing search.
+
+Inserts a large synthetic set of active job applications (inside a transaction
+that is rolled back at the end), then runs a page of the search for a few typical
+filter combinations. For each it reports the latency and prints the
+``EXPLAIN (ANALYZE, BUFFERS)`` plan, which shows the status/city/created_at
+composite indexes serving the ordered page and the GIN index on ``skill_ids``
+serving the skills filter without joining the skill tables.
+
+Usage:
+    python -m benchmarks.job_application_search
+"""
+
+from sqlalchemy import bindparam, select, text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.orm import Query, Session
+
+from app.schemas.common import SearchJobApplication
+from app.services.job_application_service import _search_job_applications
+from app.sql_app.city.city import City
+from app.sql_app.database import engine
+from app.sql_app.job_application.job_application import JobApplication
+from app.sql_app.job_application.job_application_status import JobStatus
+from app.sql_app.skill.skill import Skill
+from benchmarks.utils import measure, print_table
+
+SYNTHETIC_ROWS = 200_000
+PAGE_SIZE = 10
+
+_INSERT_SYNTHETIC_JOB_APPLICATIONS = text(
+    """
+    INSERT INTO job_application (
+        category_id, name, min_salary, max_salary, status, description,
+        professional_id, is_main, city_id, skill_ids, created_at, updated_at
+    )
+    SELECT
+        template.category_id,
+        'Synthetic application ' || n,
+        salary.min_salary,
+        salary.min_salary + 1000,
+        template.status,
+        template.description,
+        template.professional_id,
+        false,
+        (:city_ids)[1 + n % :city_count],
+        ARRAY(
+            SELECT (:skill_ids)[1 + floor(random() * :skill_count)::int]
+            FROM generate_series(1, 3 + n % 6)
+        ),
+        now() - n * interval '1 minute',
+        now() - n * interval '1 minute'
+    FROM job_application AS template,
+        generate_series(1, :rows) AS n,
+        LATERAL (SELECT 500 + (n * 7919) % 5000 AS min_salary) AS salary
+    WHERE template.id = :template_id
+    """
+).bindparams(
+    bindparam("city_ids", type_=ARRAY(UUID(as_uuid=True))),
+    bindparam("skill_ids", type_=ARRAY(UUID(as_uuid=True))),
+)
+
+
+def _load_page(db: Session, search_params: SearchJobApplication) -> list:
+    return _page_query(db, search_params).all()
+
+
+def _page_query(db: Session, search_params: SearchJobApplication) -> Query:
+    return _search_job_applications(search_params=search_params, db=db).limit(PAGE_SIZE)
+
+
+def _explain(db: Session, query: Query) -> str:
+    compiled = query.statement.compile(
+        dialect=engine.dialect, compile_kwargs={"render_postcompile": True}
+    )
+    plan = db.connection().exec_driver_sql(
+        f"EXPLAIN (ANALYZE, BUFFERS) {compiled}", compiled.params
+    )
+    return "\n".join(row[0] for row in plan)
+
+
+def main() -> None:
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        db = Session(bind=connection)
+        try:
+            template = (
+                db.query(JobApplication)
+                .filter(JobApplication.status == JobStatus.ACTIVE)
+                .first()
+            )
+            city_ids = db.scalars(select(City.id)).all()
+            skills = db.execute(select(Skill.id, Skill.name)).all()
+            if template is None or not city_ids or len(skills) < 3:
+                raise SystemExit(
+                    "The benchmark needs an active job application, a city and "
+                    "three skills"
+                )
+
+            connection.execute(
+                _INSERT_SYNTHETIC_JOB_APPLICATIONS,
+                {
+                    "rows": SYNTHETIC_ROWS,
+                    "template_id": template.id,
+                    "city_ids": city_ids,
+                    "city_count": len(city_ids),
+                    "skill_ids": [skill.id for skill in skills],
+                    "skill_count": len(skills),
+                },
+            )
+            connection.execute(text("ANALYZE job_application"))
+
+            skill_names = [skill.name for skill in skills[:3]]
+            searches = {
+                "newest first": SearchJobApplication(),
+                "oldest first": SearchJobApplication(order="asc"),
+                "one city": SearchJobApplication(city_id=city_ids[0]),
+                "2 of 3 skills": SearchJobApplication(
+                    skills=skill_names, skills_threshold=1
+                ),
+                "salary 2000-2500": SearchJobApplication(
+                    min_salary=2000, max_salary=2500
+                ),
+            }
+
+            rows, plans = [], {}
+            for name, search_params in searches.items():
+                rows.append(
+                    {
+                        "search": name,
+                        "results": len(_load_page(db, search_params)),
+                        **measure(lambda: _load_page(db, search_params), repeat=10),
+                    }
+                )
+                plans[name] = _explain(db, _page_query(db, search_params))
+        finally:
+            db.close()
+            transaction.rollback()
+
+    print_table(
+        f"Job application search over {SYNTHETIC_ROWS} synthetic job applications, "
+        f"page of {PAGE_SIZE}",
+        rows,
+    )
+    for name, plan in plans.items():
+        print(f"\nQuery plan: {name}\n{plan}")
+
+
+if __name__ == "__main__":
+    main()
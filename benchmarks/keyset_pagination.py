@@ -0,0 +1,127 @@
+"""
+Job ad listing: OFFSET pagination vs keyset (cursor) pagination.
+
+Inserts a large synthetic set of active job ads (inside a transaction that is
+rolled back at the end), then times fetching pages deep into the listing. With
+OFFSET the database reads and discards every row before the page, so latency
+grows with the page number; with a cursor it seeks straight to the page through
+the ``(status, created_at, id)`` index and stays flat.
+
+Usage:
+    python -m benchmarks.keyset_pagination
+"""
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.schemas.common import FilterParams, JobAdSearchParams
+from app.services.job_ad_service import _keyset, _search_job_ads
+from app.sql_app.database import engine
+from app.sql_app.job_ad.job_ad import JobAd
+from app.sql_app.job_ad.job_ad_status import JobAdStatus
+from benchmarks.utils import measure, print_table
+
+SYNTHETIC_ROWS = 200_000
+PAGE_SIZE = 10
+PAGES = (1, 100, 10_000)
+
+_INSERT_SYNTHETIC_JOB_ADS = text(
+    """
+    INSERT INTO job_ad (
+        company_id, category_id, location_id, title, description,
+        min_salary, max_salary, skill_level, status, created_at
+    )
+    SELECT
+        template.company_id,
+        template.category_id,
+        template.location_id,
+        template.title || ' ' || n,
+        template.description,
+        template.min_salary,
+        template.max_salary,
+        template.skill_level,
+        template.status,
+        now() - n * interval '1 minute'
+    FROM job_ad AS template, generate_series(1, :rows) AS n
+    WHERE template.id = :template_id
+    """
+)
+
+
+def _load_page(
+    db: Session,
+    search_params: JobAdSearchParams,
+    filter_params: FilterParams,
+) -> list[JobAd]:
+    keyset = _keyset(search_params=search_params, filter_params=filter_params)
+    query = _search_job_ads(search_params=search_params, db=db)
+    return keyset.apply(query=query, filter_params=filter_params).all()
+
+
+def _cursor_before(
+    db: Session,
+    search_params: JobAdSearchParams,
+    page: int,
+) -> str:
+    """Returns the cursor a client holds after walking to the given page."""
+    if page == 1:
+        return ""
+    offset_params = FilterParams(offset=(page - 1) * PAGE_SIZE - 1, limit=1)
+    (previous,) = _load_page(db, search_params, offset_params)
+    keyset = _keyset(search_params=search_params, filter_params=offset_params)
+    return keyset._encode(keyset.key(previous))
+
+
+def main() -> None:
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        db = Session(bind=connection)
+        try:
+            template = (
+                db.query(JobAd).filter(JobAd.status == JobAdStatus.ACTIVE).first()
+            )
+            if template is None:
+                raise SystemExit("The benchmark needs at least one active job ad")
+
+            connection.execute(
+                _INSERT_SYNTHETIC_JOB_ADS,
+                {"rows": SYNTHETIC_ROWS, "template_id": template.id},
+            )
+            connection.execute(text("ANALYZE job_ad"))
+
+            search_params = JobAdSearchParams()
+            rows = []
+            for page in PAGES:
+                offset_params = FilterParams(
+                    offset=(page - 1) * PAGE_SIZE, limit=PAGE_SIZE
+                )
+                cursor_params = FilterParams(
+                    limit=PAGE_SIZE,
+                    cursor=_cursor_before(db, search_params, page),
+                )
+                for mode, filter_params in (
+                    ("offset", offset_params),
+                    ("cursor", cursor_params),
+                ):
+                    rows.append(
+                        {
+                            "page": page,
+                            "mode": mode,
+                            **measure(
+                                lambda: _load_page(db, search_params, filter_params),
+                                repeat=10,
+                            ),
+                        }
+                    )
+        finally:
+            db.close()
+            transaction.rollback()
+
+    print_table(
+        f"Job ad listing over {SYNTHETIC_ROWS} synthetic job ads, page of {PAGE_SIZE}",
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Recommendations: top-k skill matching over the in-memory match index.
+
+Builds a SkillMatchIndex of synthetic job ads (no database needed) and times a
+top-10 lookup for a job application at different index sizes. Each synthetic
+entry has 3-12 skills drawn from a vocabulary skewed towards popular skills, a
+salary range, and one of a few dozen cities and categories.
+
+Usage:
+    python -m benchmarks.recommendations
+"""
+
+import random
+import time
+import uuid
+
+from app.utils.skill_match import MatchEntry, SkillMatchIndex, Vocabulary
+from benchmarks.utils import measure, print_table
+
+SIZES = (10_000, 100_000, 300_000)
+SKILLS = 5_000
+CITIES = 30
+CATEGORIES = 25
+LIMIT = 10
+
+_random = random.Random(42)
+_skill_ids = [uuid.uuid4() for _ in range(SKILLS)]
+_city_ids = [uuid.uuid4() for _ in range(CITIES)]
+_category_ids = [uuid.uuid4() for _ in range(CATEGORIES)]
+
+
+def _synthetic_entry() -> MatchEntry:
+    min_salary = _random.randrange(800, 6000, 100)
+    return MatchEntry(
+        id=uuid.uuid4(),
+        # Pareto-distributed ranks make a few skills far more common than others.
+        skill_ids=[
+            _skill_ids[min(int(_random.paretovariate(1.2)) - 1, SKILLS - 1)]
+            if _random.random() < 0.5
+            else _random.choice(_skill_ids)
+            for _ in range(_random.randint(3, 12))
+        ],
+        min_salary=min_salary,
+        max_salary=min_salary + _random.randrange(0, 3000, 100),
+        location_id=_random.choice(_city_ids),
+        category_id=_random.choice(_category_ids),
+    )
+
+
+def main() -> None:
+    rows = []
+    for size in SIZES:
+        index = SkillMatchIndex(Vocabulary(), Vocabulary(), Vocabulary())
+        start = time.perf_counter()
+        index.upsert(_synthetic_entry() for _ in range(size))
+        build_ms = (time.perf_counter() - start) * 1000
+
+        query = index.encode(_synthetic_entry())
+        for similarity in ("jaccard", "overlap"):
+            rows.append(
+                {
+                    "entries": size,
+                    "similarity": similarity,
+                    "build_ms": round(build_ms),
+                    **measure(
+                        lambda: index.top_k(
+                            query=query, limit=LIMIT, similarity=similarity
+                        )
+                    ),
+                }
+            )
+
+    print_table(f"Top-{LIMIT} recommendations, {SKILLS} distinct skills", rows)
+
+
+if __name__ == "__main__":
+    main()
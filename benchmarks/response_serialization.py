@@ -0,0 +1,90 @@
+"""
+Response serialization: model_dump + json.dumps vs pydantic's JSON serializer.
+
+Renders a list of job application responses the way process_request used to,
+dumping every model to Python objects and encoding them again with json.dumps
+through JSONResponse, and the way ModelJSONResponse does, serializing the models
+straight to bytes. Both must produce the same bytes; the benchmark checks that
+before timing them. It does not need a database.
+
+Usage:
+    python -m benchmarks.response_serialization
+"""
+
+import uuid
+from datetime import datetime, timedelta
+
+from fastapi.responses import JSONResponse
+
+from app.schemas.job_application import JobApplicationResponse
+from app.schemas.skill import SkillResponse
+from app.utils.processors import ModelJSONResponse, _format_response
+from benchmarks.utils import measure, print_table
+
+LIST_SIZES = (1, 10, 100)
+SKILLS_PER_APPLICATION = 5
+
+
+def _job_applications(count: int) -> list[JobApplicationResponse]:
+    category_id = uuid.uuid4()
+    skills = [
+        SkillResponse(id=uuid.uuid4(), name=f"Skill {n}", category_id=category_id)
+        for n in range(SKILLS_PER_APPLICATION)
+    ]
+    created_at = datetime(2024, 10, 1, 12, 30, 15, 123456)
+    return [
+        JobApplicationResponse(
+            application_id=uuid.uuid4(),
+            professional_id=uuid.uuid4(),
+            name=f"Job application {n}",
+            description="Backend developer with FastAPI and PostgreSQL — 5 years",
+            min_salary=1500.0 + n,
+            max_salary=2500.5 + n,
+            created_at=created_at - timedelta(minutes=n),
+            first_name="Jane",
+            last_name="Müller",
+            city="Sofia",
+            email=f"jane{n}@example.com",
+            has_photo=n % 2 == 0,
+            status="active",
+            skills=skills,
+            category_id=category_id,
+            category_title="Software Development",
+        )
+        for n in range(count)
+    ]
+
+
+def _render_twice(data: list[JobApplicationResponse]) -> bytes:
+    return JSONResponse(content=_format_response(data)).body
+
+
+def _render_once(data: list[JobApplicationResponse]) -> bytes:
+    return ModelJSONResponse(content=data).body
+
+
+def main() -> None:
+    rows = []
+    for size in LIST_SIZES:
+        data = _job_applications(size)
+        if _render_twice(data) != _render_once(data):
+            raise SystemExit(f"The renderers disagree for {size} job applications")
+
+        for name, render in (
+            ("model_dump + json.dumps", _render_twice),
+            ("ModelJSONResponse", _render_once),
+        ):
+            rows.append(
+                {
+                    "items": size,
+                    "renderer": name,
+                    "bytes": len(render(data)),
+                    **measure(lambda: render(data), repeat=200, warmup=20),
+                }
+            )
+
+    print_table("Rendering JobApplicationResponse lists", rows)
+
+
+if __name__ == "__main__":
+    main()
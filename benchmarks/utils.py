@@ -0,0 +1,88 @@
+"""
+Helpers shared by the benchmark scripts.
+
+The benchmarks run against the database configured through DATABASE_URL
+(see src/.env_template) and expect it to be populated with representative data.
+Run them from the repository root, e.g. ``python -m benchmarks.<name>``.
+"""
+
+import statistics
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+def measure(fn: Callable[[], object], repeat: int = 20, warmup: int = 3) -> dict:
+    """
+    Time a callable and return latency statistics in milliseconds.
+
+    Args:
+        fn (Callable[[], object]): The callable to benchmark.
+        repeat (int): Number of measured runs.
+        warmup (int): Number of unmeasured runs executed first.
+
+    Returns:
+        dict: The median, p95 and mean latency in milliseconds.
+    """
+    for _ in range(warmup):
+        fn()
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    timings.sort()
+    return {
+        "median_ms": round(statistics.median(timings), 2),
+        "p95_ms": round(timings[int(len(timings) * 0.95) - 1], 2),
+        "mean_ms": round(statistics.mean(timings), 2),
+    }
+
+
+@contextmanager
+def count_queries(engine: Engine) -> Iterator[list[str]]:
+    """
+    Collect every statement executed on the engine while the context is open.
+
+    Args:
+        engine (Engine): The engine to listen on.
+
+    Yields:
+        list[str]: The executed statements, filled in as they run.
+    """
+    statements: list[str] = []
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _before_cursor_execute)
+
+
+def print_table(title: str, rows: list[dict]) -> None:
+    """
+    Print benchmark results as an aligned text table.
+
+    Args:
+        title (str): Heading printed above the table.
+        rows (list[dict]): Result rows sharing the same keys.
+    """
+    print(f"\n{title}")
+    if not rows:
+        return
+    headers = list(rows[0].keys())
+    widths = [
+        max(len(str(header)), *(len(str(row[header])) for row in rows))
+        for header in headers
+    ]
+    print("  ".join(str(h).ljust(w) for h, w in zip(headers, widths)))
+    for row in rows:
+        print("  ".join(str(row[h]).ljust(w) for h, w in zip(headers, widths)))
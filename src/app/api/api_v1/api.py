@@ -7,7 +7,9 @@ from app.api.api_v1.endpoints import (
     job_ad_router,
     job_application_router,
     match_router,
+    monitoring_router,
     professional_router,
+    recommendation_router,
     skill_router,
 )
 
@@ -44,3 +46,13 @@ api_router.include_router(
 api_router.include_router(
     match_router.router, prefix="/match-requests", tags=["Match Requests"]
 )
+
+
+api_router.include_router(
+    recommendation_router.router, prefix="/recommendations", tags=["Recommendations"]
+)
+
+
+api_router.include_router(
+    monitoring_router.router, prefix="/monitoring", tags=["Monitoring"]
+)
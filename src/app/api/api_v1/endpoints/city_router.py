@@ -5,14 +5,14 @@ from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
 from app.services import city_service
-from app.sql_app.database import get_db
+from app.sql_app.database import get_read_db
 from app.utils.processors import process_request
 
 router = APIRouter()
 
 
 @router.get("/", description="Retrieve all cities.")
-def get_all_cities(db: Session = Depends(get_db)) -> JSONResponse:
+def get_all_cities(db: Session = Depends(get_read_db)) -> JSONResponse:
     def _get_all_cities():
         return city_service.get_all(db)
 
@@ -28,7 +28,7 @@ def get_all_cities(db: Session = Depends(get_db)) -> JSONResponse:
     "/default",
     description="Retrieve the default city.",
 )
-def get_default_city(db: Session = Depends(get_db)) -> JSONResponse:
+def get_default_city(db: Session = Depends(get_read_db)) -> JSONResponse:
     def _get_default_city():
         return city_service.get_default(db)
 
@@ -41,7 +41,7 @@ def get_default_city(db: Session = Depends(get_db)) -> JSONResponse:
 
 
 @router.get("/{city_id}", description="Retrieve a city by its identifier.")
-def get_city_by_id(city_id: UUID, db: Session = Depends(get_db)) -> JSONResponse:
+def get_city_by_id(city_id: UUID, db: Session = Depends(get_read_db)) -> JSONResponse:
     def _get_city_by_id():
         return city_service.get_by_id(city_id=city_id, db=db)
 
@@ -54,7 +54,9 @@ def get_city_by_id(city_id: UUID, db: Session = Depends(get_db)) -> JSONResponse
 
 
 @router.get("/by-name/{city_name}", description="Retrieve a city by its name.")
-def get_city_by_name(city_name: str, db: Session = Depends(get_db)) -> JSONResponse:
+def get_city_by_name(
+    city_name: str, db: Session = Depends(get_read_db)
+) -> JSONResponse:
     def _get_city_by_name():
         return city_service.get_by_name(city_name=city_name, db=db)
 
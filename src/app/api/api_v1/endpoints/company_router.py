@@ -1,13 +1,13 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, UploadFile, status
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi import APIRouter, Depends, File, Header, UploadFile, status
+from fastapi.responses import JSONResponse, Response
 from sqlalchemy.orm import Session
 
-from app.schemas.common import FilterParams
+from app.schemas.common import BatchLookup, FilterParams
 from app.schemas.company import CompanyCreate, CompanyUpdate
 from app.services import company_service
-from app.sql_app.database import get_db
+from app.sql_app.database import get_db, get_read_db
 from app.utils.processors import process_db_transaction, process_request
 
 router = APIRouter()
@@ -18,7 +18,7 @@ router = APIRouter()
     description="Retrieve all companies.",
 )
 def get_all_companies(
-    filter_params: FilterParams = Depends(), db: Session = Depends(get_db)
+    filter_params: FilterParams = Depends(), db: Session = Depends(get_read_db)
 ) -> JSONResponse:
     def _get_all_companies():
         return company_service.get_all(filter_params=filter_params, db=db)
@@ -37,7 +37,7 @@ def get_all_companies(
 )
 def get_company_by_username(
     username: str,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> JSONResponse:
     def _get_company_by_username():
         return company_service.get_by_username(username=username, db=db)
@@ -56,7 +56,7 @@ def get_company_by_username(
 )
 def get_company_by_email(
     email: str,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> JSONResponse:
     def _get_company_by_email():
         return company_service.get_by_email(email=email, db=db)
@@ -75,7 +75,7 @@ def get_company_by_email(
 )
 def get_company_by_phone(
     phone_number: str,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> JSONResponse:
     def _get_company_by_phone():
         return company_service.get_by_phone_number(phone_number=phone_number, db=db)
@@ -88,11 +88,31 @@ def get_company_by_phone(
     )
 
 
+@router.post(
+    "/batch",
+    description="Retrieve up to 100 companies by their unique identifiers.",
+)
+def get_companies_by_ids(
+    batch: BatchLookup, db: Session = Depends(get_read_db)
+) -> JSONResponse:
+    def _get_companies_by_ids():
+        return company_service.get_many(company_ids=batch.ids, db=db)
+
+    return process_request(
+        get_entities_fn=_get_companies_by_ids,
+        status_code=status.HTTP_200_OK,
+        not_found_err_msg="Could not fetch companies",
+        db=db,
+    )
+
+
 @router.get(
     "/{company_id}",
     description="Retrieve a company by its unique identifier.",
 )
-def get_company_by_id(company_id: UUID, db: Session = Depends(get_db)) -> JSONResponse:
+def get_company_by_id(
+    company_id: UUID, db: Session = Depends(get_read_db)
+) -> JSONResponse:
     def _get_company_by_id():
         return company_service.get_by_id(company_id=company_id, db=db)
 
@@ -177,10 +197,17 @@ def upload_logo(
 )
 def download_logo(
     company_id: UUID,
-    db: Session = Depends(get_db),
-) -> StreamingResponse:
+    if_none_match: str | None = Header(default=None),
+    range_header: str | None = Header(default=None, alias="Range"),
+    db: Session = Depends(get_read_db),
+) -> Response:
     def _download_logo():
-        return company_service.download_logo(company_id=company_id, db=db)
+        return company_service.download_logo(
+            company_id=company_id,
+            db=db,
+            if_none_match=if_none_match,
+            range_header=range_header,
+        )
 
     return process_db_transaction(
         transaction_func=_download_logo,
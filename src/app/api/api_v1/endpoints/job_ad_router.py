@@ -2,13 +2,14 @@ from uuid import UUID
 
 from fastapi import APIRouter, Body, Depends, status
 from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.schemas.common import FilterParams, JobAdSearchParams
+from app.schemas.common import BatchLookup, FilterParams, JobAdSearchParams
 from app.schemas.job_ad import JobAdCreate, JobAdUpdate
 from app.services import job_ad_service
-from app.sql_app.database import get_db
-from app.utils.processors import process_request
+from app.sql_app.database import get_async_read_db, get_db, get_read_db
+from app.utils.processors import process_async_request, process_request
 
 router = APIRouter()
 
@@ -17,17 +18,17 @@ router = APIRouter()
     "/all",
     description="Retrieve all job advertisements.",
 )
-def get_all_job_ads(
+async def get_all_job_ads(
     filter_params: FilterParams = Depends(),
     search_params: JobAdSearchParams = Body(),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ) -> JSONResponse:
-    def _get_all_job_ads():
-        return job_ad_service.get_all(
+    async def _get_all_job_ads():
+        return await job_ad_service.get_all_async(
             filter_params=filter_params, search_params=search_params, db=db
         )
 
-    return process_request(
+    return await process_async_request(
         get_entities_fn=_get_all_job_ads,
         status_code=status.HTTP_200_OK,
         not_found_err_msg="No job ads found",
@@ -35,15 +36,35 @@ def get_all_job_ads(
     )
 
 
+@router.post(
+    "/batch",
+    description="Retrieve up to 100 job advertisements by their unique identifiers.",
+)
+def get_job_ads_by_ids(
+    batch: BatchLookup, db: Session = Depends(get_read_db)
+) -> JSONResponse:
+    def _get_job_ads_by_ids():
+        return job_ad_service.get_many(job_ad_ids=batch.ids, db=db)
+
+    return process_request(
+        get_entities_fn=_get_job_ads_by_ids,
+        status_code=status.HTTP_200_OK,
+        not_found_err_msg="Could not fetch job ads",
+        db=db,
+    )
+
+
 @router.get(
     "/{job_ad_id}",
     description="Retrieve a job advertisement by its unique identifier.",
 )
-def get_job_ad_by_id(job_ad_id: UUID, db: Session = Depends(get_db)) -> JSONResponse:
-    def _get_job_ad_by_id():
-        return job_ad_service.get_by_id(job_ad_id=job_ad_id, db=db)
+async def get_job_ad_by_id(
+    job_ad_id: UUID, db: AsyncSession = Depends(get_async_read_db)
+) -> JSONResponse:
+    async def _get_job_ad_by_id():
+        return await job_ad_service.get_by_id_async(job_ad_id=job_ad_id, db=db)
 
-    return process_request(
+    return await process_async_request(
         get_entities_fn=_get_job_ad_by_id,
         status_code=status.HTTP_200_OK,
         not_found_err_msg=f"Job ad with id {job_ad_id} not found",
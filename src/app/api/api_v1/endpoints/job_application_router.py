@@ -5,10 +5,15 @@ from fastapi import status as status_code
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
-from app.schemas.common import FilterParams, SearchJobApplication, SearchParams
+from app.schemas.common import (
+    BatchLookup,
+    FilterParams,
+    SearchJobApplication,
+    SearchParams,
+)
 from app.schemas.job_application import JobApplicationCreate, JobApplicationUpdate
 from app.services import job_application_service
-from app.sql_app.database import get_db
+from app.sql_app.database import get_db, get_read_db
 from app.utils.processors import process_request
 
 router = APIRouter()
@@ -19,9 +24,9 @@ router = APIRouter()
     description="Retrieve all Job Applications.",
 )
 def get_all(
-    search_params: SearchJobApplication = Depends(),
+    search_params: SearchJobApplication = Body(),
     filter_params: FilterParams = Depends(),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> JSONResponse:
     def _get_all():
         return job_application_service.get_all(
@@ -38,13 +43,32 @@ def get_all(
     )
 
 
+@router.post(
+    "/batch",
+    description="Retrieve up to 100 Job Applications by their unique identifiers.",
+)
+def get_by_ids(
+    batch: BatchLookup,
+    db: Session = Depends(get_read_db),
+) -> JSONResponse:
+    def _get_by_ids():
+        return job_application_service.get_many(job_application_ids=batch.ids, db=db)
+
+    return process_request(
+        get_entities_fn=_get_by_ids,
+        status_code=status_code.HTTP_200_OK,
+        not_found_err_msg="Could not fetch Job Applications",
+        db=db,
+    )
+
+
 @router.get(
     "/{job_application_id}",
     description="Retrieve a Job Application by its unique identifier.",
 )
 def get_by_id(
     job_application_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> JSONResponse:
     def _get_by_id():
         return job_application_service.get_by_id(
@@ -2,13 +2,14 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, status
 from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.schemas.common import FilterParams
 from app.schemas.match import MatchRequestCreate, MatchRequestUpdate
 from app.services import match_service
-from app.sql_app.database import get_db
-from app.utils.processors import process_request
+from app.sql_app.database import get_async_read_db, get_db, get_read_db
+from app.utils.processors import process_async_request, process_request
 
 router = APIRouter()
 
@@ -20,7 +21,7 @@ router = APIRouter()
 def get_match_request(
     job_ad_id: UUID,
     job_application_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> JSONResponse:
     def _get_match_request():
         return match_service.get_by_id(
@@ -106,19 +107,19 @@ def accept_match_request(
     "/job-applications/{job_application_id}",
     description="Retrieve match requests for a job ad.",
 )
-def get_match_requests_for_job_application(
+async def get_match_requests_for_job_application(
     job_application_id: UUID,
     filter_params: FilterParams = Depends(),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ) -> JSONResponse:
-    def _get_match_requests_for_job_application():
-        return match_service.get_match_requests_for_job_application(
+    async def _get_match_requests_for_job_application():
+        return await match_service.get_match_requests_for_job_application_async(
             job_application_id=job_application_id,
             filter_params=filter_params,
             db=db,
         )
 
-    return process_request(
+    return await process_async_request(
         get_entities_fn=_get_match_requests_for_job_application,
         status_code=status.HTTP_200_OK,
         not_found_err_msg="Could not fetch match requests for job ad",
@@ -130,16 +131,16 @@ def get_match_requests_for_job_application(
     "/professionals/{professional_id}",
     description="Retrieve all match requests for a professional.",
 )
-def get_match_requests_for_professional(
+async def get_match_requests_for_professional(
     professional_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ) -> JSONResponse:
-    def _get_match_requests_for_professional():
-        return match_service.get_match_requests_for_professional(
+    async def _get_match_requests_for_professional():
+        return await match_service.get_match_requests_for_professional_async(
             professional_id=professional_id, db=db
         )
 
-    return process_request(
+    return await process_async_request(
         get_entities_fn=_get_match_requests_for_professional,
         status_code=status.HTTP_200_OK,
         not_found_err_msg="Could not fetch match requests for professional",
@@ -151,17 +152,17 @@ def get_match_requests_for_professional(
     "/companies/{company_id}",
     description="Retrieve all match requests for a company.",
 )
-def get_match_requests_for_company(
+async def get_match_requests_for_company(
     company_id: UUID,
     filter_params: FilterParams = Depends(),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ) -> JSONResponse:
-    def _get_match_requests_for_company():
-        return match_service.get_match_requests_for_company(
+    async def _get_match_requests_for_company():
+        return await match_service.get_match_requests_for_company_async(
             company_id=company_id, filter_params=filter_params, db=db
         )
 
-    return process_request(
+    return await process_async_request(
         get_entities_fn=_get_match_requests_for_company,
         status_code=status.HTTP_200_OK,
         not_found_err_msg="Could not fetch match requests for company",
@@ -173,14 +174,16 @@ def get_match_requests_for_company(
     "/job-ads/{job_ad_id}/received-matches",
     description="Retrieve all match requests for a job ad.",
 )
-def get_job_ad_received_matches(
+async def get_job_ad_received_matches(
     job_ad_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ) -> JSONResponse:
-    def _get_job_ad_received_matches():
-        return match_service.get_job_ad_received_matches(job_ad_id=job_ad_id, db=db)
+    async def _get_job_ad_received_matches():
+        return await match_service.get_job_ad_received_matches_async(
+            job_ad_id=job_ad_id, db=db
+        )
 
-    return process_request(
+    return await process_async_request(
         get_entities_fn=_get_job_ad_received_matches,
         status_code=status.HTTP_200_OK,
         not_found_err_msg="Could not fetch received match requests for job ad",
@@ -192,14 +195,16 @@ def get_job_ad_received_matches(
     "/job-ads/{job_ad_id}/sent-matches",
     description="Retrieve all match requests sent by a job ad.",
 )
-def get_job_ad_sent_matches(
+async def get_job_ad_sent_matches(
     job_ad_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ) -> JSONResponse:
-    def _get_job_ad_sent_matches():
-        return match_service.get_job_ad_sent_matches(job_ad_id=job_ad_id, db=db)
+    async def _get_job_ad_sent_matches():
+        return await match_service.get_job_ad_sent_matches_async(
+            job_ad_id=job_ad_id, db=db
+        )
 
-    return process_request(
+    return await process_async_request(
         get_entities_fn=_get_job_ad_sent_matches,
         status_code=status.HTTP_200_OK,
         not_found_err_msg="Could not fetch sent match requests for job ad",
@@ -0,0 +1,34 @@
+from fastapi import APIRouter
+
+from app.core.startup_metrics import startup_metrics
+from app.schemas.pool import PoolMetricsResponse
+from app.schemas.reference_data import ReferenceCacheStats
+from app.schemas.startup import StartupMetricsResponse
+from app.services.reference_data import REFERENCE_TABLES
+from app.sql_app.pool_metrics import POOL_METRICS
+
+router = APIRouter()
+
+
+@router.get(
+    "/db-pool",
+    description="Report the state of this worker's database connection pools.",
+)
+def get_db_pool_metrics() -> list[PoolMetricsResponse]:
+    return [metrics.snapshot() for metrics in POOL_METRICS]
+
+
+@router.get(
+    "/startup",
+    description="Report this worker's start-up time and time to first request.",
+)
+def get_startup_metrics() -> StartupMetricsResponse:
+    return startup_metrics.snapshot()
+
+
+@router.get(
+    "/reference-cache",
+    description="Report the hits and misses of this worker's reference data cache.",
+)
+def get_reference_cache_stats() -> list[ReferenceCacheStats]:
+    return [table.stats() for table in REFERENCE_TABLES]
@@ -1,10 +1,11 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, Query, UploadFile, status
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi import APIRouter, Depends, File, Header, Query, UploadFile, status
+from fastapi.responses import JSONResponse, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.schemas.common import FilterParams, SearchParams
+from app.schemas.common import BatchLookup, FilterParams, SearchParams
 from app.schemas.job_application import JobSearchStatus
 from app.schemas.professional import (
     PrivateMatches,
@@ -12,8 +13,12 @@ from app.schemas.professional import (
     ProfessionalUpdate,
 )
 from app.services import professional_service
-from app.sql_app.database import get_db
-from app.utils.processors import process_db_transaction, process_request
+from app.sql_app.database import get_async_read_db, get_db, get_read_db
+from app.utils.processors import (
+    process_async_request,
+    process_db_transaction,
+    process_request,
+)
 
 router = APIRouter()
 
@@ -25,7 +30,7 @@ router = APIRouter()
 def get_all_professionals(
     filter_params: FilterParams = Depends(),
     search_params: SearchParams = Depends(),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> JSONResponse:
     def _get_all_professionals():
         return professional_service.get_all(
@@ -40,17 +45,37 @@ def get_all_professionals(
     )
 
 
+@router.post(
+    "/batch",
+    description="Retrieve up to 100 professionals by their unique identifiers.",
+)
+def get_professionals_by_ids(
+    batch: BatchLookup, db: Session = Depends(get_read_db)
+) -> JSONResponse:
+    def _get_professionals_by_ids():
+        return professional_service.get_many(professional_ids=batch.ids, db=db)
+
+    return process_request(
+        get_entities_fn=_get_professionals_by_ids,
+        status_code=status.HTTP_200_OK,
+        not_found_err_msg="Could not fetch professionals",
+        db=db,
+    )
+
+
 @router.get(
     "/{professional_id}",
     description="Retrieve a professional by its unique identifier.",
 )
-def get_professional_by_id(
-    professional_id: UUID, db: Session = Depends(get_db)
+async def get_professional_by_id(
+    professional_id: UUID, db: AsyncSession = Depends(get_async_read_db)
 ) -> JSONResponse:
-    def _get_professional_by_id():
-        return professional_service.get_by_id(professional_id=professional_id, db=db)
+    async def _get_professional_by_id():
+        return await professional_service.get_by_id_async(
+            professional_id=professional_id, db=db
+        )
 
-    return process_request(
+    return await process_async_request(
         get_entities_fn=_get_professional_by_id,
         status_code=status.HTTP_200_OK,
         not_found_err_msg=f"Professional with id {professional_id} not found",
@@ -64,7 +89,7 @@ def get_professional_by_id(
 )
 def get_professional_by_sub(
     sub: str,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> JSONResponse:
     def _get_professional_by_sub():
         return professional_service.get_by_sub(sub=sub, db=db)
@@ -83,7 +108,7 @@ def get_professional_by_sub(
 )
 def get_professional_by_username(
     username: str,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> JSONResponse:
     def _get_professional_by_username():
         return professional_service.get_by_username(username=username, db=db)
@@ -143,12 +168,16 @@ def update_professional(
 )
 def get_professional_photo(
     professional_id: UUID,
-    db: Session = Depends(get_db),
-) -> StreamingResponse:
+    if_none_match: str | None = Header(default=None),
+    range_header: str | None = Header(default=None, alias="Range"),
+    db: Session = Depends(get_read_db),
+) -> Response:
     def _get_professional_photo():
         return professional_service.download_photo(
             professional_id=professional_id,
             db=db,
+            if_none_match=if_none_match,
+            range_header=range_header,
         )
 
     return process_db_transaction(
@@ -185,12 +214,16 @@ def upload_professional_photo(
 )
 def get_professional_cv(
     professional_id: UUID,
-    db: Session = Depends(get_db),
-) -> StreamingResponse:
+    if_none_match: str | None = Header(default=None),
+    range_header: str | None = Header(default=None, alias="Range"),
+    db: Session = Depends(get_read_db),
+) -> Response:
     def _get_professional_cv():
         return professional_service.download_cv(
             professional_id=professional_id,
             db=db,
+            if_none_match=if_none_match,
+            range_header=range_header,
         )
 
     return process_db_transaction(
@@ -270,7 +303,7 @@ def get_professional_applications(
     professional_id: UUID,
     application_status: JobSearchStatus = Query(),
     filter_params: FilterParams = Depends(),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> JSONResponse:
     def _get_professional_applications():
         return professional_service.get_applications(
@@ -294,7 +327,7 @@ def get_professional_applications(
 )
 def get_professional_skills(
     professional_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> JSONResponse:
     def _get_professional_skills():
         return professional_service.get_skills(professional_id=professional_id, db=db)
@@ -313,7 +346,7 @@ def get_professional_skills(
 )
 def get_professional_match_requests(
     professional_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> JSONResponse:
     def _get_professional_match_requests():
         return professional_service.get_match_requests(
@@ -0,0 +1,64 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session
+
+from app.services import recommendation_service
+from app.sql_app.database import get_read_db
+from app.utils.processors import process_request
+from app.utils.skill_match import Similarity
+
+router = APIRouter()
+
+
+@router.get(
+    "/job-applications/{job_application_id}/job-ads",
+    description="Recommend the active job ads that best match a job application.",
+)
+def get_job_ads_for_job_application(
+    job_application_id: UUID,
+    limit: int = Query(default=10, gt=0, le=100),
+    similarity: Similarity = Query(default="jaccard"),
+    db: Session = Depends(get_read_db),
+) -> JSONResponse:
+    def _get_job_ads_for_job_application():
+        return recommendation_service.get_job_ads_for_job_application(
+            job_application_id=job_application_id,
+            limit=limit,
+            similarity=similarity,
+            db=db,
+        )
+
+    return process_request(
+        get_entities_fn=_get_job_ads_for_job_application,
+        status_code=status.HTTP_200_OK,
+        not_found_err_msg="Could not fetch job ad recommendations",
+        db=db,
+    )
+
+
+@router.get(
+    "/job-ads/{job_ad_id}/job-applications",
+    description="Recommend the active job applications that best match a job ad.",
+)
+def get_job_applications_for_job_ad(
+    job_ad_id: UUID,
+    limit: int = Query(default=10, gt=0, le=100),
+    similarity: Similarity = Query(default="jaccard"),
+    db: Session = Depends(get_read_db),
+) -> JSONResponse:
+    def _get_job_applications_for_job_ad():
+        return recommendation_service.get_job_applications_for_job_ad(
+            job_ad_id=job_ad_id,
+            limit=limit,
+            similarity=similarity,
+            db=db,
+        )
+
+    return process_request(
+        get_entities_fn=_get_job_applications_for_job_ad,
+        status_code=status.HTTP_200_OK,
+        not_found_err_msg="Could not fetch job application recommendations",
+        db=db,
+    )
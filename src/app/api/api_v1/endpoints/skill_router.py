@@ -1,12 +1,12 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
 from app.schemas.skill import SkillCreate
 from app.services import skill_service
-from app.sql_app.database import get_db
+from app.sql_app.database import get_db, get_read_db
 from app.utils.processors import process_request
 
 router = APIRouter()
@@ -18,7 +18,7 @@ router = APIRouter()
 )
 def get_all_skills_for_category(
     category_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> JSONResponse:
     def _get_all_skills_for_category():
         return skill_service.get_all_for_category(category_id=category_id, db=db)
@@ -31,13 +31,33 @@ def get_all_skills_for_category(
     )
 
 
+@router.get(
+    "/search",
+    description="Find the skills whose names most closely match the given name.",
+)
+def search_skills(
+    name: str = Query(min_length=1, max_length=100),
+    limit: int = Query(default=10, gt=0, le=50),
+    db: Session = Depends(get_read_db),
+) -> JSONResponse:
+    def _search_skills():
+        return skill_service.search_by_name(name=name, limit=limit, db=db)
+
+    return process_request(
+        get_entities_fn=_search_skills,
+        status_code=status.HTTP_200_OK,
+        not_found_err_msg=f"Could not search skills matching {name}",
+        db=db,
+    )
+
+
 @router.get(
     "/{skill_id}",
     description="Retrieve a skill by its unique identifier.",
 )
 def get_skill_by_id(
     skill_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> JSONResponse:
     def _get_skill_by_id():
         return skill_service.get_by_id(skill_id=skill_id, db=db)
@@ -1,7 +1,7 @@
 # The reason to ignore "assignment" https://github.com/pydantic/pydantic/issues/3143
 # mypy: disable-error-code="assignment"
 from functools import lru_cache
-from typing import List, Union
+from typing import List, Literal, Union
 
 from pydantic import AnyHttpUrl, field_validator
 from pydantic_settings import BaseSettings
@@ -10,6 +10,15 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     API_V1_STR: str
     DATABASE_URL: str
+    ASYNC_DATABASE_URL: str | None = None
+    READ_DATABASE_URLS: List[str] = []
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = -1
+    DB_POOL_PRE_PING: bool = False
+    DB_POOL_USE_LIFO: bool = False
+    DB_BOOTSTRAP_ON_STARTUP: bool = False
 
     BACKEND_CORS_ORIGINS: List[AnyHttpUrl] = []
     VERSION: str = "9.9.9.9"
@@ -22,6 +31,17 @@ class Settings(BaseSettings):
             return v
 
     PROJECT_NAME: str = "JobMatchDB"
+    DEBUG: bool = False
+    QUERY_REPEAT_THRESHOLD: int = 5
+    RECOMMENDATIONS_REFRESH_INTERVAL: float = 30
+    REFERENCE_DATA_TTL: float = 300
+
+    BLOB_STORAGE_BACKEND: Literal["local"] = "local"
+    BLOB_STORAGE_PATH: str = "blob_storage"
+    MAX_PHOTO_SIZE: int = 5 * 1024 * 1024
+    MAX_CV_SIZE: int = 10 * 1024 * 1024
+    MAX_LOGO_SIZE: int = 2 * 1024 * 1024
+    BLOB_CACHE_CONTROL: str = "private, no-cache"
 
     class Config:
         case_sensitive = True
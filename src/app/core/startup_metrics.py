@@ -0,0 +1,106 @@
+import logging
+import os
+import time
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.schemas.startup import StartupMetricsResponse
+
+logger = logging.getLogger(__name__)
+
+
+def _process_started_at() -> float:
+    """
+    Return the wall-clock time at which the current process started.
+
+    Reads /proc where available; elsewhere falls back to the time this module
+    was imported, which happens while the application is being loaded.
+
+    Returns:
+        float: Seconds since the epoch.
+    """
+    try:
+        with open("/proc/self/stat") as stat_file:
+            # Fields after the parenthesised command name; starttime is field 22.
+            fields = stat_file.read().rsplit(")", 1)[1].split()
+        with open("/proc/uptime") as uptime_file:
+            uptime = float(uptime_file.read().split()[0])
+        started_ticks = int(fields[19])
+        return time.time() - uptime + started_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError):
+        return time.time()
+
+
+class StartupMetrics:
+    """
+    Start-up timings of the current worker process.
+
+    Attributes:
+        process_started_at (float): Wall-clock time the process started.
+        ready_at (float | None): Wall-clock time the application finished its
+            start-up.
+        first_request_at (float | None): Wall-clock time the first request arrived.
+    """
+
+    def __init__(self) -> None:
+        self.process_started_at = _process_started_at()
+        self.ready_at: float | None = None
+        self.first_request_at: float | None = None
+
+    def mark_ready(self) -> None:
+        """
+        Record that the application finished its start-up.
+        """
+        self.ready_at = time.time()
+        logger.info(
+            f"Worker {os.getpid()} started in "
+            f"{self._elapsed_ms(self.ready_at):.0f} ms"
+        )
+
+    def mark_first_request(self) -> None:
+        """
+        Record the arrival of the first request; later calls are ignored.
+        """
+        if self.first_request_at is not None:
+            return
+        self.first_request_at = time.time()
+        logger.info(
+            f"Worker {os.getpid()} received its first request "
+            f"{self._elapsed_ms(self.first_request_at):.0f} ms after start"
+        )
+
+    def snapshot(self) -> StartupMetricsResponse:
+        """
+        Return the recorded timings.
+
+        Returns:
+            StartupMetricsResponse: The start-up timings of this worker.
+        """
+        return StartupMetricsResponse(
+            pid=os.getpid(),
+            startup_ms=self._elapsed_ms(self.ready_at),
+            time_to_first_request_ms=self._elapsed_ms(self.first_request_at),
+        )
+
+    def _elapsed_ms(self, timestamp: float | None) -> float | None:
+        if timestamp is None:
+            return None
+        return round((timestamp - self.process_started_at) * 1000, 3)
+
+
+class FirstRequestMiddleware:
+    """
+    ASGI middleware recording the arrival of the worker's first HTTP request.
+    """
+
+    def __init__(self, app: ASGIApp, metrics: StartupMetrics) -> None:
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and self.metrics.first_request_at is None:
+            self.metrics.mark_first_request()
+        await self.app(scope, receive, send)
+
+
+startup_metrics = StartupMetrics()
@@ -1,4 +1,6 @@
 import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 from urllib.parse import urljoin
 
 from ecs_logging import StdlibFormatter
@@ -7,7 +9,9 @@ from starlette.middleware.cors import CORSMiddleware
 
 from app.api.api_v1.api import api_router
 from app.core.config import get_settings
-from app.sql_app.database import initialize_database
+from app.core.startup_metrics import FirstRequestMiddleware, startup_metrics
+from app.sql_app.database import dispose_engines, initialize_database
+from app.sql_app.query_stats import QueryStatsMiddleware
 
 
 def _setup_cors(p_app: FastAPI) -> None:
@@ -23,9 +27,26 @@ def _setup_cors(p_app: FastAPI) -> None:
     )
 
 
+@asynccontextmanager
+async def _lifespan(app_: FastAPI) -> AsyncIterator[None]:
+    """
+    Start-up and shutdown of a worker.
+
+    Schema creation and seeding are done by the bootstrap command
+    (src/bootstrap_db.py); workers only run them when DB_BOOTSTRAP_ON_STARTUP
+    is set.
+    """
+    if get_settings().DB_BOOTSTRAP_ON_STARTUP:
+        initialize_database()
+    startup_metrics.mark_ready()
+    yield
+    await dispose_engines()
+
+
 def _create_app() -> FastAPI:
     app_ = FastAPI(
         title=get_settings().PROJECT_NAME,
+        lifespan=_lifespan,
         openapi_url=urljoin(get_settings().API_V1_STR, "openapi.json"),
         version=get_settings().VERSION,
         docs_url="/swagger",
@@ -53,5 +74,10 @@ def _setup_logger() -> None:
 app = _create_app()
 _setup_cors(app)
 _setup_logger()
-
-initialize_database()
+app.add_middleware(
+    QueryStatsMiddleware,
+    repeat_threshold=(
+        get_settings().QUERY_REPEAT_THRESHOLD if get_settings().DEBUG else None
+    ),
+)
+app.add_middleware(FirstRequestMiddleware, metrics=startup_metrics)
@@ -1,4 +1,4 @@
-from typing import Literal
+from typing import Generic, Literal, TypeVar
 from uuid import UUID
 
 from fastapi import Query
@@ -7,6 +7,8 @@ from pydantic import BaseModel, Field, field_validator
 from app.sql_app.job_ad.job_ad_status import JobAdStatus
 from app.sql_app.job_application.job_application_status import JobStatus
 
+T = TypeVar("T")
+
 
 class FilterParams(BaseModel):
     """
@@ -22,6 +24,10 @@ class FilterParams(BaseModel):
         offset (int): The number of records to skip before starting to return results.
             - Default: 0
             - Constraints: Must be greater than or equal to 0.
+        cursor (str | None): Opaque position returned as next_cursor by the previous
+            page. When set (an empty value requests the first page) the results are
+            paginated by keyset instead of offset and wrapped in a CursorPage.
+            - Default: None
 
     Example:
         Use this schema in FastAPI endpoints to simplify pagination:
@@ -35,6 +41,11 @@ class FilterParams(BaseModel):
 
     limit: int = Field(default=10, gt=0, le=100)
     offset: int = Field(default=0, ge=0)
+    cursor: str | None = Field(
+        default=None,
+        description="Switches to cursor pagination: pass an empty value for the first "
+        "page and the returned next_cursor for the following ones. offset is ignored.",
+    )
 
 
 class SearchParams(BaseModel):
@@ -93,6 +104,19 @@ class SearchJobApplication(SearchParams):
     job_application_status (JobAdStatus): The status of the job application.
         - Default: JobAdStatus.ACTIVE
         - Constraints: Must be either JobAdStatus.ACTIVE or JobAdStatus.ARCHIVED.
+    skills_threshold (int): How many of the skills a job application may lack.
+        - Default: 0
+        - Constraints: Must be between 0 and the number of skills.
+    salary_threshold (float): How far the salary ranges may be apart and still match.
+        - Default: 0
+        - Constraints: Must be greater than or equal to 0.
+    max_salary (float | None): The maximum salary.
+        - Default: None
+    min_salary (float | None): The minimum salary.
+        - Default: None
+        - Constraints: Must be non-negative and at most max_salary if provided.
+    city_id (UUID | None): The city of the job applications.
+        - Default: None
 
 
     Example:
@@ -114,6 +138,32 @@ class SearchJobApplication(SearchParams):
         default=[],
         description="List a set of skills to be included in the search",
     )
+    skills_threshold: int = Field(description="The skills threshold", ge=0, default=0)
+    salary_threshold: float = Field(description="The salary threshold", ge=0, default=0)
+    # Declared before min_salary so that validate_min_salary can compare them.
+    max_salary: float | None = Field(description="Maximum salary", default=None)
+    min_salary: float | None = Field(description="Minimum salary", default=None)
+    city_id: UUID | None = Field(description="The city ID", default=None)
+
+    @field_validator("min_salary")
+    def validate_min_salary(cls, value, values):
+        if value is not None:
+            if value < 0:
+                raise ValueError("Minimum salary must be non-negative")
+            max_salary = values.data.get("max_salary")
+            if max_salary is not None and value > max_salary:
+                raise ValueError("Minimum salary cannot be greater than maximum salary")
+        return value
+
+    @field_validator("skills_threshold")
+    def validate_skills_threshold(cls, value, values):
+        if value is not None:
+            skills = values.data.get("skills", [])
+            if not 0 <= value <= len(skills):
+                raise ValueError(
+                    "Skills threshold must be between 0 and the number of skills"
+                )
+        return value
 
 
 class JobAdSearchParams(SearchParams):
@@ -122,6 +172,11 @@ class JobAdSearchParams(SearchParams):
 
     Attributes:
         title (str | None): The title of the job ad. Default is None.
+        query (str | None): Free-text query matched against the title and description,
+            in web search syntax ("quoted phrases", OR, -excluded). Default is None.
+        order_by (Literal["created_at", "updated_at", "relevance"]): The field to order
+            results by; "relevance" ranks matches of the query and falls back to
+            created_at when no query is given. Default is "created_at".
         salary_threshold (float): The salary threshold. Must be greater than or equal to 0. Default is 0.
         min_salary (float | None): The minimum salary. Must be non-negative and less than or equal to max_salary if provided. Default is None.
         max_salary (float | None): The maximum salary. Default is None.
@@ -130,9 +185,16 @@ class JobAdSearchParams(SearchParams):
         job_ad_status (JobAdStatus): The status of the job ad. Can be ACTIVE or ARCHIVED. Default is JobAdStatus.ACTIVE.
         skills (list[str]): A list of skills to be included in the search. Default is an empty list.
         skills_threshold (int): The skills threshold. Must be between 0 and the number of skills. Default is 0.
+        include_facets (bool): Also return the total number of matches and their counts
+            per city, category, skill level and salary range. Default is False.
     """
 
     title: str | None = Field(description="The title of the job ad", default=None)
+    query: str | None = Field(
+        description="Free-text query over the title and description in web search syntax",
+        default=None,
+    )
+    order_by: Literal["created_at", "updated_at", "relevance"] = "created_at"
     salary_threshold: float = Field(description="The salary threshold", ge=0, default=0)
     min_salary: float | None = Field(description="Minimum salary", default=None)
     max_salary: float | None = Field(description="Maximum salary", default=None)
@@ -148,6 +210,10 @@ class JobAdSearchParams(SearchParams):
         description="List a set of skills to be included in the search",
     )
     skills_threshold: int = Field(description="The skills threshold", ge=0, default=0)
+    include_facets: bool = Field(
+        description="Return the total and the facet counts of the matches with the page",
+        default=False,
+    )
 
     @field_validator("min_salary")
     def validate_min_salary(cls, value, values):
@@ -170,6 +236,46 @@ class JobAdSearchParams(SearchParams):
         return value
 
 
+class CursorPage(BaseModel, Generic[T]):
+    """
+    Envelope for a page of results fetched with cursor pagination.
+
+    Attributes:
+        items (list[T]): The results on this page.
+        next_cursor (str | None): The cursor of the following page, None on the last page.
+    """
+
+    items: list[T]
+    next_cursor: str | None
+
+
+class BatchLookup(BaseModel):
+    """
+    Ids of the entities to retrieve in one request.
+
+    Attributes:
+        ids (list[UUID]): The ids to look up, from 1 to 100. Duplicates are allowed.
+    """
+
+    ids: list[UUID] = Field(
+        min_length=1, max_length=100, description="The ids to look up"
+    )
+
+
+class BatchLookupResult(BaseModel, Generic[T]):
+    """
+    Entities retrieved by id, in the order the ids were requested.
+
+    Attributes:
+        items (list[T | None]): The entity for each requested id, at the same
+            position; None where no entity has that id.
+        not_found (list[UUID]): The requested ids with no entity, in request order.
+    """
+
+    items: list[T | None]
+    not_found: list[UUID]
+
+
 class MessageResponse(BaseModel):
     """
     Message schema for returning messages in responses.
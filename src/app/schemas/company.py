@@ -20,6 +20,7 @@ class CompanyBase(BaseModel):
     phone_number: str
     website_url: str | None = None
     youtube_video_id: str | None = None
+    has_logo: bool = False
     active_job_ads: int = 0
     successful_matches: int = 0
 
@@ -38,6 +39,7 @@ class CompanyBase(BaseModel):
             phone_number=company.phone_number,
             website_url=company.website_url,
             youtube_video_id=company.youtube_video_id,
+            has_logo=company.has_logo,
             active_job_ads=company.active_job_count or 0,
             successful_matches=company.successfull_matches_count or 0,
         )
@@ -1,15 +1,20 @@
 from datetime import datetime
+from typing import Generic, TypeVar
 from uuid import UUID
 
 from pydantic import BaseModel, condecimal
+from sqlalchemy import Row
 
 from app.schemas.city import City
+from app.schemas.common import CursorPage
 from app.schemas.custom_types import Salary
 from app.schemas.skill import SkillBase
 from app.sql_app.job_ad.job_ad import JobAd
 from app.sql_app.job_ad.job_ad_status import JobAdStatus
 from app.sql_app.job_requirement.skill_level import SkillLevel
 
+T = TypeVar("T")
+
 
 class BaseJobAd(BaseModel):
     title: str
@@ -46,6 +51,28 @@ class JobAdPreview(BaseJobAd):
     def create(cls, job_ad: JobAd) -> "JobAdPreview":
         return cls._from_job_ad(job_ad)
 
+    @classmethod
+    def create_from_row(cls, row: Row) -> "JobAdPreview":
+        """
+        Create a JobAdPreview from a row selected with JOB_AD_PREVIEW_COLUMNS.
+
+        Args:
+            row (Row): A row of a column-projected job ad query.
+
+        Returns:
+            JobAdPreview: The created preview.
+        """
+        return cls(
+            title=row.title,
+            description=row.description,
+            category_id=row.category_id,
+            category_name=row.category_name,
+            skill_level=row.skill_level,
+            city=City(id=row.city_id, name=row.city_name),
+            min_salary=row.min_salary,
+            max_salary=row.max_salary,
+        )
+
 
 class JobAdResponse(JobAdPreview):
     id: UUID
@@ -83,3 +110,63 @@ class JobAdUpdate(BaseModel):
     min_salary: Salary | None = None  # type: ignore
     max_salary: Salary | None = None  # type: ignore
     status: JobAdStatus | None = None
+
+
+class FacetCount(BaseModel, Generic[T]):
+    """
+    Number of job ads matching a search that share one facet value.
+
+    Attributes:
+        value (T): The facet value, e.g. a city id or a skill level.
+        count (int): The number of matching job ads with that value.
+    """
+
+    value: T
+    count: int
+
+
+class SalaryBucketCount(BaseModel):
+    """
+    Number of job ads matching a search whose minimum salary falls in a range.
+
+    Attributes:
+        min_salary (float): The inclusive lower bound of the range.
+        max_salary (float): The exclusive upper bound of the range.
+        count (int): The number of matching job ads in the range.
+    """
+
+    min_salary: float
+    max_salary: float
+    count: int
+
+
+class JobAdFacets(BaseModel):
+    """
+    Counts of the job ads matching a search, per facet value.
+
+    Attributes:
+        cities (list[FacetCount[UUID]]): Counts per city id, most common first.
+        categories (list[FacetCount[UUID]]): Counts per category id, most common first.
+        skill_levels (list[FacetCount[SkillLevel]]): Counts per skill level, most
+            common first.
+        salary_buckets (list[SalaryBucketCount]): Counts per minimum salary range,
+            lowest first.
+    """
+
+    cities: list[FacetCount[UUID]] = []
+    categories: list[FacetCount[UUID]] = []
+    skill_levels: list[FacetCount[SkillLevel]] = []
+    salary_buckets: list[SalaryBucketCount] = []
+
+
+class JobAdSearchPage(CursorPage[JobAdResponse]):
+    """
+    A page of job ads together with the total and facet counts of the search.
+
+    Attributes:
+        total (int): The number of job ads matching the search across all pages.
+        facets (JobAdFacets): The counts of the matching job ads per facet value.
+    """
+
+    total: int
+    facets: JobAdFacets
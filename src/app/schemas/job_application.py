@@ -99,7 +99,7 @@ class JobApplicationResponse(JobAplicationBase):
         last_name (str): Last name of the professional.
         email (EmailStr): Email of the professional.
         description (str): Description of the professional.
-        photo bytes | None: Photo of the professional.
+        has_photo (bool): Whether the professional has uploaded a photo.
     """
 
     application_id: UUID
@@ -109,7 +109,7 @@ class JobApplicationResponse(JobAplicationBase):
     last_name: str
     city: str
     email: EmailStr
-    photo: bytes | None = None
+    has_photo: bool = False
     status: str
     skills: list[SkillResponse] | None = None
     category_id: UUID
@@ -128,7 +128,7 @@ class JobApplicationResponse(JobAplicationBase):
             created_at=job_application.created_at,
             category_id=job_application.category_id,
             category_title=job_application.category.title,
-            photo=professional.photo,
+            has_photo=professional.has_photo,
             first_name=professional.first_name,
             last_name=professional.last_name,
             email=professional.email,
@@ -139,6 +139,3 @@ class JobApplicationResponse(JobAplicationBase):
             city=professional.city.name,
             skills=[SkillResponse.create(skill) for skill in job_application.skills],
         )
-
-    class Config:
-        json_encoders = {bytes: lambda v: "<binary data>"}
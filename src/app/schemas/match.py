@@ -1,12 +1,11 @@
+from typing import Self
 from uuid import UUID
 
 from pydantic import BaseModel, Field
+from sqlalchemy import Row
 
 from app.sql_app import Match
-from app.sql_app.job_ad.job_ad import JobAd
-from app.sql_app.job_application.job_application import JobApplication
 from app.sql_app.match.match_status import MatchStatus
-from app.sql_app.professional.professional import Professional
 
 
 class MatchResponse(BaseModel):
@@ -45,6 +44,19 @@ class MatchResponse(BaseModel):
             status=match.status,
         )
 
+    @classmethod
+    def create_from_row(cls, row: Row) -> Self:
+        """
+        Create the response from a result row with a column named after each field.
+
+        Args:
+            row (Row): A row of a column-projected query.
+
+        Returns:
+            Self: The created response object.
+        """
+        return cls.model_validate(row)
+
 
 class MatchRequestCreate(MatchResponse):
     pass
@@ -80,31 +92,6 @@ class MatchRequestAd(MatchResponse):
     class Config:
         from_attributes = True
 
-    @classmethod
-    def create_response(cls, match: Match, job_ad: JobAd) -> "MatchRequestAd":
-        """
-        Create a MatchRequest object from a Match object.
-
-        Args:
-            match (Match): The Match object to create a MatchRequest object from.
-            job_ad (JobAd): The JobAd object to create a MatchRequest object from.
-
-        Returns:
-            MatchRequest: The created MatchRequest object.
-        """
-
-        return cls(
-            title=job_ad.title,
-            description=job_ad.description,
-            job_ad_id=match.job_ad_id,
-            job_application_id=match.job_application_id,
-            status=match.status,
-            company_id=job_ad.company_id,
-            company_name=job_ad.company.name,
-            min_salary=job_ad.min_salary,
-            max_salary=job_ad.max_salary,
-        )
-
 
 class MatchRequestApplication(MatchResponse):
     """
@@ -119,8 +106,8 @@ class MatchRequestApplication(MatchResponse):
         professional_id (UUID): The ID of the professional that was matched.
         professional_first_name (str): The first name of the professional that was matched.
         professional_last_name (str): The last name of the professional that was matched.
-        min_salary (float): The minimum salary for the job ad.
-        max_salary (float): The maximum salary for the job ad.
+        min_salary (float | None): The minimum salary for the job application.
+        max_salary (float | None): The maximum salary for the job application.
     """
 
     name: str = Field(description="The title of the job application.")
@@ -134,36 +121,12 @@ class MatchRequestApplication(MatchResponse):
     professional_last_name: str = Field(
         description="The name of the professional that was matched."
     )
-    min_salary: float = Field(description="The minimum salary for the job application.")
-    max_salary: float = Field(description="The maximum salary for the job application.")
+    min_salary: float | None = Field(
+        description="The minimum salary for the job application.", default=None
+    )
+    max_salary: float | None = Field(
+        description="The maximum salary for the job application.", default=None
+    )
 
     class Config:
         from_attributes = True
-
-    @classmethod
-    def create_response(
-        cls, match: Match, job_application: JobApplication
-    ) -> "MatchRequestApplication":
-        """
-        Create a MatchRequest object from a Match object.
-
-        Args:
-            match (Match): The Match object to create a MatchRequest object from.
-            job_application (JobApplication): The JobApplication object to create a MatchRequest object from.
-
-        Returns:
-            MatchRequest: The created MatchRequest object.
-        """
-
-        return cls(
-            name=job_application.name,
-            description=job_application.description,
-            job_ad_id=match.job_ad_id,
-            job_application_id=match.job_application_id,
-            status=match.status,
-            professional_id=job_application.professional_id,
-            professional_first_name=job_application.professional.first_name,
-            professional_last_name=job_application.professional.last_name,
-            min_salary=job_application.min_salary,
-            max_salary=job_application.max_salary,
-        )
@@ -0,0 +1,43 @@
+from pydantic import BaseModel
+
+
+class WaitTimeBucket(BaseModel):
+    """
+    Pydantic schema for one bucket of the connection checkout wait-time histogram.
+
+    Attributes:
+        le_ms (float | None): Upper bound of the bucket in milliseconds, None for
+            the bucket collecting every longer wait.
+        count (int): Number of checkouts that waited at most le_ms.
+    """
+
+    le_ms: float | None
+    count: int
+
+
+class PoolMetricsResponse(BaseModel):
+    """
+    Pydantic schema for the metrics of one database connection pool.
+
+    Attributes:
+        name (str): Which pool the metrics describe, e.g. "primary" or
+            "replica-1-async".
+        pool_size (int): Configured number of persistent connections.
+        checked_out (int): Connections currently in use.
+        checked_in (int): Idle connections available in the pool.
+        overflow (int): Connections currently open beyond pool_size.
+        checkouts (int): Successful checkouts since start-up.
+        timeouts (int): Checkouts that failed with a pool timeout since start-up.
+        wait_time_total_ms (float): Total time spent waiting for connections.
+        wait_time_buckets (list[WaitTimeBucket]): Checkout wait-time histogram.
+    """
+
+    name: str
+    pool_size: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    wait_time_total_ms: float
+    wait_time_buckets: list[WaitTimeBucket]
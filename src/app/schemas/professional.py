@@ -64,7 +64,8 @@ class ProfessionalResponse(ProfessionalBase):
         first_name (str): First name of the professional.
         last_name (str): Last name of the professional.
         description (str): Description of the professional.
-        photo bytes | None: Photo of the professional.
+        has_photo (bool): Whether the professional has uploaded a photo.
+        has_cv (bool): Whether the professional has uploaded a CV.
         active_application_count (int): Number of active applications.
         city (str): The city the professional is located in.
         status (ProfessionalStatus): The status of the professional.
@@ -75,7 +76,8 @@ class ProfessionalResponse(ProfessionalBase):
 
     id: UUID
     email: EmailStr
-    photo: bytes | None = None
+    has_photo: bool = False
+    has_cv: bool = False
     status: ProfessionalStatus
     skills: list[SkillResponse] = []
     active_application_count: int
@@ -97,13 +99,11 @@ class ProfessionalResponse(ProfessionalBase):
             email=professional.email,
             city=professional.city.name,
             description=professional.description,
-            photo=professional.photo,
+            has_photo=professional.has_photo,
+            has_cv=professional.has_cv,
             status=professional.status,
             skills=skills,
             active_application_count=professional.active_application_count,
             matched_ads=matched_ads if not professional.has_private_matches else None,
             sent_match_requests=sent_match_requests,
         )
-
-    class Config:
-        json_encoders = {bytes: lambda v: "<binary data>"}
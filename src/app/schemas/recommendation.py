@@ -0,0 +1,41 @@
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from app.utils.skill_match import ScoredMatch
+
+
+class RecommendationResponse(BaseModel):
+    """
+    Pydantic schema for a recommended job ad or job application.
+
+    Attributes:
+        id (UUID): The identifier of the recommended job ad or job application.
+        score (float): The overall match score, from 0 to 1.
+        matched_skills (int): The number of skills shared with the requester.
+        skill_similarity (float): Similarity of the two skill sets, from 0 to 1.
+        salary_overlap (float): Share of the requester's salary range covered by
+            the recommendation's range, from 0 to 1.
+        same_location (bool): Whether both are in the same city.
+        same_category (bool): Whether both are in the same category.
+    """
+
+    id: UUID
+    score: float
+    matched_skills: int
+    skill_similarity: float
+    salary_overlap: float
+    same_location: bool
+    same_category: bool
+
+    @classmethod
+    def create(cls, match: ScoredMatch) -> "RecommendationResponse":
+        return cls(
+            id=match.id,
+            score=round(match.score, 4),
+            matched_skills=match.matched_skills,
+            skill_similarity=round(match.skill_similarity, 4),
+            salary_overlap=round(match.salary_overlap, 4),
+            same_location=match.same_location,
+            same_category=match.same_category,
+        )
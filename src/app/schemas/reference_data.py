@@ -0,0 +1,25 @@
+from pydantic import BaseModel
+
+
+class ReferenceCacheStats(BaseModel):
+    """
+    Pydantic schema for the state of one cached reference table.
+
+    Attributes:
+        table (str): Name of the cached table.
+        version (int): Number of times the table has been loaded by this worker.
+        rows (int): Number of rows in the current snapshot, 0 when none is loaded.
+        age_s (float | None): Seconds since the current snapshot was loaded, None
+            when none is loaded.
+        hits (int): Lookups served from a loaded snapshot.
+        misses (int): Lookups that had to load the table from the database.
+        invalidations (int): Explicit invalidations after writes to the table.
+    """
+
+    table: str
+    version: int
+    rows: int
+    age_s: float | None
+    hits: int
+    misses: int
+    invalidations: int
@@ -53,3 +53,24 @@ class SkillResponse(SkillBase):
             name=skill.name,
             category_id=skill.category_id,
         )
+
+
+class SkillMatchResponse(SkillResponse):
+    """
+    SkillMatchResponse is a Pydantic model for a skill returned by a fuzzy name search.
+
+    Attributes:
+        similarity (float): How closely the skill name matches the searched name,
+            from 0 (unrelated) to 1 (identical).
+    """
+
+    similarity: float
+
+    @classmethod
+    def create(cls, skill: Skill, similarity: float) -> "SkillMatchResponse":
+        return cls(
+            id=skill.id,
+            name=skill.name,
+            category_id=skill.category_id,
+            similarity=round(similarity, 4),
+        )
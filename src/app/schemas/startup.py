@@ -0,0 +1,18 @@
+from pydantic import BaseModel
+
+
+class StartupMetricsResponse(BaseModel):
+    """
+    Pydantic schema for the start-up timings of a worker process.
+
+    Attributes:
+        pid (int): Process id of the worker.
+        startup_ms (float | None): Time from process start until the application
+            finished its start-up, None while still starting.
+        time_to_first_request_ms (float | None): Time from process start until the
+            first request arrived, None if no request has been served yet.
+    """
+
+    pid: int
+    startup_ms: float | None
+    time_to_first_request_ms: float | None
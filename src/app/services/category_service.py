@@ -1,18 +1,63 @@
+from uuid import UUID
+
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from app.schemas.category import CategoryResponse
-from app.sql_app.category.category import Category
+from app.services import reference_data
+from app.sql_app import Category, JobAd
+from app.sql_app.job_application.job_application import JobApplication
 
 
 def get_all(db: Session) -> list[CategoryResponse]:
     """
-    Retrieve all categories from the database.
+    Retrieve all categories from the reference data cache.
+
+    The job ad and job application counts change with every new job ad and job
+    application, so they are not cached; they are counted with one query on every
+    call.
 
     Args:
-        db (Session): The database session used to query the categories.
+        db (Session): The database session used to count the job ads and job applications, and to load the categories if they are not cached.
 
     Returns:
         list[CategoryResponse]: A list of CategoryResponse objects representing all categories in the database.
     """
-    categories = db.query(Category).all()
-    return [CategoryResponse.create(category) for category in categories]
+    categories = reference_data.categories.get(db).rows
+    counts = _count_by_category(db)
+    return [
+        CategoryResponse(
+            id=category.id,
+            title=category.title,
+            description=category.description,
+            job_ads_count=counts.get(category.id, (0, 0))[0],
+            job_applications_count=counts.get(category.id, (0, 0))[1],
+        )
+        for category in categories
+    ]
+
+
+def _count_by_category(db: Session) -> dict[UUID, tuple[int, int]]:
+    """
+    Count the job ads and job applications of every category.
+
+    Args:
+        db (Session): The database session used for the query.
+
+    Returns:
+        dict[UUID, tuple[int, int]]: The job ad and job application counts by
+            category id.
+    """
+    job_ads_count = (
+        select(func.count()).where(JobAd.category_id == Category.id).scalar_subquery()
+    )
+    job_applications_count = (
+        select(func.count())
+        .where(JobApplication.category_id == Category.id)
+        .scalar_subquery()
+    )
+    rows = db.query(Category.id, job_ads_count, job_applications_count)
+    return {
+        category_id: (job_ads, job_applications)
+        for category_id, job_ads, job_applications in rows
+    }
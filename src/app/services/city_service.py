@@ -5,20 +5,21 @@ from sqlalchemy.orm import Session
 
 from app.exceptions.custom_exceptions import ApplicationError
 from app.schemas.city import CityResponse
+from app.services import reference_data
 from app.sql_app.city.city import City
 
 
 def get_all(db: Session) -> list[CityResponse]:
     """
-    Retrieve all cities from the database.
+    Retrieve all cities from the reference data cache.
 
     Args:
-        db (Session): The database session used to query the cities.
+        db (Session): The database session used to load the cities if they are not cached.
 
     Returns:
         list[CityResponse]: A list of CityResponse objects containing the id and name of each city.
     """
-    cities = db.query(City).all()
+    cities = reference_data.cities.get(db).rows
     return [CityResponse(id=city.id, name=city.name) for city in cities]
 
 
@@ -39,7 +40,10 @@ def get_by_id(
     Raises:
         ApplicationError: If no city is found with the given identifier.
     """
-    city = db.query(City).filter(City.id == city_id).first()
+    city = reference_data.cities.get(db).by_id.get(city_id)
+    if city is None:
+        # The city may have been added after the cache was loaded.
+        city = db.query(City).filter(City.id == city_id).first()
     if city is None:
         raise ApplicationError(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -89,7 +93,10 @@ def get_by_name(
     Raises:
         ApplicationError: If no city is found with the given name.
     """
-    city = db.query(City).filter(City.name == city_name).first()
+    city = reference_data.cities.get(db).by_name.get(city_name)
+    if city is None:
+        # The city may have been added after the cache was loaded.
+        city = db.query(City).filter(City.name == city_name).first()
     if city is None:
         raise ApplicationError(
             status_code=status.HTTP_404_NOT_FOUND,
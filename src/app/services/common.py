@@ -1,17 +1,148 @@
 import logging
+from typing import TypeVar
 from uuid import UUID
 
 from fastapi import status
-from sqlalchemy import and_
-from sqlalchemy.orm import Session
+from sqlalchemy import ColumnElement, and_, any_, func, select, text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from app.exceptions.custom_exceptions import ApplicationError
-from app.sql_app import Company, JobAd, Professional, Skill
+from app.schemas.common import BatchLookupResult
+from app.services import reference_data
+from app.sql_app import (
+    Category,
+    City,
+    Company,
+    JobAd,
+    JobAdSkill,
+    Professional,
+    Skill,
+)
 from app.sql_app.job_application.job_application import JobApplication
+from app.sql_app.job_application_skill.job_application_skill import JobApplicationSkill
 from app.sql_app.match.match import Match
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Loader options for every query whose rows end up in a JobApplicationResponse.
+# The many-to-one relationships are joined into the main statement and the skills
+# collection is fetched with one extra SELECT ... IN for the whole page.
+JOB_APPLICATION_RESPONSE_OPTIONS = (
+    joinedload(JobApplication.professional).joinedload(Professional.city),
+    joinedload(JobApplication.category),
+    selectinload(JobApplication.skills),
+)
+
+# Loader options for queries whose rows end up in a JobAdPreview or JobAdResponse.
+# Required on an AsyncSession, where relationships cannot be lazy loaded.
+JOB_AD_PREVIEW_OPTIONS = (
+    joinedload(JobAd.category),
+    joinedload(JobAd.location),
+)
+JOB_AD_RESPONSE_OPTIONS = (
+    *JOB_AD_PREVIEW_OPTIONS,
+    selectinload(JobAd.skills),
+)
+
+# Columns read by JobAdPreview.create_from_row. The query must join JobAd.category
+# and JobAd.location.
+JOB_AD_PREVIEW_COLUMNS = (
+    JobAd.title,
+    JobAd.description,
+    JobAd.skill_level,
+    JobAd.category_id,
+    Category.title.label("category_name"),
+    City.id.label("city_id"),
+    City.name.label("city_name"),
+    JobAd.min_salary,
+    JobAd.max_salary,
+)
+
+
+# Extensions found installed. Only positive results are cached, so an extension
+# installed after start-up is picked up without a restart.
+_installed_extensions: set[str] = set()
+# Missing extensions already logged, to warn once per process.
+_reported_missing_extensions: set[str] = set()
+
+
+def is_extension_available(extension_name: str, db: Session) -> bool:
+    """
+    Check whether a PostgreSQL extension is installed in the connected database.
+
+    An installed extension is cached for the lifetime of the process; a missing
+    one is checked again on every call.
+
+    Args:
+        extension_name (str): The name of the extension, e.g. "pg_trgm".
+        db (Session): The database session.
+
+    Returns:
+        bool: True if the extension is installed, False otherwise.
+    """
+    if extension_name in _installed_extensions:
+        return True
+
+    installed = db.execute(
+        text("SELECT 1 FROM pg_extension WHERE extname = :extension_name"),
+        {"extension_name": extension_name},
+    ).first()
+    if installed is not None:
+        _installed_extensions.add(extension_name)
+        return True
+
+    if extension_name not in _reported_missing_extensions:
+        _reported_missing_extensions.add(extension_name)
+        logger.warning(f"PostgreSQL extension {extension_name} is not installed")
+    return False
+
+
+def filter_by_skill_ids(
+    skill_ids: ColumnElement[list[UUID]],
+    skill_names: list[str],
+    required_matches: int,
+) -> ColumnElement[bool]:
+    """
+    Build a condition matching rows whose skill_ids array holds at least
+    required_matches of the named skills.
+
+    The names are resolved to ids (case-insensitively) by an uncorrelated
+    subquery the database evaluates once per statement. The array overlap lets a
+    GIN index on skill_ids narrow the candidates before the matching ids are
+    counted.
+
+    Args:
+        skill_ids (ColumnElement[list[UUID]]): The skill_ids array column to test.
+        skill_names (list[str]): The names of the requested skills.
+        required_matches (int): The minimum number of requested skills to hold.
+
+    Returns:
+        ColumnElement[bool]: The filter condition.
+    """
+    requested_skill_ids = func.array(
+        select(Skill.id)
+        .where(func.lower(Skill.name).in_([name.lower() for name in skill_names]))
+        .scalar_subquery(),
+        type_=ARRAY(PG_UUID(as_uuid=True)),
+    )
+    skill_id = func.unnest(skill_ids).column_valued("skill_id")
+    matched_skills = (
+        select(func.count())
+        .where(skill_id == any_(requested_skill_ids))
+        .scalar_subquery()
+    )
+
+    return and_(
+        skill_ids.overlap(requested_skill_ids),
+        matched_skills >= required_matches,
+    )
+
 
 def get_company_by_id(company_id: UUID, db: Session) -> Company:
     """
@@ -62,6 +193,33 @@ def get_job_ad_by_id(job_ad_id: UUID, db: Session) -> JobAd:
     return job_ad
 
 
+async def get_job_ad_by_id_async(job_ad_id: UUID, db: AsyncSession) -> JobAd:
+    """
+    Retrieve a job advertisement, with everything JobAdResponse needs, by its ID.
+
+    Args:
+        job_ad_id (UUID): The unique identifier of the job advertisement.
+        db (AsyncSession): The asynchronous database session.
+
+    Returns:
+        JobAd: The job advertisement object if found.
+
+    Raises:
+        ApplicationError: If the job advertisement with the given ID is not found.
+    """
+    job_ad = await db.scalar(
+        select(JobAd).options(*JOB_AD_RESPONSE_OPTIONS).filter(JobAd.id == job_ad_id)
+    )
+    if job_ad is None:
+        logger.error(f"Job ad with id {job_ad_id} not found")
+        raise ApplicationError(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job ad with id {job_ad_id} not found",
+        )
+
+    return job_ad
+
+
 def get_job_application_by_id(job_application_id: UUID, db: Session) -> JobApplication:
     """
     Retrieve a job application by its ID from the database.
@@ -118,6 +276,40 @@ def get_professional_by_id(professional_id: UUID, db: Session) -> Professional:
     return professional
 
 
+async def get_professional_by_id_async(
+    professional_id: UUID,
+    db: AsyncSession,
+) -> Professional:
+    """
+    Retrieve a Professional, with the city ProfessionalResponse needs, by its ID.
+
+    Args:
+        professional_id (UUID): The identifier of the Professional.
+        db (AsyncSession): The asynchronous database session.
+
+    Returns:
+        Professional: SQLAlchemy model for Professional.
+
+    Raises:
+        ApplicationError: If the professional with the given id is
+            not found in the database.
+    """
+    professional = await db.scalar(
+        select(Professional)
+        .options(joinedload(Professional.city))
+        .filter(Professional.id == professional_id)
+    )
+    if professional is None:
+        logger.error(f"Professional with id {professional_id} not found")
+        raise ApplicationError(
+            detail=f"Professional with id {professional_id} not found",
+            status_code=status.HTTP_404_NOT_FOUND,
+        )
+
+    logger.info(f"Professional with id {professional_id} fetched")
+    return professional
+
+
 def get_skill_by_id(
     skill_id: UUID,
     db: Session,
@@ -145,15 +337,99 @@ def get_skill_by_id(
     return skill
 
 
-def get_skill_by_name(skill_name: str, db: Session) -> Skill:
-    skill = db.query(Skill).filter(Skill.name == skill_name).first()
-    if skill is None:
+def get_skill_ids_by_names(skill_names: list[str], db: Session) -> list[UUID]:
+    """
+    Resolve skill names to skill ids.
+
+    Names are looked up in the reference data cache first; the ones it does not
+    know are resolved together in a single query.
+
+    Args:
+        skill_names (list[str]): The exact skill names; duplicates are ignored.
+        db (Session): The database session.
+
+    Returns:
+        list[UUID]: The skill ids, in the order of their first name.
+
+    Raises:
+        ApplicationError: If any of the names is not a known skill. The error lists
+            every unknown name.
+    """
+    names = list(dict.fromkeys(skill_names))
+    cached = reference_data.skills.get(db).by_name
+    skill_ids = {name: cached[name].id for name in names if name in cached}
+
+    uncached = [name for name in names if name not in skill_ids]
+    if uncached:
+        # The skills may have been added after the cache was loaded.
+        rows = db.execute(
+            select(Skill.name, Skill.id).where(Skill.name.in_(uncached))
+        ).all()
+        skill_ids.update({name: skill_id for name, skill_id in rows})
+
+    unknown = [name for name in names if name not in skill_ids]
+    if unknown:
         raise ApplicationError(
-            detail=f"Skill with name {skill_name} not found.",
+            detail=f"Skills with names {', '.join(unknown)} not found.",
             status_code=status.HTTP_404_NOT_FOUND,
         )
 
-    return skill
+    return [skill_ids[name] for name in names]
+
+
+def insert_skill_links(
+    link_model: type[JobAdSkill] | type[JobApplicationSkill],
+    owner_id: UUID,
+    skill_ids: list[UUID],
+    db: Session,
+) -> list[UUID]:
+    """
+    Link skills to a job ad or job application with one multi-row INSERT.
+
+    Links that already exist are left as they are. The skill_ids trigger on the
+    link table then updates the job ad or job application once for the statement.
+
+    Args:
+        link_model (type[JobAdSkill] | type[JobApplicationSkill]): The link table.
+        owner_id (UUID): The id of the job ad or job application.
+        skill_ids (list[UUID]): The ids of the skills to link.
+        db (Session): The database session.
+
+    Returns:
+        list[UUID]: The ids of the skills that were not linked before.
+    """
+    if not skill_ids:
+        return []
+
+    owner_column = "job_ad_id" if link_model is JobAdSkill else "job_application_id"
+    rows = [{owner_column: owner_id, "skill_id": skill_id} for skill_id in skill_ids]
+    statement = (
+        insert(link_model)
+        .values(rows)
+        .on_conflict_do_nothing()
+        .returning(link_model.skill_id)
+    )
+    return list(db.scalars(statement))
+
+
+def create_batch_lookup_result(
+    ids: list[UUID], items: dict[UUID, T]
+) -> BatchLookupResult[T]:
+    """
+    Arrange entities retrieved by id in the order of the requested ids.
+
+    Args:
+        ids (list[UUID]): The requested ids.
+        items (dict[UUID, T]): The response models of the entities found, by id.
+
+    Returns:
+        BatchLookupResult[T]: An item, or None, for each requested id and the ids
+            that were not found.
+    """
+    return BatchLookupResult(
+        items=[items.get(item_id) for item_id in ids],
+        not_found=[item_id for item_id in ids if item_id not in items],
+    )
 
 
 def get_match_by_id(
@@ -1,39 +1,58 @@
-import io
 import logging
 from datetime import datetime
 from uuid import UUID
 
 from fastapi import HTTPException, UploadFile, status
-from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session
+from fastapi.responses import Response
+from sqlalchemy.orm import Session, joinedload
 
+from app.core.config import get_settings
 from app.exceptions.custom_exceptions import ApplicationError
-from app.schemas.common import FilterParams, MessageResponse
+from app.schemas.common import (
+    BatchLookupResult,
+    CursorPage,
+    FilterParams,
+    MessageResponse,
+)
 from app.schemas.company import CompanyCreate, CompanyResponse, CompanyUpdate
 from app.schemas.user import User
-from app.services.common import get_company_by_id
+from app.services.common import create_batch_lookup_result, get_company_by_id
 from app.sql_app.company.company import Company
+from app.storage import IMAGE_SIGNATURES, get_blob_store, store_upload
+from app.utils.pagination import Keyset
 
 logger = logging.getLogger(__name__)
 
+COMPANIES_KEYSET = Keyset(
+    name="company", columns=(Company.created_at, Company.id), order="asc"
+)
 
-def get_all(filter_params: FilterParams, db: Session) -> list[CompanyResponse]:
+
+def get_all(
+    filter_params: FilterParams, db: Session
+) -> list[CompanyResponse] | CursorPage[CompanyResponse]:
     """
     Retrieve a list of companies from the database based on the provided filter parameters.
 
+    Cursor pages are ordered by creation time.
+
     Args:
-        filter_params (FilterParams): The parameters to filter the companies, including offset and limit.
+        filter_params (FilterParams): The parameters to filter the companies, including offset and limit or cursor.
         db (Session): The database session used to query the companies.
 
     Returns:
-        list[CompanyResponse]: A list of CompanyResponse objects representing the retrieved companies.
+        list[CompanyResponse] | CursorPage[CompanyResponse]: A list of CompanyResponse objects representing the retrieved companies, wrapped in a CursorPage when paginating by cursor.
     """
-    companies = (
-        db.query(Company).offset(filter_params.offset).limit(filter_params.limit).all()
-    )
+    companies = COMPANIES_KEYSET.apply(
+        query=db.query(Company), filter_params=filter_params
+    ).all()
     logger.info(f"Retrieved {len(companies)} companies")
 
-    return [CompanyResponse.create(company) for company in companies]
+    return COMPANIES_KEYSET.page(
+        rows=companies,
+        filter_params=filter_params,
+        create_items=lambda rows: [CompanyResponse.create(company) for company in rows],
+    )
 
 
 def get_by_id(company_id: UUID, db: Session) -> CompanyResponse:
@@ -56,6 +75,34 @@ def get_by_id(company_id: UUID, db: Session) -> CompanyResponse:
     return CompanyResponse.create(company)
 
 
+def get_many(
+    company_ids: list[UUID], db: Session
+) -> BatchLookupResult[CompanyResponse]:
+    """
+    Retrieve several companies by their IDs with one query.
+
+    Args:
+        company_ids (list[UUID]): The IDs of the companies to retrieve.
+        db (Session): The database session to use for the query.
+
+    Returns:
+        BatchLookupResult[CompanyResponse]: The companies in the order of the IDs,
+            with None and a not_found entry for every unknown ID.
+    """
+    companies = (
+        db.query(Company)
+        .options(joinedload(Company.city))
+        .filter(Company.id.in_(set(company_ids)))
+        .all()
+    )
+    logger.info(f"Retrieved {len(companies)} of {len(company_ids)} requested companies")
+
+    return create_batch_lookup_result(
+        ids=company_ids,
+        items={company.id: CompanyResponse.create(company) for company in companies},
+    )
+
+
 def get_by_username(username: str, db: Session) -> User:
     """
     Retrieve a company by its username.
@@ -201,9 +248,21 @@ def upload_logo(company_id: UUID, logo: UploadFile, db: Session) -> MessageRespo
 
     Returns:
         MessageResponse: A response message indicating the result of the upload operation.
+
+    Raises:
+        ApplicationError: If the logo is too large or is not a supported image.
     """
     company = get_company_by_id(company_id=company_id, db=db)
-    company.logo = logo.file.read()
+    blob = store_upload(
+        upload=logo,
+        max_size=get_settings().MAX_LOGO_SIZE,
+        signatures=IMAGE_SIGNATURES,
+    )
+    company.logo_hash = blob.hash
+    company.logo_size = blob.size
+    company.logo_media_type = blob.media_type
+    # Drop the legacy in-table logo so migrate_blobs cannot bring it back.
+    company.logo = None
     company.updated_at = datetime.now()
     db.commit()
     logger.info(f"Uploaded logo for company with id {company_id}")
@@ -211,27 +270,38 @@ def upload_logo(company_id: UUID, logo: UploadFile, db: Session) -> MessageRespo
     return MessageResponse(message="Logo uploaded successfully")
 
 
-def download_logo(company_id: UUID, db: Session) -> StreamingResponse:
+def download_logo(
+    company_id: UUID,
+    db: Session,
+    if_none_match: str | None = None,
+    range_header: str | None = None,
+) -> Response:
     """
     Downloads the logo of a company.
     Args:
         company_id (UUID): The unique identifier of the company.
         db (Session): The database session.
+        if_none_match (str | None): The If-None-Match request header, if any.
+        range_header (str | None): The Range request header, if any.
     Returns:
-        StreamingResponse: A streaming response containing the company's logo.
+        Response: A response serving the company's logo from the blob store, or 304 if unchanged.
     Raises:
         ApplicationError: If the company does not have a logo or does not exist.
     """
     company = get_company_by_id(company_id=company_id, db=db)
-    logo = company.logo
-    if logo is None:
+    if company.logo_hash is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Company with id {company_id} does not have a logo",
         )
     logger.info(f"Downloaded logo of company with id {company_id}")
 
-    return StreamingResponse(io.BytesIO(logo), media_type="image/png")
+    return get_blob_store().create_response(
+        blob_hash=company.logo_hash,
+        media_type=company.logo_media_type or "image/png",
+        if_none_match=if_none_match,
+        range_header=range_header,
+    )
 
 
 def delete_logo(company_id: UUID, db: Session) -> MessageResponse:
@@ -247,6 +317,9 @@ def delete_logo(company_id: UUID, db: Session) -> MessageResponse:
     """
     company = get_company_by_id(company_id=company_id, db=db)
     company.logo = None
+    company.logo_hash = None
+    company.logo_size = None
+    company.logo_media_type = None
     company.updated_at = datetime.now()
 
     db.commit()
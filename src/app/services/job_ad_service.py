@@ -1,49 +1,100 @@
 import logging
 from datetime import datetime
+from typing import TypeVar
 from uuid import UUID
 
 from fastapi import status
-from sqlalchemy import asc, desc, func
-from sqlalchemy.orm import Query, Session, aliased
+from sqlalchemy import Row, Select, asc, desc, func, literal, select, tuple_
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query, Session
 
 from app.exceptions.custom_exceptions import ApplicationError
-from app.schemas.common import FilterParams, JobAdSearchParams, MessageResponse
-from app.schemas.job_ad import JobAdCreate, JobAdResponse, JobAdUpdate
+from app.schemas.common import (
+    BatchLookupResult,
+    CursorPage,
+    FilterParams,
+    JobAdSearchParams,
+    MessageResponse,
+)
+from app.schemas.job_ad import (
+    FacetCount,
+    JobAdCreate,
+    JobAdFacets,
+    JobAdResponse,
+    JobAdSearchPage,
+    JobAdUpdate,
+    SalaryBucketCount,
+)
 from app.services import company_service
 from app.services.common import (
+    JOB_AD_RESPONSE_OPTIONS,
+    create_batch_lookup_result,
+    filter_by_skill_ids,
     get_company_by_id,
     get_job_ad_by_id,
+    get_job_ad_by_id_async,
     get_skill_by_id,
-    get_skill_by_name,
+    get_skill_ids_by_names,
+    insert_skill_links,
 )
-from app.sql_app import JobAd, JobAdSkill, Skill
+from app.sql_app import JobAd, JobAdSkill
+from app.sql_app.job_ad.job_ad import SEARCH_CONFIG
 from app.sql_app.job_ad.job_ad_status import JobAdStatus
+from app.utils.pagination import Keyset
 
 logger = logging.getLogger(__name__)
 
+# The search helpers accept both legacy Query objects (sync path) and 2.0 style
+# Select statements (async path), which share the filter/join/order_by API.
+JobAdsQuery = TypeVar("JobAdsQuery", Query, Select)
+
+# Width of the minimum salary ranges the search facets count job ads in.
+SALARY_BUCKET_SIZE = 1000
+
 
 def get_all(
     filter_params: FilterParams,
     search_params: JobAdSearchParams,
     db: Session,
-) -> list[JobAdResponse]:
+) -> list[JobAdResponse] | CursorPage[JobAdResponse] | JobAdSearchPage:
     """
     Retrieve all job advertisements.
 
     Args:
+        filter_params (FilterParams): The offset and limit, or cursor, of the page.
+        search_params (JobAdSearchParams): The parameters to filter job advertisements.
         db (Session): The database session used to query the job advertisements.
-        skip (int): The number of job advertisements to skip.
-        limit (int): The maximum number of job advertisements to retrieve.
 
     Returns:
-        list[JobAdResponse]: The list of job advertisements.
+        list[JobAdResponse] | CursorPage[JobAdResponse] | JobAdSearchPage: The list
+            of job advertisements, wrapped in a CursorPage when paginating by cursor,
+            or in a JobAdSearchPage with the total and facet counts when requested.
+
+    Notes:
+        - Runs the same statements as get_all_async, so endpoints can switch
+          between the sync and the async path without changing their responses.
     """
-    job_ads = _search_job_ads(search_params=search_params, db=db)
-    job_ads = job_ads.offset(filter_params.offset).limit(filter_params.limit)
-    job_ads_list = job_ads.all()
-    logger.info(f"Retrieved {len(job_ads_list)} job ads")
+    keyset = _keyset(search_params=search_params, filter_params=filter_params)
+    if search_params.include_facets:
+        # Must run before the session's first query to set up its transaction.
+        db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+    statement = _page_statement(
+        search_params=search_params, filter_params=filter_params, keyset=keyset
+    )
+    job_ads = db.scalars(statement).all()
+    logger.info(f"Retrieved {len(job_ads)} job ads")
+
+    page = keyset.page(
+        rows=list(job_ads),
+        filter_params=filter_params,
+        create_items=lambda rows: [JobAdResponse.create(job_ad) for job_ad in rows],
+    )
+    if not search_params.include_facets:
+        return page
 
-    return [JobAdResponse.create(job_ad) for job_ad in job_ads_list]
+    facet_rows = db.execute(_facets_statement(search_params=search_params)).all()
+    return _create_search_page(page=page, facet_rows=facet_rows)
 
 
 def get_by_id(job_ad_id: UUID, db: Session) -> JobAdResponse:
@@ -63,6 +114,96 @@ def get_by_id(job_ad_id: UUID, db: Session) -> JobAdResponse:
     return JobAdResponse.create(job_ad)
 
 
+def get_many(job_ad_ids: list[UUID], db: Session) -> BatchLookupResult[JobAdResponse]:
+    """
+    Retrieve several job advertisements by their unique identifiers with one query.
+
+    Args:
+        job_ad_ids (list[UUID]): The unique identifiers of the job advertisements.
+        db (Session): The database session used to query the job advertisements.
+
+    Returns:
+        BatchLookupResult[JobAdResponse]: The job advertisements in the order of
+            the ids, with None and a not_found entry for every unknown id.
+    """
+    job_ads = (
+        db.query(JobAd)
+        .options(*JOB_AD_RESPONSE_OPTIONS)
+        .filter(JobAd.id.in_(set(job_ad_ids)))
+        .all()
+    )
+    logger.info(f"Retrieved {len(job_ads)} of {len(job_ad_ids)} requested job ads")
+
+    return create_batch_lookup_result(
+        ids=job_ad_ids,
+        items={job_ad.id: JobAdResponse.create(job_ad) for job_ad in job_ads},
+    )
+
+
+async def get_all_async(
+    filter_params: FilterParams,
+    search_params: JobAdSearchParams,
+    db: AsyncSession,
+) -> list[JobAdResponse] | CursorPage[JobAdResponse] | JobAdSearchPage:
+    """
+    Retrieve all job advertisements using an asynchronous session.
+
+    Args:
+        filter_params (FilterParams): The offset and limit, or cursor, of the page.
+        search_params (JobAdSearchParams): The parameters to filter job advertisements.
+        db (AsyncSession): The asynchronous database session.
+
+    Returns:
+        list[JobAdResponse] | CursorPage[JobAdResponse] | JobAdSearchPage: The list
+            of job advertisements, wrapped in a CursorPage when paginating by cursor,
+            or in a JobAdSearchPage with the total and facet counts when requested.
+
+    Notes:
+        - With facets the page and the counts are two queries: the page loads
+          JobAd entities with their relationships, which cannot share a result
+          set with the grouped count rows. Both run in one REPEATABLE READ
+          transaction, so the total and the facets describe the same snapshot
+          as the page.
+    """
+    keyset = _keyset(search_params=search_params, filter_params=filter_params)
+    if search_params.include_facets:
+        # Must run before the session's first query to set up its transaction.
+        await db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+    statement = _page_statement(
+        search_params=search_params, filter_params=filter_params, keyset=keyset
+    )
+    job_ads = (await db.scalars(statement)).all()
+    logger.info(f"Retrieved {len(job_ads)} job ads")
+
+    page = keyset.page(
+        rows=list(job_ads),
+        filter_params=filter_params,
+        create_items=lambda rows: [JobAdResponse.create(job_ad) for job_ad in rows],
+    )
+    if not search_params.include_facets:
+        return page
+
+    result = await db.execute(_facets_statement(search_params=search_params))
+    return _create_search_page(page=page, facet_rows=result.all())
+
+
+async def get_by_id_async(job_ad_id: UUID, db: AsyncSession) -> JobAdResponse:
+    """
+    Retrieve a job advertisement by its unique identifier using an asynchronous session.
+
+    Args:
+        job_ad_id (UUID): The unique identifier of the job advertisement.
+        db (AsyncSession): The asynchronous database session.
+
+    Returns:
+        JobAdResponse: The job advertisement.
+    """
+    job_ad = await get_job_ad_by_id_async(job_ad_id=job_ad_id, db=db)
+    logger.info(f"Retrieved job ad with id {job_ad_id}")
+
+    return JobAdResponse.create(job_ad)
+
+
 def create(
     job_ad_data: JobAdCreate,
     db: Session,
@@ -78,18 +219,20 @@ def create(
         JobAdResponse: The created job advertisement.
 
     Raises:
-        ApplicationError: If the company or city is not found.
+        ApplicationError: If the company, city or any of the skills is not found.
     """
     company = get_company_by_id(company_id=job_ad_data.company_id, db=db)
+    skill_ids = get_skill_ids_by_names(skill_names=job_ad_data.skills, db=db)
     job_ad = JobAd(
         **job_ad_data.model_dump(exclude={"skills"}), status=JobAdStatus.ACTIVE
     )
 
-    _add_skills(job_ad=job_ad, skills=job_ad_data.skills, db=db)
-
     company.active_job_count += 1
 
     db.add(job_ad)
+    # The job ad id is generated by the database and needed for the skill links.
+    db.flush()
+    _add_skills(job_ad=job_ad, skill_ids=skill_ids, db=db)
     db.commit()
     db.refresh(job_ad)
     logger.info(f"Created job ad with id {job_ad.id}")
@@ -150,9 +293,10 @@ def add_skill_requirement(
         ApplicationError: If the skill is already added to the job advertisement.
     """
     job_ad = get_job_ad_by_id(job_ad_id=job_ad_id, db=db)
-    skill = get_skill_by_id(skill_id=skill_id, db=db)
+    get_skill_by_id(skill_id=skill_id, db=db)
 
-    if skill in job_ad.skills:
+    # The insert skips an existing link, which avoids loading job_ad.skills.
+    if not _add_skills(job_ad=job_ad, skill_ids=[skill_id], db=db):
         logger.error(
             f"Skill with id {skill_id} already added to job ad with id {job_ad_id}"
         )
@@ -161,14 +305,7 @@ def add_skill_requirement(
             detail=f"Skill with id {skill_id} already added to job ad with id {job_ad_id}",
         )
 
-    job_ad_skill = JobAdSkill(
-        job_ad_id=job_ad_id,
-        skill_id=skill_id,
-    )
-
-    db.add(job_ad_skill)
     db.commit()
-    db.refresh(job_ad_skill)
     logger.info(f"Added skill with id {skill_id} to job ad with id {job_ad_id}")
 
     return MessageResponse(message="Skill added to job ad")
@@ -176,21 +313,83 @@ def add_skill_requirement(
 
 def _add_skills(
     job_ad: JobAd,
-    skills: list[str],
+    skill_ids: list[UUID],
     db: Session,
-) -> None:
+) -> list[UUID]:
     """
-    Adds a list of skills to a job advertisement.
+    Adds skills to a persisted job advertisement with a single INSERT.
 
     Args:
-        job_ad (JobAd): The job application to which the skills will be added.
-        skills (list[str]): A list of skill names to be added to the job application.
-        db (Session): The database session used for querying and adding skills.
+        job_ad (JobAd): The job advertisement to which the skills will be added.
+        skill_ids (list[UUID]): The ids of the skills to be added.
+        db (Session): The database session used for adding skills.
+
+    Returns:
+        list[UUID]: The ids of the skills the job advertisement did not have yet.
     """
-    for skill in skills:
-        skill_model = get_skill_by_name(skill_name=skill, db=db)
-        job_ad.skills.append(skill_model)
-        logger.info(f"Added skill {skill} to job ad with id {job_ad.id}")
+    added = insert_skill_links(
+        link_model=JobAdSkill, owner_id=job_ad.id, skill_ids=skill_ids, db=db
+    )
+    logger.info(f"Added {len(added)} skills to job ad with id {job_ad.id}")
+
+    return added
+
+
+def _keyset(search_params: JobAdSearchParams, filter_params: FilterParams) -> Keyset:
+    """
+    Returns the keyset paginating job advertisements in the requested order.
+
+    Args:
+        search_params (JobAdSearchParams): The search parameters holding the order.
+        filter_params (FilterParams): The pagination parameters.
+
+    Returns:
+        Keyset: The keyset over the sort column and the job ad id.
+
+    Raises:
+        ApplicationError: If cursor pagination is requested with relevance ordering.
+    """
+    order_by = search_params.order_by
+    if order_by == "relevance":
+        if search_params.query and filter_params.cursor is not None:
+            raise ApplicationError(
+                detail="Cursor pagination is not supported when ordering by relevance",
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+        # Without a query relevance falls back to created_at; with one, the keyset
+        # only serves offset pagination, which keeps the ts_rank order.
+        order_by = "created_at"
+
+    return Keyset(
+        name=f"job_ad:{order_by}:{search_params.order}",
+        columns=(getattr(JobAd, order_by), JobAd.id),
+        order=search_params.order,
+    )
+
+
+def _page_statement(
+    search_params: JobAdSearchParams,
+    filter_params: FilterParams,
+    keyset: Keyset,
+) -> Select:
+    """
+    Builds the statement selecting one page of job advertisements for a search.
+
+    The statement loads every relationship JobAdResponse reads, so it runs the same
+    queries on a sync Session as on an AsyncSession, which cannot lazy load.
+
+    Args:
+        search_params (JobAdSearchParams): The parameters to filter job advertisements.
+        filter_params (FilterParams): The offset and limit, or cursor, of the page.
+        keyset (Keyset): The keyset returned by _keyset for the same parameters.
+
+    Returns:
+        Select: The statement selecting the page of job advertisements.
+    """
+    statement = _apply_search_params(
+        job_ads=select(JobAd), search_params=search_params
+    ).options(*JOB_AD_RESPONSE_OPTIONS)
+    return keyset.apply(query=statement, filter_params=filter_params)
 
 
 def _search_job_ads(search_params: JobAdSearchParams, db: Session) -> Query[JobAd]:
@@ -202,8 +401,41 @@ def _search_job_ads(search_params: JobAdSearchParams, db: Session) -> Query[JobA
     Returns:
         list[JobAd]: A list of job advertisements that match the search criteria.
     """
-    job_ads = db.query(JobAd)
+    return _apply_search_params(job_ads=db.query(JobAd), search_params=search_params)
+
+
+def _apply_search_params(
+    job_ads: JobAdsQuery,
+    search_params: JobAdSearchParams,
+) -> JobAdsQuery:
+    """
+    Applies the search parameters to a query or statement selecting job advertisements.
+
+    Args:
+        job_ads (JobAdsQuery): The Query or Select of job advertisements to narrow down.
+        search_params (JobAdSearchParams): The parameters to filter job advertisements.
+
+    Returns:
+        JobAdsQuery: The filtered and ordered Query or Select.
+    """
+    job_ads = _filter_job_ads(job_ads=job_ads, search_params=search_params)
+    return _order_by(job_ads=job_ads, search_params=search_params)
+
 
+def _filter_job_ads(
+    job_ads: JobAdsQuery,
+    search_params: JobAdSearchParams,
+) -> JobAdsQuery:
+    """
+    Applies the search filters, but not the ordering, to a query or statement.
+
+    Args:
+        job_ads (JobAdsQuery): The Query or Select of job advertisements to narrow down.
+        search_params (JobAdSearchParams): The parameters to filter job advertisements.
+
+    Returns:
+        JobAdsQuery: The filtered Query or Select.
+    """
     if search_params.company_id:
         job_ads = job_ads.filter(JobAd.company_id == search_params.company_id)
         logger.info(
@@ -214,6 +446,12 @@ def _search_job_ads(search_params: JobAdSearchParams, db: Session) -> Query[JobA
         job_ads = job_ads.filter(JobAd.title.ilike(f"%{search_params.title}%"))
         logger.info(f"Searching for job ads with title: {search_params.title}")
 
+    if search_params.query:
+        job_ads = job_ads.filter(
+            JobAd.search_vector.bool_op("@@")(_text_search_query(search_params.query))
+        )
+        logger.info(f"Searching for job ads matching query: {search_params.query}")
+
     if search_params.location_id:
         job_ads = job_ads.filter(JobAd.location_id == search_params.location_id)
         logger.info(
@@ -225,25 +463,115 @@ def _search_job_ads(search_params: JobAdSearchParams, db: Session) -> Query[JobA
         logger.info(f"Searching for job ads with status: {search_params.job_ad_status}")
 
     job_ads = _filter_by_salary(job_ads=job_ads, search_params=search_params)
-    job_ads = _filter_by_skills(job_ads=job_ads, search_params=search_params, db=db)
-    job_ads = _order_by(job_ads=job_ads, search_params=search_params)
+    job_ads = _filter_by_skills(job_ads=job_ads, search_params=search_params)
 
     return job_ads
 
 
+def _facets_statement(search_params: JobAdSearchParams) -> Select:
+    """
+    Builds the statement counting the job ads matching a search per facet value.
+
+    Each facet is one grouping set over the same filtered job ads, and the empty
+    grouping set gives the total, so all counts come back from a single query. The
+    grouped columns are not nullable, so the NULLs in a row tell which grouping set
+    it belongs to.
+
+    Args:
+        search_params (JobAdSearchParams): The parameters to filter job advertisements.
+
+    Returns:
+        Select: The statement returning location_id, category_id, skill_level,
+            salary_bucket and count rows.
+    """
+    salary_bucket = (
+        func.floor(JobAd.min_salary / SALARY_BUCKET_SIZE) * SALARY_BUCKET_SIZE
+    )
+    filtered = _filter_job_ads(
+        job_ads=select(
+            JobAd.location_id,
+            JobAd.category_id,
+            JobAd.skill_level,
+            salary_bucket.label("salary_bucket"),
+        ),
+        search_params=search_params,
+    ).subquery("filtered_job_ads")
+    facets = (
+        filtered.c.location_id,
+        filtered.c.category_id,
+        filtered.c.skill_level,
+        filtered.c.salary_bucket,
+    )
+    count = func.count().label("count")
+
+    return (
+        select(*facets, count)
+        .group_by(func.grouping_sets(*(tuple_(facet) for facet in facets), tuple_()))
+        .order_by(desc(count))
+    )
+
+
+def _create_search_page(
+    page: list[JobAdResponse] | CursorPage[JobAdResponse],
+    facet_rows: list[Row],
+) -> JobAdSearchPage:
+    """
+    Combines a page of job ads with the rows returned by the facets statement.
+
+    Args:
+        page (list[JobAdResponse] | CursorPage[JobAdResponse]): The page of job ads.
+        facet_rows (list[Row]): The rows returned by _facets_statement.
+
+    Returns:
+        JobAdSearchPage: The page with the total and facet counts.
+    """
+    if isinstance(page, CursorPage):
+        items, next_cursor = page.items, page.next_cursor
+    else:
+        items, next_cursor = page, None
+
+    total = 0
+    facets = JobAdFacets()
+    for row in facet_rows:
+        if row.location_id is not None:
+            facets.cities.append(FacetCount(value=row.location_id, count=row.count))
+        elif row.category_id is not None:
+            facets.categories.append(FacetCount(value=row.category_id, count=row.count))
+        elif row.skill_level is not None:
+            facets.skill_levels.append(
+                FacetCount(value=row.skill_level, count=row.count)
+            )
+        elif row.salary_bucket is not None:
+            facets.salary_buckets.append(
+                SalaryBucketCount(
+                    min_salary=row.salary_bucket,
+                    max_salary=row.salary_bucket + SALARY_BUCKET_SIZE,
+                    count=row.count,
+                )
+            )
+        else:
+            total = row.count
+    facets.salary_buckets.sort(key=lambda bucket: bucket.min_salary)
+    logger.info(f"Counted {total} job ads matching the search")
+
+    return JobAdSearchPage(
+        items=items, next_cursor=next_cursor, total=total, facets=facets
+    )
+
+
 def _filter_by_salary(
-    job_ads: Query[JobAd],
+    job_ads: JobAdsQuery,
     search_params: JobAdSearchParams,
-) -> Query[JobAd]:
+) -> JobAdsQuery:
     """
     Filters job advertisements by salary range.
 
     Args:
-        job_ads (Query[JobAd]): The query object containing the job advertisements.
+        job_ads (JobAdsQuery): The query object containing the job advertisements.
         search_params (JobAdSearchParams): The search parameters to filter the job advertisements.
 
     Returns:
-        Query[JobAd]: The filtered query object containing the job advertisements.
+        JobAdsQuery: The filtered query object containing the job advertisements.
     """
     min_salary = search_params.min_salary or 0
     max_salary = search_params.max_salary or float("inf")
@@ -266,20 +594,18 @@ def _filter_by_salary(
 
 
 def _filter_by_skills(
-    job_ads: Query[JobAd],
+    job_ads: JobAdsQuery,
     search_params: JobAdSearchParams,
-    db: Session,
-) -> Query[JobAd]:
+) -> JobAdsQuery:
     """
     Filters job advertisements based on the provided skills in the search parameters.
 
     Args:
-        job_ads (Query[JobAd]): The initial query of job advertisements.
+        job_ads (JobAdsQuery): The initial query of job advertisements.
         search_params (JobAdSearchParams): The search parameters containing the skills and threshold.
-        db (Session): The database session.
 
     Returns:
-        Query[JobAd]: The filtered query of job advertisements.
+        JobAdsQuery: The filtered query of job advertisements.
 
     Notes:
         - If the number of skills in the search parameters is equal to the threshold, skill filtering is skipped.
@@ -296,23 +622,12 @@ def _filter_by_skills(
             )
             return job_ads
 
-        skill_alias = aliased(Skill)
-
-        skill_match_count = (
-            db.query(JobAd.id.label("job_ad_id"))
-            .join(JobAd.skills)
-            .filter(
-                func.lower(skill_alias.name).in_(
-                    [skill.lower() for skill in search_params.skills]
-                )
+        job_ads = job_ads.filter(
+            filter_by_skill_ids(
+                skill_ids=JobAd.skill_ids,
+                skill_names=search_params.skills,
+                required_matches=required_matches,
             )
-            .group_by(JobAd.id)
-            .having(func.count(func.distinct(skill_alias.id)) >= required_matches)
-            .subquery()
-        )
-
-        job_ads = job_ads.join(
-            skill_match_count, JobAd.id == skill_match_count.c.job_ad_id
         )
         logger.info(
             f"Searching for job ads with at least {required_matches} skills from the provided skill list: {search_params.skills}"
@@ -322,31 +637,55 @@ def _filter_by_skills(
 
 
 def _order_by(
-    job_ads: Query[JobAd],
+    job_ads: JobAdsQuery,
     search_params: JobAdSearchParams,
-) -> Query[JobAd]:
+) -> JobAdsQuery:
     """
     Orders job advertisements based on the provided search parameters.
 
+    Ordering by relevance ranks the job ads by how well they match the free-text
+    query and falls back to created_at when no query is given. Ties are broken by
+    id so that offset pages are stable.
+
     Args:
-        job_ads (Query[JobAd]): The query object containing the job advertisements.
+        job_ads (JobAdsQuery): The query object containing the job advertisements.
         search_params (JobAdSearchParams): The search parameters to order the job advertisements.
 
     Returns:
-        Query[JobAd]: The ordered query object containing the job advertisements.
+        JobAdsQuery: The ordered query object containing the job advertisements.
     """
-    order_by_column = getattr(JobAd, search_params.order_by, None)
+    if search_params.order_by == "relevance" and search_params.query:
+        order_by_column = func.ts_rank(
+            JobAd.search_vector, _text_search_query(search_params.query)
+        )
+    elif search_params.order_by == "relevance":
+        order_by_column = JobAd.created_at
+    else:
+        order_by_column = getattr(JobAd, search_params.order_by, None)
 
     if order_by_column is not None:
         if search_params.order == "asc":
-            job_ads = job_ads.order_by(asc(order_by_column))
+            job_ads = job_ads.order_by(asc(order_by_column), asc(JobAd.id))
             logger.info(
                 f"Ordering job ads by {search_params.order_by} in ascending order"
             )
         else:
-            job_ads = job_ads.order_by(desc(order_by_column))
+            job_ads = job_ads.order_by(desc(order_by_column), desc(JobAd.id))
             logger.info(
                 f"Ordering job ads by {search_params.order_by} in descending order"
             )
 
     return job_ads
+
+
+def _text_search_query(query: str):
+    """
+    Builds the full-text search query matched against JobAd.search_vector.
+
+    Args:
+        query (str): The user's query in web search syntax.
+
+    Returns:
+        The websearch_to_tsquery() expression for the query.
+    """
+    return func.websearch_to_tsquery(literal(SEARCH_CONFIG, REGCONFIG), query)
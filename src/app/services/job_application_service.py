@@ -2,25 +2,33 @@ import logging
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy.orm import Session
-
-from app.schemas.common import FilterParams, SearchJobApplication, SearchParams
+from sqlalchemy.orm import Query, Session
+
+from app.schemas.common import (
+    BatchLookupResult,
+    CursorPage,
+    FilterParams,
+    SearchJobApplication,
+    SearchParams,
+)
 from app.schemas.job_application import (
     JobApplicationCreate,
     JobApplicationResponse,
     JobApplicationUpdate,
 )
-from app.schemas.skill import SkillBase
 from app.services.common import (
+    JOB_APPLICATION_RESPONSE_OPTIONS,
+    create_batch_lookup_result,
+    filter_by_skill_ids,
     get_job_application_by_id,
     get_professional_by_id,
-    get_skill_by_name,
+    get_skill_ids_by_names,
+    insert_skill_links,
 )
 from app.sql_app.job_application.job_application import JobApplication
 from app.sql_app.job_application.job_application_status import JobStatus
 from app.sql_app.job_application_skill.job_application_skill import JobApplicationSkill
-from app.sql_app.professional.professional import Professional
-from app.sql_app.skill.skill import Skill
+from app.utils.pagination import Keyset
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +37,7 @@ def get_all(
     filter_params: FilterParams,
     search_params: SearchJobApplication,
     db: Session,
-) -> list[JobApplicationResponse]:
+) -> list[JobApplicationResponse] | CursorPage[JobApplicationResponse]:
     """
     Retrieve all Job Applications that match the filtering parameters and keywords.
 
@@ -38,49 +46,29 @@ def get_all(
         search_params (SearchJobApplication): Pydantic schema for search params.
         db (Session): The database session.
     Returns:
-        list[JobApplicationResponse]: A list of Job Applications that are visible for Companies.
+        list[JobApplicationResponse] | CursorPage[JobApplicationResponse]: A list of Job Applications that are visible for Companies, wrapped in a CursorPage when paginating by cursor.
     """
-    job_applications_query = (
-        db.query(JobApplication)
-        .join(Professional, JobApplication.professional_id == Professional.id)
-        .filter(
-            JobApplication.status == JobStatus.ACTIVE,
-        )
+    keyset = Keyset(
+        name=f"job_application:{search_params.order_by}:{search_params.order}",
+        columns=(getattr(JobApplication, search_params.order_by), JobApplication.id),
+        order=search_params.order,
     )
-
-    if search_params.skills:
-        job_applications_query = (
-            job_applications_query.join(JobApplicationSkill)
-            .join(Skill)
-            .filter(Skill.name.in_(search_params.skills))
-        )
-        logger.info("Filtered job applications by skills.")
-
-    if search_params.order == "desc":
-        job_applications_query.order_by(
-            getattr(JobApplication, search_params.order_by).desc()
-        )
-    else:
-        job_applications_query.order_by(
-            getattr(JobApplication, search_params.order_by).asc()
-        )
-    logger.info(
-        f"Order job applications based on search params order {search_params.order} and order_by {search_params.order_by}"
+    job_applications_query = _search_job_applications(
+        search_params=search_params, db=db
     )
-
-    job_applications = (
-        job_applications_query.offset(filter_params.offset)
-        .limit(filter_params.limit)
-        .all()
+    job_applications = keyset.apply(
+        query=job_applications_query, filter_params=filter_params
+    ).all()
+    logger.info(f"Retrieved {len(job_applications)} job applications")
+
+    return keyset.page(
+        rows=job_applications,
+        filter_params=filter_params,
+        create_items=lambda rows: [
+            JobApplicationResponse.create(job_application) for job_application in rows
+        ],
     )
 
-    logger.info("Limited job applications based on offset and limit")
-
-    return [
-        JobApplicationResponse.create(job_application)
-        for job_application in job_applications
-    ]
-
 
 def get_by_id(job_application_id: UUID, db: Session) -> JobApplicationResponse:
     """
@@ -101,6 +89,39 @@ def get_by_id(job_application_id: UUID, db: Session) -> JobApplicationResponse:
     return JobApplicationResponse.create(job_application)
 
 
+def get_many(
+    job_application_ids: list[UUID], db: Session
+) -> BatchLookupResult[JobApplicationResponse]:
+    """
+    Fetches several Job Applications by their IDs with one query.
+
+    Args:
+        job_application_ids (list[UUID]): The identifiers of the Job applications.
+        db (Session): Database dependency.
+
+    Returns:
+        BatchLookupResult[JobApplicationResponse]: The Job applications in the order
+            of the ids, with None and a not_found entry for every unknown id.
+    """
+    job_applications = (
+        db.query(JobApplication)
+        .options(*JOB_APPLICATION_RESPONSE_OPTIONS)
+        .filter(JobApplication.id.in_(set(job_application_ids)))
+        .all()
+    )
+    logger.info(
+        f"Retrieved {len(job_applications)} of {len(job_application_ids)} requested job applications"
+    )
+
+    return create_batch_lookup_result(
+        ids=job_application_ids,
+        items={
+            job_application.id: JobApplicationResponse.create(job_application)
+            for job_application in job_applications
+        },
+    )
+
+
 def create(
     job_application_create: JobApplicationCreate,
     db: Session,
@@ -117,20 +138,20 @@ def create(
     professional = get_professional_by_id(
         professional_id=job_application_create.professional_id, db=db
     )
+    skill_ids = get_skill_ids_by_names(
+        skill_names=[skill.name for skill in job_application_create.skills], db=db
+    )
     job_application = JobApplication(
         **job_application_create.model_dump(exclude={"skills", "status"}),
         status=job_application_create.status.name,
     )
 
-    _add_skills(
-        job_application=job_application,
-        skills=job_application_create.skills,
-        db=db,
-    )
-
     professional.active_application_count += 1
 
     db.add(job_application)
+    # The job application id is generated by the database and needed for the links.
+    db.flush()
+    _add_skills(job_application=job_application, skill_ids=skill_ids, db=db)
     db.commit()
     db.refresh(job_application)
 
@@ -189,18 +210,173 @@ def update(
 
 def _add_skills(
     job_application: JobApplication,
-    skills: list[SkillBase],
+    skill_ids: list[UUID],
     db: Session,
-) -> None:
+) -> list[UUID]:
     """
-    Adds a list of skills to a job application.
+    Adds skills to a persisted job application with a single INSERT.
 
     Args:
         job_application (JobApplication): The job application to which the skills will be added.
-        skills (list[SkillBase]): A list of skills to be added to the job application.
-        db (Session): The database session used for querying and adding skills.
+        skill_ids (list[UUID]): The ids of the skills to be added.
+        db (Session): The database session used for adding skills.
+
+    Returns:
+        list[UUID]: The ids of the skills the job application did not have yet.
+    """
+    added = insert_skill_links(
+        link_model=JobApplicationSkill,
+        owner_id=job_application.id,
+        skill_ids=skill_ids,
+        db=db,
+    )
+    logger.info(f"Added {len(added)} skills to job application {job_application.id}")
+
+    return added
+
+
+def _search_job_applications(
+    search_params: SearchJobApplication,
+    db: Session,
+) -> Query[JobApplication]:
+    """
+    Builds the query of the active Job Applications matching the search parameters.
+
+    Args:
+        search_params (SearchJobApplication): The parameters to filter Job Applications.
+        db (Session): The database session.
+
+    Returns:
+        Query[JobApplication]: The filtered and ordered query.
+    """
+    job_applications = (
+        db.query(JobApplication)
+        .options(*JOB_APPLICATION_RESPONSE_OPTIONS)
+        .filter(JobApplication.status == JobStatus.ACTIVE)
+    )
+
+    if search_params.city_id:
+        job_applications = job_applications.filter(
+            JobApplication.city_id == search_params.city_id
+        )
+        logger.info(
+            f"Searching for job applications with city_id: {search_params.city_id}"
+        )
+
+    job_applications = _filter_by_salary(
+        job_applications=job_applications, search_params=search_params
+    )
+    job_applications = _filter_by_skills(
+        job_applications=job_applications, search_params=search_params
+    )
+
+    return _order_by(job_applications=job_applications, search_params=search_params)
+
+
+def _filter_by_salary(
+    job_applications: Query[JobApplication],
+    search_params: SearchJobApplication,
+) -> Query[JobApplication]:
+    """
+    Filters Job Applications whose salary range, widened by the salary threshold,
+    overlaps the requested range.
+
+    Job Applications without a salary range only match when no range is requested.
+
+    Args:
+        job_applications (Query[JobApplication]): The query of Job Applications.
+        search_params (SearchJobApplication): The search parameters with the range.
+
+    Returns:
+        Query[JobApplication]: The filtered query.
+    """
+    threshold = search_params.salary_threshold
+
+    if search_params.max_salary is not None:
+        job_applications = job_applications.filter(
+            (JobApplication.min_salary - threshold) <= search_params.max_salary
+        )
+        logger.info(
+            f"Filtering job applications with max_salary: {search_params.max_salary}"
+        )
+
+    if search_params.min_salary is not None:
+        job_applications = job_applications.filter(
+            (JobApplication.max_salary + threshold) >= search_params.min_salary
+        )
+        logger.info(
+            f"Filtering job applications with min_salary: {search_params.min_salary}"
+        )
+
+    return job_applications
+
+
+def _filter_by_skills(
+    job_applications: Query[JobApplication],
+    search_params: SearchJobApplication,
+) -> Query[JobApplication]:
     """
-    for skill in skills:
-        skill_model = get_skill_by_name(skill_name=skill.name, db=db)
-        job_application.skills.append(skill_model)
-        logger.info(f"Added skill {skill.name} to job application {job_application.id}")
+    Filters Job Applications that have enough of the requested skills.
+
+    The skills are matched against the skill_ids array of each Job Application, so
+    every application appears at most once however many skills it matches.
+
+    Args:
+        job_applications (Query[JobApplication]): The query of Job Applications.
+        search_params (SearchJobApplication): The search parameters containing the
+            skills and the number of them that may be missing.
+
+    Returns:
+        Query[JobApplication]: The filtered query.
+    """
+    if not search_params.skills:
+        return job_applications
+
+    num_skills = len(search_params.skills)
+    required_matches = max(num_skills - search_params.skills_threshold, 0)
+    if required_matches == 0:
+        logger.info(
+            f"Threshold equals to the number of skills({num_skills}), skipping skill filtering."
+        )
+        return job_applications
+
+    job_applications = job_applications.filter(
+        filter_by_skill_ids(
+            skill_ids=JobApplication.skill_ids,
+            skill_names=search_params.skills,
+            required_matches=required_matches,
+        )
+    )
+    logger.info(
+        f"Searching for job applications with at least {required_matches} skills from the provided skill list: {search_params.skills}"
+    )
+
+    return job_applications
+
+
+def _order_by(
+    job_applications: Query[JobApplication],
+    search_params: SearchJobApplication,
+) -> Query[JobApplication]:
+    """
+    Orders Job Applications by the requested column, breaking ties by id so that
+    offset pages are stable.
+
+    Args:
+        job_applications (Query[JobApplication]): The query of Job Applications.
+        search_params (SearchJobApplication): The search parameters with the order.
+
+    Returns:
+        Query[JobApplication]: The ordered query.
+    """
+    columns = (getattr(JobApplication, search_params.order_by), JobApplication.id)
+    logger.info(
+        f"Order job applications based on search params order {search_params.order} and order_by {search_params.order_by}"
+    )
+
+    return job_applications.order_by(
+        *(
+            column.desc() if search_params.order == "desc" else column.asc()
+            for column in columns
+        )
+    )
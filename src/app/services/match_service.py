@@ -1,10 +1,12 @@
 import logging
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import and_
+from sqlalchemy import Row, Select, and_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.schemas.common import FilterParams, MessageResponse
+from app.schemas.common import CursorPage, FilterParams, MessageResponse
 from app.schemas.match import (
     MatchRequestAd,
     MatchRequestApplication,
@@ -13,16 +15,47 @@ from app.schemas.match import (
     MatchResponse,
 )
 from app.services.common import get_match_by_id
-from app.sql_app import Match
+from app.sql_app import Company, Match, Professional
 from app.sql_app.job_ad.job_ad import JobAd
 from app.sql_app.job_ad.job_ad_status import JobAdStatus
 from app.sql_app.job_application.job_application import JobApplication
 from app.sql_app.job_application.job_application_status import JobStatus
 from app.sql_app.match.match_status import MatchStatus
 from app.sql_app.professional.professional_status import ProfessionalStatus
+from app.utils.pagination import Keyset
 
 logger = logging.getLogger(__name__)
 
+MATCH_REQUESTS_KEYSET = Keyset(
+    name="match_request",
+    columns=(Match.created_at, Match.job_ad_id, Match.job_application_id),
+    order="desc",
+)
+
+# Columns read by MatchResponse.create_from_row and the create_from_row of its
+# subclasses. Match.created_at is selected for the cursor of MATCH_REQUESTS_KEYSET.
+MATCH_RESPONSE_COLUMNS = (Match.job_ad_id, Match.job_application_id, Match.status)
+MATCH_REQUEST_COLUMNS = (*MATCH_RESPONSE_COLUMNS, Match.created_at)
+MATCH_REQUEST_AD_COLUMNS = (
+    *MATCH_REQUEST_COLUMNS,
+    JobAd.title,
+    JobAd.description,
+    JobAd.company_id,
+    Company.name.label("company_name"),
+    JobAd.min_salary,
+    JobAd.max_salary,
+)
+MATCH_REQUEST_APPLICATION_COLUMNS = (
+    *MATCH_REQUEST_COLUMNS,
+    JobApplication.name,
+    JobApplication.description,
+    JobApplication.professional_id,
+    Professional.first_name.label("professional_first_name"),
+    Professional.last_name.label("professional_last_name"),
+    JobApplication.min_salary,
+    JobApplication.max_salary,
+)
+
 
 def create(
     match_request_data: MatchRequestCreate,
@@ -144,6 +177,8 @@ def accept_match_request(
     professional.status = ProfessionalStatus.BUSY
     job_application.status = JobStatus.MATCHED
     job_ad.status = JobAdStatus.ARCHIVED
+    job_application.updated_at = datetime.now()
+    job_ad.updated_at = datetime.now()
 
     professional.active_application_count -= 1
     company.successfull_matches_count += 1
@@ -160,7 +195,7 @@ def get_match_requests_for_job_application(
     job_application_id: UUID,
     filter_params: FilterParams,
     db: Session,
-) -> list[MatchRequestAd]:
+) -> list[MatchRequestAd] | CursorPage[MatchRequestAd]:
     """
     Retrieve match requests for a job advertisement.
 
@@ -169,26 +204,23 @@ def get_match_requests_for_job_application(
         db (Session): The database session.
 
     Returns:
-        list[MatchResponse]: A list of match requests for the job advertisement.
+        list[MatchResponse] | CursorPage[MatchRequestAd]: A list of match requests for the job advertisement, wrapped in a CursorPage when paginating by cursor.
     """
-    requests = (
-        db.query(Match, JobAd)
-        .join(JobAd, Match.job_ad_id == JobAd.id)
-        .filter(
-            and_(
-                Match.job_application_id == job_application_id,
-                Match.status == MatchStatus.REQUESTED_BY_JOB_AD,
-            )
+    requests_query = _select_match_requests_ad().filter(
+        and_(
+            Match.job_application_id == job_application_id,
+            Match.status == MatchStatus.REQUESTED_BY_JOB_AD,
         )
-        .offset(filter_params.offset)
-        .limit(filter_params.limit)
-        .all()
     )
-
-    return [
-        MatchRequestAd.create_response(match=match, job_ad=job_ad)
-        for (match, job_ad) in requests
-    ]
+    requests = db.execute(
+        MATCH_REQUESTS_KEYSET.apply(query=requests_query, filter_params=filter_params)
+    ).all()
+
+    return MATCH_REQUESTS_KEYSET.page(
+        rows=requests,
+        filter_params=filter_params,
+        create_items=_create_match_requests_ad,
+    )
 
 
 def get_match_requests_for_professional(
@@ -206,23 +238,14 @@ def get_match_requests_for_professional(
         list[MatchRequestAd]: A list of MatchRequestAd objects representing
         the match requests for the professional.
     """
-    result = (
-        db.query(Match, JobAd)
-        .join(JobApplication, Match.job_application_id == JobApplication.id)
-        .join(JobAd, Match.job_ad_id == JobAd.id)
-        .filter(
-            and_(
-                JobApplication.professional_id == professional_id,
-                JobApplication.status == JobStatus.ACTIVE,
-                Match.status == MatchStatus.REQUESTED_BY_JOB_AD,
-            )
+    result = db.execute(
+        _select_professional_match_requests(
+            professional_id=professional_id,
+            match_status=MatchStatus.REQUESTED_BY_JOB_AD,
         )
-        .all()
-    )
+    ).all()
 
-    return [
-        MatchRequestAd.create_response(match=match, job_ad=ad) for (match, ad) in result
-    ]
+    return _create_match_requests_ad(result)
 
 
 def get_sent_match_requests_for_professional(
@@ -239,30 +262,21 @@ def get_sent_match_requests_for_professional(
         list[MatchRequestAd]: Response models containing basic information for the Job Ads that sent the match request.
     """
 
-    result = (
-        db.query(Match, JobAd)
-        .join(JobApplication, Match.job_application_id == JobApplication.id)
-        .join(JobAd, Match.job_ad_id == JobAd.id)
-        .filter(
-            and_(
-                JobApplication.professional_id == professional_id,
-                JobApplication.status == JobStatus.ACTIVE,
-                Match.status == MatchStatus.REQUESTED_BY_JOB_APP,
-            )
+    result = db.execute(
+        _select_professional_match_requests(
+            professional_id=professional_id,
+            match_status=MatchStatus.REQUESTED_BY_JOB_APP,
         )
-        .all()
-    )
+    ).all()
 
-    return [
-        MatchRequestAd.create_response(match=match, job_ad=ad) for (match, ad) in result
-    ]
+    return _create_match_requests_ad(result)
 
 
 def get_match_requests_for_company(
     company_id: UUID,
     filter_params: FilterParams,
     db: Session,
-) -> list[MatchRequestApplication]:
+) -> list[MatchRequestApplication] | CursorPage[MatchRequestApplication]:
     """
     Retrieve match requests for a given company.
 
@@ -272,30 +286,26 @@ def get_match_requests_for_company(
         db (Session): The database session used for querying.
 
     Returns:
-        list[MatchRequestApplication]: A list of MatchRequestApplication objects representing
-        the match requests for the company.
+        list[MatchRequestApplication] | CursorPage[MatchRequestApplication]: A list of MatchRequestApplication objects representing
+        the match requests for the company, wrapped in a CursorPage when paginating by cursor.
     """
-    requests = (
-        db.query(Match, JobApplication)
-        .join(Match.job_application)
-        .join(Match.job_ad)
-        .filter(
-            and_(
-                JobAd.company_id == company_id,
-                Match.status == MatchStatus.REQUESTED_BY_JOB_APP,
-            )
+    requests_query = _select_match_requests_application().filter(
+        and_(
+            JobAd.company_id == company_id,
+            Match.status == MatchStatus.REQUESTED_BY_JOB_APP,
         )
-        .offset(filter_params.offset)
-        .limit(filter_params.limit)
-        .all()
     )
+    requests = db.execute(
+        MATCH_REQUESTS_KEYSET.apply(query=requests_query, filter_params=filter_params)
+    ).all()
 
     logger.info(f"Retrieved {len(requests)} requests for company with id {company_id}")
 
-    return [
-        MatchRequestApplication.create_response(match, job_application)
-        for (match, job_application) in requests
-    ]
+    return MATCH_REQUESTS_KEYSET.page(
+        rows=requests,
+        filter_params=filter_params,
+        create_items=_create_match_requests_application,
+    )
 
 
 def get_job_ad_received_matches(
@@ -313,19 +323,14 @@ def get_job_ad_received_matches(
         list[MatchResponse]: A list of MatchResponse objects representing
         the match requests for the job advertisement
     """
-    requests = requests = (
-        db.query(Match)
-        .join(Match.job_ad)
-        .filter(
-            and_(
-                JobAd.id == job_ad_id, Match.status == MatchStatus.REQUESTED_BY_JOB_APP
-            )
+    requests = db.execute(
+        _select_job_ad_matches(
+            job_ad_id=job_ad_id, match_status=MatchStatus.REQUESTED_BY_JOB_APP
         )
-        .all()
-    )
+    ).all()
     logger.info(f"Retrieved {len(requests)} requests for job ad with id {job_ad_id}")
 
-    return [MatchResponse.create(request) for request in requests]
+    return [MatchResponse.create_from_row(request) for request in requests]
 
 
 def get_job_ad_sent_matches(
@@ -343,19 +348,302 @@ def get_job_ad_sent_matches(
         list[MatchResponse]: A list of MatchResponse objects representing
         the match requests sent by the job advertisement
     """
+    requests = db.execute(
+        _select_job_ad_matches(
+            job_ad_id=job_ad_id, match_status=MatchStatus.REQUESTED_BY_JOB_AD
+        )
+    ).all()
+
+    logger.info(
+        f"Retrieved {len(requests)} sent requests for job ad with id {job_ad_id}"
+    )
+
+    return [MatchResponse.create_from_row(request) for request in requests]
+
+
+async def get_match_requests_for_job_application_async(
+    job_application_id: UUID,
+    filter_params: FilterParams,
+    db: AsyncSession,
+) -> list[MatchRequestAd] | CursorPage[MatchRequestAd]:
+    """
+    Retrieve match requests for a job application using an asynchronous session.
+
+    Args:
+        job_application_id (UUID): The ID of the job application.
+        filter_params (FilterParams): The filter parameters to apply to the query.
+        db (AsyncSession): The asynchronous database session.
+
+    Returns:
+        list[MatchRequestAd] | CursorPage[MatchRequestAd]: A list of match requests for the job application, wrapped in a CursorPage when paginating by cursor.
+    """
     requests = (
-        db.query(Match)
-        .filter(
-            and_(
-                Match.job_ad_id == job_ad_id,
-                Match.status == MatchStatus.REQUESTED_BY_JOB_AD,
+        await db.execute(
+            MATCH_REQUESTS_KEYSET.apply(
+                query=_select_match_requests_ad().filter(
+                    and_(
+                        Match.job_application_id == job_application_id,
+                        Match.status == MatchStatus.REQUESTED_BY_JOB_AD,
+                    )
+                ),
+                filter_params=filter_params,
             )
         )
-        .all()
+    ).all()
+
+    return MATCH_REQUESTS_KEYSET.page(
+        rows=requests,
+        filter_params=filter_params,
+        create_items=_create_match_requests_ad,
+    )
+
+
+async def get_match_requests_for_professional_async(
+    professional_id: UUID,
+    db: AsyncSession,
+) -> list[MatchRequestAd]:
+    """
+    Retrieve match requests for a given professional using an asynchronous session.
+
+    Args:
+        professional_id (UUID): The unique identifier of the professional.
+        db (AsyncSession): The asynchronous database session.
+
+    Returns:
+        list[MatchRequestAd]: A list of MatchRequestAd objects representing
+        the match requests for the professional.
+    """
+    return await _get_professional_match_requests_async(
+        professional_id=professional_id,
+        match_status=MatchStatus.REQUESTED_BY_JOB_AD,
+        db=db,
+    )
+
+
+async def get_sent_match_requests_for_professional_async(
+    professional_id: UUID,
+    db: AsyncSession,
+) -> list[MatchRequestAd]:
+    """
+    Fetch match requests sent by the given Professional using an asynchronous session.
+
+    Args:
+        professional_id (UUID): The identifier of the Professional.
+        db (AsyncSession): The asynchronous database session.
+
+    Returns:
+        list[MatchRequestAd]: Response models containing basic information for the Job Ads that sent the match request.
+    """
+    return await _get_professional_match_requests_async(
+        professional_id=professional_id,
+        match_status=MatchStatus.REQUESTED_BY_JOB_APP,
+        db=db,
     )
 
+
+async def get_match_requests_for_company_async(
+    company_id: UUID,
+    filter_params: FilterParams,
+    db: AsyncSession,
+) -> list[MatchRequestApplication] | CursorPage[MatchRequestApplication]:
+    """
+    Retrieve match requests for a given company using an asynchronous session.
+
+    Args:
+        company_id (UUID): The unique identifier of the company.
+        filter_params (FilterParams): The filter parameters to apply to the query.
+        db (AsyncSession): The asynchronous database session.
+
+    Returns:
+        list[MatchRequestApplication] | CursorPage[MatchRequestApplication]: A list of MatchRequestApplication objects representing
+        the match requests for the company, wrapped in a CursorPage when paginating by cursor.
+    """
+    requests = (
+        await db.execute(
+            MATCH_REQUESTS_KEYSET.apply(
+                query=_select_match_requests_application().filter(
+                    and_(
+                        JobAd.company_id == company_id,
+                        Match.status == MatchStatus.REQUESTED_BY_JOB_APP,
+                    )
+                ),
+                filter_params=filter_params,
+            )
+        )
+    ).all()
+
+    logger.info(f"Retrieved {len(requests)} requests for company with id {company_id}")
+
+    return MATCH_REQUESTS_KEYSET.page(
+        rows=requests,
+        filter_params=filter_params,
+        create_items=_create_match_requests_application,
+    )
+
+
+async def get_job_ad_received_matches_async(
+    job_ad_id: UUID,
+    db: AsyncSession,
+) -> list[MatchResponse]:
+    """
+    Retrieve match requests for a given job advertisement using an asynchronous session.
+
+    Args:
+        job_ad_id (UUID): The unique identifier of the job advertisement.
+        db (AsyncSession): The asynchronous database session.
+
+    Returns:
+        list[MatchResponse]: A list of MatchResponse objects representing
+        the match requests for the job advertisement
+    """
+    requests = (
+        await db.execute(
+            _select_job_ad_matches(
+                job_ad_id=job_ad_id, match_status=MatchStatus.REQUESTED_BY_JOB_APP
+            )
+        )
+    ).all()
+    logger.info(f"Retrieved {len(requests)} requests for job ad with id {job_ad_id}")
+
+    return [MatchResponse.create_from_row(request) for request in requests]
+
+
+async def get_job_ad_sent_matches_async(
+    job_ad_id: UUID,
+    db: AsyncSession,
+) -> list[MatchResponse]:
+    """
+    Retrieve match requests sent by a given job advertisement using an asynchronous session.
+
+    Args:
+        job_ad_id (UUID): The unique identifier of the job advertisement.
+        db (AsyncSession): The asynchronous database session.
+
+    Returns:
+        list[MatchResponse]: A list of MatchResponse objects representing
+        the match requests sent by the job advertisement
+    """
+    requests = (
+        await db.execute(
+            _select_job_ad_matches(
+                job_ad_id=job_ad_id, match_status=MatchStatus.REQUESTED_BY_JOB_AD
+            )
+        )
+    ).all()
+
     logger.info(
         f"Retrieved {len(requests)} sent requests for job ad with id {job_ad_id}"
     )
 
-    return [MatchResponse.create(request) for request in requests]
+    return [MatchResponse.create_from_row(request) for request in requests]
+
+
+async def _get_professional_match_requests_async(
+    professional_id: UUID,
+    match_status: MatchStatus,
+    db: AsyncSession,
+) -> list[MatchRequestAd]:
+    """
+    Retrieve the match requests with the given status on a professional's active applications.
+
+    Args:
+        professional_id (UUID): The unique identifier of the professional.
+        match_status (MatchStatus): The status of the match requests to retrieve.
+        db (AsyncSession): The asynchronous database session.
+
+    Returns:
+        list[MatchRequestAd]: A list of MatchRequestAd objects.
+    """
+    result = (
+        await db.execute(
+            _select_professional_match_requests(
+                professional_id=professional_id, match_status=match_status
+            )
+        )
+    ).all()
+
+    return _create_match_requests_ad(result)
+
+
+def _select_job_ad_matches(job_ad_id: UUID, match_status: MatchStatus) -> Select:
+    """
+    Build the query for the matches with the given status on a job advertisement.
+
+    Args:
+        job_ad_id (UUID): The unique identifier of the job advertisement.
+        match_status (MatchStatus): The status of the matches to retrieve.
+
+    Returns:
+        Select: The query, yielding rows with the MATCH_RESPONSE_COLUMNS.
+    """
+    return select(*MATCH_RESPONSE_COLUMNS).filter(
+        and_(Match.job_ad_id == job_ad_id, Match.status == match_status)
+    )
+
+
+def _select_match_requests_ad() -> Select:
+    """
+    Build the base query for match requests shown with their job ad.
+
+    Only the MATCH_REQUEST_AD_COLUMNS are selected, with the company name joined
+    in, so no entity or relationship is loaded for the listing.
+
+    Returns:
+        Select: The query, to be filtered by the caller.
+    """
+    return select(*MATCH_REQUEST_AD_COLUMNS).join(Match.job_ad).join(JobAd.company)
+
+
+def _select_match_requests_application() -> Select:
+    """
+    Build the base query for match requests shown with their job application.
+
+    Only the MATCH_REQUEST_APPLICATION_COLUMNS are selected, with the professional
+    names joined in, so no entity or relationship is loaded for the listing.
+
+    Returns:
+        Select: The query, to be filtered by the caller.
+    """
+    return (
+        select(*MATCH_REQUEST_APPLICATION_COLUMNS)
+        .join(Match.job_application)
+        .join(JobApplication.professional)
+        .join(Match.job_ad)
+    )
+
+
+def _select_professional_match_requests(
+    professional_id: UUID,
+    match_status: MatchStatus,
+) -> Select:
+    """
+    Build the query for a professional's match requests with the given status.
+
+    Args:
+        professional_id (UUID): The unique identifier of the professional.
+        match_status (MatchStatus): The status of the match requests to retrieve.
+
+    Returns:
+        Select: The query, yielding rows with the MATCH_REQUEST_AD_COLUMNS.
+    """
+    return (
+        _select_match_requests_ad()
+        .join(Match.job_application)
+        .filter(
+            and_(
+                JobApplication.professional_id == professional_id,
+                JobApplication.status == JobStatus.ACTIVE,
+                Match.status == match_status,
+            )
+        )
+    )
+
+
+def _create_match_requests_ad(requests: list[Row]) -> list[MatchRequestAd]:
+    return [MatchRequestAd.create_from_row(row) for row in requests]
+
+
+def _create_match_requests_application(
+    requests: list[Row],
+) -> list[MatchRequestApplication]:
+    return [MatchRequestApplication.create_from_row(row) for row in requests]
@@ -1,15 +1,22 @@
-import io
 import logging
 from datetime import datetime
 from uuid import UUID
 
 from fastapi import HTTPException, UploadFile, status
-from fastapi.responses import StreamingResponse
-from sqlalchemy import and_
-from sqlalchemy.orm import Session
+from fastapi.responses import Response
+from sqlalchemy import Select, and_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
 
+from app.core.config import get_settings
 from app.exceptions.custom_exceptions import ApplicationError
-from app.schemas.common import FilterParams, MessageResponse, SearchParams
+from app.schemas.common import (
+    BatchLookupResult,
+    CursorPage,
+    FilterParams,
+    MessageResponse,
+    SearchParams,
+)
 from app.schemas.job_ad import JobAdPreview
 from app.schemas.job_application import JobApplicationResponse, JobSearchStatus
 from app.schemas.match import MatchRequestAd
@@ -22,35 +29,58 @@ from app.schemas.professional import (
 from app.schemas.skill import SkillResponse
 from app.schemas.user import User
 from app.services import match_service
-from app.services.common import get_professional_by_id
+from app.services.common import (
+    JOB_AD_PREVIEW_COLUMNS,
+    JOB_APPLICATION_RESPONSE_OPTIONS,
+    create_batch_lookup_result,
+    get_professional_by_id,
+    get_professional_by_id_async,
+)
 from app.sql_app.job_ad.job_ad import JobAd
 from app.sql_app.job_application.job_application import JobApplication
 from app.sql_app.job_application.job_application_status import JobStatus
+from app.sql_app.job_application_skill.job_application_skill import JobApplicationSkill
 from app.sql_app.match.match import Match
 from app.sql_app.professional.professional import Professional
 from app.sql_app.professional.professional_status import ProfessionalStatus
+from app.sql_app.skill.skill import Skill
+from app.storage import (
+    IMAGE_SIGNATURES,
+    PDF_SIGNATURES,
+    get_blob_store,
+    store_upload,
+)
+from app.utils.pagination import Keyset
 
 logger = logging.getLogger(__name__)
 
+APPLICATIONS_KEYSET = Keyset(
+    name="professional_application",
+    columns=(JobApplication.created_at, JobApplication.id),
+    order="desc",
+)
+
 
 def get_all(
     db: Session,
     filter_params: FilterParams,
     search_params: SearchParams,
-) -> list[ProfessionalResponse]:
+) -> list[ProfessionalResponse] | CursorPage[ProfessionalResponse]:
     """
     Retrieve all active professionals from the database with optional filtering and sorting.
 
     Args:
         db (Session): The database session to use for the query.
-        filter_params (FilterParams): Parameters for filtering the results, including offset and limit.
+        filter_params (FilterParams): Parameters for filtering the results, including offset and limit or cursor.
         search_params (SearchParams): Parameters for sorting the results, including order and order_by fields.
 
     Returns:
-        list[ProfessionalResponse]: A list of ProfessionalResponse objects representing the active professionals.
+        list[ProfessionalResponse] | CursorPage[ProfessionalResponse]: A list of ProfessionalResponse objects representing the active professionals, wrapped in a CursorPage when paginating by cursor.
     """
-    professionals = db.query(Professional).filter(
-        Professional.status == ProfessionalStatus.ACTIVE
+    professionals = (
+        db.query(Professional)
+        .options(joinedload(Professional.city))
+        .filter(Professional.status == ProfessionalStatus.ACTIVE)
     )
 
     if search_params.order == "desc":
@@ -65,20 +95,36 @@ def get_all(
         f"Order Professionals based on search params order {search_params.order} and order_by {search_params.order_by}"
     )
 
-    professionals_list = (
-        professionals.offset(filter_params.offset).limit(filter_params.limit).all()
+    keyset = Keyset(
+        name=f"professional:{search_params.order_by}:{search_params.order}",
+        columns=(getattr(Professional, search_params.order_by), Professional.id),
+        order=search_params.order,
     )
+    professionals_list = keyset.apply(
+        query=professionals, filter_params=filter_params
+    ).all()
     logger.info(
         f"Retrieved all professionals with status ACTIVE and filtered by offset {filter_params.offset} and limit {filter_params.limit}"
     )
 
-    return [
-        ProfessionalResponse.create(
-            professional=professional,
-            skills=get_skills(professional_id=professional.id, db=db),
+    def _create_items(rows: list[Professional]) -> list[ProfessionalResponse]:
+        skills = get_skills_for_professionals(
+            professional_ids=[professional.id for professional in rows],
+            db=db,
         )
-        for professional in professionals_list
-    ]
+        return [
+            ProfessionalResponse.create(
+                professional=professional,
+                skills=skills[professional.id],
+            )
+            for professional in rows
+        ]
+
+    return keyset.page(
+        rows=professionals_list,
+        filter_params=filter_params,
+        create_items=_create_items,
+    )
 
 
 def get_by_id(professional_id: UUID, db: Session) -> ProfessionalResponse:
@@ -112,6 +158,86 @@ def get_by_id(professional_id: UUID, db: Session) -> ProfessionalResponse:
     )
 
 
+def get_many(
+    professional_ids: list[UUID], db: Session
+) -> BatchLookupResult[ProfessionalResponse]:
+    """
+    Retrieve several Professional profiles by their IDs.
+
+    The professionals are loaded with one query and their skills with another.
+    As in get_all, the profiles do not include matched ads or sent match requests.
+
+    Args:
+        professional_ids (list[UUID]): The identifiers of the professionals.
+        db (Session): Database session dependency.
+
+    Returns:
+        BatchLookupResult[ProfessionalResponse]: The profiles in the order of the
+            IDs, with None and a not_found entry for every unknown ID.
+    """
+    professionals = (
+        db.query(Professional)
+        .options(joinedload(Professional.city))
+        .filter(Professional.id.in_(set(professional_ids)))
+        .all()
+    )
+    skills = get_skills_for_professionals(
+        professional_ids=[professional.id for professional in professionals],
+        db=db,
+    )
+    logger.info(
+        f"Retrieved {len(professionals)} of {len(professional_ids)} requested professionals"
+    )
+
+    return create_batch_lookup_result(
+        ids=professional_ids,
+        items={
+            professional.id: ProfessionalResponse.create(
+                professional=professional, skills=skills[professional.id]
+            )
+            for professional in professionals
+        },
+    )
+
+
+async def get_by_id_async(
+    professional_id: UUID,
+    db: AsyncSession,
+) -> ProfessionalResponse:
+    """
+    Retrieve a Professional profile by its ID using an asynchronous session.
+
+    Args:
+        professional_id (UUID): The identifier of the professional.
+        db (AsyncSession): The asynchronous database session.
+
+    Returns:
+        ProfessionalResponse: The professional profile response.
+    """
+    professional = await get_professional_by_id_async(
+        professional_id=professional_id, db=db
+    )
+
+    matched_ads = (
+        await _get_matches_async(professional_id=professional_id, db=db)
+        if not professional.has_private_matches
+        else None
+    )
+    skills = await _get_skills_async(professional_id=professional_id, db=db)
+    sent_match_requests = (
+        await match_service.get_sent_match_requests_for_professional_async(
+            professional_id=professional_id, db=db
+        )
+    )
+
+    return ProfessionalResponse.create(
+        professional=professional,
+        matched_ads=matched_ads,
+        skills=skills,
+        sent_match_requests=sent_match_requests,
+    )
+
+
 def create(
     professional_data: ProfessionalCreate,
     db: Session,
@@ -187,9 +313,20 @@ def upload_photo(
         db (Session): The database session.
     Returns:
         MessageResponse: A response message indicating the result of the upload operation.
+    Raises:
+        ApplicationError: If the photo is too large or is not a supported image.
     """
     profesional = get_professional_by_id(professional_id=professional_id, db=db)
-    profesional.photo = photo.file.read()
+    blob = store_upload(
+        upload=photo,
+        max_size=get_settings().MAX_PHOTO_SIZE,
+        signatures=IMAGE_SIGNATURES,
+    )
+    profesional.photo_hash = blob.hash
+    profesional.photo_size = blob.size
+    profesional.photo_media_type = blob.media_type
+    # Drop the legacy in-table photo so migrate_blobs cannot bring it back.
+    profesional.photo = None
     profesional.updated_at = datetime.now()
 
     db.commit()
@@ -201,30 +338,38 @@ def upload_photo(
 def download_photo(
     professional_id: UUID,
     db: Session,
-) -> StreamingResponse:
+    if_none_match: str | None = None,
+    range_header: str | None = None,
+) -> Response:
     """
     Downloads the photo of a professional by their ID.
 
     Args:
         professional_id (UUID): The unique identifier of the professional.
         db (Session): The database session to use for querying.
+        if_none_match (str | None): The If-None-Match request header, if any.
+        range_header (str | None): The Range request header, if any.
 
     Returns:
-        StreamingResponse: A streaming response containing the photo in PNG format.
+        Response: A response serving the photo from the blob store, or 304 if unchanged.
 
     Raises:
         HTTPException: If the professional does not have a photo, a 404 error is raised.
     """
     professional = get_professional_by_id(professional_id=professional_id, db=db)
-    photo = professional.photo
-    if photo is None:
+    if professional.photo_hash is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Professional with id {professional_id} does not have a photo",
         )
     logger.info(f"Downloaded photo of Professional with id {professional_id}")
 
-    return StreamingResponse(io.BytesIO(photo), media_type="image/png")
+    return get_blob_store().create_response(
+        blob_hash=professional.photo_hash,
+        media_type=professional.photo_media_type or "image/png",
+        if_none_match=if_none_match,
+        range_header=range_header,
+    )
 
 
 def upload_cv(professional_id: UUID, cv: UploadFile, db: Session) -> MessageResponse:
@@ -238,9 +383,21 @@ def upload_cv(professional_id: UUID, cv: UploadFile, db: Session) -> MessageResp
 
     Returns:
         MessageResponse: A response message indicating the result of the operation.
+
+    Raises:
+        ApplicationError: If the CV is too large or is not a PDF file.
     """
     profesional = get_professional_by_id(professional_id=professional_id, db=db)
-    profesional.cv = cv.file.read()
+    blob = store_upload(
+        upload=cv,
+        max_size=get_settings().MAX_CV_SIZE,
+        signatures=PDF_SIGNATURES,
+    )
+    profesional.cv_hash = blob.hash
+    profesional.cv_size = blob.size
+    profesional.cv_media_type = blob.media_type
+    # Drop the legacy in-table CV so migrate_blobs cannot bring it back.
+    profesional.cv = None
     profesional.updated_at = datetime.now()
 
     db.commit()
@@ -249,29 +406,39 @@ def upload_cv(professional_id: UUID, cv: UploadFile, db: Session) -> MessageResp
     return MessageResponse(message="CV successfully uploaded")
 
 
-def download_cv(professional_id: UUID, db: Session) -> StreamingResponse:
+def download_cv(
+    professional_id: UUID,
+    db: Session,
+    if_none_match: str | None = None,
+    range_header: str | None = None,
+) -> Response:
     """
     Downloads the CV for a given professional.
 
     Args:
         professional_id (UUID): The unique identifier of the professional.
         db (Session): The database session to use for querying.
+        if_none_match (str | None): The If-None-Match request header, if any.
+        range_header (str | None): The Range request header, if any.
 
     Returns:
-        StreamingResponse: A streaming response containing the CV file.
+        Response: A response serving the CV file from the blob store, or 304 if unchanged.
 
     Raises:
         HTTPException: If the CV for the given professional ID is not found.
     """
     professional = get_professional_by_id(professional_id=professional_id, db=db)
-    cv = professional.cv
-    if cv is None:
+    if professional.cv_hash is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"CV for professional with id {professional_id} not found",
         )
 
-    return _generate_cv_response(professional=professional, cv=cv)
+    return _generate_cv_response(
+        professional=professional,
+        if_none_match=if_none_match,
+        range_header=range_header,
+    )
 
 
 def delete_cv(professional_id: UUID, db: Session) -> MessageResponse:
@@ -289,12 +456,15 @@ def delete_cv(professional_id: UUID, db: Session) -> MessageResponse:
         ApplicationError: If the professional's CV is not found.
     """
     professional = get_professional_by_id(professional_id=professional_id, db=db)
-    if professional.cv is None:
+    if not professional.has_cv:
         raise ApplicationError(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"CV for professional with id {professional_id} not found",
         )
     professional.cv = None
+    professional.cv_hash = None
+    professional.cv_size = None
+    professional.cv_media_type = None
     professional.updated_at = datetime.now()
 
     db.commit()
@@ -389,10 +559,12 @@ def get_applications(
     application_status: JobSearchStatus,
     filter_params: FilterParams,
     db: Session,
-) -> list[JobApplicationResponse]:
+) -> list[JobApplicationResponse] | CursorPage[JobApplicationResponse]:
     """
     Retrieve job applications for a given professional based on the application status and filter parameters.
 
+    Cursor pages are ordered from the newest application.
+
     Args:
         professional_id (UUID): The unique identifier of the professional.
         application_status (JobSearchStatus): The status of the job applications to filter by.
@@ -400,7 +572,7 @@ def get_applications(
         db (Session): The database session to use for querying.
 
     Returns:
-        list[JobApplicationResponse]: A list of job application responses matching the criteria.
+        list[JobApplicationResponse] | CursorPage[JobApplicationResponse]: A list of job application responses matching the criteria, wrapped in a CursorPage when paginating by cursor.
 
     Raises:
         ApplicationError: If the professional has set their matches to private and the application status is 'MATCHED'.
@@ -417,23 +589,28 @@ def get_applications(
 
     search_status = JobStatus(application_status.value)
 
-    applications = (
+    applications_query = (
         db.query(JobApplication)
+        .options(*JOB_APPLICATION_RESPONSE_OPTIONS)
         .filter(
             and_(
                 JobApplication.professional_id == professional_id,
                 JobApplication.status == search_status,
             )
         )
-        .offset(filter_params.offset)
-        .limit(filter_params.limit)
-        .all()
     )
-
-    return [
-        JobApplicationResponse.create(job_application=application)
-        for application in applications
-    ]
+    applications = APPLICATIONS_KEYSET.apply(
+        query=applications_query, filter_params=filter_params
+    ).all()
+
+    return APPLICATIONS_KEYSET.page(
+        rows=applications,
+        filter_params=filter_params,
+        create_items=lambda rows: [
+            JobApplicationResponse.create(job_application=application)
+            for application in rows
+        ],
+    )
 
 
 def get_application(
@@ -457,6 +634,7 @@ def get_application(
     """
     job_application = (
         db.query(JobApplication)
+        .options(*JOB_APPLICATION_RESPONSE_OPTIONS)
         .filter(
             and_(
                 JobApplication.professional_id == professional_id,
@@ -487,17 +665,67 @@ def get_skills(professional_id: UUID, db: Session) -> list[SkillResponse]:
     """
     professional = get_professional_by_id(professional_id=professional_id, db=db)
     skills = {
-        (skill.id, skill)
+        skill.id: skill
         for job_application in professional.job_applications
         for skill in job_application.skills
     }
 
     return [
         SkillResponse(id=skill.id, name=skill.name, category_id=skill.category_id)
-        for (skill_id, skill) in skills
+        for skill in skills.values()
     ]
 
 
+def get_skills_for_professionals(
+    professional_ids: list[UUID],
+    db: Session,
+) -> dict[UUID, list[SkillResponse]]:
+    """
+    Retrieve the distinct skills of several professionals with a single query.
+
+    Each professional's skills are ordered by name.
+
+    Args:
+        professional_ids (list[UUID]): The unique identifiers of the professionals.
+        db (Session): The database session to use for the query.
+
+    Returns:
+        dict[UUID, list[SkillResponse]]: A mapping of professional id to the skills
+            listed across all of that professional's job applications.
+    """
+    skills: dict[UUID, list[SkillResponse]] = {
+        professional_id: [] for professional_id in professional_ids
+    }
+    if not professional_ids:
+        return skills
+
+    rows = (
+        db.query(
+            JobApplication.professional_id,
+            Skill.id,
+            Skill.name,
+            Skill.category_id,
+        )
+        .join(
+            JobApplicationSkill,
+            JobApplicationSkill.job_application_id == JobApplication.id,
+        )
+        .join(Skill, Skill.id == JobApplicationSkill.skill_id)
+        .filter(JobApplication.professional_id.in_(professional_ids))
+        .distinct()
+        .order_by(Skill.name)
+        .all()
+    )
+    logger.info(f"Retrieved skills for {len(professional_ids)} professionals")
+
+    for professional_id, skill_id, skill_name, category_id in rows:
+        skills[professional_id].append(
+            SkillResponse(id=skill_id, name=skill_name, category_id=category_id)
+        )
+
+    return skills
+
+
 def get_match_requests(professional_id: UUID, db: Session) -> list[MatchRequestAd]:
     """
     Fetches Match Requests for the given Professional.
@@ -553,8 +781,29 @@ def _get_matches(professional_id: UUID, db: Session) -> list[JobAdPreview]:
     Returns:
         list[JobAdPreview]: A list of job advertisement previews that match the professional.
     """
-    ads: list[JobAd] = (
-        db.query(JobAd)
+    rows = db.execute(_select_matches(professional_id=professional_id)).all()
+
+    return [JobAdPreview.create_from_row(row) for row in rows]
+
+
+def _select_matches(professional_id: UUID) -> Select:
+    """
+    Build the query for the previews of the job ads matched with a professional.
+
+    Only the columns of the previews are selected, with the category title and
+    the city joined in, so no job ad entity or relationship is loaded.
+
+    Args:
+        professional_id (UUID): The unique identifier of the professional.
+
+    Returns:
+        Select: The query, yielding rows with the JOB_AD_PREVIEW_COLUMNS.
+    """
+    return (
+        select(*JOB_AD_PREVIEW_COLUMNS)
+        .select_from(JobAd)
+        .join(JobAd.category)
+        .join(JobAd.location)
         .join(Match, Match.job_ad_id == JobAd.id)
         .join(JobApplication, Match.job_application_id == JobApplication.id)
         .filter(
@@ -563,26 +812,86 @@ def _get_matches(professional_id: UUID, db: Session) -> list[JobAdPreview]:
                 JobApplication.status == JobStatus.MATCHED,
             )
         )
-        .all()
     )
 
-    return [JobAdPreview.create(ad) for ad in ads]
 
-
-def _generate_cv_response(professional: Professional, cv: bytes) -> StreamingResponse:
+def _generate_cv_response(
+    professional: Professional,
+    if_none_match: str | None = None,
+    range_header: str | None = None,
+) -> Response:
     """
-    Generates a streaming response for downloading a CV as a PDF file.
+    Generates a response for downloading a CV as a PDF file.
 
     Args:
         professional (Professional): An instance of the Professional class containing the professional's details.
-        cv (bytes): The CV content in bytes.
+        if_none_match (str | None): The If-None-Match request header, if any.
+        range_header (str | None): The Range request header, if any.
 
     Returns:
-        StreamingResponse: A response object that streams the CV as a PDF file with appropriate headers.
+        Response: A response object that serves the CV from the blob store with appropriate headers.
     """
     filename = f"{professional.first_name}_{professional.last_name}_CV.pdf"
-    response = StreamingResponse(io.BytesIO(cv), media_type="application/pdf")
-    response.headers["Content-Disposition"] = f"attachment; filename={filename}"
-    response.headers["Access-Control-Expose-Headers"] = "Content-Disposition"
 
-    return response
+    return get_blob_store().create_response(
+        blob_hash=professional.cv_hash,
+        media_type=professional.cv_media_type or "application/pdf",
+        headers={
+            "Content-Disposition": f"attachment; filename={filename}",
+            "Access-Control-Expose-Headers": "Content-Disposition",
+        },
+        if_none_match=if_none_match,
+        range_header=range_header,
+    )
+
+
+async def _get_skills_async(
+    professional_id: UUID,
+    db: AsyncSession,
+) -> list[SkillResponse]:
+    """
+    Retrieve the distinct skills listed across a professional's job applications.
+
+    Args:
+        professional_id (UUID): The unique identifier of the professional.
+        db (AsyncSession): The asynchronous database session.
+
+    Returns:
+        list[SkillResponse]: The skills of the professional.
+    """
+    rows = (
+        await db.execute(
+            select(Skill.id, Skill.name, Skill.category_id)
+            .join(JobApplicationSkill, JobApplicationSkill.skill_id == Skill.id)
+            .join(
+                JobApplication,
+                JobApplication.id == JobApplicationSkill.job_application_id,
+            )
+            .filter(JobApplication.professional_id == professional_id)
+            .distinct()
+        )
+    ).all()
+
+    return [
+        SkillResponse(id=skill_id, name=skill_name, category_id=category_id)
+        for skill_id, skill_name, category_id in rows
+    ]
+
+
+async def _get_matches_async(
+    professional_id: UUID,
+    db: AsyncSession,
+) -> list[JobAdPreview]:
+    """
+    Retrieve the job advertisements matched with a professional using an asynchronous session.
+
+    Args:
+        professional_id (UUID): The unique identifier of the professional.
+        db (AsyncSession): The asynchronous database session.
+
+    Returns:
+        list[JobAdPreview]: A list of job advertisement previews that match the professional.
+    """
+    rows = (await db.execute(_select_matches(professional_id=professional_id))).all()
+
+    return [JobAdPreview.create_from_row(row) for row in rows]
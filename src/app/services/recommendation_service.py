@@ -0,0 +1,302 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from fastapi import status
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.exceptions.custom_exceptions import ApplicationError
+from app.schemas.recommendation import RecommendationResponse
+from app.sql_app.job_ad.job_ad import JobAd
+from app.sql_app.job_ad.job_ad_status import JobAdStatus
+from app.sql_app.job_application.job_application import JobApplication
+from app.sql_app.job_application.job_application_status import JobStatus
+from app.utils.skill_match import (
+    MatchEntry,
+    Similarity,
+    SkillMatchIndex,
+    Vocabulary,
+)
+
+logger = logging.getLogger(__name__)
+
+# Rows changed this long before the newest change already seen are read again on
+# every refresh, so transactions that commit out of timestamp order are not missed.
+REFRESH_OVERLAP = timedelta(minutes=1)
+
+
+@dataclass(frozen=True, eq=False)
+class _Source:
+    """
+    How to load the matching attributes of one side of a match.
+
+    Attributes:
+        name (str): Name used in log messages and errors.
+        model (type): The mapped class.
+        location (Any): The column holding the city id.
+        active_status (Any): The status of the rows that can be recommended.
+    """
+
+    name: str
+    model: type
+    location: Any
+    active_status: Any
+
+    @property
+    def changed_at(self) -> Any:
+        return func.coalesce(self.model.updated_at, self.model.created_at)
+
+
+JOB_ADS = _Source(
+    name="Job ad",
+    model=JobAd,
+    location=JobAd.location_id,
+    active_status=JobAdStatus.ACTIVE,
+)
+JOB_APPLICATIONS = _Source(
+    name="Job application",
+    model=JobApplication,
+    location=JobApplication.city_id,
+    active_status=JobStatus.ACTIVE,
+)
+
+
+class RecommendationEngine:
+    """
+    Process-local index of the active job ads and job applications.
+
+    The first refresh loads every row; later refreshes only read the rows created
+    or updated since the newest change seen, and run at most once per
+    RECOMMENDATIONS_REFRESH_INTERVAL seconds. Rows that are no longer active are
+    dropped from the index.
+
+    Attributes:
+        job_ads (SkillMatchIndex): The active job ads.
+        job_applications (SkillMatchIndex): The active job applications.
+    """
+
+    def __init__(self) -> None:
+        skills, locations, categories = Vocabulary(), Vocabulary(), Vocabulary()
+        self.job_ads = SkillMatchIndex(skills, locations, categories)
+        self.job_applications = SkillMatchIndex(skills, locations, categories)
+        self.lock = threading.Lock()
+        self._indexes = {JOB_ADS: self.job_ads, JOB_APPLICATIONS: self.job_applications}
+        self._watermarks: dict[_Source, datetime] = {}
+        self._refreshed_at: float | None = None
+
+    def index(self, source: _Source) -> SkillMatchIndex:
+        """
+        Return the index holding one side of a match.
+
+        Args:
+            source (_Source): JOB_ADS or JOB_APPLICATIONS.
+
+        Returns:
+            SkillMatchIndex: The index of that side.
+        """
+        return self._indexes[source]
+
+    def refresh(self, db: Session, force: bool = False) -> None:
+        """
+        Bring the indexes up to date with the database.
+
+        Must be called with the lock held.
+
+        Args:
+            db (Session): The database session.
+            force (bool): Refresh even if the refresh interval has not passed.
+        """
+        interval = get_settings().RECOMMENDATIONS_REFRESH_INTERVAL
+        if (
+            not force
+            and self._refreshed_at is not None
+            and time.monotonic() - self._refreshed_at < interval
+        ):
+            return
+
+        for source, index in self._indexes.items():
+            watermark = self._watermarks.get(source)
+            rows = _load_rows(
+                source=source,
+                db=db,
+                changed_since=watermark - REFRESH_OVERLAP if watermark else None,
+            )
+            index.upsert(
+                _to_entry(row) for row in rows if row.status == source.active_status
+            )
+            index.remove(row.id for row in rows if row.status != source.active_status)
+            if rows:
+                newest = max(row.changed_at for row in rows)
+                self._watermarks[source] = max(newest, watermark or newest)
+            logger.info(
+                f"Refreshed {source.name.lower()} recommendations with {len(rows)} "
+                f"changed rows, {len(index)} indexed"
+            )
+
+        self._refreshed_at = time.monotonic()
+
+
+recommendation_engine = RecommendationEngine()
+
+
+def get_job_ads_for_job_application(
+    job_application_id: UUID,
+    limit: int,
+    similarity: Similarity,
+    db: Session,
+) -> list[RecommendationResponse]:
+    """
+    Recommend the active job ads that best match a job application.
+
+    Args:
+        job_application_id (UUID): The identifier of the job application.
+        limit (int): The maximum number of job ads to recommend.
+        similarity (Similarity): How to compare the skill sets, "jaccard" or "overlap".
+        db (Session): The database session.
+
+    Returns:
+        list[RecommendationResponse]: The recommended job ads, best first.
+
+    Raises:
+        ApplicationError: If the job application does not exist.
+    """
+    return _recommend(
+        source=JOB_APPLICATIONS,
+        entry_id=job_application_id,
+        limit=limit,
+        similarity=similarity,
+        db=db,
+    )
+
+
+def get_job_applications_for_job_ad(
+    job_ad_id: UUID,
+    limit: int,
+    similarity: Similarity,
+    db: Session,
+) -> list[RecommendationResponse]:
+    """
+    Recommend the active job applications that best match a job ad.
+
+    Args:
+        job_ad_id (UUID): The identifier of the job ad.
+        limit (int): The maximum number of job applications to recommend.
+        similarity (Similarity): How to compare the skill sets, "jaccard" or "overlap".
+        db (Session): The database session.
+
+    Returns:
+        list[RecommendationResponse]: The recommended job applications, best first.
+
+    Raises:
+        ApplicationError: If the job ad does not exist.
+    """
+    return _recommend(
+        source=JOB_ADS,
+        entry_id=job_ad_id,
+        limit=limit,
+        similarity=similarity,
+        db=db,
+    )
+
+
+def _recommend(
+    source: _Source,
+    entry_id: UUID,
+    limit: int,
+    similarity: Similarity,
+    db: Session,
+) -> list[RecommendationResponse]:
+    """
+    Score the entries on the other side of a match against one entry.
+
+    Args:
+        source (_Source): The side the entry belongs to.
+        entry_id (UUID): The identifier of the entry.
+        limit (int): The maximum number of recommendations.
+        similarity (Similarity): How to compare the skill sets.
+        db (Session): The database session.
+
+    Returns:
+        list[RecommendationResponse]: The recommendations, best first.
+
+    Raises:
+        ApplicationError: If the entry does not exist.
+    """
+    engine = recommendation_engine
+    counterpart = JOB_ADS if source is JOB_APPLICATIONS else JOB_APPLICATIONS
+
+    with engine.lock:
+        engine.refresh(db=db)
+        own_index, other_index = engine.index(source), engine.index(counterpart)
+        query = own_index.query(entry_id)
+        if query is None:
+            # Inactive entries are not indexed but can still ask for matches.
+            rows = _load_rows(source=source, db=db, entry_id=entry_id)
+            if not rows:
+                raise ApplicationError(
+                    detail=f"{source.name} with id {entry_id} not found",
+                    status_code=status.HTTP_404_NOT_FOUND,
+                )
+            query = own_index.encode(_to_entry(rows[0]))
+        matches = other_index.top_k(query=query, limit=limit, similarity=similarity)
+
+    logger.info(f"Recommended {len(matches)} matches for {source.name} {entry_id}")
+    return [RecommendationResponse.create(match) for match in matches]
+
+
+def _load_rows(
+    source: _Source,
+    db: Session,
+    changed_since: datetime | None = None,
+    entry_id: UUID | None = None,
+) -> list[Any]:
+    """
+    Load the matching attributes of job ads or job applications.
+
+    Only the needed columns are selected; the skills come from the denormalized
+    skill_ids array, so no join is needed.
+
+    Args:
+        source (_Source): Which side of a match to load.
+        db (Session): The database session.
+        changed_since (datetime | None): Only load rows created or updated since.
+        entry_id (UUID | None): Only load the row with this id.
+
+    Returns:
+        list[Any]: Rows with id, skill_ids, min_salary, max_salary, location_id,
+            category_id, status and changed_at.
+    """
+    model = source.model
+    query = db.query(
+        model.id,
+        model.skill_ids,
+        model.min_salary,
+        model.max_salary,
+        source.location.label("location_id"),
+        model.category_id,
+        model.status,
+        source.changed_at.label("changed_at"),
+    )
+    if changed_since is not None:
+        query = query.filter(source.changed_at >= changed_since)
+    if entry_id is not None:
+        query = query.filter(model.id == entry_id)
+
+    return query.all()
+
+
+def _to_entry(row: Any) -> MatchEntry:
+    return MatchEntry(
+        id=row.id,
+        skill_ids=row.skill_ids,
+        min_salary=row.min_salary,
+        max_salary=row.max_salary,
+        location_id=row.location_id,
+        category_id=row.category_id,
+    )
@@ -0,0 +1,221 @@
+import logging
+import time
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any, Callable, Generic, TypeVar
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.schemas.reference_data import ReferenceCacheStats
+from app.sql_app import Category, City, Skill
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class CityEntry:
+    id: UUID
+    name: str
+
+
+@dataclass(frozen=True)
+class CategoryEntry:
+    id: UUID
+    title: str
+    description: str
+
+
+@dataclass(frozen=True)
+class SkillEntry:
+    id: UUID
+    name: str
+    category_id: UUID
+
+
+@dataclass(frozen=True)
+class ReferenceSnapshot(Generic[T]):
+    """
+    Immutable copy of a reference table with lookup indexes.
+
+    Attributes:
+        version (int): Increases every time the table is loaded.
+        loaded_at (float): time.monotonic() when the table was loaded.
+        rows (tuple[T, ...]): Every row of the table.
+        by_id (dict[UUID, T]): The rows by id.
+        by_name (dict[str, T]): The rows by their exact name.
+        by_group (dict[Any, tuple[T, ...]]): The rows by group, e.g. skills by
+            category; empty for tables that are not grouped.
+    """
+
+    version: int
+    loaded_at: float
+    rows: tuple[T, ...]
+    by_id: dict[UUID, T]
+    by_name: dict[str, T]
+    by_group: dict[Any, tuple[T, ...]] = field(default_factory=dict)
+
+
+class ReferenceTable(Generic[T]):
+    """
+    Process-local cache of a small table that rarely changes.
+
+    The whole table is loaded into a snapshot on first use and reloaded when it
+    is older than REFERENCE_DATA_TTL seconds, or after invalidate(). Services that
+    write to the table call invalidate() after committing so this worker sees the
+    change at once; other workers see it when their snapshot expires.
+
+    Attributes:
+        name (str): Name of the table, used in logs and statistics.
+        hits (int): Lookups served from a loaded snapshot.
+        misses (int): Lookups that loaded the table from the database.
+        invalidations (int): Calls to invalidate().
+    """
+
+    def __init__(
+        self,
+        name: str,
+        load: Callable[[Session], list[T]],
+        name_of: Callable[[T], str],
+        group_of: Callable[[T], Any] | None = None,
+    ) -> None:
+        self.name = name
+        self._load = load
+        self._name_of = name_of
+        self._group_of = group_of
+        self._snapshot: ReferenceSnapshot[T] | None = None
+        self._version = 0
+        self._load_lock = Lock()
+        self._stats_lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, db: Session) -> ReferenceSnapshot[T]:
+        """
+        Return a current snapshot of the table, loading it if needed.
+
+        Args:
+            db (Session): The database session used if the table must be loaded.
+
+        Returns:
+            ReferenceSnapshot[T]: The snapshot.
+        """
+        snapshot = self._snapshot
+        if self._is_fresh(snapshot):
+            self._record(hit=True)
+            return snapshot
+
+        with self._load_lock:
+            # Another request may have loaded the table while this one waited.
+            snapshot = self._snapshot
+            if self._is_fresh(snapshot):
+                self._record(hit=True)
+                return snapshot
+
+            self._record(hit=False)
+            rows = tuple(self._load(db))
+            self._version += 1
+            snapshot = ReferenceSnapshot(
+                version=self._version,
+                loaded_at=time.monotonic(),
+                rows=rows,
+                by_id={row.id: row for row in rows},
+                by_name={self._name_of(row): row for row in rows},
+                by_group=self._group(rows),
+            )
+            self._snapshot = snapshot
+
+        logger.info(
+            f"Loaded {len(rows)} {self.name} into the reference cache "
+            f"(version {snapshot.version})"
+        )
+        return snapshot
+
+    def invalidate(self) -> None:
+        """
+        Drop the current snapshot so the next lookup reloads the table.
+        """
+        with self._load_lock:
+            self._snapshot = None
+        with self._stats_lock:
+            self.invalidations += 1
+        logger.info(f"Invalidated the cached {self.name}")
+
+    def stats(self) -> ReferenceCacheStats:
+        """
+        Report the hit and miss counters and the state of the snapshot.
+
+        Returns:
+            ReferenceCacheStats: The statistics of this table.
+        """
+        snapshot = self._snapshot
+        with self._stats_lock:
+            return ReferenceCacheStats(
+                table=self.name,
+                version=self._version,
+                rows=len(snapshot.rows) if snapshot else 0,
+                age_s=(
+                    round(time.monotonic() - snapshot.loaded_at, 3)
+                    if snapshot
+                    else None
+                ),
+                hits=self.hits,
+                misses=self.misses,
+                invalidations=self.invalidations,
+            )
+
+    def _is_fresh(self, snapshot: ReferenceSnapshot[T] | None) -> bool:
+        return (
+            snapshot is not None
+            and time.monotonic() - snapshot.loaded_at
+            < get_settings().REFERENCE_DATA_TTL
+        )
+
+    def _record(self, hit: bool) -> None:
+        with self._stats_lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _group(self, rows: tuple[T, ...]) -> dict[Any, tuple[T, ...]]:
+        if self._group_of is None:
+            return {}
+        groups: dict[Any, list[T]] = {}
+        for row in rows:
+            groups.setdefault(self._group_of(row), []).append(row)
+        return {group: tuple(members) for group, members in groups.items()}
+
+
+def _load_cities(db: Session) -> list[CityEntry]:
+    return [CityEntry(id=id, name=name) for id, name in db.query(City.id, City.name)]
+
+
+def _load_categories(db: Session) -> list[CategoryEntry]:
+    rows = db.query(Category.id, Category.title, Category.description)
+    return [CategoryEntry(*row) for row in rows]
+
+
+def _load_skills(db: Session) -> list[SkillEntry]:
+    rows = db.query(Skill.id, Skill.name, Skill.category_id)
+    return [SkillEntry(*row) for row in rows]
+
+
+cities: ReferenceTable[CityEntry] = ReferenceTable(
+    name="cities", load=_load_cities, name_of=lambda city: city.name
+)
+categories: ReferenceTable[CategoryEntry] = ReferenceTable(
+    name="categories", load=_load_categories, name_of=lambda category: category.title
+)
+skills: ReferenceTable[SkillEntry] = ReferenceTable(
+    name="skills",
+    load=_load_skills,
+    name_of=lambda skill: skill.name,
+    group_of=lambda skill: skill.category_id,
+)
+
+REFERENCE_TABLES = (cities, categories, skills)
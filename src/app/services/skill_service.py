@@ -1,11 +1,15 @@
 import logging
+from difflib import SequenceMatcher
 from uuid import UUID
 
 from fastapi import status
+from sqlalchemy import func, or_
 from sqlalchemy.orm import Session
 
 from app.exceptions.custom_exceptions import ApplicationError
-from app.schemas.skill import SkillCreate, SkillResponse
+from app.schemas.skill import SkillCreate, SkillMatchResponse, SkillResponse
+from app.services import reference_data
+from app.services.common import is_extension_available
 from app.sql_app.pending_skill.pending_skill import PendingSkill
 from app.sql_app.skill.skill import Skill
 
@@ -14,16 +18,16 @@ logger = logging.getLogger(__name__)
 
 def get_all_for_category(category_id: UUID, db: Session) -> list[SkillResponse]:
     """
-    Retrieve all skills for a given category.
+    Retrieve all skills for a given category from the reference data cache.
 
     Args:
         category_id (UUID): The identifier of the category for which to retrieve the skills.
-        db (Session): The database session used to query the skills.
+        db (Session): The database session used to load the skills if they are not cached.
 
     Returns:
         list[SkillResponse]: A list of SkillResponse objects representing all skills for the given category.
     """
-    skills = db.query(Skill).filter(Skill.category_id == category_id).all()
+    skills = reference_data.skills.get(db).by_group.get(category_id, ())
     return [SkillResponse.create(skill) for skill in skills]
 
 
@@ -51,6 +55,56 @@ def get_by_id(skill_id: UUID, db: Session) -> SkillResponse:
     return SkillResponse.create(skill)
 
 
+def search_by_name(name: str, limit: int, db: Session) -> list[SkillMatchResponse]:
+    """
+    Find the skills whose names most closely match the given name.
+
+    With the pg_trgm extension, skills are matched by trigram similarity, which
+    tolerates typos, or by name prefix for autocompletion, both served by the
+    trigram index. Without it, the search falls back to case-insensitive
+    substring matching ranked by similarity computed in Python.
+
+    Args:
+        name (str): The (possibly misspelled or partial) skill name.
+        limit (int): The maximum number of skills to return.
+        db (Session): The database session used to query the skills.
+
+    Returns:
+        list[SkillMatchResponse]: The matching skills, closest match first.
+    """
+    if is_extension_available("pg_trgm", db=db):
+        similarity = func.similarity(Skill.name, name)
+        rows = (
+            db.query(Skill, similarity)
+            .filter(
+                or_(
+                    Skill.name.op("%")(name),
+                    Skill.name.istartswith(name, autoescape=True),
+                )
+            )
+            .order_by(similarity.desc(), Skill.name)
+            .limit(limit)
+            .all()
+        )
+        logger.info(f"Found {len(rows)} skills similar to {name}")
+        return [
+            SkillMatchResponse.create(skill, similarity) for skill, similarity in rows
+        ]
+
+    skills = db.query(Skill).filter(Skill.name.icontains(name, autoescape=True)).all()
+    matches = sorted(
+        (
+            (skill, SequenceMatcher(None, name.lower(), skill.name.lower()).ratio())
+            for skill in skills
+        ),
+        key=lambda match: (-match[1], match[0].name),
+    )[:limit]
+    logger.info(f"Found {len(matches)} skills containing {name}")
+    return [
+        SkillMatchResponse.create(skill, similarity) for skill, similarity in matches
+    ]
+
+
 def create(skill_data: SkillCreate, db: Session) -> SkillResponse:
     """
     Create a new skill in the database.
@@ -67,6 +121,7 @@ def create(skill_data: SkillCreate, db: Session) -> SkillResponse:
     db.add(skill)
     db.commit()
     db.refresh(skill)
+    reference_data.skills.invalidate()
 
     return SkillResponse.create(skill)
 
@@ -30,7 +30,7 @@ class City(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, unique=True, nullable=False
     )
-    name: Mapped[str] = mapped_column(String, nullable=False)
+    name: Mapped[str] = mapped_column(String, nullable=False, index=True)
 
     professionals: Mapped[list["Professional"]] = relationship(
         "Professional", back_populates="city", uselist=True, collection_class=list
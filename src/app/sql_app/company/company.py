@@ -2,9 +2,17 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, Integer, LargeBinary, String, func
+from sqlalchemy import (
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    func,
+)
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, column_property, mapped_column, relationship
 from sqlalchemy.sql import expression
 
 from app.sql_app.database import Base
@@ -29,7 +37,11 @@ class Company(Base):
         phone_number (str): Unique phone number of the company.
         website_url (str, optional): URL of the company's website.
         youtube_video_id (str, optional): YouTube video ID of the company.
-        logo (bytes): Logo of the company.
+        logo (bytes): Legacy in-table logo, kept until moved to the blob store.
+        logo_hash (str, optional): SHA-256 digest of the logo in the blob store.
+        logo_size (int, optional): Size of the logo in bytes.
+        logo_media_type (str, optional): Media type of the logo.
+        has_logo (bool): Whether the company has uploaded a logo.
         active_job_count (int, optional): Number of active job postings by the company.
         successfull_matches_count (int, optional): Number of successful matches made by the company.
         created_at (datetime): Timestamp when the company record was created.
@@ -41,6 +53,7 @@ class Company(Base):
     """
 
     __tablename__ = "company"
+    __table_args__ = (Index("ix_company_created_at_id", "created_at", "id"),)
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -61,7 +74,13 @@ class Company(Base):
     phone_number: Mapped[str] = mapped_column(String(25), unique=True, nullable=False)
     website_url: Mapped[str] = mapped_column(String, nullable=True)
     youtube_video_id: Mapped[str] = mapped_column(String, nullable=True)
-    logo: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+    logo: Mapped[bytes | None] = mapped_column(
+        LargeBinary, nullable=True, deferred=True
+    )
+    logo_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    logo_size: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    logo_media_type: Mapped[str | None] = mapped_column(String, nullable=True)
+    has_logo: Mapped[bool] = column_property(logo_hash.isnot(None))
     active_job_count: Mapped[int] = mapped_column(
         Integer, nullable=False, server_default=expression.text("0")
     )
@@ -1,11 +1,84 @@
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import DeclarativeBase, sessionmaker
+import logging
+from itertools import count
+from typing import Any, TypeVar
+
+from fastapi import Header
+from sqlalchemy import Connection, create_engine, make_url, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
 from app.core.config import get_settings
+from app.sql_app.pool_metrics import instrument_pool
+from app.sql_app.query_stats import instrument_engine
+
+logger = logging.getLogger(__name__)
+
+# Key of the PostgreSQL advisory lock serializing initialize_database() runs.
+BOOTSTRAP_LOCK_ID = 7_240_135_001
+
+EngineT = TypeVar("EngineT")
+
+
+def _pool_options() -> dict[str, Any]:
+    settings = get_settings()
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_use_lifo": settings.DB_POOL_USE_LIFO,
+    }
 
-engine = create_engine(get_settings().DATABASE_URL)
+
+def _async_url(url: str):
+    return make_url(url).set(drivername="postgresql+asyncpg")
+
+
+engine = create_engine(get_settings().DATABASE_URL, **_pool_options())
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# The async engine talks to the same database through asyncpg. Unless
+# ASYNC_DATABASE_URL is set, its URL is DATABASE_URL with the driver swapped.
+async_engine = create_async_engine(
+    get_settings().ASYNC_DATABASE_URL or _async_url(get_settings().DATABASE_URL),
+    **_pool_options(),
+)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
+# Read replicas listed in READ_DATABASE_URLS. Read sessions are bound to one of
+# them per request, round robin; with no replicas reads go to the primary.
+read_engines = [
+    create_engine(url, **_pool_options()) for url in get_settings().READ_DATABASE_URLS
+]
+async_read_engines = [
+    create_async_engine(_async_url(url), **_pool_options())
+    for url in get_settings().READ_DATABASE_URLS
+]
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False)
+AsyncReadSessionLocal = async_sessionmaker(autoflush=False, expire_on_commit=False)
+_read_engine_counter = count()
+
+# Every pool is reported by /monitoring/db-pool under the name given here.
+for _name, _engine in (
+    ("primary", engine),
+    ("primary-async", async_engine.sync_engine),
+    *((f"replica-{i}", e) for i, e in enumerate(read_engines, start=1)),
+    *(
+        (f"replica-{i}-async", e.sync_engine)
+        for i, e in enumerate(async_read_engines, start=1)
+    ),
+):
+    instrument_engine(_engine)
+    instrument_pool(name=_name, engine=_engine)
+
+
+def _next_read_engine(engines: list[EngineT]) -> EngineT:
+    return engines[next(_read_engine_counter) % len(engines)]
+
 
 class Base(DeclarativeBase):
     pass
@@ -31,39 +104,305 @@ def get_db():
         db.close()
 
 
-def create_uuid_extension():
+def get_read_db(x_read_primary: str | None = Header(default=None)):
+    """
+    Provides a database session for read-only endpoints.
+
+    The session is bound to a read replica when READ_DATABASE_URLS is set.
+    Replicas may lag behind the primary, so clients that need to see their own
+    writes immediately can send the X-Read-Primary header (any value) to have
+    the request served by the primary.
+
+    Args:
+        x_read_primary (str | None): The X-Read-Primary request header, if any.
+
+    Yields:
+        db: A database session object. It must not be used for writes.
+    """
+    if x_read_primary is not None or not read_engines:
+        yield from get_db()
+        return
+
+    db = ReadSessionLocal(bind=_next_read_engine(read_engines))
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_db():
+    """
+    Provides an asynchronous database session for use in async endpoints.
+
+    Relationships are not lazy loaded on an AsyncSession, so queries run through
+    it must eagerly load everything the response models access.
+
+    Yields:
+        db: An asynchronous database session object.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_async_read_db(x_read_primary: str | None = Header(default=None)):
+    """
+    Provides an asynchronous database session for read-only async endpoints.
+
+    Routes to the read replicas the same way get_read_db() does, including the
+    X-Read-Primary escape hatch.
+
+    Args:
+        x_read_primary (str | None): The X-Read-Primary request header, if any.
+
+    Yields:
+        db: An asynchronous database session object. It must not be used for writes.
+    """
+    if x_read_primary is not None or not async_read_engines:
+        async with AsyncSessionLocal() as db:
+            yield db
+        return
+
+    async with AsyncReadSessionLocal(bind=_next_read_engine(async_read_engines)) as db:
+        yield db
+
+
+async def dispose_engines() -> None:
+    """
+    Close the pooled connections of every engine.
+
+    Called when a worker shuts down, after in-flight requests have finished, so
+    connections are closed cleanly instead of being dropped with the process.
+    """
+    engine.dispose()
+    for read_engine in read_engines:
+        read_engine.dispose()
+    await async_engine.dispose()
+    for async_read_engine in async_read_engines:
+        await async_read_engine.dispose()
+
+
+def create_uuid_extension(connection: Connection) -> None:
     """
     Creates the "uuid-ossp" extension in the connected PostgreSQL database if it does not already exist.
 
-    This function establishes a connection to the database using the provided engine,
-    begins a transaction, and executes the SQL command to create the "uuid-ossp" extension.
     The "uuid-ossp" extension provides functions to generate universally unique identifiers (UUIDs).
+
+    Args:
+        connection (Connection): The connection to execute the statement on.
     """
-    with engine.connect() as connection:
-        with connection.begin():
-            connection.execute(text('CREATE EXTENSION IF NOT EXISTS "uuid-ossp"'))
+    connection.execute(text('CREATE EXTENSION IF NOT EXISTS "uuid-ossp"'))
 
 
-def create_tables():
+def create_tables(connection: Connection) -> None:
     """
     Create all tables in the database.
 
     This function uses SQLAlchemy's metadata to create all tables that are defined
-    in the Base class. It binds the metadata to the specified engine and creates
-    the tables if they do not already exist.
+    in the Base class, if they do not already exist.
+
+    Args:
+        connection (Connection): The connection to create the tables through.
+    """
+    Base.metadata.create_all(bind=connection)
+
+
+def add_search_columns(connection: Connection) -> None:
+    """
+    Add the full-text search column and its GIN index to an existing job_ad table.
+
+    create_all() does not alter tables that already exist, so databases created
+    before job ad full-text search was introduced need them added explicitly.
+
+    Args:
+        connection (Connection): The connection to execute the statements on.
+    """
+    from app.sql_app.job_ad.job_ad import SEARCH_VECTOR_EXPRESSION
+
+    connection.execute(
+        text(
+            "ALTER TABLE job_ad ADD COLUMN IF NOT EXISTS search_vector tsvector "
+            f"GENERATED ALWAYS AS ({SEARCH_VECTOR_EXPRESSION}) STORED"
+        )
+    )
+    connection.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS ix_job_ad_search_vector "
+            "ON job_ad USING gin (search_vector)"
+        )
+    )
+
+
+# (index name, table, column) of the pg_trgm indexes backing fuzzy name lookups.
+TRIGRAM_INDEXES = (
+    ("ix_skill_name_trgm", "skill", "name"),
+    ("ix_city_name_trgm", "city", "name"),
+    ("ix_company_name_trgm", "company", "name"),
+)
+
+
+# (table, skill link table, link column) of the denormalized skill_ids arrays.
+SKILL_ID_ARRAYS = (
+    ("job_ad", "job_ad_skill", "job_ad_id"),
+    ("job_application", "job_application_skill", "job_application_id"),
+)
+
+
+def add_skill_id_arrays(connection: Connection) -> None:
+    """
+    Add the skill_ids arrays to job_ad and job_application and keep them in sync.
+
+    Each array mirrors the rows of the table's skill link table. Triggers on the
+    link table rewrite the array whenever skills are added or removed, so every
+    writer (the services, the seed data, manual SQL) keeps it current. They also
+    bump updated_at, which incremental readers such as the recommendation
+    engine use to find changed rows. Existing rows are backfilled.
+
+    The triggers fire once per statement and read the changed links from its
+    transition tables, so a statement linking N skills updates each affected job
+    ad or job application once rather than N times.
+
+    Args:
+        connection (Connection): The connection to execute the statements on.
     """
-    Base.metadata.create_all(bind=engine)
+    for table, link_table, link_column in SKILL_ID_ARRAYS:
+        linked_skill_ids = (
+            f"ARRAY(SELECT skill_id FROM {link_table} "
+            f"WHERE {link_column} = {{}} ORDER BY skill_id)"
+        )
+        update_changed = (
+            f"UPDATE {table} "
+            f"SET skill_ids = {linked_skill_ids.format(f'{table}.id')}, "
+            "updated_at = now() "
+            f"WHERE id IN ({{}}); "
+        )
+        connection.execute(
+            text(
+                f"ALTER TABLE {table} "
+                "ADD COLUMN IF NOT EXISTS skill_ids uuid[] NOT NULL DEFAULT '{}'"
+            )
+        )
+        connection.execute(
+            text(
+                f"CREATE OR REPLACE FUNCTION sync_{table}_skill_ids() "
+                "RETURNS trigger AS $$ "
+                "BEGIN "
+                "IF TG_OP = 'INSERT' THEN "
+                + update_changed.format(f"SELECT {link_column} FROM new_links")
+                + "ELSIF TG_OP = 'DELETE' THEN "
+                + update_changed.format(f"SELECT {link_column} FROM old_links")
+                + "ELSE "
+                + update_changed.format(
+                    f"SELECT {link_column} FROM old_links "
+                    f"UNION SELECT {link_column} FROM new_links"
+                )
+                + "END IF; "
+                "RETURN NULL; "
+                "END; "
+                "$$ LANGUAGE plpgsql"
+            )
+        )
+        # Databases created before the triggers fired per statement have the
+        # row-level trigger.
+        connection.execute(
+            text(f"DROP TRIGGER IF EXISTS sync_skill_ids ON {link_table}")
+        )
+        for event, transition_tables in (
+            ("INSERT", "NEW TABLE AS new_links"),
+            ("DELETE", "OLD TABLE AS old_links"),
+            ("UPDATE", "OLD TABLE AS old_links NEW TABLE AS new_links"),
+        ):
+            trigger = f"sync_skill_ids_{event.lower()}"
+            connection.execute(
+                text(f"DROP TRIGGER IF EXISTS {trigger} ON {link_table}")
+            )
+            connection.execute(
+                text(
+                    f"CREATE TRIGGER {trigger} AFTER {event} ON {link_table} "
+                    f"REFERENCING {transition_tables} "
+                    f"FOR EACH STATEMENT EXECUTE FUNCTION sync_{table}_skill_ids()"
+                )
+            )
+        connection.execute(
+            text(
+                f"UPDATE {table} "
+                f"SET skill_ids = {linked_skill_ids.format(f'{table}.id')} "
+                "WHERE skill_ids IS DISTINCT FROM "
+                f"{linked_skill_ids.format(f'{table}.id')}"
+            )
+        )
 
 
-def initialize_database():
+def create_missing_indexes(connection: Connection) -> None:
     """
-    Initialize the database by creating the tables and the "uuid-ossp" extension.
+    Create the indexes declared on the models that do not exist yet.
+
+    create_all() skips tables that already exist together with their indexes, so
+    indexes added to a model later (e.g. the keyset pagination indexes) are
+    created here for existing databases.
+
+    Args:
+        connection (Connection): The connection to create the indexes through.
+    """
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=connection, checkfirst=True)
+
+
+def add_name_indexes(connection: Connection) -> None:
+    """
+    Create the trigram indexes backing fuzzy name lookups.
+
+    The indexes need the pg_trgm extension; when it cannot be installed they are
+    skipped and fuzzy lookups fall back to substring matching.
+
+    Args:
+        connection (Connection): The connection to execute the statements on.
+    """
+    try:
+        with connection.begin_nested():
+            connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    except DBAPIError as ex:
+        logger.warning(f"pg_trgm is not available, skipping trigram indexes: {ex}")
+        return
+
+    for index_name, table, column in TRIGRAM_INDEXES:
+        connection.execute(
+            text(
+                f"CREATE INDEX IF NOT EXISTS {index_name} "
+                f"ON {table} USING gin ({column} gin_trgm_ops)"
+            )
+        )
+
+
+def initialize_database(seed: bool = True) -> None:
+    """
+    Initialize the database by creating the "uuid-ossp" extension and the tables,
+    bringing existing tables up to date, and optionally inserting the sample data.
+
+    Everything runs in one transaction holding a transaction-scoped advisory lock,
+    so concurrent runs (e.g. several containers starting together) execute one
+    after another and later runs find the work already done.
 
-    This function calls the create_tables() and create_uuid_extension() functions
-    to create the necessary tables and enable the "uuid-ossp" extension in the database.
+    Args:
+        seed (bool): Whether to insert the sample data into an empty database.
     """
-    create_uuid_extension()
-    create_tables()
     from app.sql_app.init_data import insert_data
+    from app.storage.migration import add_blob_reference_columns
 
-    insert_data(db=SessionLocal())
+    with engine.begin() as connection:
+        connection.execute(
+            text("SELECT pg_advisory_xact_lock(:lock_id)"),
+            {"lock_id": BOOTSTRAP_LOCK_ID},
+        )
+        create_uuid_extension(connection=connection)
+        create_tables(connection=connection)
+        add_search_columns(connection=connection)
+        add_skill_id_arrays(connection=connection)
+        add_blob_reference_columns(connection=connection)
+        create_missing_indexes(connection=connection)
+        add_name_indexes(connection=connection)
+        if seed:
+            # The session joins the connection's transaction, so its commits
+            # only take effect when the whole bootstrap commits.
+            with Session(bind=connection) as db:
+                insert_data(db=db)
@@ -2,8 +2,18 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Numeric, String, func
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import (
+    Computed,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Numeric,
+    String,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.sql_app.database import Base
@@ -13,6 +23,15 @@ from app.sql_app.job_requirement.skill_level import SkillLevel
 if TYPE_CHECKING:
     from app.sql_app import Category, City, Company, Match, Skill
 
+# Text search configuration used for the job ad search vector and queries.
+SEARCH_CONFIG = "english"
+
+# Title matches rank above description matches.
+SEARCH_VECTOR_EXPRESSION = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')"
+)
+
 
 class JobAd(Base):
     """
@@ -31,6 +50,10 @@ class JobAd(Base):
         status (JobAdStatus): Current status of the job advertisement.
         created_at (datetime): Timestamp when the job advertisement was created.
         updated_at (datetime): Timestamp when the job advertisement was last updated.
+        search_vector (str): Weighted full-text search vector over the title and
+            description, generated by the database and not loaded by default.
+        skill_ids (list[uuid.UUID]): Ids of the required skills, kept in sync with
+            job_ad_skill by a database trigger and not loaded by default.
 
     Relationships:
         skills (list[Skill]): List of skills required for the job.
@@ -41,6 +64,12 @@ class JobAd(Base):
     """
 
     __tablename__ = "job_ad"
+    __table_args__ = (
+        Index("ix_job_ad_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_job_ad_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_job_ad_status_updated_at_id", "status", "updated_at", "id"),
+        Index("ix_job_ad_skill_ids", "skill_ids", postgresql_using="gin"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -70,6 +99,17 @@ class JobAd(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+        deferred=True,
+    )
+    skill_ids: Mapped[list[uuid.UUID]] = mapped_column(
+        ARRAY(UUID(as_uuid=True)),
+        server_default=text("'{}'"),
+        nullable=False,
+        deferred=True,
+    )
 
     skills: Mapped[list["Skill"]] = relationship(
         "Skill",
@@ -2,8 +2,18 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Numeric, String, func
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Numeric,
+    String,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.sql_app.database import Base
@@ -30,6 +40,8 @@ class JobApplication(Base):
         created_at (datetime): Timestamp when the job application was created.
         updated_at (datetime): Timestamp when the job application was last updated.
         city_id (uuid.UUID): Identifier for the associated city.
+        skill_ids (list[uuid.UUID]): Ids of the application's skills, kept in sync
+            with job_application_skill by a database trigger and not loaded by default.
 
     Relationships:
         professional (Professional): The professional associated with the job application.
@@ -40,6 +52,25 @@ class JobApplication(Base):
     """
 
     __tablename__ = "job_application"
+    __table_args__ = (
+        Index("ix_job_application_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_job_application_status_updated_at_id", "status", "updated_at", "id"),
+        Index(
+            "ix_job_application_status_city_created_at_id",
+            "status",
+            "city_id",
+            "created_at",
+            "id",
+        ),
+        Index(
+            "ix_job_application_professional_status_created_at_id",
+            "professional_id",
+            "status",
+            "created_at",
+            "id",
+        ),
+        Index("ix_job_application_skill_ids", "skill_ids", postgresql_using="gin"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -72,6 +103,12 @@ class JobApplication(Base):
     city_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("city.id"), nullable=False
     )
+    skill_ids: Mapped[list[uuid.UUID]] = mapped_column(
+        ARRAY(UUID(as_uuid=True)),
+        server_default=text("'{}'"),
+        nullable=False,
+        deferred=True,
+    )
 
     professional: Mapped["Professional"] = relationship(
         "Professional", back_populates="job_applications"
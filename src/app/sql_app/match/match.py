@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Enum, ForeignKey, func
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -29,6 +29,15 @@ class Match(Base):
     """
 
     __tablename__ = "match"
+    __table_args__ = (
+        Index(
+            "ix_match_job_application_status_created_at",
+            "job_application_id",
+            "status",
+            "created_at",
+        ),
+        Index("ix_match_job_ad_status_created_at", "job_ad_id", "status", "created_at"),
+    )
 
     job_ad_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("job_ad.id"), primary_key=True
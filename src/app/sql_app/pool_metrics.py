@@ -0,0 +1,131 @@
+import bisect
+import time
+from threading import Lock
+
+from sqlalchemy import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.schemas.pool import PoolMetricsResponse, WaitTimeBucket
+
+# Upper bounds, in milliseconds, of the checkout wait-time histogram buckets.
+WAIT_TIME_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class PoolMetrics:
+    """
+    Thread-safe collector for the checkout statistics of one engine's pool.
+
+    Attributes:
+        name (str): Name of the pool in the monitoring report.
+        engine (Engine): The engine whose pool is reported on.
+        checkouts (int): Number of successful checkouts.
+        timeouts (int): Number of checkouts that gave up after pool_timeout.
+        wait_time_counts (list[int]): Checkout count per wait-time bucket; the last
+            entry counts waits longer than the largest bucket bound.
+        wait_time_total_ms (float): Sum of all checkout wait times.
+    """
+
+    def __init__(self, name: str, engine: Engine) -> None:
+        self.name = name
+        self.engine = engine
+        self._lock = Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Clear all collected statistics.
+        """
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.wait_time_counts = [0] * (len(WAIT_TIME_BUCKETS_MS) + 1)
+            self.wait_time_total_ms = 0.0
+
+    def observe_checkout(self, wait_time_ms: float, timed_out: bool) -> None:
+        """
+        Record one checkout attempt.
+
+        Args:
+            wait_time_ms (float): Time spent waiting for a connection.
+            timed_out (bool): Whether the attempt ended with a pool timeout.
+        """
+        bucket = bisect.bisect_left(WAIT_TIME_BUCKETS_MS, wait_time_ms)
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_time_counts[bucket] += 1
+            self.wait_time_total_ms += wait_time_ms
+
+    def snapshot(self) -> PoolMetricsResponse:
+        """
+        Combine the collected statistics with the live state of the engine's pool.
+
+        Returns:
+            PoolMetricsResponse: The current pool metrics.
+        """
+        pool = self.engine.pool
+        with self._lock:
+            bounds: list[float | None] = [*WAIT_TIME_BUCKETS_MS, None]
+            return PoolMetricsResponse(
+                name=self.name,
+                pool_size=pool.size(),
+                checked_out=pool.checkedout(),
+                checked_in=pool.checkedin(),
+                overflow=max(pool.overflow(), 0),
+                checkouts=self.checkouts,
+                timeouts=self.timeouts,
+                wait_time_total_ms=round(self.wait_time_total_ms, 3),
+                wait_time_buckets=[
+                    WaitTimeBucket(le_ms=bound, count=count)
+                    for bound, count in zip(bounds, self.wait_time_counts)
+                ],
+            )
+
+
+# The metrics of every instrumented engine, in the order they were created.
+POOL_METRICS: list[PoolMetrics] = []
+
+
+def instrument_pool(name: str, engine: Engine) -> PoolMetrics:
+    """
+    Record the checkout wait times and timeouts of an engine's pool.
+
+    The pool has no event that fires before a checkout starts, so the wait is
+    timed around Engine.raw_connection, through which every Connection, and so
+    every sync and async session, asks the pool for a connection. It covers
+    everything the pool does to hand out a connection: waiting for one to be
+    returned, opening a new overflow connection and the pre-ping. Checkouts that
+    give up after pool_timeout are recorded as timeouts.
+
+    Args:
+        name (str): Name of the pool in the monitoring report.
+        engine (Engine): The engine to instrument; for an AsyncEngine, pass its
+            sync_engine.
+
+    Returns:
+        PoolMetrics: The collector of the engine's statistics, also listed in
+            POOL_METRICS.
+    """
+    metrics = PoolMetrics(name=name, engine=engine)
+    raw_connection = engine.raw_connection
+
+    def _timed_raw_connection():
+        started_at = time.perf_counter()
+        try:
+            connection = raw_connection()
+        except PoolTimeoutError:
+            metrics.observe_checkout(
+                wait_time_ms=(time.perf_counter() - started_at) * 1000,
+                timed_out=True,
+            )
+            raise
+        metrics.observe_checkout(
+            wait_time_ms=(time.perf_counter() - started_at) * 1000, timed_out=False
+        )
+        return connection
+
+    engine.raw_connection = _timed_raw_connection
+    POOL_METRICS.append(metrics)
+    return metrics
@@ -13,7 +13,7 @@ from sqlalchemy import (
     String,
 )
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, column_property, mapped_column, relationship
 from sqlalchemy.sql import expression, func
 
 from app.sql_app.database import Base
@@ -35,7 +35,16 @@ class Professional(Base):
         password (str): Password for the professional.
         description (str): Description of the professional.
         email (str): Unique email address of the professional.
-        photo (bytes, optional): Photo of the professional.
+        photo (bytes, optional): Legacy in-table photo, kept until moved to the blob store.
+        cv (bytes, optional): Legacy in-table CV, kept until moved to the blob store.
+        photo_hash (str, optional): SHA-256 digest of the photo in the blob store.
+        photo_size (int, optional): Size of the photo in bytes.
+        photo_media_type (str, optional): Media type of the photo.
+        cv_hash (str, optional): SHA-256 digest of the CV in the blob store.
+        cv_size (int, optional): Size of the CV in bytes.
+        cv_media_type (str, optional): Media type of the CV.
+        has_photo (bool): Whether the professional has uploaded a photo.
+        has_cv (bool): Whether the professional has uploaded a CV.
         status (ProfessionalStatus): Current status of the professional.
         active_application_count (int): Number of active job applications by the professional.
         first_name (str): First name of the professional.
@@ -72,8 +81,18 @@ class Professional(Base):
     password_hash: Mapped[str] = mapped_column(String(64), nullable=False)
     description: Mapped[str] = mapped_column(String, nullable=False)
     email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
-    photo: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
-    cv: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+    photo: Mapped[bytes | None] = mapped_column(
+        LargeBinary, nullable=True, deferred=True
+    )
+    cv: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True, deferred=True)
+    photo_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    photo_size: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    photo_media_type: Mapped[str | None] = mapped_column(String, nullable=True)
+    cv_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    cv_size: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    cv_media_type: Mapped[str | None] = mapped_column(String, nullable=True)
+    has_photo: Mapped[bool] = column_property(photo_hash.isnot(None))
+    has_cv: Mapped[bool] = column_property(cv_hash.isnot(None))
     status: Mapped[ProfessionalStatus] = mapped_column(
         Enum(ProfessionalStatus, native_enum=True),
         nullable=False,
@@ -97,4 +116,8 @@ class Professional(Base):
         collection_class=list,
     )
 
-    __table_args__ = (Index("unique_sub", "sub", postgresql_where=(sub.isnot(None))),)
+    __table_args__ = (
+        Index("unique_sub", "sub", postgresql_where=(sub.isnot(None))),
+        Index("ix_professional_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_professional_status_updated_at_id", "status", "updated_at", "id"),
+    )
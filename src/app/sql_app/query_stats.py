@@ -0,0 +1,173 @@
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from sqlalchemy import Engine, event
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+# Expanded IN lists and executemany VALUES tuples of different lengths have the
+# same shape, e.g. "IN (%(id_1_1)s, %(id_1_2)s)" -> "IN (?)".
+_PARAMETER_LIST = re.compile(r"\(\s*%\(\w+\)s(?:\s*,\s*%\(\w+\)s)*\s*\)")
+
+
+class QueryStats:
+    """
+    SQL statements executed while tracking is active.
+
+    Attributes:
+        count (int): Number of executed statements.
+        duration_ms (float): Total time spent executing them.
+        shapes (Counter[str]): Number of executions per normalized statement.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.duration_ms = 0.0
+        self.shapes: Counter[str] = Counter()
+
+    def record(self, statement: str, duration_ms: float) -> None:
+        """
+        Record one executed statement.
+
+        Args:
+            statement (str): The SQL sent to the database.
+            duration_ms (float): How long the execution took.
+        """
+        self.count += 1
+        self.duration_ms += duration_ms
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated_statements(self, threshold: int) -> list[tuple[str, int]]:
+        """
+        Return the statements executed more than ``threshold`` times.
+
+        Args:
+            threshold (int): The maximum number of executions per statement.
+
+        Returns:
+            list[tuple[str, int]]: (statement shape, execution count) pairs,
+                most frequent first.
+        """
+        return [
+            (shape, count)
+            for shape, count in self.shapes.most_common()
+            if count > threshold
+        ]
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def statement_shape(statement: str) -> str:
+    """
+    Normalize a statement so executions differing only in parameters compare equal.
+
+    Args:
+        statement (str): The SQL sent to the database.
+
+    Returns:
+        str: The statement with whitespace collapsed and parameter lists folded.
+    """
+    statement = _WHITESPACE.sub(" ", statement).strip()
+    return _PARAMETER_LIST.sub("(?)", statement)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    Count the statements executed by instrumented engines within the block.
+
+    Tracking follows the current context, so statements run from threads started
+    by Starlette's threadpool or from SQLAlchemy's async greenlets are included.
+
+    Yields:
+        QueryStats: The statistics, updated as statements execute.
+    """
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+# The start time is kept on the execution context rather than on the connection:
+# when a statement fails after_cursor_execute never fires, and a start time left
+# on a pooled connection would be paired with a later statement.
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._query_started_at = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    started_at = getattr(context, "_query_started_at", None)
+    duration_ms = (
+        0.0 if started_at is None else (time.perf_counter() - started_at) * 1000
+    )
+    stats.record(statement, duration_ms)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Register the statement counting listeners on an engine.
+
+    Args:
+        engine (Engine): The engine to instrument; pass ``sync_engine`` for an
+            AsyncEngine.
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class QueryStatsMiddleware:
+    """
+    ASGI middleware reporting the statements each request executed.
+
+    Adds an ``X-DB-Queries`` header with the statement count and a
+    ``Server-Timing`` entry with the time spent in the database. When
+    ``repeat_threshold`` is set, logs a warning for every statement executed
+    more than that many times in one request, which usually points at a lazy
+    relationship loaded in a loop (N+1 queries).
+    """
+
+    def __init__(self, app: ASGIApp, repeat_threshold: int | None = None) -> None:
+        self.app = app
+        self.repeat_threshold = repeat_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+
+            async def send_with_stats(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers.append("X-DB-Queries", str(stats.count))
+                    headers.append(
+                        "Server-Timing",
+                        f'db;dur={stats.duration_ms:.3f};desc="{stats.count} queries"',
+                    )
+                await send(message)
+
+            await self.app(scope, receive, send_with_stats)
+
+        if self.repeat_threshold is None:
+            return
+        for shape, count in stats.repeated_statements(self.repeat_threshold):
+            logger.warning(
+                f"Possible N+1 query: {scope['method']} {scope['path']} executed "
+                f"the same statement {count} times: {shape}"
+            )
@@ -1,7 +1,7 @@
 import uuid
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, String, func
+from sqlalchemy import ForeignKey, Index, String, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -25,7 +25,6 @@ class Skill(Base):
     """
 
     __tablename__ = "skill"
-
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         server_default=func.uuid_generate_v4(),
@@ -52,3 +51,8 @@ class Skill(Base):
         uselist=True,
         collection_class=list,
     )
+
+
+# Backs the case-insensitive skill name filters of the job ad and job application
+# searches.
+Index("ix_skill_name_lower", func.lower(Skill.name))
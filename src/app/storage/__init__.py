@@ -0,0 +1,11 @@
+from app.storage.blob_store import BlobStore, StoredBlob, get_blob_store
+from app.storage.upload import IMAGE_SIGNATURES, PDF_SIGNATURES, store_upload
+
+__all__ = [
+    "BlobStore",
+    "StoredBlob",
+    "get_blob_store",
+    "IMAGE_SIGNATURES",
+    "PDF_SIGNATURES",
+    "store_upload",
+]
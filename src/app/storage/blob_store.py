@@ -0,0 +1,366 @@
+import secrets
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import BinaryIO, Iterator
+
+from fastapi import status
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel
+
+from app.core.config import get_settings
+
+CHUNK_SIZE = 64 * 1024
+MAX_RANGES = 16
+
+
+class StoredBlob(BaseModel):
+    """
+    Reference to a blob persisted in a BlobStore.
+
+    Attributes:
+        hash (str): Hex encoded SHA-256 digest of the content, used as the blob key.
+        size (int): Size of the content in bytes.
+        media_type (str): Media type of the content.
+    """
+
+    hash: str
+    size: int
+    media_type: str
+
+
+class BlobStore(ABC):
+    """
+    Content-addressed storage for binary assets (photos, CVs, logos).
+
+    Blobs are keyed by the SHA-256 digest of their content, so storing the same
+    file twice keeps a single copy. Database rows only keep the digest, size and
+    media type returned by put().
+    """
+
+    @abstractmethod
+    def put(self, file: BinaryIO, media_type: str) -> StoredBlob:
+        """
+        Store the content of a file-like object.
+
+        Args:
+            file (BinaryIO): The content to store, read until exhausted.
+            media_type (str): The media type of the content.
+
+        Returns:
+            StoredBlob: Reference to the stored content.
+        """
+
+    @abstractmethod
+    def open(self, blob_hash: str) -> BinaryIO:
+        """
+        Open a stored blob for reading.
+
+        Args:
+            blob_hash (str): The digest returned by put().
+
+        Returns:
+            BinaryIO: A seekable binary file object positioned at the start.
+
+        Raises:
+            FileNotFoundError: If no blob with the given digest exists.
+        """
+
+    @abstractmethod
+    def size(self, blob_hash: str) -> int:
+        """
+        Return the size of a stored blob.
+
+        Args:
+            blob_hash (str): The digest returned by put().
+
+        Returns:
+            int: The size of the blob in bytes.
+
+        Raises:
+            FileNotFoundError: If no blob with the given digest exists.
+        """
+
+    @abstractmethod
+    def exists(self, blob_hash: str) -> bool:
+        """
+        Check whether a blob with the given digest is stored.
+
+        Args:
+            blob_hash (str): The digest returned by put().
+
+        Returns:
+            bool: True if the blob exists, False otherwise.
+        """
+
+    def create_response(
+        self,
+        blob_hash: str,
+        media_type: str,
+        headers: dict[str, str] | None = None,
+        if_none_match: str | None = None,
+        range_header: str | None = None,
+    ) -> Response:
+        """
+        Build an HTTP response serving a stored blob.
+
+        The content digest doubles as a strong ETag. When it matches the client's
+        If-None-Match header a 304 response is returned without opening the blob.
+        A satisfiable Range header yields a 206 response that reads only the
+        requested byte ranges from storage; an unsatisfiable one yields 416.
+        Malformed Range headers are ignored and the full blob is served.
+
+        Args:
+            blob_hash (str): The digest returned by put().
+            media_type (str): The media type to serve the blob with.
+            headers (dict[str, str] | None): Additional response headers.
+            if_none_match (str | None): The If-None-Match request header, if any.
+            range_header (str | None): The Range request header, if any.
+
+        Returns:
+            Response: A 304, 206 or 416 response, or a response serving the whole blob.
+        """
+        headers = {
+            **(headers or {}),
+            "ETag": etag(blob_hash),
+            "Cache-Control": get_settings().BLOB_CACHE_CONTROL,
+            "Accept-Ranges": "bytes",
+        }
+        if if_none_match is not None and etag_matches(
+            if_none_match=if_none_match, blob_hash=blob_hash
+        ):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        if range_header is not None:
+            size = self.size(blob_hash)
+            ranges = parse_range_header(range_header=range_header, size=size)
+            if ranges == []:
+                return Response(
+                    status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                    headers={**headers, "Content-Range": f"bytes */{size}"},
+                )
+            if ranges is not None:
+                return self._range_response(
+                    blob_hash=blob_hash,
+                    media_type=media_type,
+                    headers=headers,
+                    ranges=ranges,
+                    size=size,
+                )
+
+        return self._content_response(
+            blob_hash=blob_hash, media_type=media_type, headers=headers
+        )
+
+    def _content_response(
+        self,
+        blob_hash: str,
+        media_type: str,
+        headers: dict[str, str],
+    ) -> Response:
+        """
+        Build the response carrying the blob content.
+
+        Backends that can hand a file to the server directly should override this.
+
+        Args:
+            blob_hash (str): The digest returned by put().
+            media_type (str): The media type to serve the blob with.
+            headers (dict[str, str]): The response headers.
+
+        Returns:
+            Response: A response streaming the blob content.
+        """
+        return StreamingResponse(
+            _iter_chunks(self.open(blob_hash)),
+            media_type=media_type,
+            headers=headers,
+        )
+
+    def _range_response(
+        self,
+        blob_hash: str,
+        media_type: str,
+        headers: dict[str, str],
+        ranges: list[tuple[int, int]],
+        size: int,
+    ) -> Response:
+        """
+        Build a 206 response carrying one or more byte ranges of a blob.
+
+        A single range is sent as-is with a Content-Range header, several ranges
+        are sent as a multipart/byteranges body.
+
+        Args:
+            blob_hash (str): The digest returned by put().
+            media_type (str): The media type of the blob.
+            headers (dict[str, str]): The response headers.
+            ranges (list[tuple[int, int]]): Inclusive (start, end) byte offsets.
+            size (int): The size of the blob in bytes.
+
+        Returns:
+            StreamingResponse: A partial content response.
+        """
+        if len(ranges) == 1:
+            start, end = ranges[0]
+            return StreamingResponse(
+                _iter_ranges(self.open(blob_hash), parts=[(b"", start, end)]),
+                status_code=status.HTTP_206_PARTIAL_CONTENT,
+                media_type=media_type,
+                headers={
+                    **headers,
+                    "Content-Range": f"bytes {start}-{end}/{size}",
+                    "Content-Length": str(end - start + 1),
+                },
+            )
+
+        boundary = secrets.token_hex(16)
+        parts = [
+            (
+                f"--{boundary}\r\n"
+                f"Content-Type: {media_type}\r\n"
+                f"Content-Range: bytes {start}-{end}/{size}\r\n\r\n".encode(),
+                start,
+                end,
+            )
+            for start, end in ranges
+        ]
+        closing = f"\r\n--{boundary}--\r\n".encode()
+        separators_length = len(b"\r\n") * (len(parts) - 1)
+        content_length = (
+            sum(len(header) + end - start + 1 for header, start, end in parts)
+            + separators_length
+            + len(closing)
+        )
+
+        return StreamingResponse(
+            _iter_ranges(self.open(blob_hash), parts=parts, closing=closing),
+            status_code=status.HTTP_206_PARTIAL_CONTENT,
+            media_type=f"multipart/byteranges; boundary={boundary}",
+            headers={**headers, "Content-Length": str(content_length)},
+        )
+
+
+def etag(blob_hash: str) -> str:
+    """
+    Return the strong ETag of a blob.
+
+    Args:
+        blob_hash (str): The digest returned by put().
+
+    Returns:
+        str: The quoted content digest.
+    """
+    return f'"{blob_hash}"'
+
+
+def etag_matches(if_none_match: str, blob_hash: str) -> bool:
+    """
+    Check whether an If-None-Match header matches a blob.
+
+    Uses the weak comparison required for If-None-Match, so ``W/`` prefixes
+    are ignored.
+
+    Args:
+        if_none_match (str): The If-None-Match request header.
+        blob_hash (str): The digest returned by put().
+
+    Returns:
+        bool: True if the client already has the current representation.
+    """
+    if if_none_match.strip() == "*":
+        return True
+    tags = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag(blob_hash) in tags
+
+
+def parse_range_header(
+    range_header: str,
+    size: int,
+) -> list[tuple[int, int]] | None:
+    """
+    Parse a bytes Range header against a blob of the given size.
+
+    Args:
+        range_header (str): The Range request header, e.g. ``bytes=0-99,-500``.
+        size (int): The size of the blob in bytes.
+
+    Returns:
+        list[tuple[int, int]] | None: Inclusive (start, end) offsets of the
+            satisfiable ranges, an empty list if none is satisfiable, or None if
+            the header is malformed or asks for more than MAX_RANGES ranges and
+            should be ignored.
+    """
+    unit, _, specs = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or not specs:
+        return None
+
+    specs_list = specs.split(",")
+    if len(specs_list) > MAX_RANGES:
+        return None
+
+    ranges = []
+    for spec in specs_list:
+        first, separator, last = spec.strip().partition("-")
+        if not separator or not (first or last):
+            return None
+        if (first and not first.isdigit()) or (last and not last.isdigit()):
+            return None
+
+        if not first:
+            suffix_length = int(last)
+            if suffix_length > 0 and size > 0:
+                ranges.append((max(size - suffix_length, 0), size - 1))
+            continue
+
+        start = int(first)
+        if last and int(last) < start:
+            return None
+        if start < size:
+            end = min(int(last), size - 1) if last else size - 1
+            ranges.append((start, end))
+
+    return ranges
+
+
+def _iter_ranges(
+    file: BinaryIO,
+    parts: list[tuple[bytes, int, int]],
+    closing: bytes = b"",
+) -> Iterator[bytes]:
+    with file:
+        for index, (header, start, end) in enumerate(parts):
+            if index > 0:
+                yield b"\r\n"
+            yield header
+            file.seek(start)
+            remaining = end - start + 1
+            while remaining > 0:
+                chunk = file.read(min(CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+        yield closing
+
+
+def _iter_chunks(file: BinaryIO) -> Iterator[bytes]:
+    with file:
+        while chunk := file.read(CHUNK_SIZE):
+            yield chunk
+
+
+@lru_cache()
+def get_blob_store() -> BlobStore:
+    """
+    Return the blob store configured through BLOB_STORAGE_BACKEND.
+
+    Returns:
+        BlobStore: The process-wide blob store instance.
+    """
+    settings = get_settings()
+    if settings.BLOB_STORAGE_BACKEND == "local":
+        from app.storage.local_blob_store import LocalBlobStore
+
+        return LocalBlobStore(root=settings.BLOB_STORAGE_PATH)
+
+    raise ValueError(f"Unknown blob storage backend {settings.BLOB_STORAGE_BACKEND}")
@@ -0,0 +1,83 @@
+import hashlib
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import BinaryIO
+
+from fastapi.responses import FileResponse, Response
+
+from app.storage.blob_store import CHUNK_SIZE, BlobStore, StoredBlob
+
+logger = logging.getLogger(__name__)
+
+
+class LocalBlobStore(BlobStore):
+    """
+    BlobStore keeping blobs as files on the local filesystem.
+
+    A blob with digest ``abcdef...`` is stored at ``<root>/ab/cd/abcdef...``.
+    Writes go to a temporary file in the same directory tree and are moved into
+    place atomically, so readers never observe partially written blobs.
+    """
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def put(self, file: BinaryIO, media_type: str) -> StoredBlob:
+        digest = hashlib.sha256()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, prefix=".upload-")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                while chunk := file.read(CHUNK_SIZE):
+                    digest.update(chunk)
+                    size += len(chunk)
+                    tmp_file.write(chunk)
+
+            blob_hash = digest.hexdigest()
+            path = self.path(blob_hash)
+            if path.exists():
+                os.remove(tmp_path)
+            else:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(tmp_path, path)
+                logger.info(f"Stored blob {blob_hash} ({size} bytes)")
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        return StoredBlob(hash=blob_hash, size=size, media_type=media_type)
+
+    def open(self, blob_hash: str) -> BinaryIO:
+        return open(self.path(blob_hash), "rb")
+
+    def size(self, blob_hash: str) -> int:
+        return self.path(blob_hash).stat().st_size
+
+    def exists(self, blob_hash: str) -> bool:
+        return self.path(blob_hash).is_file()
+
+    def path(self, blob_hash: str) -> Path:
+        """
+        Return the filesystem path of a blob.
+
+        Args:
+            blob_hash (str): The digest returned by put().
+
+        Returns:
+            Path: The location of the blob under the store root.
+        """
+        return self.root / blob_hash[:2] / blob_hash[2:4] / blob_hash
+
+    def _content_response(
+        self,
+        blob_hash: str,
+        media_type: str,
+        headers: dict[str, str],
+    ) -> Response:
+        return FileResponse(
+            self.path(blob_hash), media_type=media_type, headers=headers
+        )
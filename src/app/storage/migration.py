@@ -0,0 +1,153 @@
+import io
+import logging
+from typing import Type
+
+from sqlalchemy import Connection, text
+from sqlalchemy.orm import Session
+
+from app.sql_app import Company, Professional
+from app.sql_app.database import Base, SessionLocal, engine
+from app.storage.blob_store import BlobStore, get_blob_store
+
+logger = logging.getLogger(__name__)
+
+# (model, legacy LargeBinary column, media type the column was served with)
+BLOB_COLUMNS: tuple[tuple[Type[Base], str, str], ...] = (
+    (Professional, "photo", "image/png"),
+    (Professional, "cv", "application/pdf"),
+    (Company, "logo", "image/png"),
+)
+
+
+def add_blob_reference_columns(connection: Connection) -> None:
+    """
+    Add the <name>_hash, <name>_size and <name>_media_type columns to existing tables.
+
+    create_all() does not alter tables that already exist, so databases created
+    before the blob store was introduced need these columns added explicitly.
+    initialize_database() adds them on every bootstrap, because the mapped
+    models select them.
+
+    Args:
+        connection (Connection): The connection to execute the statements on.
+    """
+    for model, name, _ in BLOB_COLUMNS:
+        table = model.__table__
+        for suffix in ("hash", "size", "media_type"):
+            column = table.c[f"{name}_{suffix}"]
+            column_type = column.type.compile(dialect=connection.dialect)
+            connection.execute(
+                text(
+                    f"ALTER TABLE {table.name} "
+                    f"ADD COLUMN IF NOT EXISTS {column.name} {column_type}"
+                )
+            )
+    logger.info("Blob reference columns are present")
+
+
+def migrate_blobs(batch_size: int = 50) -> dict[str, int]:
+    """
+    Move every photo, CV and logo stored in the database into the blob store.
+
+    Rows are processed in batches of ``batch_size`` and each batch is committed on
+    its own, so the migration can be interrupted and resumed safely.
+
+    Until it has run, photos, CVs and logos still held in the legacy columns are
+    not served, so it is a required step when deploying the blob store onto an
+    existing database.
+
+    Args:
+        batch_size (int): Number of rows moved per transaction.
+
+    Returns:
+        dict[str, int]: Number of migrated rows per "<table>.<column>".
+    """
+    with engine.begin() as connection:
+        add_blob_reference_columns(connection=connection)
+    blob_store = get_blob_store()
+    migrated = {}
+
+    with SessionLocal() as db:
+        for model, name, media_type in BLOB_COLUMNS:
+            key = f"{model.__tablename__}.{name}"
+            migrated[key] = _migrate_column(
+                model=model,
+                name=name,
+                media_type=media_type,
+                batch_size=batch_size,
+                blob_store=blob_store,
+                db=db,
+            )
+            logger.info(f"Migrated {migrated[key]} rows of {key} to the blob store")
+
+    return migrated
+
+
+def _migrate_column(
+    model: Type[Base],
+    name: str,
+    media_type: str,
+    batch_size: int,
+    blob_store: BlobStore,
+    db: Session,
+) -> int:
+    """
+    Move the content of one LargeBinary column into the blob store.
+
+    Only rows without a blob reference are moved. A row that already has one
+    was uploaded to the blob store after deploy, so its legacy bytes are older
+    and are dropped instead of overwriting the newer file.
+
+    Args:
+        model (Type[Base]): The mapped class owning the column.
+        name (str): The name of the legacy LargeBinary column.
+        media_type (str): The media type to record for migrated blobs.
+        batch_size (int): Number of rows moved per transaction.
+        blob_store (BlobStore): The destination blob store.
+        db (Session): The database session.
+
+    Returns:
+        int: The number of migrated rows.
+    """
+    data_column = getattr(model, name)
+    hash_column = getattr(model, f"{name}_hash")
+    migrated = 0
+
+    superseded = (
+        db.query(model)
+        .filter(data_column.isnot(None), hash_column.isnot(None))
+        .update({name: None}, synchronize_session=False)
+    )
+    db.commit()
+    if superseded:
+        logger.info(
+            f"Dropped {superseded} legacy {model.__tablename__}.{name} values "
+            "replaced by newer uploads"
+        )
+
+    while True:
+        rows = (
+            db.query(model.id, data_column)
+            .filter(data_column.isnot(None), hash_column.is_(None))
+            .limit(batch_size)
+            .all()
+        )
+        if not rows:
+            return migrated
+
+        for row_id, data in rows:
+            blob = blob_store.put(io.BytesIO(data), media_type=media_type)
+            # A file uploaded since the row was read is newer; keep it.
+            db.query(model).filter(model.id == row_id, hash_column.is_(None)).update(
+                {
+                    f"{name}_hash": blob.hash,
+                    f"{name}_size": blob.size,
+                    f"{name}_media_type": blob.media_type,
+                    name: None,
+                },
+                synchronize_session=False,
+            )
+
+        db.commit()
+        migrated += len(rows)
+        logger.info(f"Moved {migrated} rows of {model.__tablename__}.{name} so far")
@@ -0,0 +1,96 @@
+import logging
+from typing import BinaryIO
+
+from fastapi import UploadFile, status
+
+from app.exceptions.custom_exceptions import ApplicationError
+from app.storage.blob_store import StoredBlob, get_blob_store
+
+logger = logging.getLogger(__name__)
+
+IMAGE_SIGNATURES: dict[bytes, str] = {
+    b"\x89PNG\r\n\x1a\n": "image/png",
+    b"\xff\xd8\xff": "image/jpeg",
+    b"GIF87a": "image/gif",
+    b"GIF89a": "image/gif",
+}
+PDF_SIGNATURES: dict[bytes, str] = {
+    b"%PDF-": "application/pdf",
+}
+
+
+class _SizeLimitedReader:
+    """
+    File-like wrapper that fails as soon as more than max_size bytes are read.
+    """
+
+    def __init__(self, file: BinaryIO, max_size: int):
+        self.file = file
+        self.max_size = max_size
+        self.size = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self.file.read(size)
+        self.size += len(chunk)
+        if self.size > self.max_size:
+            raise _too_large_error(max_size=self.max_size)
+        return chunk
+
+
+def store_upload(
+    upload: UploadFile,
+    max_size: int,
+    signatures: dict[bytes, str],
+) -> StoredBlob:
+    """
+    Validate an uploaded file and stream it into the blob store.
+
+    The media type is detected from the leading magic bytes of the file instead of
+    the client supplied content type. The file is then read in fixed-size chunks by
+    the blob store, so memory use is bounded by the chunk size regardless of the
+    upload size.
+
+    Args:
+        upload (UploadFile): The uploaded file.
+        max_size (int): The maximum accepted size in bytes.
+        signatures (dict[bytes, str]): Accepted magic bytes mapped to their media type.
+
+    Returns:
+        StoredBlob: Reference to the stored content.
+
+    Raises:
+        ApplicationError: If the file is too large (413) or its content does not
+            match any of the accepted signatures (415).
+    """
+    if upload.size is not None and upload.size > max_size:
+        raise _too_large_error(max_size=max_size)
+
+    head = upload.file.read(max(len(signature) for signature in signatures))
+    media_type = next(
+        (
+            media_type
+            for signature, media_type in signatures.items()
+            if head.startswith(signature)
+        ),
+        None,
+    )
+    if media_type is None:
+        raise ApplicationError(
+            detail=f"Unsupported file type, expected one of: "
+            f"{', '.join(sorted(set(signatures.values())))}",
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+        )
+    upload.file.seek(0)
+
+    return get_blob_store().put(
+        _SizeLimitedReader(file=upload.file, max_size=max_size),
+        media_type=media_type,
+    )
+
+
+def _too_large_error(max_size: int) -> ApplicationError:
+    logger.info(f"Rejected upload larger than {max_size} bytes")
+    return ApplicationError(
+        detail=f"File exceeds the maximum size of {max_size} bytes",
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+    )
@@ -0,0 +1,136 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Callable, Literal, Sequence, TypeVar
+
+from fastapi import status
+from sqlalchemy import Select, tuple_
+from sqlalchemy.orm import InstrumentedAttribute, Query
+
+from app.exceptions.custom_exceptions import ApplicationError
+from app.schemas.common import CursorPage, FilterParams
+
+QueryT = TypeVar("QueryT", Query, Select)
+ItemT = TypeVar("ItemT")
+
+
+class Keyset:
+    """
+    Keyset (cursor) pagination over an ordered, unique tuple of columns.
+
+    A page continues strictly after the key of the previous page's last row, so
+    the database seeks straight to it through an index on the key columns instead
+    of reading and discarding every preceding row as OFFSET does. The last
+    column must make the key unique (usually the primary key).
+
+    When the filter parameters carry no cursor, apply() and page() fall back to
+    plain offset pagination and a bare list of items.
+
+    Attributes:
+        name (str): Identifies the ordering; cursors issued for another ordering
+            are rejected.
+        columns (tuple[InstrumentedAttribute, ...]): The key columns.
+        order (Literal["asc", "desc"]): The direction of every key column.
+        key (Callable[[Any], tuple]): Extracts the key values from a result row.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        columns: Sequence[InstrumentedAttribute],
+        order: Literal["asc", "desc"],
+        key: Callable[[Any], tuple] | None = None,
+    ) -> None:
+        self.name = name
+        self.columns = tuple(columns)
+        self.order = order
+        self.key = key or (
+            lambda row: tuple(getattr(row, column.key) for column in self.columns)
+        )
+
+    def apply(self, query: QueryT, filter_params: FilterParams) -> QueryT:
+        """
+        Restrict a query or statement to the requested page.
+
+        Args:
+            query (QueryT): The filtered Query or Select.
+            filter_params (FilterParams): The pagination parameters.
+
+        Returns:
+            QueryT: The Query or Select limited to the page. In cursor mode it is
+                ordered by the key and fetches one extra row to detect a next page.
+        """
+        if filter_params.cursor is None:
+            return query.offset(filter_params.offset).limit(filter_params.limit)
+
+        query = query.order_by(None).order_by(
+            *(
+                column.asc() if self.order == "asc" else column.desc()
+                for column in self.columns
+            )
+        )
+        if filter_params.cursor:
+            key = tuple_(*self.columns)
+            after = tuple_(*self._decode(filter_params.cursor))
+            query = query.filter(key > after if self.order == "asc" else key < after)
+
+        return query.limit(filter_params.limit + 1)
+
+    def page(
+        self,
+        rows: list,
+        filter_params: FilterParams,
+        create_items: Callable[[list], list[ItemT]],
+    ) -> list[ItemT] | CursorPage[ItemT]:
+        """
+        Build the response for rows fetched with apply().
+
+        Args:
+            rows (list): The rows returned by the paginated query.
+            filter_params (FilterParams): The pagination parameters.
+            create_items (Callable[[list], list[ItemT]]): Converts rows to response items.
+
+        Returns:
+            list[ItemT] | CursorPage[ItemT]: The items, wrapped in a CursorPage with
+                the next cursor in cursor mode.
+        """
+        if filter_params.cursor is None:
+            return create_items(rows)
+
+        has_next_page = len(rows) > filter_params.limit
+        rows = rows[: filter_params.limit]
+        return CursorPage(
+            items=create_items(rows),
+            next_cursor=self._encode(self.key(rows[-1])) if has_next_page else None,
+        )
+
+    def _encode(self, values: tuple) -> str:
+        payload = {
+            "k": self.name,
+            "v": [
+                value.isoformat() if isinstance(value, datetime) else str(value)
+                for value in values
+            ],
+        }
+        return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+    def _decode(self, cursor: str) -> tuple:
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            if payload["k"] != self.name or len(payload["v"]) != len(self.columns):
+                raise ValueError("Cursor does not match the requested ordering")
+            return tuple(
+                _parse_value(value, column.type.python_type)
+                for value, column in zip(payload["v"], self.columns)
+            )
+        except (binascii.Error, UnicodeDecodeError, KeyError, TypeError, ValueError):
+            raise ApplicationError(
+                detail="Invalid cursor", status_code=status.HTTP_400_BAD_REQUEST
+            )
+
+
+def _parse_value(value: str, python_type: type) -> Any:
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    return python_type(value)
@@ -1,10 +1,12 @@
 import logging
-from typing import Any, Callable
+from functools import lru_cache
+from typing import Any, Awaitable, Callable
 
 from fastapi import status
 from fastapi.responses import JSONResponse
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.exceptions.custom_exceptions import ApplicationError
@@ -12,6 +14,33 @@ from app.exceptions.custom_exceptions import ApplicationError
 logger = logging.getLogger(__name__)
 
 
+class ModelJSONResponse(JSONResponse):
+    """
+    JSONResponse that serializes pydantic models straight to JSON bytes.
+
+    A model, or a list of models of the same type, is rendered by pydantic's
+    serializer in one pass instead of being dumped to Python objects first and
+    encoded again by json.dumps. The bytes are the same as JSONResponse would
+    produce for the dumped data. Any other content is rendered by JSONResponse.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return _type_adapter(type(content)).dump_json(content)
+        if isinstance(content, list) and content:
+            model = type(content[0])
+            if issubclass(model, BaseModel) and all(
+                type(item) is model for item in content
+            ):
+                return _type_adapter(list[model]).dump_json(content)
+        return super().render(_format_response(content))
+
+
+@lru_cache
+def _type_adapter(type_: Any) -> TypeAdapter:
+    return TypeAdapter(type_)
+
+
 def process_request(
     get_entities_fn: Callable,
     status_code: int,
@@ -40,9 +69,61 @@ def process_request(
             transaction_func=get_entities_fn,
             db=db,
         )
+        return ModelJSONResponse(
+            status_code=status_code,
+            content=response,
+        )
+    except ApplicationError as ex:
+        logger.exception(str(ex))
         return JSONResponse(
+            status_code=ex.data.status,
+            content={"detail": {"error": ex.data.detail}},
+        )
+    except TypeError as ex:
+        logger.exception(not_found_err_msg)
+        return JSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={"detail": {"error": str(ex)}},
+        )
+    except SyntaxError as ex:
+        logger.exception("Pers thrown an exception")
+        return JSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content={"detail": {"error": str(ex)}},
+        )
+
+
+async def process_async_request(
+    get_entities_fn: Callable[[], Awaitable],
+    status_code: int,
+    not_found_err_msg: str,
+    db: AsyncSession,
+) -> JSONResponse:
+    """
+    Asynchronous counterpart of process_request for endpoints using an AsyncSession.
+
+    Args:
+        get_entities_fn (Callable[[], Awaitable]): A coroutine function that retrieves entities.
+        status_code (int): The status code to return on successful processing.
+        not_found_err_msg (str): The error message to log if a TypeError occurs.
+        db (AsyncSession): The SQLAlchemy asynchronous database session.
+
+    Returns:
+        JSONResponse: A JSON response with the appropriate status code and content.
+
+    Raises:
+        ApplicationError: If an application-specific error occurs.
+        TypeError: If a type error occurs.
+        SyntaxError: If a syntax error occurs.
+    """
+    try:
+        response = await process_async_db_transaction(
+            transaction_func=get_entities_fn,
+            db=db,
+        )
+        return ModelJSONResponse(
             status_code=status_code,
-            content=_format_response(response),
+            content=response,
         )
     except ApplicationError as ex:
         logger.exception(str(ex))
@@ -64,6 +145,40 @@ def process_request(
         )
 
 
+async def process_async_db_transaction(
+    transaction_func: Callable[[], Awaitable],
+    db: AsyncSession,
+) -> Any:
+    """
+    Awaits a database transaction coroutine function and handles exceptions.
+
+    Args:
+        transaction_func (Callable[[], Awaitable]): The coroutine function to await.
+        db (AsyncSession): The SQLAlchemy asynchronous database session.
+
+    Returns:
+        Any: The result of the transaction function if successful.
+
+    Raises:
+        ApplicationError: If an IntegrityError or SQLAlchemyError occurs during the transaction.
+    """
+    try:
+        return await transaction_func()
+    except IntegrityError as e:
+        await db.rollback()
+        logger.error(f"Integrity error: {str(e)}")
+        raise ApplicationError(
+            detail="Database conflict occurred", status_code=status.HTTP_409_CONFLICT
+        )
+    except SQLAlchemyError as e:
+        await db.rollback()
+        logger.error(f"Unexpected DB error: {str(e)}")
+        raise ApplicationError(
+            detail="Internal server error",
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+
 def process_db_transaction(transaction_func: Callable, db: Session) -> Any:
     """
     Executes a database transaction function and handles exceptions.
@@ -0,0 +1,400 @@
+import math
+from dataclasses import dataclass
+from typing import Hashable, Iterable, Literal
+from uuid import UUID
+
+import numpy as np
+
+# Skills are stored one bit per skill, packed into 64-bit words.
+WORD_BITS = 64
+INITIAL_CAPACITY = 1024
+
+# Weights of the score components; they add up to 1.
+SKILL_WEIGHT = 0.6
+SALARY_WEIGHT = 0.2
+LOCATION_WEIGHT = 0.1
+CATEGORY_WEIGHT = 0.1
+
+Similarity = Literal["jaccard", "overlap"]
+
+
+class Vocabulary:
+    """
+    Assigns consecutive integer codes to keys (skill, city or category ids).
+
+    The indexes of both sides of a match share vocabularies, so a skill has the
+    same column and a city the same code in each of them.
+    """
+
+    def __init__(self) -> None:
+        self._codes: dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def code(self, key: Hashable | None) -> int:
+        """
+        Return the code of a key, assigning the next free code to new keys.
+
+        Args:
+            key (Hashable | None): The key to encode.
+
+        Returns:
+            int: The code of the key, or -1 for None.
+        """
+        if key is None:
+            return -1
+        return self._codes.setdefault(key, len(self._codes))
+
+
+@dataclass(frozen=True)
+class MatchEntry:
+    """
+    The matching attributes of a job ad or job application.
+
+    Attributes:
+        id (UUID): The identifier of the job ad or job application.
+        skill_ids (list[UUID]): The ids of its skills.
+        min_salary (float | None): The lower end of its salary range.
+        max_salary (float | None): The upper end of its salary range.
+        location_id (UUID | None): The id of its city.
+        category_id (UUID | None): The id of its category.
+    """
+
+    id: UUID
+    skill_ids: list[UUID]
+    min_salary: float | None
+    max_salary: float | None
+    location_id: UUID | None
+    category_id: UUID | None
+
+
+@dataclass(frozen=True)
+class MatchQuery:
+    """
+    A MatchEntry encoded against the vocabularies of an index.
+
+    Attributes:
+        skills (np.ndarray): The packed skill bits.
+        skill_count (int): The number of skills.
+        min_salary (float): The lower end of the salary range, NaN if unknown.
+        max_salary (float): The upper end of the salary range, NaN if unknown.
+        location (int): The location code, -1 if unknown.
+        category (int): The category code, -1 if unknown.
+    """
+
+    skills: np.ndarray
+    skill_count: int
+    min_salary: float
+    max_salary: float
+    location: int
+    category: int
+
+
+@dataclass(frozen=True)
+class ScoredMatch:
+    """
+    A candidate returned by SkillMatchIndex.top_k().
+
+    Attributes:
+        id (UUID): The identifier of the candidate.
+        score (float): The weighted score, from 0 to 1.
+        matched_skills (int): The number of skills shared with the query.
+        skill_similarity (float): Jaccard or overlap similarity of the skill sets.
+        salary_overlap (float): Share of the query's salary range covered by the
+            candidate's range, from 0 to 1.
+        same_location (bool): Whether the candidate is in the query's city.
+        same_category (bool): Whether the candidate is in the query's category.
+    """
+
+    id: UUID
+    score: float
+    matched_skills: int
+    skill_similarity: float
+    salary_overlap: float
+    same_location: bool
+    same_category: bool
+
+
+def _salary(value: float | None) -> float:
+    return math.nan if value is None else float(value)
+
+
+class SkillMatchIndex:
+    """
+    In-memory matching attributes of a set of job ads or job applications.
+
+    Each entry occupies a row of a skill incidence matrix stored as packed bits
+    (one uint64 per 64 skills), next to parallel arrays of skill counts, salary
+    ranges and location and category codes. Scoring a query against every row is
+    a handful of vectorized NumPy operations that only read the matrix words
+    holding the query's skills. Rows of removed entries are reused.
+
+    The index is not thread-safe; callers serialize access.
+    """
+
+    def __init__(
+        self,
+        skills: Vocabulary,
+        locations: Vocabulary,
+        categories: Vocabulary,
+    ) -> None:
+        self._skill_vocabulary = skills
+        self._location_vocabulary = locations
+        self._category_vocabulary = categories
+
+        self._rows: dict[UUID, int] = {}
+        self._ids: list[UUID | None] = []
+        self._free_rows: list[int] = []
+
+        self._skills = np.zeros((INITIAL_CAPACITY, 1), dtype=np.uint64, order="F")
+        self._skill_counts = np.zeros(INITIAL_CAPACITY, dtype=np.int32)
+        self._min_salaries = np.full(INITIAL_CAPACITY, np.nan)
+        self._max_salaries = np.full(INITIAL_CAPACITY, np.nan)
+        self._locations = np.full(INITIAL_CAPACITY, -1, dtype=np.int32)
+        self._categories = np.full(INITIAL_CAPACITY, -1, dtype=np.int32)
+        self._occupied = np.zeros(INITIAL_CAPACITY, dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, entry_id: UUID) -> bool:
+        return entry_id in self._rows
+
+    def encode(self, entry: MatchEntry) -> MatchQuery:
+        """
+        Encode an entry for use as a query.
+
+        Args:
+            entry (MatchEntry): The entry to encode.
+
+        Returns:
+            MatchQuery: The encoded entry.
+        """
+        columns = {
+            self._skill_vocabulary.code(skill_id) for skill_id in entry.skill_ids
+        }
+        skills = np.zeros(
+            max(1, math.ceil(len(self._skill_vocabulary) / WORD_BITS)), dtype=np.uint64
+        )
+        for column in columns:
+            skills[column // WORD_BITS] |= np.uint64(1 << (column % WORD_BITS))
+
+        return MatchQuery(
+            skills=skills,
+            skill_count=len(columns),
+            min_salary=_salary(entry.min_salary),
+            max_salary=_salary(entry.max_salary),
+            location=self._location_vocabulary.code(entry.location_id),
+            category=self._category_vocabulary.code(entry.category_id),
+        )
+
+    def query(self, entry_id: UUID) -> MatchQuery | None:
+        """
+        Return the encoded attributes of an indexed entry.
+
+        Args:
+            entry_id (UUID): The identifier of the entry.
+
+        Returns:
+            MatchQuery | None: The encoded entry, or None if it is not indexed.
+        """
+        row = self._rows.get(entry_id)
+        if row is None:
+            return None
+        return MatchQuery(
+            skills=self._skills[row].copy(),
+            skill_count=int(self._skill_counts[row]),
+            min_salary=float(self._min_salaries[row]),
+            max_salary=float(self._max_salaries[row]),
+            location=int(self._locations[row]),
+            category=int(self._categories[row]),
+        )
+
+    def upsert(self, entries: Iterable[MatchEntry]) -> None:
+        """
+        Add entries to the index or replace the indexed attributes of entries.
+
+        Args:
+            entries (Iterable[MatchEntry]): The entries to store.
+        """
+        for entry in entries:
+            query = self.encode(entry)
+            self._ensure_width(len(query.skills))
+
+            row = self._rows.get(entry.id)
+            if row is None:
+                row = self._allocate_row(entry.id)
+
+            self._skills[row] = 0
+            self._skills[row, : len(query.skills)] = query.skills
+            self._skill_counts[row] = query.skill_count
+            self._min_salaries[row] = query.min_salary
+            self._max_salaries[row] = query.max_salary
+            self._locations[row] = query.location
+            self._categories[row] = query.category
+
+    def remove(self, entry_ids: Iterable[UUID]) -> None:
+        """
+        Remove entries from the index. Unknown ids are ignored.
+
+        Args:
+            entry_ids (Iterable[UUID]): The identifiers of the entries to remove.
+        """
+        for entry_id in entry_ids:
+            row = self._rows.pop(entry_id, None)
+            if row is None:
+                continue
+            self._ids[row] = None
+            self._occupied[row] = False
+            self._free_rows.append(row)
+
+    def top_k(
+        self,
+        query: MatchQuery,
+        limit: int,
+        similarity: Similarity = "jaccard",
+    ) -> list[ScoredMatch]:
+        """
+        Score every entry against a query and return the best ones.
+
+        Entries sharing no skill with the query are not returned, unless the query
+        has no skills.
+
+        Args:
+            query (MatchQuery): The encoded query.
+            limit (int): The maximum number of matches to return.
+            similarity (Similarity): "jaccard" divides the shared skills by the
+                skills of either side, "overlap" by the skills of the smaller side.
+
+        Returns:
+            list[ScoredMatch]: The matches, best first.
+        """
+        size = len(self._ids)
+        if size == 0 or limit <= 0:
+            return []
+
+        # Only the words holding the query's skills can contribute matches. A query
+        # has a handful of skills, and each word is a contiguous column of the
+        # column-major matrix, so the rest of the matrix is not read.
+        query_skills = query.skills[: self._skills.shape[1]]
+        matched = np.zeros(size, dtype=np.int32)
+        for word in np.flatnonzero(query_skills):
+            matched += np.bitwise_count(self._skills[:size, word] & query_skills[word])
+
+        candidates = self._occupied[:size]
+        if query.skill_count > 0:
+            candidates = candidates & (matched > 0)
+        rows = np.flatnonzero(candidates)
+        if len(rows) == 0:
+            return []
+
+        matched = matched[rows]
+        counts = self._skill_counts[rows]
+        if similarity == "overlap":
+            denominator = np.minimum(counts, query.skill_count)
+        else:
+            denominator = counts + query.skill_count - matched
+        skill_similarity = np.divide(
+            matched,
+            denominator,
+            out=np.zeros(len(rows)),
+            where=denominator > 0,
+        )
+        salary_overlap = self._salary_overlap(rows=rows, query=query)
+        same_location = (self._locations[rows] == query.location) & (
+            query.location >= 0
+        )
+        same_category = (self._categories[rows] == query.category) & (
+            query.category >= 0
+        )
+
+        scores = (
+            SKILL_WEIGHT * skill_similarity
+            + SALARY_WEIGHT * salary_overlap
+            + LOCATION_WEIGHT * same_location
+            + CATEGORY_WEIGHT * same_category
+        )
+        limit = min(limit, len(rows))
+        best = np.argpartition(-scores, limit - 1)[:limit]
+        best = best[np.argsort(-scores[best], kind="stable")]
+
+        return [
+            ScoredMatch(
+                id=self._ids[rows[i]],
+                score=float(scores[i]),
+                matched_skills=int(matched[i]),
+                skill_similarity=float(skill_similarity[i]),
+                salary_overlap=float(salary_overlap[i]),
+                same_location=bool(same_location[i]),
+                same_category=bool(same_category[i]),
+            )
+            for i in best
+        ]
+
+    def _salary_overlap(self, rows: np.ndarray, query: MatchQuery) -> np.ndarray:
+        """
+        Share of the query's salary range covered by the given rows' ranges.
+
+        Unknown ranges on either side score 0. A single-value query range scores
+        1 when it falls inside the entry's range.
+        """
+        overlap = np.minimum(self._max_salaries[rows], query.max_salary) - np.maximum(
+            self._min_salaries[rows], query.min_salary
+        )
+        query_width = query.max_salary - query.min_salary
+        with np.errstate(invalid="ignore"):
+            if query_width > 0:
+                share = np.clip(overlap / query_width, 0, 1)
+            else:
+                share = (overlap >= 0).astype(float)
+        return np.nan_to_num(share, nan=0.0)
+
+    def _allocate_row(self, entry_id: UUID) -> int:
+        if self._free_rows:
+            row = self._free_rows.pop()
+            self._ids[row] = entry_id
+        else:
+            row = len(self._ids)
+            self._ensure_capacity(row + 1)
+            self._ids.append(entry_id)
+        self._rows[entry_id] = row
+        self._occupied[row] = True
+        return row
+
+    def _ensure_capacity(self, rows: int) -> None:
+        capacity = len(self._skill_counts)
+        if rows <= capacity:
+            return
+        extra = max(rows, capacity * 2) - capacity
+
+        padding = np.zeros((extra, self._skills.shape[1]), dtype=np.uint64)
+        self._skills = np.asfortranarray(np.vstack([self._skills, padding]))
+        self._skill_counts = np.concatenate(
+            [self._skill_counts, np.zeros(extra, dtype=np.int32)]
+        )
+        self._min_salaries = np.concatenate(
+            [self._min_salaries, np.full(extra, np.nan)]
+        )
+        self._max_salaries = np.concatenate(
+            [self._max_salaries, np.full(extra, np.nan)]
+        )
+        self._locations = np.concatenate(
+            [self._locations, np.full(extra, -1, dtype=np.int32)]
+        )
+        self._categories = np.concatenate(
+            [self._categories, np.full(extra, -1, dtype=np.int32)]
+        )
+        self._occupied = np.concatenate([self._occupied, np.zeros(extra, dtype=bool)])
+
+    def _ensure_width(self, words: int) -> None:
+        width = self._skills.shape[1]
+        if words <= width:
+            return
+        # Widen in steps so new skills do not copy the matrix every time.
+        extra = max(words, width * 2) - width
+        self._skills = np.asfortranarray(
+            np.hstack(
+                [self._skills, np.zeros((len(self._skills), extra), dtype=np.uint64)]
+            )
+        )
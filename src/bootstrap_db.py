@@ -0,0 +1,22 @@
+"""
+One-shot database bootstrap: creates the extension and tables and seeds sample data
+"""
+#!/usr/bin/env python3
+
+import logging
+from argparse import ArgumentParser
+
+from app.sql_app.database import initialize_database
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument(
+        "--no-seed",
+        action="store_true",
+        help="create the schema only, without inserting the sample data",
+    )
+    config = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    initialize_database(seed=not config.no_seed)
+    print("Database bootstrap completed")
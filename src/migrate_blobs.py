@@ -0,0 +1,24 @@
+"""
+One-shot migration moving photos, CVs and logos from the database to the blob store
+"""
+#!/usr/bin/env python3
+
+import logging
+from argparse import ArgumentParser
+
+from app.storage.migration import migrate_blobs
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument(
+        "-b",
+        "--batch-size",
+        type=int,
+        default=50,
+        help="number of rows moved per transaction (default: 50)",
+    )
+    config = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    for column, count in migrate_blobs(batch_size=config.batch_size).items():
+        print(f"{column}: {count} rows migrated")
@@ -3,6 +3,7 @@ Entry point for running server
 """
 #!/usr/bin/env python3
 
+import os
 from argparse import ArgumentParser
 
 import uvicorn
@@ -24,16 +25,92 @@ if __name__ == "__main__":
         "--port",
         type=int,
         default=7999,
-        help="port to listen on (default: 8000)",
+        help="port to listen on (default: 7999)",
+    )
+    parser.add_argument(
+        "--production",
+        action="store_true",
+        help="serve with multiple workers and no auto-reloading",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="number of worker processes in production mode (default: CPU count)",
+    )
+    parser.add_argument(
+        "--loop",
+        choices=["auto", "asyncio", "uvloop"],
+        default="auto",
+        help="event loop implementation; 'auto' uses uvloop when installed",
+    )
+    parser.add_argument(
+        "--http",
+        choices=["auto", "h11", "httptools"],
+        default="auto",
+        help="HTTP protocol implementation; 'auto' uses httptools when installed",
+    )
+    parser.add_argument(
+        "--keep-alive",
+        type=int,
+        default=5,
+        help="seconds to keep idle connections open (default: 5)",
+    )
+    parser.add_argument(
+        "--backlog",
+        type=int,
+        default=2048,
+        help="maximum number of pending connections (default: 2048)",
+    )
+    parser.add_argument(
+        "--max-requests",
+        type=int,
+        default=0,
+        help="requests a worker serves before it is replaced, to cap memory "
+        "growth; only honoured with more than one worker, since a lone worker "
+        "is not respawned (default: 0, disabled)",
+    )
+    parser.add_argument(
+        "--graceful-timeout",
+        type=int,
+        default=30,
+        help="seconds to wait for in-flight requests on shutdown (default: 30)",
     )
     config = parser.parse_args()
 
-    reload_dirs = config.reload.split(",") if config.reload else []
+    if not config.production:
+        reload_dirs = config.reload.split(",") if config.reload else []
+        # Enables development checks such as the N+1 query warnings.
+        os.environ.setdefault("DEBUG", "true")
 
-    uvicorn.run(
-        "app.main:app",
-        host="0.0.0.0",
-        port=config.port,
-        reload_dirs=reload_dirs,
-        reload=True,
-    )
+        uvicorn.run(
+            "app.main:app",
+            host="0.0.0.0",
+            port=config.port,
+            reload_dirs=reload_dirs,
+            reload=True,
+        )
+    else:
+        if config.reload:
+            parser.error("--reload is only available in development mode")
+
+        # uvicorn only respawns workers it supervises; a single worker that
+        # hits the limit exits and takes the server down with it.
+        max_requests = config.max_requests if config.workers > 1 else 0
+
+        # Each worker opens a sync and an async pool per database, so the
+        # primary and every replica must accept
+        # workers * 2 * (DB_POOL_SIZE + DB_MAX_OVERFLOW) connections.
+        uvicorn.run(
+            "app.main:app",
+            host="0.0.0.0",
+            port=config.port,
+            workers=config.workers,
+            loop=config.loop,
+            http=config.http,
+            timeout_keep_alive=config.keep_alive,
+            backlog=config.backlog,
+            limit_max_requests=max_requests or None,
+            timeout_graceful_shutdown=config.graceful_timeout,
+        )
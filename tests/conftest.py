@@ -0,0 +1,69 @@
+from contextlib import contextmanager
+from typing import Callable, ContextManager, Iterator
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.services.reference_data import REFERENCE_TABLES
+from app.sql_app.query_stats import QueryStats, track_queries
+
+
+@pytest.fixture(autouse=True)
+def empty_reference_cache() -> Iterator[None]:
+    """
+    Start and end every test with an empty reference data cache, so cached rows
+    from one test's mocks never leak into another.
+    """
+    for table in REFERENCE_TABLES:
+        table.invalidate()
+    yield
+    for table in REFERENCE_TABLES:
+        table.invalidate()
+
+
+@pytest.fixture
+def assert_max_queries() -> Callable[[int], ContextManager[QueryStats]]:
+    """
+    Assert that a block executes at most the given number of SQL statements.
+
+    Usage::
+
+        with assert_max_queries(2):
+            job_ad_service.get_by_id(job_ad_id=job_ad_id, db=db_session)
+    """
+
+    @contextmanager
+    def _assert_max_queries(max_queries: int) -> Iterator[QueryStats]:
+        with track_queries() as stats:
+            yield stats
+        assert (
+            stats.count <= max_queries
+        ), f"Expected at most {max_queries} queries, got {stats.count}:\n" + "\n".join(
+            f"{count}x {shape}" for shape, count in stats.shapes.most_common()
+        )
+
+    return _assert_max_queries
+
+
+@pytest.fixture
+def db_session() -> Iterator[Session]:
+    """
+    A session on the database configured in .env, rolled back after the test.
+
+    Tests using it are skipped when the database is not reachable.
+    """
+    from app.sql_app.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        db.execute(text("SELECT 1"))
+    except OperationalError:
+        db.close()
+        pytest.skip("database is not reachable")
+    try:
+        yield db
+    finally:
+        db.rollback()
+        db.close()
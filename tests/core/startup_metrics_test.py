@@ -0,0 +1,62 @@
+import asyncio
+
+from app.core.startup_metrics import FirstRequestMiddleware, StartupMetrics
+
+
+def test_snapshot_returnsNoTimings_beforeStartupCompletes() -> None:
+    # Arrange
+    metrics = StartupMetrics()
+
+    # Act
+    result = metrics.snapshot()
+
+    # Assert
+    assert result.startup_ms is None
+    assert result.time_to_first_request_ms is None
+
+
+def test_snapshot_returnsElapsedTimesSinceProcessStart(mocker) -> None:
+    # Arrange
+    metrics = StartupMetrics()
+    metrics.process_started_at = 100.0
+    mock_time = mocker.patch("app.core.startup_metrics.time")
+    mock_time.time.side_effect = [100.25, 101.5]
+
+    # Act
+    metrics.mark_ready()
+    metrics.mark_first_request()
+    result = metrics.snapshot()
+
+    # Assert
+    assert result.startup_ms == 250
+    assert result.time_to_first_request_ms == 1500
+
+
+def test_markFirstRequest_keepsFirstTimestamp() -> None:
+    # Arrange
+    metrics = StartupMetrics()
+    metrics.mark_first_request()
+    first_request_at = metrics.first_request_at
+
+    # Act
+    metrics.mark_first_request()
+
+    # Assert
+    assert metrics.first_request_at == first_request_at
+
+
+def test_firstRequestMiddleware_recordsHttpRequests(mocker) -> None:
+    # Arrange
+    metrics = StartupMetrics()
+    app = mocker.AsyncMock()
+    middleware = FirstRequestMiddleware(app=app, metrics=metrics)
+
+    # Act
+    asyncio.run(middleware({"type": "lifespan"}, mocker.Mock(), mocker.Mock()))
+    lifespan_first_request_at = metrics.first_request_at
+    asyncio.run(middleware({"type": "http"}, mocker.Mock(), mocker.Mock()))
+
+    # Assert
+    assert lifespan_first_request_at is None
+    assert metrics.first_request_at is not None
+    assert app.await_count == 2
@@ -2,7 +2,6 @@ import pytest
 
 from app.schemas.category import CategoryResponse
 from app.services import category_service
-from app.sql_app.category.category import Category
 from tests import test_data as td
 
 
@@ -11,34 +10,72 @@ def mock_db(mocker):
     return mocker.Mock()
 
 
-def test_getAll_returnsCategories_whenCategoriesExist(mocker, mock_db) -> None:
+def test_getAll_returnsCategories_whenCategoriesExist(mock_db) -> None:
     # Arrange
-    categories = [mocker.MagicMock(**td.CATEGORY), mocker.MagicMock(**td.CATEGORY_2)]
-
-    mock_query = mock_db.query.return_value
-    mock_query.all.return_value = categories
+    categories = (td.CATEGORY, td.CATEGORY_2)
+    mock_db.query.side_effect = [
+        [
+            (category["id"], category["title"], category["description"])
+            for category in categories
+        ],
+        [(category["id"], 2, 3) for category in categories],
+    ]
 
     # Act
     result = category_service.get_all(mock_db)
 
     # Assert
-    mock_db.query.assert_called_with(Category)
-    mock_query.all.assert_called_once()
+    assert mock_db.query.call_count == 2
     assert len(result) == 2
     assert isinstance(result, list)
     assert isinstance(result[0], CategoryResponse)
     assert isinstance(result[1], CategoryResponse)
+    assert result[0].job_ads_count == 2
+    assert result[0].job_applications_count == 3
+
+
+def test_getAll_servesCategoriesFromCache_andCountsOnEveryCall(mock_db) -> None:
+    # Arrange
+    mock_db.query.side_effect = [
+        [(td.VALID_CATEGORY_ID, td.VALID_CATEGORY_TITLE, "")],
+        [(td.VALID_CATEGORY_ID, 0, 0)],
+        [(td.VALID_CATEGORY_ID, 1, 4)],
+    ]
+    category_service.get_all(mock_db)
+
+    # Act
+    result = category_service.get_all(mock_db)
+
+    # Assert
+    assert mock_db.query.call_count == 3
+    assert result[0].id == td.VALID_CATEGORY_ID
+    assert result[0].job_ads_count == 1
+    assert result[0].job_applications_count == 4
+
+
+def test_getAll_returnsZeroCounts_whenCategoryHasNoJobAdsOrApplications(
+    mock_db,
+) -> None:
+    # Arrange
+    mock_db.query.side_effect = [
+        [(td.VALID_CATEGORY_ID, td.VALID_CATEGORY_TITLE, "")],
+        [],
+    ]
+
+    # Act
+    result = category_service.get_all(mock_db)
+
+    # Assert
+    assert result[0].job_ads_count == 0
+    assert result[0].job_applications_count == 0
 
 
 def test_getAll_returnsEmptyList_whenNoCategoriesExist(mock_db) -> None:
     # Arrange
-    mock_query = mock_db.query.return_value
-    mock_query.all.return_value = []
+    mock_db.query.side_effect = [[], []]
 
     # Act
     result = category_service.get_all(mock_db)
 
     # Assert
-    mock_db.query.assert_called_with(Category)
-    mock_query.all.assert_called()
     assert result == []
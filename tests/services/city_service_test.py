@@ -5,7 +5,7 @@ from fastapi import status
 
 from app.exceptions.custom_exceptions import ApplicationError
 from app.schemas.city import CityResponse
-from app.services import city_service
+from app.services import city_service, reference_data
 from app.sql_app.city.city import City
 from tests import test_data as td
 from tests.utils import assert_filter_called_with
@@ -27,60 +27,69 @@ def mock_city(mocker):
     return _create_mock_city
 
 
-def test_getAll_returnsCities_whenCitiesExist(mock_db, mock_city):
+def _cache_cities(mocker, cities: list[dict]) -> None:
+    rows = [(city["id"], city["name"]) for city in cities]
+    reference_data.cities.get(db=mocker.Mock(**{"query.return_value": rows}))
+
+
+def test_getAll_returnsCities_whenCitiesExist(mock_db):
     # Arrange
-    cities = [mock_city(**td.CITY), mock_city(**td.CITY_2)]
-    mock_query = mock_db.query.return_value
-    mock_query.all.return_value = cities
+    mock_db.query.return_value = [
+        (td.VALID_CITY_ID, td.VALID_CITY_NAME),
+        (td.VALID_CITY_ID_2, td.VALID_CITY_NAME_2),
+    ]
 
     # Act
     result = city_service.get_all(mock_db)
 
     # Assert
-    mock_db.query.assert_called_with(City)
-    mock_query.all.assert_called_once()
+    mock_db.query.assert_called_once_with(City.id, City.name)
     assert len(result) == 2
     assert isinstance(result, list)
     assert isinstance(result[0], CityResponse)
     assert isinstance(result[1], CityResponse)
 
 
-def test_getAll_returnsEmptyList_whenNoCitiesExist(mock_db):
+def test_getAll_servesCitiesFromCache_afterFirstCall(mocker, mock_db):
     # Arrange
-    mock_query = mock_db.query.return_value
-    mock_query.all.return_value = []
+    _cache_cities(mocker, [td.CITY, td.CITY_2])
 
     # Act
     result = city_service.get_all(mock_db)
 
     # Assert
-    mock_db.query.assert_called_with(City)
-    mock_query.all.assert_called()
-    assert result == []
+    mock_db.query.assert_not_called()
+    assert [city.id for city in result] == [td.VALID_CITY_ID, td.VALID_CITY_ID_2]
+    assert reference_data.cities.stats().hits == 1
 
 
-def test_getById_returnsCity_whenCityIsFound(mock_db, mock_city):
+def test_getAll_returnsEmptyList_whenNoCitiesExist(mock_db):
     # Arrange
-    city = mock_city(**td.CITY)
+    mock_db.query.return_value = []
 
-    mock_query = mock_db.query.return_value
-    mock_filter = mock_query.filter.return_value
-    mock_filter.first.return_value = city
+    # Act
+    result = city_service.get_all(mock_db)
+
+    # Assert
+    assert result == []
 
+
+def test_getById_returnsCity_whenCityIsCached(mocker, mock_db):
+    # Arrange
+    _cache_cities(mocker, [td.CITY])
     expected_city_response = CityResponse(id=td.VALID_CITY_ID, name=td.VALID_CITY_NAME)
 
     # Act
     result = city_service.get_by_id(city_id=td.VALID_CITY_ID, db=mock_db)
 
     # Assert
-    mock_db.query.assert_called_once_with(City)
-    mock_query.filter.assert_called_once_with(ANY)
-    assert_filter_called_with(mock_query, City.id == td.VALID_CITY_ID)
+    mock_db.query.assert_not_called()
     assert result == expected_city_response
 
 
-def test_getById_raisesApplicationError_whenCityIsNotFound(mock_db):
+def test_getById_raisesApplicationError_whenCityIsNotFound(mocker, mock_db):
     # Arrange
+    _cache_cities(mocker, [td.CITY_2])
     mock_query = mock_db.query.return_value
     mock_filter = mock_query.filter.return_value
     mock_filter.first.return_value = None
@@ -128,15 +137,24 @@ def test_getDefault_raisesApplicationError_whenCityIsNotFound(mock_db):
     assert exc.value.data.detail == "No default city found"
 
 
-def test_getByName_returnsCity_whenCityIsFound(mock_db, mock_city):
+def test_getByName_returnsCity_whenCityIsCached(mocker, mock_db):
     # Arrange
-    city = mock_city(**td.CITY)
+    _cache_cities(mocker, [td.CITY])
+    expected_city_response = CityResponse(id=td.VALID_CITY_ID, name=td.VALID_CITY_NAME)
 
-    mock_query = mock_db.query.return_value
-    mock_filter = mock_query.filter.return_value
-    mock_filter.first.return_value = city
+    # Act
+    result = city_service.get_by_name(city_name=td.VALID_CITY_NAME, db=mock_db)
+
+    # Assert
+    mock_db.query.assert_not_called()
+    assert result == expected_city_response
 
-    expected_city_response = CityResponse(id=td.VALID_CITY_ID, name=td.VALID_CITY_NAME)
+
+def test_getByName_queriesCity_whenCityIsNotCached(mocker, mock_db, mock_city):
+    # Arrange
+    _cache_cities(mocker, [td.CITY_2])
+    mock_query = mock_db.query.return_value
+    mock_query.filter.return_value.first.return_value = mock_city(**td.CITY)
 
     # Act
     result = city_service.get_by_name(city_name=td.VALID_CITY_NAME, db=mock_db)
@@ -145,11 +163,12 @@ def test_getByName_returnsCity_whenCityIsFound(mock_db, mock_city):
     mock_db.query.assert_called_once_with(City)
     mock_query.filter.assert_called_once_with(ANY)
     assert_filter_called_with(mock_query, City.name == td.VALID_CITY_NAME)
-    assert result == expected_city_response
+    assert result == CityResponse(id=td.VALID_CITY_ID, name=td.VALID_CITY_NAME)
 
 
-def test_getByName_raisesApplicationError_whenCityIsNotFound(mock_db):
+def test_getByName_raisesApplicationError_whenCityIsNotFound(mocker, mock_db):
     # Arrange
+    _cache_cities(mocker, [td.CITY_2])
     mock_query = mock_db.query.return_value
     mock_filter = mock_query.filter.return_value
     mock_filter.first.return_value = None
@@ -1,16 +1,26 @@
+from unittest.mock import ANY
+
 import pytest
 from fastapi import status
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
 
 from app.exceptions.custom_exceptions import ApplicationError
+from app.services import reference_data
 from app.services.common import (
+    create_batch_lookup_result,
+    filter_by_skill_ids,
     get_company_by_id,
     get_job_ad_by_id,
     get_job_application_by_id,
     get_match_by_id,
     get_professional_by_id,
     get_skill_by_id,
-    get_skill_by_name,
+    get_skill_ids_by_names,
+    insert_skill_links,
+    is_extension_available,
 )
+from app.sql_app import JobAdSkill
 from app.sql_app.company.company import Company
 from app.sql_app.job_ad.job_ad import JobAd
 from app.sql_app.job_application.job_application import JobApplication
@@ -219,41 +229,123 @@ def test_getSkillById_raisesApplicationError_whenSkillNotFound(mock_db) -> None:
     assert exc_info.value.data.detail == f"Skill with id {td.VALID_SKILL_ID} not found"
 
 
-def test_getSkillByName_returnsSkill_whenSkillFound(mocker, mock_db) -> None:
+def test_getSkillIdsByNames_queriesUncachedNamesOnce(mocker, mock_db) -> None:
     # Arrange
-    skill = mocker.Mock(name=td.VALID_SKILL_NAME)
-    mock_query = mock_db.query.return_value
-    mock_filter = mock_query.filter.return_value
-    mock_filter.first.return_value = skill
+    reference_data.skills.get(
+        db=mocker.Mock(
+            **{
+                "query.return_value": [
+                    (td.VALID_SKILL_ID, td.VALID_SKILL_NAME, td.VALID_CATEGORY_ID)
+                ]
+            }
+        )
+    )
+    mock_db.execute.return_value.all.return_value = [
+        (td.VALID_SKILL_NAME_2, td.VALID_SKILL_ID_2)
+    ]
 
     # Act
-    result = get_skill_by_name(skill_name=td.VALID_SKILL_NAME, db=mock_db)
+    result = get_skill_ids_by_names(
+        skill_names=[td.VALID_SKILL_NAME_2, td.VALID_SKILL_NAME, td.VALID_SKILL_NAME],
+        db=mock_db,
+    )
 
     # Assert
-    mock_db.query.assert_called_once_with(Skill)
-    assert_filter_called_with(mock_query, Skill.name == td.VALID_SKILL_NAME)
-    assert result == skill
+    mock_db.execute.assert_called_once()
+    statement = mock_db.execute.call_args.args[0]
+    assert statement.compare(
+        select(Skill.name, Skill.id).where(Skill.name.in_([td.VALID_SKILL_NAME_2]))
+    )
+    assert result == [td.VALID_SKILL_ID_2, td.VALID_SKILL_ID]
 
 
-def test_getSkillByName_raisesApplicationError_whenSkillNotFound(mock_db) -> None:
+def test_getSkillIdsByNames_raisesApplicationError_listingEveryUnknownName(
+    mocker,
+    mock_db,
+) -> None:
     # Arrange
-    mock_query = mock_db.query.return_value
-    mock_filter = mock_query.filter.return_value
-    mock_filter.first.return_value = None
+    mocker.patch.object(
+        reference_data.skills, "get", return_value=mocker.Mock(by_name={})
+    )
+    mock_db.execute.return_value.all.return_value = [
+        (td.VALID_SKILL_NAME, td.VALID_SKILL_ID)
+    ]
 
     # Act
     with pytest.raises(ApplicationError) as exc_info:
-        get_skill_by_name(skill_name=td.VALID_SKILL_NAME, db=mock_db)
+        get_skill_ids_by_names(
+            skill_names=["Unknown 1", td.VALID_SKILL_NAME, "Unknown 2"],
+            db=mock_db,
+        )
 
     # Assert
-    mock_db.query.assert_called_once_with(Skill)
-    assert_filter_called_with(mock_query, Skill.name == td.VALID_SKILL_NAME)
+    mock_db.execute.assert_called_once()
     assert exc_info.value.data.status == status.HTTP_404_NOT_FOUND
     assert (
         exc_info.value.data.detail
-        == f"Skill with name {td.VALID_SKILL_NAME} not found."
+        == "Skills with names Unknown 1, Unknown 2 not found."
+    )
+
+
+def test_insertSkillLinks_insertsAllLinksInOneStatement(mock_db) -> None:
+    # Arrange
+    skill_ids = [td.VALID_SKILL_ID, td.VALID_SKILL_ID_2]
+    mock_db.scalars.return_value = iter([td.VALID_SKILL_ID_2])
+
+    # Act
+    result = insert_skill_links(
+        link_model=JobAdSkill,
+        owner_id=td.VALID_JOB_AD_ID,
+        skill_ids=skill_ids,
+        db=mock_db,
+    )
+
+    # Assert
+    mock_db.scalars.assert_called_once()
+    statement = mock_db.scalars.call_args.args[0]
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert sql.count("INSERT") == 1
+    assert "ON CONFLICT DO NOTHING RETURNING job_ad_skill.skill_id" in sql
+    assert statement.compile(dialect=postgresql.dialect()).params == {
+        "job_ad_id_m0": td.VALID_JOB_AD_ID,
+        "skill_id_m0": td.VALID_SKILL_ID,
+        "job_ad_id_m1": td.VALID_JOB_AD_ID,
+        "skill_id_m1": td.VALID_SKILL_ID_2,
+    }
+    assert result == [td.VALID_SKILL_ID_2]
+
+
+def test_insertSkillLinks_doesNothing_whenNoSkillIds(mock_db) -> None:
+    # Act
+    result = insert_skill_links(
+        link_model=JobAdSkill, owner_id=td.VALID_JOB_AD_ID, skill_ids=[], db=mock_db
+    )
+
+    # Assert
+    mock_db.scalars.assert_not_called()
+    assert result == []
+
+
+def test_createBatchLookupResult_keepsRequestOrder_andMarksMissingIds() -> None:
+    # Arrange
+    unknown_id = td.NON_EXISTENT_ID
+    items = {td.VALID_JOB_AD_ID: "job ad", td.VALID_JOB_AD_ID_2: "job ad 2"}
+
+    # Act
+    result = create_batch_lookup_result(
+        ids=[
+            td.VALID_JOB_AD_ID_2,
+            unknown_id,
+            td.VALID_JOB_AD_ID,
+            td.VALID_JOB_AD_ID_2,
+        ],
+        items=items,
     )
 
+    # Assert
+    assert result.items == ["job ad 2", None, "job ad", "job ad 2"]
+    assert result.not_found == [unknown_id]
+
 
 def test_getMatchById_returnsMatch_whenMatchFound(mocker, mock_db) -> None:
     # Arrange
@@ -304,3 +396,70 @@ def test_getMatchById_raisesApplicationError_whenMatchNotFound(mock_db) -> None:
     )
     assert exc_info.value.data.status == status.HTTP_404_NOT_FOUND
     assert exc_info.value.data.detail == "Match request not found"
+
+
+def test_isExtensionAvailable_cachesResult(mocker, mock_db) -> None:
+    # Arrange
+    mocker.patch("app.services.common._installed_extensions", set())
+    mock_db.execute.return_value.first.return_value = (1,)
+
+    # Act
+    first_result = is_extension_available("pg_trgm", db=mock_db)
+    second_result = is_extension_available("pg_trgm", db=mock_db)
+
+    # Assert
+    assert first_result is True
+    assert second_result is True
+    mock_db.execute.assert_called_once()
+
+
+def test_isExtensionAvailable_returnsFalse_whenExtensionIsMissing(
+    mocker, mock_db
+) -> None:
+    # Arrange
+    mocker.patch("app.services.common._installed_extensions", set())
+    mock_db.execute.return_value.first.return_value = None
+
+    # Act
+    result = is_extension_available("pg_trgm", db=mock_db)
+
+    # Assert
+    assert result is False
+
+
+def test_isExtensionAvailable_checksAgain_afterExtensionWasMissing(
+    mocker, mock_db
+) -> None:
+    # Arrange
+    mocker.patch("app.services.common._installed_extensions", set())
+    mock_db.execute.return_value.first.side_effect = [None, (1,)]
+
+    # Act
+    first_result = is_extension_available("pg_trgm", db=mock_db)
+    second_result = is_extension_available("pg_trgm", db=mock_db)
+
+    # Assert
+    assert first_result is False
+    assert second_result is True
+    assert mock_db.execute.call_count == 2
+
+
+def test_filterBySkillIds_matchesArrayAgainstResolvedSkillIds() -> None:
+    # Arrange
+    skill_names = ["Python", "SQL"]
+
+    # Act
+    condition = filter_by_skill_ids(
+        skill_ids=JobAd.skill_ids, skill_names=skill_names, required_matches=2
+    )
+
+    # Assert
+    sql = str(
+        condition.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+    assert "job_ad.skill_ids && array(" in sql
+    assert "lower(skill.name) IN ('python', 'sql')" in sql
+    assert "unnest(job_ad.skill_ids)" in sql
+    assert ">= 2" in sql
@@ -9,6 +9,7 @@ from app.schemas.common import MessageResponse
 from app.schemas.company import CompanyUpdate
 from app.services import company_service
 from app.sql_app.company.company import Company
+from app.storage import IMAGE_SIGNATURES
 from tests import test_data as td
 from tests.utils import assert_filter_called_with
 
@@ -26,6 +27,7 @@ def mock_company(mocker):
     mock_company.city.name = td.VALID_CITY_NAME
     mock_company.website_url = td.VALID_COMPANY_WEBSITE_URL
     mock_company.youtube_video_id = td.VALID_COMPANY_YOUTUBE_VIDEO_ID
+    mock_company.has_logo = False
     mock_company.active_job_count = 0
     mock_company.successfull_matches_count = 0
     return mock_company
@@ -36,7 +38,7 @@ def test_getAll_returnsCompanies_whenCompaniesAreFound(
     mock_db,
 ) -> None:
     # Arrange
-    mock_filter_params = mocker.Mock(offset=0, limit=10)
+    mock_filter_params = mocker.Mock(offset=0, limit=10, cursor=None)
     mock_companies = [mocker.Mock(), mocker.Mock()]
     mock_company_response = [mocker.Mock(), mocker.Mock()]
 
@@ -69,7 +71,7 @@ def test_getAll_returnsEmptyList_whenNoCompaniesAreFound(
     mock_db,
 ) -> None:
     # Arrange
-    mock_filter_params = mocker.Mock(offset=0, limit=10)
+    mock_filter_params = mocker.Mock(offset=0, limit=10, cursor=None)
 
     mock_query = mock_db.query.return_value
     mock_offset = mock_query.offset.return_value
@@ -113,6 +115,31 @@ def test_getById_returnsCompany_whenCompanyIsFound(
     assert result == mock_response
 
 
+def test_getMany_returnsCompaniesInRequestOrder_withOneQuery(mocker, mock_db) -> None:
+    # Arrange
+    companies = [
+        mocker.Mock(id=td.VALID_COMPANY_ID),
+        mocker.Mock(id=td.VALID_COMPANY_ID_2),
+    ]
+    mock_query = mock_db.query.return_value
+    mock_options = mock_query.options.return_value
+    mock_options.filter.return_value.all.return_value = companies
+    mocker.patch(
+        "app.schemas.company.CompanyResponse.create",
+        side_effect=lambda company: company.id,
+    )
+    company_ids = [td.VALID_COMPANY_ID_2, td.NON_EXISTENT_ID, td.VALID_COMPANY_ID]
+
+    # Act
+    result = company_service.get_many(company_ids=company_ids, db=mock_db)
+
+    # Assert
+    mock_db.query.assert_called_once_with(Company)
+    assert_filter_called_with(mock_options, Company.id.in_(set(company_ids)))
+    assert result.items == [td.VALID_COMPANY_ID_2, None, td.VALID_COMPANY_ID]
+    assert result.not_found == [td.NON_EXISTENT_ID]
+
+
 def test_getByUsername_returnsCompany_whenCompanyIsFound(
     mocker,
     mock_db,
@@ -658,12 +685,17 @@ def test_uploadLogo_uploadsLogo_whenDataIsValid(
 ) -> None:
     # Arrange
     mock_logo = mocker.Mock()
-    mock_company = mocker.Mock(id=td.VALID_COMPANY_ID, logo=b"mock_logo_data")
+    mock_company = mocker.Mock(id=td.VALID_COMPANY_ID)
+    mock_blob = mocker.Mock(hash="logo_hash", size=14, media_type="image/png")
 
     mock_get_company_by_id = mocker.patch(
         "app.services.company_service.get_company_by_id",
         return_value=mock_company,
     )
+    mock_store_upload = mocker.patch(
+        "app.services.company_service.store_upload",
+        return_value=mock_blob,
+    )
 
     # Act
     result = company_service.upload_logo(
@@ -672,7 +704,14 @@ def test_uploadLogo_uploadsLogo_whenDataIsValid(
 
     # Assert
     mock_get_company_by_id.assert_called_with(company_id=mock_company.id, db=mock_db)
+    mock_store_upload.assert_called_once_with(
+        upload=mock_logo, max_size=ANY, signatures=IMAGE_SIGNATURES
+    )
     mock_db.commit.assert_called_once()
+    assert mock_company.logo_hash == mock_blob.hash
+    assert mock_company.logo_size == mock_blob.size
+    assert mock_company.logo_media_type == mock_blob.media_type
+    assert mock_company.logo is None
     assert isinstance(result, MessageResponse)
 
 
@@ -681,28 +720,32 @@ def test_downloadLogo_returnsLogo_whenCompanyHasLogo(
     mock_db,
 ) -> None:
     # Arrange
-    mock_logo_data = b"mock_logo_data"
-    mock_company = mocker.Mock(id=td.VALID_COMPANY_ID, logo=mock_logo_data)
+    mock_company = mocker.Mock(
+        id=td.VALID_COMPANY_ID,
+        logo_hash="logo_hash",
+        logo_media_type="image/png",
+    )
 
     mock_get_company_by_id = mocker.patch(
         "app.services.company_service.get_company_by_id",
         return_value=mock_company,
     )
-    mock_bytes_io = mocker.patch("app.services.company_service.io.BytesIO")
-    mock_streaming_response = mocker.patch(
-        "app.services.company_service.StreamingResponse"
-    )
+    mock_blob_store = mocker.patch(
+        "app.services.company_service.get_blob_store"
+    ).return_value
 
     # Act
     result = company_service.download_logo(company_id=mock_company.id, db=mock_db)
 
     # Assert
     mock_get_company_by_id.assert_called_with(company_id=mock_company.id, db=mock_db)
-    mock_bytes_io.assert_called_with(mock_logo_data)
-    mock_streaming_response.assert_called_with(
-        mock_bytes_io.return_value, media_type="image/png"
+    mock_blob_store.create_response.assert_called_with(
+        blob_hash="logo_hash",
+        media_type="image/png",
+        if_none_match=None,
+        range_header=None,
     )
-    assert result == mock_streaming_response.return_value
+    assert result == mock_blob_store.create_response.return_value
 
 
 def test_downloadLogo_raisesHTTPException_whenCompanyHasNoLogo(
@@ -710,7 +753,7 @@ def test_downloadLogo_raisesHTTPException_whenCompanyHasNoLogo(
     mock_db,
 ) -> None:
     # Arrange
-    mock_company = mocker.Mock(id=td.VALID_COMPANY_ID, logo=None)
+    mock_company = mocker.Mock(id=td.VALID_COMPANY_ID, logo_hash=None)
 
     mock_get_company_by_id = mocker.patch(
         "app.services.company_service.get_company_by_id",
@@ -731,7 +774,7 @@ def test_deleteLogo_deletesLogo_whenCompanyHasLogo(
     mock_db,
 ) -> None:
     # Arrange
-    mock_company = mocker.Mock(id=td.VALID_COMPANY_ID, logo=b"mock_logo_data")
+    mock_company = mocker.Mock(id=td.VALID_COMPANY_ID, logo_hash="logo_hash")
 
     mock_get_company_by_id = mocker.patch(
         "app.services.company_service.get_company_by_id",
@@ -745,5 +788,8 @@ def test_deleteLogo_deletesLogo_whenCompanyHasLogo(
     mock_get_company_by_id.assert_called_with(company_id=mock_company.id, db=mock_db)
     mock_db.commit.assert_called_once()
     assert mock_company.logo is None
+    assert mock_company.logo_hash is None
+    assert mock_company.logo_size is None
+    assert mock_company.logo_media_type is None
     assert isinstance(mock_company.updated_at, datetime)
     assert isinstance(result, MessageResponse)
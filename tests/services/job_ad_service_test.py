@@ -1,25 +1,38 @@
+import asyncio
 from datetime import datetime
 from unittest.mock import ANY
 
 import pytest
-from sqlalchemy import asc, desc
+from fastapi import status
+from sqlalchemy import asc, desc, func
+from sqlalchemy.dialects import postgresql
 
+from app.exceptions.custom_exceptions import ApplicationError
 from app.schemas.city import City
 from app.schemas.common import FilterParams, JobAdSearchParams, MessageResponse
 from app.schemas.job_ad import JobAdCreate, JobAdUpdate
+from app.services.common import JOB_AD_RESPONSE_OPTIONS, filter_by_skill_ids
 from app.services.job_ad_service import (
+    SALARY_BUCKET_SIZE,
+    _facets_statement,
     _filter_by_salary,
     _filter_by_skills,
     _order_by,
     _search_job_ads,
+    _text_search_query,
     add_skill_requirement,
     create,
     get_all,
+    get_all_async,
     get_by_id,
+    get_by_id_async,
+    get_many,
     update,
 )
+from app.sql_app import JobAdSkill
 from app.sql_app.job_ad.job_ad import JobAd
 from app.sql_app.job_ad.job_ad_status import JobAdStatus
+from app.sql_app.job_requirement.skill_level import SkillLevel
 from tests import test_data as td
 from tests.utils import assert_called_with, assert_filter_called_with
 
@@ -49,66 +62,233 @@ def mock_job_ad(mocker):
     return _create_mock_job_ad
 
 
-def test_getAll_returnsJobAds_whenJobAdsExist(
-    mocker,
-    mock_db,
-    mock_job_ad,
-) -> None:
+def test_getAll_loadsPageWithResponseOptions(mocker, mock_db, mock_job_ad) -> None:
     # Arrange
     filter_params = FilterParams(offset=0, limit=10)
     search_params = JobAdSearchParams()
     job_ads = [mock_job_ad(td.JOB_AD), mock_job_ad(td.JOB_AD_2)]
     job_ad_responses = [mocker.Mock(), mocker.Mock()]
 
-    mock_query = mock_db.query.return_value
-    mock_offset = mock_query.offset.return_value
-    mock_limit = mock_offset.limit.return_value
-    mock_limit.all.return_value = job_ads
+    mock_db.scalars.return_value.all.return_value = job_ads
+    mocker.patch(
+        "app.schemas.job_ad.JobAdResponse.create",
+        side_effect=job_ad_responses,
+    )
+
+    # Act
+    result = get_all(filter_params, search_params, mock_db)
+
+    # Assert
+    mock_db.connection.assert_not_called()
+    statement = mock_db.scalars.call_args.args[0]
+    assert statement._with_options == JOB_AD_RESPONSE_OPTIONS
+    assert statement._offset_clause.value == filter_params.offset
+    assert statement._limit_clause.value == filter_params.limit
+    assert result == job_ad_responses
 
-    mock_search_job_ads = mocker.patch(
-        "app.services.job_ad_service._search_job_ads", return_value=mock_query
+
+def test_getAll_readsPageAndFacetsInRepeatableRead_whenFacetsAreRequested(
+    mocker, mock_db
+) -> None:
+    # Arrange
+    filter_params = FilterParams(offset=0, limit=10)
+    search_params = JobAdSearchParams(include_facets=True)
+    mock_db.scalars.return_value.all.return_value = []
+    mock_db.execute.return_value.all.return_value = [
+        mocker.Mock(
+            location_id=None,
+            category_id=None,
+            skill_level=None,
+            salary_bucket=None,
+            count=4,
+        )
+    ]
+
+    # Act
+    result = get_all(filter_params, search_params, mock_db)
+
+    # Assert
+    mock_db.connection.assert_called_once_with(
+        execution_options={"isolation_level": "REPEATABLE READ"}
     )
+    mock_db.execute.assert_called_once()
+    assert result.items == []
+    assert result.total == 4
+
+
+def test_getAllAsync_returnsJobAds_whenJobAdsExist(mocker, mock_job_ad) -> None:
+    # Arrange
+    filter_params = FilterParams(offset=0, limit=10)
+    search_params = JobAdSearchParams()
+    job_ads = [mock_job_ad(td.JOB_AD), mock_job_ad(td.JOB_AD_2)]
+    job_ad_responses = [mocker.Mock(), mocker.Mock()]
+
+    mock_db = mocker.AsyncMock()
+    mock_db.scalars.return_value = mocker.Mock(all=mocker.Mock(return_value=job_ads))
     mock_create = mocker.patch(
         "app.schemas.job_ad.JobAdResponse.create",
         side_effect=job_ad_responses,
     )
 
     # Act
-    result = get_all(filter_params, search_params, mock_db)
+    result = asyncio.run(get_all_async(filter_params, search_params, mock_db))
 
     # Assert
-    mock_search_job_ads.assert_called_with(search_params=search_params, db=mock_db)
-    mock_query.offset.assert_called_with(filter_params.offset)
-    mock_offset.limit.assert_called_with(filter_params.limit)
+    mock_db.scalars.assert_awaited_once()
     mock_create.assert_any_call(job_ads[0])
     mock_create.assert_any_call(job_ads[1])
-    assert len(result) == 2
-    assert result[0] == job_ad_responses[0]
-    assert result[1] == job_ad_responses[1]
+    assert result == job_ad_responses
 
 
-def test_getAll_returnsEmptyList_whenNoJobAdsExist(mocker, mock_db) -> None:
+def test_getAllAsync_loadsPageWithResponseOptions(mocker) -> None:
     # Arrange
     filter_params = FilterParams(offset=0, limit=10)
     search_params = JobAdSearchParams()
+    mock_db = mocker.AsyncMock()
+    mock_db.scalars.return_value = mocker.Mock(all=mocker.Mock(return_value=[]))
 
-    mock_query = mock_db.query.return_value
-    mock_offset = mock_query.offset.return_value
-    mock_limit = mock_offset.limit.return_value
-    mock_limit.all.return_value = []
+    # Act
+    result = asyncio.run(get_all_async(filter_params, search_params, mock_db))
+
+    # Assert
+    mock_db.connection.assert_not_called()
+    statement = mock_db.scalars.await_args.args[0]
+    assert statement._with_options == JOB_AD_RESPONSE_OPTIONS
+    assert statement._offset_clause.value == filter_params.offset
+    assert statement._limit_clause.value == filter_params.limit
+    assert result == []
+
+
+def test_getAllAsync_returnsCursorPage_whenCursorIsGiven(mocker) -> None:
+    # Arrange
+    filter_params = FilterParams(limit=2, cursor="")
+    search_params = JobAdSearchParams()
+    job_ads = [
+        mocker.Mock(created_at=datetime(2024, 1, day), id=td.VALID_JOB_AD_ID)
+        for day in (3, 2, 1)
+    ]
+    job_ad_responses = [mocker.Mock(), mocker.Mock()]
 
-    mock_search_job_ads = mocker.patch(
-        "app.services.job_ad_service._search_job_ads", return_value=mock_query
+    mock_db = mocker.AsyncMock()
+    mock_db.scalars.return_value = mocker.Mock(all=mocker.Mock(return_value=job_ads))
+    mocker.patch(
+        "app.schemas.job_ad.JobAdResponse.create", side_effect=job_ad_responses
     )
 
     # Act
-    result = get_all(filter_params, search_params, mock_db)
+    result = asyncio.run(get_all_async(filter_params, search_params, mock_db))
 
     # Assert
-    mock_search_job_ads.assert_called_with(search_params=search_params, db=mock_db)
-    mock_query.offset.assert_called_with(filter_params.offset)
-    mock_offset.limit.assert_called_with(filter_params.limit)
-    assert result == []
+    statement = mock_db.scalars.await_args.args[0]
+    assert statement._limit_clause.value == filter_params.limit + 1
+    assert result.items == job_ad_responses
+    assert result.next_cursor is not None
+
+
+def test_getAllAsync_returnsTotalAndFacets_whenFacetsAreRequested(mocker) -> None:
+    # Arrange
+    filter_params = FilterParams(offset=0, limit=10)
+    search_params = JobAdSearchParams(include_facets=True)
+    mock_db = mocker.AsyncMock()
+    mock_db.scalars.return_value = mocker.Mock(all=mocker.Mock(return_value=[]))
+
+    def _facet_row(location_id=None, skill_level=None, salary_bucket=None, count=0):
+        return mocker.Mock(
+            location_id=location_id,
+            category_id=None,
+            skill_level=skill_level,
+            salary_bucket=salary_bucket,
+            count=count,
+        )
+
+    mock_db.execute.return_value = mocker.Mock(
+        all=mocker.Mock(
+            return_value=[
+                _facet_row(count=5),
+                _facet_row(location_id=td.VALID_CITY_ID, count=5),
+                _facet_row(salary_bucket=2000, count=3),
+                _facet_row(skill_level=SkillLevel.EXPERT, count=3),
+                _facet_row(salary_bucket=1000, count=2),
+            ]
+        )
+    )
+
+    # Act
+    result = asyncio.run(get_all_async(filter_params, search_params, mock_db))
+
+    # Assert
+    mock_db.connection.assert_awaited_once_with(
+        execution_options={"isolation_level": "REPEATABLE READ"}
+    )
+    mock_db.execute.assert_awaited_once()
+    assert result.items == []
+    assert result.next_cursor is None
+    assert result.total == 5
+    assert result.facets.cities[0].value == td.VALID_CITY_ID
+    assert result.facets.categories == []
+    assert result.facets.skill_levels[0].value == SkillLevel.EXPERT
+    assert [bucket.min_salary for bucket in result.facets.salary_buckets] == [
+        1000,
+        2000,
+    ]
+    assert result.facets.salary_buckets[0].max_salary == 1000 + SALARY_BUCKET_SIZE
+
+
+def test_facetsStatement_groupsFilteredJobAdsByEveryFacetAndTotal() -> None:
+    # Arrange
+    search_params = JobAdSearchParams(location_id=td.VALID_CITY_ID)
+
+    # Act
+    sql = str(_facets_statement(search_params).compile(dialect=postgresql.dialect()))
+
+    # Assert
+    assert "job_ad.location_id = " in sql
+    assert "GROUPING SETS((filtered_job_ads.location_id), " in sql
+    assert "(filtered_job_ads.salary_bucket), ())" in sql
+
+
+def test_getAllAsync_raisesApplicationError_whenCursorIsUsedWithRelevanceOrder(
+    mocker,
+) -> None:
+    # Arrange
+    filter_params = FilterParams(cursor="")
+    search_params = JobAdSearchParams(query="python", order_by="relevance")
+    mock_db = mocker.AsyncMock()
+
+    # Act
+    with pytest.raises(ApplicationError) as exc:
+        asyncio.run(get_all_async(filter_params, search_params, mock_db))
+
+    # Assert
+    assert exc.value.data.status == status.HTTP_400_BAD_REQUEST
+    mock_db.scalars.assert_not_called()
+
+
+def test_getByIdAsync_returnsJobAd_whenJobAdExists(mocker, mock_job_ad) -> None:
+    # Arrange
+    job_ad = mock_job_ad(td.JOB_AD)
+    job_ad_response = mocker.Mock()
+    mock_db = mocker.AsyncMock()
+
+    mock_get_job_ad_by_id_async = mocker.patch(
+        "app.services.job_ad_service.get_job_ad_by_id_async",
+        return_value=job_ad,
+    )
+    mock_create = mocker.patch(
+        "app.schemas.job_ad.JobAdResponse.create",
+        return_value=job_ad_response,
+    )
+
+    # Act
+    result = asyncio.run(get_by_id_async(td.VALID_JOB_AD_ID, mock_db))
+
+    # Assert
+    mock_get_job_ad_by_id_async.assert_awaited_once_with(
+        job_ad_id=td.VALID_JOB_AD_ID,
+        db=mock_db,
+    )
+    mock_create.assert_called_with(job_ad)
+    assert result == job_ad_response
 
 
 def test_getById_returnsJobAd_whenJobAdExists(mocker, mock_db, mock_job_ad) -> None:
@@ -137,6 +317,29 @@ def test_getById_returnsJobAd_whenJobAdExists(mocker, mock_db, mock_job_ad) -> N
     assert result == job_ad_response
 
 
+def test_getMany_returnsJobAdsInRequestOrder_withOneQuery(mocker, mock_db) -> None:
+    # Arrange
+    job_ads = [mocker.Mock(id=td.VALID_JOB_AD_ID), mocker.Mock(id=td.VALID_JOB_AD_ID_2)]
+    mock_query = mock_db.query.return_value
+    mock_options = mock_query.options.return_value
+    mock_options.filter.return_value.all.return_value = job_ads
+    mocker.patch(
+        "app.services.job_ad_service.JobAdResponse.create",
+        side_effect=lambda job_ad: job_ad.id,
+    )
+    job_ad_ids = [td.VALID_JOB_AD_ID_2, td.NON_EXISTENT_ID, td.VALID_JOB_AD_ID]
+
+    # Act
+    result = get_many(job_ad_ids=job_ad_ids, db=mock_db)
+
+    # Assert
+    mock_db.query.assert_called_once_with(JobAd)
+    mock_query.options.assert_called_once_with(*JOB_AD_RESPONSE_OPTIONS)
+    assert_filter_called_with(mock_options, JobAd.id.in_(set(job_ad_ids)))
+    assert result.items == [td.VALID_JOB_AD_ID_2, None, td.VALID_JOB_AD_ID]
+    assert result.not_found == [td.NON_EXISTENT_ID]
+
+
 def test_create_createsJobAd_whenValidJobAd(mocker, mock_db) -> None:
     # Arrange
     job_ad_data = JobAdCreate(
@@ -156,6 +359,14 @@ def test_create_createsJobAd_whenValidJobAd(mocker, mock_db) -> None:
         "app.services.job_ad_service.get_company_by_id",
         return_value=mock_company,
     )
+    mock_get_skill_ids_by_names = mocker.patch(
+        "app.services.job_ad_service.get_skill_ids_by_names",
+        return_value=[td.VALID_SKILL_ID],
+    )
+    mock_insert_skill_links = mocker.patch(
+        "app.services.job_ad_service.insert_skill_links",
+        return_value=[td.VALID_SKILL_ID],
+    )
     mock_create_response = mocker.patch(
         "app.schemas.job_ad.JobAdResponse.create",
         return_value=mock_job_ad_response,
@@ -165,7 +376,17 @@ def test_create_createsJobAd_whenValidJobAd(mocker, mock_db) -> None:
     result = create(job_ad_data=job_ad_data, db=mock_db)
 
     # Assert
+    mock_get_skill_ids_by_names.assert_called_once_with(
+        skill_names=job_ad_data.skills, db=mock_db
+    )
     mock_db.add.assert_called_with(ANY)
+    mock_db.flush.assert_called_once()
+    mock_insert_skill_links.assert_called_once_with(
+        link_model=JobAdSkill,
+        owner_id=mock_db.add.call_args.args[0].id,
+        skill_ids=[td.VALID_SKILL_ID],
+        db=mock_db,
+    )
     mock_db.commit.assert_called()
     mock_db.refresh.assert_called_with(ANY)
     mock_get_company_by_id.assert_called_with(
@@ -479,6 +700,10 @@ def test_addSkillRequirement_addsSkillRequirement_whenValidData(
         "app.services.job_ad_service.get_skill_by_id",
         return_value=skill,
     )
+    mock_insert_skill_links = mocker.patch(
+        "app.services.job_ad_service.insert_skill_links",
+        return_value=[td.VALID_SKILL_ID],
+    )
 
     # Act
     result = add_skill_requirement(
@@ -496,12 +721,47 @@ def test_addSkillRequirement_addsSkillRequirement_whenValidData(
         skill_id=td.VALID_SKILL_ID,
         db=mock_db,
     )
-    mock_db.add.assert_called_with(ANY)
+    mock_insert_skill_links.assert_called_once_with(
+        link_model=JobAdSkill,
+        owner_id=job_ad.id,
+        skill_ids=[td.VALID_SKILL_ID],
+        db=mock_db,
+    )
     mock_db.commit.assert_called()
-    mock_db.refresh.assert_called_with(ANY)
     assert result == message_response
 
 
+def test_addSkillRequirement_raisesApplicationError_whenSkillAlreadyAdded(
+    mocker,
+    mock_db,
+    mock_job_ad,
+) -> None:
+    # Arrange
+    job_ad = mock_job_ad(td.JOB_AD)
+
+    mocker.patch(
+        "app.services.job_ad_service.get_job_ad_by_id",
+        return_value=job_ad,
+    )
+    mocker.patch("app.services.job_ad_service.get_skill_by_id")
+    mocker.patch(
+        "app.services.job_ad_service.insert_skill_links",
+        return_value=[],
+    )
+
+    # Act
+    with pytest.raises(ApplicationError) as exc_info:
+        add_skill_requirement(
+            job_ad_id=td.VALID_JOB_AD_ID,
+            skill_id=td.VALID_SKILL_ID,
+            db=mock_db,
+        )
+
+    # Assert
+    assert exc_info.value.data.status == status.HTTP_409_CONFLICT
+    mock_db.commit.assert_not_called()
+
+
 def test_searchJobAds_filtersByCompanyId(mocker, mock_db, mock_job_ad) -> None:
     # Arrange
     search_params = JobAdSearchParams(company_id=td.VALID_COMPANY_ID)
@@ -601,6 +861,42 @@ def test_searchJobAds_filtersByTitle(mocker, mock_db, mock_job_ad) -> None:
     assert result.all() == job_ads
 
 
+def test_searchJobAds_filtersByTextQuery(mocker, mock_db, mock_job_ad) -> None:
+    # Arrange
+    search_params = JobAdSearchParams(query="python developer")
+    job_ads = [mock_job_ad(td.JOB_AD), mock_job_ad(td.JOB_AD_2)]
+
+    mock_query = mock_db.query.return_value
+    mock_filter = mock_query.filter.return_value
+    mock_filter.all.return_value = job_ads
+
+    mocker.patch(
+        "app.services.job_ad_service._filter_by_salary",
+        return_value=mock_filter,
+    )
+    mocker.patch(
+        "app.services.job_ad_service._filter_by_skills",
+        return_value=mock_filter,
+    )
+    mocker.patch(
+        "app.services.job_ad_service._order_by",
+        return_value=mock_filter,
+    )
+
+    # Act
+    result = _search_job_ads(search_params=search_params, db=mock_db)
+
+    # Assert
+    assert_filter_called_with(
+        mock_query=mock_query,
+        expected_expression=JobAd.search_vector.bool_op("@@")(
+            _text_search_query(search_params.query)
+        ),
+    )
+    assert "websearch_to_tsquery" in str(mock_query.filter.call_args[0][0])
+    assert result.all() == job_ads
+
+
 def test_searchJobAds_filtersByLocation(mocker, mock_db, mock_job_ad) -> None:
     # Arrange
     search_params = JobAdSearchParams(location_id=td.VALID_CITY_ID)
@@ -719,9 +1015,7 @@ def test_filterBySkills_returnsJobAds_whenNoSkillsProvided(
     mock_query.all.return_value = job_ads
 
     # Act
-    result = _filter_by_skills(
-        job_ads=mock_query, search_params=search_params, db=mock_db
-    )
+    result = _filter_by_skills(job_ads=mock_query, search_params=search_params)
 
     # Assert
     assert result.all() == job_ads
@@ -737,15 +1031,21 @@ def test_filterBySkills_filtersBySkills_whenSkillsProvided(
     job_ads = [mock_job_ad(td.JOB_AD), mock_job_ad(td.JOB_AD_2)]
 
     mock_query = mock_db.query.return_value
-    mock_join = mock_query.join.return_value
-    mock_join.all.return_value = job_ads
+    mock_filter = mock_query.filter.return_value
+    mock_filter.all.return_value = job_ads
 
     # Act
-    result = _filter_by_skills(
-        job_ads=mock_query, search_params=search_params, db=mock_db
-    )
+    result = _filter_by_skills(job_ads=mock_query, search_params=search_params)
 
     # Assert
+    assert_filter_called_with(
+        mock_query,
+        filter_by_skill_ids(
+            skill_ids=JobAd.skill_ids,
+            skill_names=search_params.skills,
+            required_matches=2,
+        ),
+    )
     assert result.all() == job_ads
 
 
@@ -761,15 +1061,21 @@ def test_filterBySkills_filtersBySkills_whenSkillThresholdIsLessThanNumberOfSkil
     job_ads = [mock_job_ad(td.JOB_AD), mock_job_ad(td.JOB_AD_2)]
 
     mock_query = mock_db.query.return_value
-    mock_join = mock_query.join.return_value
-    mock_join.all.return_value = job_ads
+    mock_filter = mock_query.filter.return_value
+    mock_filter.all.return_value = job_ads
 
     # Act
-    result = _filter_by_skills(
-        job_ads=mock_query, search_params=search_params, db=mock_db
-    )
+    result = _filter_by_skills(job_ads=mock_query, search_params=search_params)
 
     # Assert
+    assert_filter_called_with(
+        mock_query,
+        filter_by_skill_ids(
+            skill_ids=JobAd.skill_ids,
+            skill_names=search_params.skills,
+            required_matches=1,
+        ),
+    )
     assert result.all() == job_ads
 
 
@@ -788,9 +1094,7 @@ def test_filterBySkills_filtersBySkills_whenSkillThresholdEqualsNumberOfSkills(
     mock_query.all.return_value = job_ads
 
     # Act
-    result = _filter_by_skills(
-        job_ads=mock_query, search_params=search_params, db=mock_db
-    )
+    result = _filter_by_skills(job_ads=mock_query, search_params=search_params)
 
     # Assert
     assert result.all() == job_ads
@@ -813,6 +1117,7 @@ def test_orderBy_ordersByCreatedAtAsc_whenCreatedAtAscIsProvided(
 
     # Assert
     assert_called_with(mock_query.order_by, asc(JobAd.created_at))
+    assert str(mock_query.order_by.call_args.args[1]) == str(asc(JobAd.id))
     assert result.all() == job_ads
 
 
@@ -833,6 +1138,7 @@ def test_orderBy_ordersByCreatedAtDesc_whenCreatedAtDescIsProvided(
 
     # Assert
     assert_called_with(mock_query.order_by, desc(JobAd.created_at))
+    assert str(mock_query.order_by.call_args.args[1]) == str(desc(JobAd.id))
     assert result.all() == job_ads
 
 
@@ -853,6 +1159,7 @@ def test_orderBy_ordersByUpdatedAtAsc_whenUpdatedAtAscIsProvided(
 
     # Assert
     assert_called_with(mock_query.order_by, asc(JobAd.updated_at))
+    assert str(mock_query.order_by.call_args.args[1]) == str(asc(JobAd.id))
     assert result.all() == job_ads
 
 
@@ -873,4 +1180,50 @@ def test_orderBy_ordersByUpdatedAtDesc_whenUpdatedAtDescIsProvided(
 
     # Assert
     assert_called_with(mock_query.order_by, desc(JobAd.updated_at))
+    assert str(mock_query.order_by.call_args.args[1]) == str(desc(JobAd.id))
+    assert result.all() == job_ads
+
+
+def test_orderBy_ordersByRelevance_whenQueryIsProvided(
+    mock_db,
+    mock_job_ad,
+) -> None:
+    # Arrange
+    search_params = JobAdSearchParams(query="python", order_by="relevance")
+    job_ads = [mock_job_ad(td.JOB_AD), mock_job_ad(td.JOB_AD_2)]
+
+    mock_query = mock_db.query.return_value
+    mock_order_by = mock_query.order_by.return_value
+    mock_order_by.all.return_value = job_ads
+
+    # Act
+    result = _order_by(job_ads=mock_query, search_params=search_params)
+
+    # Assert
+    assert_called_with(
+        mock_query.order_by,
+        desc(func.ts_rank(JobAd.search_vector, _text_search_query("python"))),
+    )
+    assert str(mock_query.order_by.call_args.args[1]) == str(desc(JobAd.id))
+    assert result.all() == job_ads
+
+
+def test_orderBy_ordersByCreatedAt_whenRelevanceWithoutQueryIsProvided(
+    mock_db,
+    mock_job_ad,
+) -> None:
+    # Arrange
+    search_params = JobAdSearchParams(order_by="relevance", order="desc")
+    job_ads = [mock_job_ad(td.JOB_AD), mock_job_ad(td.JOB_AD_2)]
+
+    mock_query = mock_db.query.return_value
+    mock_order_by = mock_query.order_by.return_value
+    mock_order_by.all.return_value = job_ads
+
+    # Act
+    result = _order_by(job_ads=mock_query, search_params=search_params)
+
+    # Assert
+    assert_called_with(mock_query.order_by, desc(JobAd.created_at))
+    assert str(mock_query.order_by.call_args.args[1]) == str(desc(JobAd.id))
     assert result.all() == job_ads
@@ -3,11 +3,16 @@ from unittest.mock import ANY
 
 import pytest
 
+from app.schemas.common import FilterParams, SearchJobApplication
 from app.schemas.job_application import JobApplicationResponse, JobApplicationUpdate
 from app.schemas.skill import SkillResponse
 from app.services import job_application_service
+from app.services.common import JOB_APPLICATION_RESPONSE_OPTIONS, filter_by_skill_ids
+from app.sql_app.job_application.job_application import JobApplication
 from app.sql_app.job_application.job_application_status import JobStatus
+from app.sql_app.job_application_skill.job_application_skill import JobApplicationSkill
 from tests import test_data as td
+from tests.utils import assert_filter_called_with
 
 
 @pytest.fixture
@@ -37,7 +42,7 @@ def mock_job_application(mocker):
         first_name=td.VALID_PROFESSIONAL_FIRST_NAME,
         last_name=td.VALID_PROFESSIONAL_LAST_NAME,
         email=td.VALID_PROFESSIONAL_EMAIL,
-        photo=b"photo",
+        has_photo=True,
         city=city,
     )
     job_application.category = mocker.Mock(
@@ -64,26 +69,21 @@ def skills_response(mock_job_application):
     return [SkillResponse.create(skill) for skill in mock_job_application.skills]
 
 
-def test_getAllJobApplications_withSkills(mocker, mock_db):
+def test_getAll_returnsJobApplications_inSearchOrder(mocker, mock_db):
     # Arrange
-    filter_params = mocker.Mock(offset=0, limit=10)
-    search_params = mocker.Mock(
-        order="asc", order_by="created_at", skills=["Python", "Linux", "React"]
-    )
-
-    mock_job_app = [(mocker.Mock(), mocker.Mock())]
-    mock_job_app_response = [(mocker.Mock(), mocker.Mock())]
+    filter_params = FilterParams(offset=20, limit=10)
+    search_params = SearchJobApplication()
 
-    mock_query = mock_db.query.return_value
-    mock_join_1 = mock_query.join.return_value
-    mock_filter_1 = mock_join_1.filter.return_value
-    mock_join_2 = mock_filter_1.join.return_value
-    mock_join_3 = mock_join_2.join.return_value
-    mock_filter_2 = mock_join_3.filter.return_value
-    mock_offset = mock_filter_2.offset.return_value
-    mock_limit = mock_offset.limit.return_value
-    mock_limit.all.return_value = mock_job_app
+    mock_job_app = [mocker.Mock(), mocker.Mock()]
+    mock_job_app_response = [mocker.Mock(), mocker.Mock()]
 
+    mock_query = mocker.Mock()
+    mock_offset = mock_query.offset.return_value
+    mock_offset.limit.return_value.all.return_value = mock_job_app
+    mock_search_job_applications = mocker.patch(
+        "app.services.job_application_service._search_job_applications",
+        return_value=mock_query,
+    )
     mocker.patch(
         "app.schemas.job_application.JobApplicationResponse.create",
         side_effect=mock_job_app_response,
@@ -97,69 +97,130 @@ def test_getAllJobApplications_withSkills(mocker, mock_db):
     )
 
     # Assert
+    mock_search_job_applications.assert_called_once_with(
+        search_params=search_params, db=mock_db
+    )
+    mock_query.offset.assert_called_once_with(20)
+    mock_offset.limit.assert_called_once_with(10)
     assert result == mock_job_app_response
 
 
-def test_getAllJobApplications_withNoSkills(mocker, mock_db):
+def test_searchJobApplications_filtersActiveJobApplications_andOrdersThem(
+    mocker,
+    mock_db,
+):
     # Arrange
-    filter_params = mocker.Mock(offset=0, limit=10)
-    search_params = mocker.Mock(order="asc", order_by="created_at", skills=[])
+    search_params = SearchJobApplication(city_id=td.VALID_CITY_ID)
+    mock_order_by = mocker.patch(
+        "app.services.job_application_service._order_by",
+        side_effect=lambda job_applications, search_params: job_applications,
+    )
 
-    mock_job_app = [(mocker.Mock(), mocker.Mock())]
-    mock_job_app_response = [(mocker.Mock(), mocker.Mock())]
+    # Act
+    result = job_application_service._search_job_applications(
+        search_params=search_params, db=mock_db
+    )
 
-    mock_query = mock_db.query.return_value
-    mock_join_1 = mock_query.join.return_value
-    mock_filter_1 = mock_join_1.filter.return_value
-    mock_offset = mock_filter_1.offset.return_value
-    mock_limit = mock_offset.limit.return_value
-    mock_limit.all.return_value = mock_job_app
+    # Assert
+    mock_db.query.return_value.options.assert_called_once_with(
+        *JOB_APPLICATION_RESPONSE_OPTIONS
+    )
+    mock_query = mock_db.query.return_value.options.return_value
+    mock_active = mock_query.filter.return_value
+    assert_filter_called_with(mock_query, JobApplication.status == JobStatus.ACTIVE)
+    assert_filter_called_with(mock_active, JobApplication.city_id == td.VALID_CITY_ID)
+    mock_order_by.assert_called_once()
+    assert result == mock_active.filter.return_value
 
-    mocker.patch(
-        "app.schemas.job_application.JobApplicationResponse.create",
-        side_effect=mock_job_app_response,
+
+def test_filterBySalary_filtersOverlappingRanges_withThreshold(mocker):
+    # Arrange
+    search_params = SearchJobApplication(
+        min_salary=1000, max_salary=2000, salary_threshold=100
     )
+    mock_query = mocker.Mock()
 
     # Act
-    result = job_application_service.get_all(
-        filter_params=filter_params,
-        search_params=search_params,
-        db=mock_db,
+    job_application_service._filter_by_salary(
+        job_applications=mock_query, search_params=search_params
     )
 
     # Assert
-    assert result == mock_job_app_response
+    assert_filter_called_with(mock_query, (JobApplication.min_salary - 100) <= 2000)
+    assert_filter_called_with(
+        mock_query.filter.return_value,
+        (JobApplication.max_salary + 100) >= 1000,
+    )
 
 
-def test_getAllJobApplications_withOrderDesc(mocker, mock_db):
+def test_filterBySalary_skipsFilter_whenNoRangeIsGiven(mocker):
     # Arrange
-    filter_params = mocker.Mock(offset=0, limit=10)
-    search_params = mocker.Mock(order="desc", order_by="created_at", skills=[])
+    mock_query = mocker.Mock()
 
-    mock_job_app = [(mocker.Mock(), mocker.Mock())]
-    mock_job_app_response = [(mocker.Mock(), mocker.Mock())]
+    # Act
+    result = job_application_service._filter_by_salary(
+        job_applications=mock_query, search_params=SearchJobApplication()
+    )
 
-    mock_query = mock_db.query.return_value
-    mock_join_1 = mock_query.join.return_value
-    mock_filter_1 = mock_join_1.filter.return_value
-    mock_offset = mock_filter_1.offset.return_value
-    mock_limit = mock_offset.limit.return_value
-    mock_limit.all.return_value = mock_job_app
+    # Assert
+    mock_query.filter.assert_not_called()
+    assert result == mock_query
 
-    mocker.patch(
-        "app.schemas.job_application.JobApplicationResponse.create",
-        side_effect=mock_job_app_response,
+
+def test_filterBySkills_filtersBySkillIds_withThreshold(mocker):
+    # Arrange
+    search_params = SearchJobApplication(
+        skills=["Python", "Linux", "React"], skills_threshold=1
     )
+    mock_query = mocker.Mock()
 
     # Act
-    result = job_application_service.get_all(
-        filter_params=filter_params,
-        search_params=search_params,
-        db=mock_db,
+    job_application_service._filter_by_skills(
+        job_applications=mock_query, search_params=search_params
     )
 
     # Assert
-    assert result == mock_job_app_response
+    assert_filter_called_with(
+        mock_query,
+        filter_by_skill_ids(
+            skill_ids=JobApplication.skill_ids,
+            skill_names=["Python", "Linux", "React"],
+            required_matches=2,
+        ),
+    )
+
+
+def test_filterBySkills_skipsFilter_whenThresholdEqualsNumberOfSkills(mocker):
+    # Arrange
+    search_params = SearchJobApplication(skills=["Python"], skills_threshold=1)
+    mock_query = mocker.Mock()
+
+    # Act
+    result = job_application_service._filter_by_skills(
+        job_applications=mock_query, search_params=search_params
+    )
+
+    # Assert
+    mock_query.filter.assert_not_called()
+    assert result == mock_query
+
+
+def test_orderBy_ordersByColumnAndId(mocker):
+    # Arrange
+    search_params = SearchJobApplication(order="asc", order_by="updated_at")
+    mock_query = mocker.Mock()
+
+    # Act
+    job_application_service._order_by(
+        job_applications=mock_query, search_params=search_params
+    )
+
+    # Assert
+    mock_query.order_by.assert_called_once()
+    assert [str(clause) for clause in mock_query.order_by.call_args.args] == [
+        str(JobApplication.updated_at.asc()),
+        str(JobApplication.id.asc()),
+    ]
 
 
 def test_getById_ReturnsJobApplicationResponse(
@@ -188,6 +249,46 @@ def test_getById_ReturnsJobApplicationResponse(
     assert isinstance(result, JobApplicationResponse)
 
 
+def test_getMany_returnsJobApplicationsInRequestOrder_withOneQuery(
+    mocker, mock_db
+) -> None:
+    # Arrange
+    job_applications = [
+        mocker.Mock(id=td.VALID_JOB_APPLICATION_ID),
+        mocker.Mock(id=td.VALID_JOB_APPLICATION_ID_2),
+    ]
+    mock_query = mock_db.query.return_value
+    mock_options = mock_query.options.return_value
+    mock_options.filter.return_value.all.return_value = job_applications
+    mocker.patch(
+        "app.services.job_application_service.JobApplicationResponse.create",
+        side_effect=lambda job_application: job_application.id,
+    )
+    job_application_ids = [
+        td.NON_EXISTENT_ID,
+        td.VALID_JOB_APPLICATION_ID_2,
+        td.VALID_JOB_APPLICATION_ID,
+    ]
+
+    # Act
+    result = job_application_service.get_many(
+        job_application_ids=job_application_ids, db=mock_db
+    )
+
+    # Assert
+    mock_db.query.assert_called_once_with(JobApplication)
+    mock_query.options.assert_called_once_with(*JOB_APPLICATION_RESPONSE_OPTIONS)
+    assert_filter_called_with(
+        mock_options, JobApplication.id.in_(set(job_application_ids))
+    )
+    assert result.items == [
+        None,
+        td.VALID_JOB_APPLICATION_ID_2,
+        td.VALID_JOB_APPLICATION_ID,
+    ]
+    assert result.not_found == [td.NON_EXISTENT_ID]
+
+
 def test_create_createsJobApplication_whenValidData(
     mocker,
     mock_db,
@@ -211,6 +312,10 @@ def test_create_createsJobApplication_whenValidData(
 
     job_application_create.model_dump.return_value = {}
 
+    mock_get_skill_ids_by_names = mocker.patch(
+        "app.services.job_application_service.get_skill_ids_by_names",
+        return_value=[td.VALID_SKILL_ID],
+    )
     mock_add_skills = mocker.patch("app.services.job_application_service._add_skills")
 
     mock_job_application_create = mocker.patch(
@@ -229,7 +334,17 @@ def test_create_createsJobApplication_whenValidData(
         professional_id=job_application_create.professional_id,
         db=mock_db,
     )
+    mock_get_skill_ids_by_names.assert_called_once_with(
+        skill_names=[skill.name for skill in job_application_create.skills],
+        db=mock_db,
+    )
     mock_db.add.assert_called_once_with(ANY)
+    mock_db.flush.assert_called_once()
+    mock_add_skills.assert_called_once_with(
+        job_application=mock_db.add.call_args.args[0],
+        skill_ids=[td.VALID_SKILL_ID],
+        db=mock_db,
+    )
     mock_db.commit.assert_called_once()
     mock_db.refresh.assert_called_once_with(ANY)
     assert mock_professional.active_application_count == 1
@@ -300,7 +415,7 @@ def test_update_updatesName_whenNameIsProvided(
     assert result.created_at == mock_job_application.created_at
     assert result.category_id == mock_job_application.category_id
     assert result.category_title == mock_job_application.category.title
-    assert result.photo == mock_job_application.professional.photo
+    assert result.has_photo == mock_job_application.professional.has_photo
     assert result.first_name == mock_job_application.professional.first_name
     assert result.last_name == mock_job_application.professional.last_name
     assert result.email == mock_job_application.professional.email
@@ -349,7 +464,7 @@ def test_update_updatesDescription_whenDescriptionIsProvided(
     assert result.created_at == mock_job_application.created_at
     assert result.category_id == mock_job_application.category_id
     assert result.category_title == mock_job_application.category.title
-    assert result.photo == mock_job_application.professional.photo
+    assert result.has_photo == mock_job_application.professional.has_photo
     assert result.first_name == mock_job_application.professional.first_name
     assert result.last_name == mock_job_application.professional.last_name
     assert result.email == mock_job_application.professional.email
@@ -395,7 +510,7 @@ def test_update_updatesMinSalary_whenMinSalaryIsProvided(
     assert result.created_at == mock_job_application.created_at
     assert result.category_id == mock_job_application.category_id
     assert result.category_title == mock_job_application.category.title
-    assert result.photo == mock_job_application.professional.photo
+    assert result.has_photo == mock_job_application.professional.has_photo
     assert result.first_name == mock_job_application.professional.first_name
     assert result.last_name == mock_job_application.professional.last_name
     assert result.email == mock_job_application.professional.email
@@ -441,7 +556,7 @@ def test_update_updatesMaxSalary_whenMaxSalaryIsProvided(
     assert result.created_at == mock_job_application.created_at
     assert result.category_id == mock_job_application.category_id
     assert result.category_title == mock_job_application.category.title
-    assert result.photo == mock_job_application.professional.photo
+    assert result.has_photo == mock_job_application.professional.has_photo
     assert result.first_name == mock_job_application.professional.first_name
     assert result.last_name == mock_job_application.professional.last_name
     assert result.email == mock_job_application.professional.email
@@ -488,7 +603,7 @@ def test_update_updatesStatus_whenStatusIsProvided(
     assert result.created_at == mock_job_application.created_at
     assert result.category_id == mock_job_application.category_id
     assert result.category_title == mock_job_application.category.title
-    assert result.photo == mock_job_application.professional.photo
+    assert result.has_photo == mock_job_application.professional.has_photo
     assert result.first_name == mock_job_application.professional.first_name
     assert result.last_name == mock_job_application.professional.last_name
     assert result.email == mock_job_application.professional.email
@@ -534,7 +649,7 @@ def test_update_updatesCityId_whenCityIdIsProvided(
     assert result.created_at == mock_job_application.created_at
     assert result.category_id == mock_job_application.category_id
     assert result.category_title == mock_job_application.category.title
-    assert result.photo == mock_job_application.professional.photo
+    assert result.has_photo == mock_job_application.professional.has_photo
     assert result.first_name == mock_job_application.professional.first_name
     assert result.last_name == mock_job_application.professional.last_name
     assert result.email == mock_job_application.professional.email
@@ -580,7 +695,7 @@ def test_update_updatesIsMain_whenIsMainIsProvided(
     assert result.created_at == mock_job_application.created_at
     assert result.category_id == mock_job_application.category_id
     assert result.category_title == mock_job_application.category.title
-    assert result.photo == mock_job_application.professional.photo
+    assert result.has_photo == mock_job_application.professional.has_photo
     assert result.first_name == mock_job_application.professional.first_name
     assert result.last_name == mock_job_application.professional.last_name
     assert result.email == mock_job_application.professional.email
@@ -642,7 +757,7 @@ def test_update_updatesAllFields_whenAllFieldsAreProvided(
     assert result.created_at == mock_job_application.created_at
     assert result.category_id == mock_job_application.category_id
     assert result.category_title == mock_job_application.category.title
-    assert result.photo == mock_job_application.professional.photo
+    assert result.has_photo == mock_job_application.professional.has_photo
     assert result.first_name == mock_job_application.professional.first_name
     assert result.last_name == mock_job_application.professional.last_name
     assert result.email == mock_job_application.professional.email
@@ -684,7 +799,7 @@ def test_update_updatesNothing_whenNoFieldsAreProvided(
     assert result.created_at == mock_job_application.created_at
     assert result.category_id == mock_job_application.category_id
     assert result.category_title == mock_job_application.category.title
-    assert result.photo == mock_job_application.professional.photo
+    assert result.has_photo == mock_job_application.professional.has_photo
     assert result.first_name == mock_job_application.professional.first_name
     assert result.last_name == mock_job_application.professional.last_name
     assert result.email == mock_job_application.professional.email
@@ -698,41 +813,42 @@ def test_update_updatesNothing_whenNoFieldsAreProvided(
 
 def test_addSkills_addsNewSkills_whenSkillsListIsNotEmpty(mocker, mock_db):
     # Arrange
-    job_application = mocker.Mock(id=td.VALID_JOB_APPLICATION_ID, skills=[])
-    skills = [mocker.Mock(), mocker.Mock()]
-    skills[0].name = td.VALID_SKILL_NAME
-    skills[1].name = td.VALID_SKILL_NAME_2
+    job_application = mocker.Mock(id=td.VALID_JOB_APPLICATION_ID)
+    skill_ids = [td.VALID_SKILL_ID, td.VALID_SKILL_ID_2]
 
-    mock_get_skill_by_name = mocker.patch(
-        "app.services.job_application_service.get_skill_by_name", side_effect=skills
+    mock_insert_skill_links = mocker.patch(
+        "app.services.job_application_service.insert_skill_links",
+        return_value=skill_ids,
     )
 
     # Act
-    job_application_service._add_skills(
+    result = job_application_service._add_skills(
         job_application=job_application,
-        skills=skills,
+        skill_ids=skill_ids,
         db=mock_db,
     )
 
     # Assert
-    mock_get_skill_by_name.assert_any_call(skill_name=td.VALID_SKILL_NAME, db=mock_db)
-    mock_get_skill_by_name.assert_any_call(skill_name=td.VALID_SKILL_NAME_2, db=mock_db)
-    assert len(job_application.skills) == 2
-    assert job_application.skills[0].name == td.VALID_SKILL_NAME
-    assert job_application.skills[1].name == td.VALID_SKILL_NAME_2
+    mock_insert_skill_links.assert_called_once_with(
+        link_model=JobApplicationSkill,
+        owner_id=td.VALID_JOB_APPLICATION_ID,
+        skill_ids=skill_ids,
+        db=mock_db,
+    )
+    assert result == skill_ids
 
 
 def test_addSkills_doesNotAddAnySkills_whenSkillsListIsEmpty(mocker, mock_db):
     # Arrange
-    job_application = mocker.Mock(id=td.VALID_JOB_APPLICATION_ID, skills=[])
-    skills = []
+    job_application = mocker.Mock(id=td.VALID_JOB_APPLICATION_ID)
 
     # Act
-    job_application_service._add_skills(
+    result = job_application_service._add_skills(
         job_application=job_application,
-        skills=skills,
+        skill_ids=[],
         db=mock_db,
     )
 
     # Assert
-    assert len(job_application.skills) == 0
+    mock_db.scalars.assert_not_called()
+    assert result == []
@@ -1,7 +1,9 @@
+from datetime import datetime
+
 import pytest
+from sqlalchemy import select
 
-from app.schemas.city import City
-from app.schemas.common import MessageResponse
+from app.schemas.common import CursorPage, MessageResponse
 from app.schemas.match import (
     MatchRequestAd,
     MatchRequestApplication,
@@ -15,9 +17,7 @@ from app.sql_app.job_application.job_application import JobApplication
 from app.sql_app.job_application.job_application_status import JobStatus
 from app.sql_app.match.match import Match
 from app.sql_app.match.match_status import MatchStatus
-from app.sql_app.professional.professional_status import ProfessionalStatus
 from tests import test_data as td
-from tests.utils import assert_filter_called_with
 
 
 @pytest.fixture
@@ -26,41 +26,55 @@ def mock_db(mocker):
 
 
 @pytest.fixture
-def mock_job_ads(mocker):
-    job_ads = [
-        mocker.Mock(**td.JOB_AD, company=mocker.Mock(), location=City(**td.CITY)),
-        mocker.Mock(**td.JOB_AD_2, company=mocker.Mock(), location=City(**td.CITY_2)),
+def mock_match_request_ad_rows(mocker):
+    return [
+        mocker.Mock(
+            **td.MATCH,
+            title=td.VALID_JOB_AD_TITLE,
+            description=td.VALID_JOB_AD_DESCRIPTION,
+            company_id=td.VALID_COMPANY_ID,
+            company_name=td.VALID_COMPANY_NAME,
+            min_salary=td.JOB_AD["min_salary"],
+            max_salary=td.JOB_AD["max_salary"],
+        ),
+        mocker.Mock(
+            **td.MATCH_2,
+            title=td.VALID_JOB_AD_TITLE_2,
+            description=td.VALID_JOB_AD_DESCRIPTION_2,
+            company_id=td.VALID_COMPANY_ID,
+            company_name=td.VALID_COMPANY_NAME_2,
+            min_salary=td.JOB_AD_2["min_salary"],
+            max_salary=td.JOB_AD_2["max_salary"],
+        ),
     ]
-    job_ads[0].company.name = td.VALID_COMPANY_NAME
-    job_ads[1].company.name = td.VALID_COMPANY_NAME_2
-
-    return job_ads
 
 
 @pytest.fixture
-def mock_job_applications(mocker):
-    job_applications = [
+def mock_match_request_application_rows(mocker):
+    rows = [
         mocker.Mock(
-            **td.JOB_APPLICATION,
-            professional=mocker.Mock(
-                first_name=td.VALID_PROFESSIONAL_FIRST_NAME,
-                last_name=td.VALID_PROFESSIONAL_LAST_NAME,
-                status=ProfessionalStatus.ACTIVE,
-            ),
+            **td.MATCH,
+            description=td.VALID_JOB_APPLICATION_DESCRIPTION,
+            professional_id=td.VALID_PROFESSIONAL_ID,
+            professional_first_name=td.VALID_PROFESSIONAL_FIRST_NAME,
+            professional_last_name=td.VALID_PROFESSIONAL_LAST_NAME,
+            min_salary=td.JOB_APPLICATION["min_salary"],
+            max_salary=td.JOB_APPLICATION["max_salary"],
         ),
         mocker.Mock(
-            **td.JOB_APPLICATION_2,
-            professional=mocker.Mock(
-                first_name=td.VALID_PROFESSIONAL_FIRST_NAME_2,
-                last_name=td.VALID_PROFESSIONAL_LAST_NAME_2,
-                status=ProfessionalStatus.ACTIVE,
-            ),
+            **td.MATCH_2,
+            description=td.VALID_JOB_APPLICATION_DESCRIPTION_2,
+            professional_id=td.VALID_PROFESSIONAL_ID,
+            professional_first_name=td.VALID_PROFESSIONAL_FIRST_NAME_2,
+            professional_last_name=td.VALID_PROFESSIONAL_LAST_NAME_2,
+            min_salary=td.JOB_APPLICATION_2["min_salary"],
+            max_salary=td.JOB_APPLICATION_2["max_salary"],
         ),
     ]
-    job_applications[0].name = td.VALID_JOB_APPLICATION_NAME
-    job_applications[1].name = td.VALID_JOB_APPLICATION_NAME_2
+    rows[0].name = td.VALID_JOB_APPLICATION_NAME
+    rows[1].name = td.VALID_JOB_APPLICATION_NAME_2
 
-    return job_applications
+    return rows
 
 
 def test_create_createsMatchRequest_whenValidData(mocker, mock_db) -> None:
@@ -181,20 +195,11 @@ def test_acceptMatchRequest_acceptsMatchRequest_whenValidData(mocker, mock_db) -
 
 
 def test_getMatchRequestsForJobApplication_returnsMatchRequests_whenValidData(
-    mocker, mock_db, mock_job_ads
+    mocker, mock_db, mock_match_request_ad_rows
 ) -> None:
     # Arrange
-    filter_params = mocker.Mock(offset=0, limit=10)
-
-    mock_query = mock_db.query.return_value
-    mock_join = mock_query.join.return_value
-    mock_filter = mock_join.filter.return_value
-    mock_offset = mock_filter.offset.return_value
-    mock_limit = mock_offset.limit.return_value
-    mock_limit.all.return_value = [
-        (mocker.Mock(**td.MATCH), mock_job_ads[0]),
-        (mocker.Mock(**td.MATCH_2), mock_job_ads[1]),
-    ]
+    filter_params = mocker.Mock(offset=0, limit=10, cursor=None)
+    mock_db.execute.return_value.all.return_value = mock_match_request_ad_rows
 
     # Act
     result = match_service.get_match_requests_for_job_application(
@@ -204,33 +209,30 @@ def test_getMatchRequestsForJobApplication_returnsMatchRequests_whenValidData(
     )
 
     # Assert
-    assert_filter_called_with(
-        mock_join,
+    statement = mock_db.execute.call_args.args[0]
+    assert list(statement.selected_columns) == list(
+        select(*match_service.MATCH_REQUEST_AD_COLUMNS).selected_columns
+    )
+    assert statement.whereclause.compare(
         (Match.job_application_id == td.VALID_JOB_APPLICATION_ID)
-        & (Match.status == MatchStatus.REQUESTED_BY_JOB_AD),
+        & (Match.status == MatchStatus.REQUESTED_BY_JOB_AD)
     )
-    mock_filter.offset.assert_called_with(filter_params.offset)
-    mock_offset.limit.assert_called_with(filter_params.limit)
+    assert statement._offset == filter_params.offset
+    assert statement._limit == filter_params.limit
     assert isinstance(result, list)
     assert len(result) == 2
     assert isinstance(result[0], MatchRequestAd)
-    assert isinstance(result[1], MatchRequestAd)
+    assert result[0].company_name == td.VALID_COMPANY_NAME
+    assert result[1].title == td.VALID_JOB_AD_TITLE_2
 
 
 def test_getMatchRequestsForProfessional_returnsMatchRequests_whenValidData(
     mocker,
     mock_db,
-    mock_job_ads,
+    mock_match_request_ad_rows,
 ) -> None:
     # Arrange
-    mock_query = mock_db.query.return_value
-    mock_join_job_app = mock_query.join.return_value
-    mock_join_job_ad = mock_join_job_app.join.return_value
-    mock_filter = mock_join_job_ad.filter.return_value
-    mock_filter.all.return_value = [
-        (mocker.Mock(**td.MATCH), mock_job_ads[0]),
-        (mocker.Mock(**td.MATCH_2), mock_job_ads[1]),
-    ]
+    mock_db.execute.return_value.all.return_value = mock_match_request_ad_rows
 
     # Act
     result = match_service.get_match_requests_for_professional(
@@ -239,11 +241,11 @@ def test_getMatchRequestsForProfessional_returnsMatchRequests_whenValidData(
     )
 
     # Assert
-    assert_filter_called_with(
-        mock_join_job_ad,
+    statement = mock_db.execute.call_args.args[0]
+    assert statement.whereclause.compare(
         (JobApplication.professional_id == td.VALID_PROFESSIONAL_ID)
         & (JobApplication.status == JobStatus.ACTIVE)
-        & (Match.status == MatchStatus.REQUESTED_BY_JOB_APP),
+        & (Match.status == MatchStatus.REQUESTED_BY_JOB_AD)
     )
     assert isinstance(result, list)
     assert len(result) == 2
@@ -254,17 +256,10 @@ def test_getMatchRequestsForProfessional_returnsMatchRequests_whenValidData(
 def test_getSentMatchRequestsForProfessional_returnsMatchRequests_whenValidData(
     mocker,
     mock_db,
-    mock_job_ads,
+    mock_match_request_ad_rows,
 ) -> None:
     # Arrange
-    mock_query = mock_db.query.return_value
-    mock_join_job_app = mock_query.join.return_value
-    mock_join_job_ad = mock_join_job_app.join.return_value
-    mock_filter = mock_join_job_ad.filter.return_value
-    mock_filter.all.return_value = [
-        (mocker.Mock(**td.MATCH), mock_job_ads[0]),
-        (mocker.Mock(**td.MATCH_2), mock_job_ads[1]),
-    ]
+    mock_db.execute.return_value.all.return_value = mock_match_request_ad_rows
 
     # Act
     result = match_service.get_sent_match_requests_for_professional(
@@ -273,11 +268,11 @@ def test_getSentMatchRequestsForProfessional_returnsMatchRequests_whenValidData(
     )
 
     # Assert
-    assert_filter_called_with(
-        mock_join_job_ad,
+    statement = mock_db.execute.call_args.args[0]
+    assert statement.whereclause.compare(
         (JobApplication.professional_id == td.VALID_PROFESSIONAL_ID)
         & (JobApplication.status == JobStatus.ACTIVE)
-        & (Match.status == MatchStatus.REQUESTED_BY_JOB_APP),
+        & (Match.status == MatchStatus.REQUESTED_BY_JOB_APP)
     )
     assert isinstance(result, list)
     assert len(result) == 2
@@ -286,21 +281,11 @@ def test_getSentMatchRequestsForProfessional_returnsMatchRequests_whenValidData(
 
 
 def test_getMatchRequestsForCompany_returnsMatchRequests_whenValidData(
-    mocker, mock_db, mock_job_applications
+    mocker, mock_db, mock_match_request_application_rows
 ) -> None:
     # Arrange
-    filter_params = mocker.Mock(offset=0, limit=10)
-
-    mock_query = mock_db.query.return_value
-    mock_join = mock_query.join.return_value
-    mock_join_job_ad = mock_join.join.return_value
-    mock_filter = mock_join_job_ad.filter.return_value
-    mock_offset = mock_filter.offset.return_value
-    mock_limit = mock_offset.limit.return_value
-    mock_limit.all.return_value = [
-        (mocker.Mock(**td.MATCH), mock_job_applications[0]),
-        (mocker.Mock(**td.MATCH_2), mock_job_applications[1]),
-    ]
+    filter_params = mocker.Mock(offset=0, limit=10, cursor=None)
+    mock_db.execute.return_value.all.return_value = mock_match_request_application_rows
 
     # Act
     result = match_service.get_match_requests_for_company(
@@ -310,25 +295,73 @@ def test_getMatchRequestsForCompany_returnsMatchRequests_whenValidData(
     )
 
     # Assert
-    assert_filter_called_with(
-        mock_join_job_ad,
+    statement = mock_db.execute.call_args.args[0]
+    assert list(statement.selected_columns) == list(
+        select(*match_service.MATCH_REQUEST_APPLICATION_COLUMNS).selected_columns
+    )
+    assert statement.whereclause.compare(
         (JobAd.company_id == td.VALID_COMPANY_ID)
-        & (Match.status == MatchStatus.REQUESTED_BY_JOB_APP),
+        & (Match.status == MatchStatus.REQUESTED_BY_JOB_APP)
     )
-    mock_filter.offset.assert_called_with(filter_params.offset)
-    mock_offset.limit.assert_called_with(filter_params.limit)
+    assert statement._offset == filter_params.offset
+    assert statement._limit == filter_params.limit
     assert isinstance(result, list)
     assert len(result) == 2
     assert isinstance(result[0], MatchRequestApplication)
-    assert isinstance(result[1], MatchRequestApplication)
+    assert result[0].name == td.VALID_JOB_APPLICATION_NAME
+    assert result[1].professional_first_name == td.VALID_PROFESSIONAL_FIRST_NAME_2
+
+
+def test_getMatchRequestsForCompany_returnsNoSalary_whenApplicationHasNone(
+    mocker, mock_db, mock_match_request_application_rows
+) -> None:
+    # Arrange
+    filter_params = mocker.Mock(offset=0, limit=10, cursor=None)
+    mock_match_request_application_rows[0].min_salary = None
+    mock_match_request_application_rows[0].max_salary = None
+    mock_db.execute.return_value.all.return_value = mock_match_request_application_rows
+
+    # Act
+    result = match_service.get_match_requests_for_company(
+        company_id=td.VALID_COMPANY_ID,
+        db=mock_db,
+        filter_params=filter_params,
+    )
+
+    # Assert
+    assert result[0].min_salary is None
+    assert result[0].max_salary is None
+    assert result[1].min_salary == td.JOB_APPLICATION_2["min_salary"]
+
+
+def test_getMatchRequestsForCompany_returnsCursorPage_whenPaginatingByCursor(
+    mocker, mock_db, mock_match_request_application_rows
+) -> None:
+    # Arrange
+    filter_params = mocker.Mock(offset=0, limit=1, cursor="")
+    for row, created_at in zip(
+        mock_match_request_application_rows,
+        (datetime(2024, 10, 2), datetime(2024, 10, 1)),
+    ):
+        row.created_at = created_at
+    mock_db.execute.return_value.all.return_value = mock_match_request_application_rows
+
+    # Act
+    result = match_service.get_match_requests_for_company(
+        company_id=td.VALID_COMPANY_ID,
+        db=mock_db,
+        filter_params=filter_params,
+    )
+
+    # Assert
+    assert isinstance(result, CursorPage)
+    assert len(result.items) == 1
+    assert result.next_cursor is not None
 
 
 def test_getJobAdReceivedMatches_returnsMatches_whenValidData(mocker, mock_db) -> None:
     # Arrange
-    mock_query = mock_db.query.return_value
-    mock_join = mock_query.join.return_value
-    mock_filter = mock_join.filter.return_value
-    mock_filter.all.return_value = [
+    mock_db.execute.return_value.all.return_value = [
         mocker.Mock(**td.MATCH),
         mocker.Mock(**td.MATCH_2),
     ]
@@ -340,10 +373,13 @@ def test_getJobAdReceivedMatches_returnsMatches_whenValidData(mocker, mock_db) -
     )
 
     # Assert
-    assert_filter_called_with(
-        mock_join,
-        (JobAd.id == td.VALID_JOB_AD_ID)
-        & (Match.status == MatchStatus.REQUESTED_BY_JOB_APP),
+    statement = mock_db.execute.call_args.args[0]
+    assert list(statement.selected_columns) == list(
+        select(*match_service.MATCH_RESPONSE_COLUMNS).selected_columns
+    )
+    assert statement.whereclause.compare(
+        (Match.job_ad_id == td.VALID_JOB_AD_ID)
+        & (Match.status == MatchStatus.REQUESTED_BY_JOB_APP)
     )
     assert isinstance(result, list)
     assert len(result) == 2
@@ -353,9 +389,7 @@ def test_getJobAdReceivedMatches_returnsMatches_whenValidData(mocker, mock_db) -
 
 def test_getJobAdSentMatches_returnsMatches_whenValidData(mocker, mock_db) -> None:
     # Arrange
-    mock_query = mock_db.query.return_value
-    mock_filter = mock_query.filter.return_value
-    mock_filter.all.return_value = [
+    mock_db.execute.return_value.all.return_value = [
         mocker.Mock(**td.MATCH),
         mocker.Mock(**td.MATCH_2),
     ]
@@ -367,10 +401,10 @@ def test_getJobAdSentMatches_returnsMatches_whenValidData(mocker, mock_db) -> No
     )
 
     # Assert
-    assert_filter_called_with(
-        mock_query,
+    statement = mock_db.execute.call_args.args[0]
+    assert statement.whereclause.compare(
         (Match.job_ad_id == td.VALID_JOB_AD_ID)
-        & (Match.status == MatchStatus.REQUESTED_BY_JOB_AD),
+        & (Match.status == MatchStatus.REQUESTED_BY_JOB_AD)
     )
     assert isinstance(result, list)
     assert len(result) == 2
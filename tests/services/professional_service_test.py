@@ -1,8 +1,11 @@
+import asyncio
+from collections import defaultdict
 from datetime import datetime
 from unittest.mock import ANY
 
 import pytest
 from fastapi import HTTPException, status
+from sqlalchemy import select
 
 from app.exceptions.custom_exceptions import ApplicationError
 from app.schemas.job_ad import JobAdPreview
@@ -12,11 +15,16 @@ from app.schemas.professional import ProfessionalResponse, ProfessionalUpdate
 from app.schemas.skill import SkillResponse
 from app.schemas.user import User
 from app.services import professional_service
-from app.sql_app.job_ad.job_ad import JobAd
+from app.services.common import (
+    JOB_AD_PREVIEW_COLUMNS,
+    JOB_APPLICATION_RESPONSE_OPTIONS,
+)
 from app.sql_app.job_application.job_application import JobApplication
 from app.sql_app.job_application.job_application_status import JobStatus
 from app.sql_app.professional.professional import Professional
 from app.sql_app.professional.professional_status import ProfessionalStatus
+from app.sql_app.skill.skill import Skill
+from app.storage import IMAGE_SIGNATURES, PDF_SIGNATURES
 from tests import test_data as td
 from tests.utils import assert_filter_called_with
 
@@ -37,13 +45,13 @@ def mock_professional(mocker):
 
 def test_getAll_returnsProfessionals_withOrderAsc(mocker, mock_db):
     # Arrange
-    filter_params = mocker.Mock(offset=0, limit=10)
+    filter_params = mocker.Mock(offset=0, limit=10, cursor=None)
     search_params = mocker.Mock(order="asc", order_by="created_at")
 
     mock_professionals = [mocker.Mock(), mocker.Mock()]
     mock_professional_response = [mocker.Mock(), mocker.Mock()]
 
-    mock_query = mock_db.query.return_value
+    mock_query = mock_db.query.return_value.options.return_value
     mock_filter = mock_query.filter.return_value
     mock_order_by = mock_filter.order_by.return_value
     mock_offset = mock_order_by.offset.return_value
@@ -55,8 +63,8 @@ def test_getAll_returnsProfessionals_withOrderAsc(mocker, mock_db):
         side_effect=mock_professional_response,
     )
     mocker.patch(
-        "app.services.professional_service.get_skills",
-        return_value=[],
+        "app.services.professional_service.get_skills_for_professionals",
+        return_value=defaultdict(list),
     )
 
     # Act
@@ -77,13 +85,13 @@ def test_getAll_returnsProfessionals_withOrderAsc(mocker, mock_db):
 
 def test_getAll_returnsProfessionals_withOrderDesc(mocker, mock_db):
     # Arrange
-    filter_params = mocker.Mock(offset=0, limit=10)
+    filter_params = mocker.Mock(offset=0, limit=10, cursor=None)
     search_params = mocker.Mock(order="desc", order_by="created_at")
 
     mock_professionals = [mocker.Mock(), mocker.Mock()]
     mock_professional_response = [mocker.Mock(), mocker.Mock()]
 
-    mock_query = mock_db.query.return_value
+    mock_query = mock_db.query.return_value.options.return_value
     mock_filter = mock_query.filter.return_value
     mock_order_by = mock_filter.order_by.return_value
     mock_offset = mock_order_by.offset.return_value
@@ -95,8 +103,8 @@ def test_getAll_returnsProfessionals_withOrderDesc(mocker, mock_db):
         side_effect=mock_professional_response,
     )
     mocker.patch(
-        "app.services.professional_service.get_skills",
-        return_value=[],
+        "app.services.professional_service.get_skills_for_professionals",
+        return_value=defaultdict(list),
     )
 
     # Act
@@ -119,14 +127,14 @@ def test_getAll_returnsProfessionalsFilteredBySkills_whenSkillsProvided(
     mocker, mock_db
 ):
     # Arrange
-    filter_params = mocker.Mock(offset=0, limit=10)
+    filter_params = mocker.Mock(offset=0, limit=10, cursor=None)
     search_params = mocker.Mock(order="asc", order_by="created_at")
 
     mock_professionals = [mocker.Mock(), mocker.Mock()]
     mock_professional_response = [mocker.Mock(), mocker.Mock()]
     mock_skills = [mocker.Mock(), mocker.Mock()]
 
-    mock_query = mock_db.query.return_value
+    mock_query = mock_db.query.return_value.options.return_value
     mock_filter = mock_query.filter.return_value
     mock_order_by = mock_filter.order_by.return_value
     mock_offset = mock_order_by.offset.return_value
@@ -138,8 +146,8 @@ def test_getAll_returnsProfessionalsFilteredBySkills_whenSkillsProvided(
         side_effect=mock_professional_response,
     )
     mocker.patch(
-        "app.services.professional_service.get_skills",
-        return_value=mock_skills,
+        "app.services.professional_service.get_skills_for_professionals",
+        return_value=defaultdict(lambda: mock_skills),
     )
 
     # Act
@@ -261,6 +269,95 @@ def test_getById_returnsProfessionalResponseWithPrivateMatches_whenProfessionalH
     assert response.matched_ads is None
 
 
+def test_getMany_returnsProfessionalsInRequestOrder_withSkills(mocker, mock_db) -> None:
+    # Arrange
+    professionals = [mocker.Mock(id=td.VALID_PROFESSIONAL_ID)]
+    skills = defaultdict(list, {td.VALID_PROFESSIONAL_ID: ["skill"]})
+    mock_query = mock_db.query.return_value
+    mock_options = mock_query.options.return_value
+    mock_options.filter.return_value.all.return_value = professionals
+    mock_get_skills_for_professionals = mocker.patch(
+        "app.services.professional_service.get_skills_for_professionals",
+        return_value=skills,
+    )
+    mock_create = mocker.patch(
+        "app.services.professional_service.ProfessionalResponse.create",
+        side_effect=lambda professional, skills: (professional.id, skills),
+    )
+    professional_ids = [td.NON_EXISTENT_ID, td.VALID_PROFESSIONAL_ID]
+
+    # Act
+    result = professional_service.get_many(
+        professional_ids=professional_ids, db=mock_db
+    )
+
+    # Assert
+    mock_db.query.assert_called_once_with(Professional)
+    assert_filter_called_with(mock_options, Professional.id.in_(set(professional_ids)))
+    mock_get_skills_for_professionals.assert_called_once_with(
+        professional_ids=[td.VALID_PROFESSIONAL_ID], db=mock_db
+    )
+    mock_create.assert_called_once_with(professional=professionals[0], skills=["skill"])
+    assert result.items == [None, (td.VALID_PROFESSIONAL_ID, ["skill"])]
+    assert result.not_found == [td.NON_EXISTENT_ID]
+
+
+def test_getByIdAsync_returnsProfessionalResponse_whenProfessionalExists(
+    mocker,
+    mock_professional,
+) -> None:
+    # Arrange
+    mock_db = mocker.AsyncMock()
+    mock_skills = [mocker.Mock(spec=SkillResponse), mocker.Mock(spec=SkillResponse)]
+    mock_sent_match_requests = [
+        mocker.Mock(spec=MatchRequestAd),
+        mocker.Mock(spec=MatchRequestAd),
+    ]
+    mock_matched_ads = [mocker.Mock(spec=JobAdPreview), mocker.Mock(spec=JobAdPreview)]
+
+    mock_get_professional_by_id_async = mocker.patch(
+        "app.services.professional_service.get_professional_by_id_async",
+        return_value=mock_professional,
+    )
+    mock_get_skills_async = mocker.patch(
+        "app.services.professional_service._get_skills_async",
+        return_value=mock_skills,
+    )
+    mock_get_sent_match_requests_async = mocker.patch(
+        "app.services.match_service.get_sent_match_requests_for_professional_async",
+        return_value=mock_sent_match_requests,
+    )
+    mock_get_matches_async = mocker.patch(
+        "app.services.professional_service._get_matches_async",
+        return_value=mock_matched_ads,
+    )
+
+    # Act
+    response = asyncio.run(
+        professional_service.get_by_id_async(
+            professional_id=mock_professional.id, db=mock_db
+        )
+    )
+
+    # Assert
+    mock_get_professional_by_id_async.assert_awaited_once_with(
+        professional_id=mock_professional.id, db=mock_db
+    )
+    mock_get_skills_async.assert_awaited_once_with(
+        professional_id=mock_professional.id, db=mock_db
+    )
+    mock_get_sent_match_requests_async.assert_awaited_once_with(
+        professional_id=mock_professional.id, db=mock_db
+    )
+    mock_get_matches_async.assert_awaited_once_with(
+        professional_id=mock_professional.id, db=mock_db
+    )
+    assert response.id == mock_professional.id
+    assert response.skills == mock_skills
+    assert response.sent_match_requests == mock_sent_match_requests
+    assert response.matched_ads == mock_matched_ads
+
+
 def test_create_createsProfessional_whenValidProfessionalData(
     mocker,
     mock_db,
@@ -371,7 +468,8 @@ def test_updatesFirstName_whenFirstNameProvided(
     assert result.email == mock_professional.email
     assert result.city == mock_professional.city.name
     assert result.description == mock_professional.description
-    assert result.photo == mock_professional.photo
+    assert result.has_photo == mock_professional.has_photo
+    assert result.has_cv == mock_professional.has_cv
     assert result.status == mock_professional.status
     assert result.active_application_count == mock_professional.active_application_count
     assert result.skills == []
@@ -420,7 +518,8 @@ def test_updatesLastName_whenLastNameProvided(
     assert result.email == mock_professional.email
     assert result.city == mock_professional.city.name
     assert result.description == mock_professional.description
-    assert result.photo == mock_professional.photo
+    assert result.has_photo == mock_professional.has_photo
+    assert result.has_cv == mock_professional.has_cv
     assert result.status == mock_professional.status
     assert result.active_application_count == mock_professional.active_application_count
     assert result.skills == []
@@ -471,7 +570,8 @@ def test_updatesDescription_whenDescriptionProvided(
     assert result.last_name == mock_professional.last_name
     assert result.email == mock_professional.email
     assert result.city == mock_professional.city.name
-    assert result.photo == mock_professional.photo
+    assert result.has_photo == mock_professional.has_photo
+    assert result.has_cv == mock_professional.has_cv
     assert result.status == mock_professional.status
     assert result.active_application_count == mock_professional.active_application_count
     assert result.skills == []
@@ -520,7 +620,8 @@ def test_updatesCityId_whenCityIdProvided(
     assert result.last_name == mock_professional.last_name
     assert result.email == mock_professional.email
     assert result.description == mock_professional.description
-    assert result.photo == mock_professional.photo
+    assert result.has_photo == mock_professional.has_photo
+    assert result.has_cv == mock_professional.has_cv
     assert result.status == mock_professional.status
     assert result.active_application_count == mock_professional.active_application_count
     assert result.skills == []
@@ -570,7 +671,8 @@ def test_updatesStatus_whenStatusProvided(
     assert result.email == mock_professional.email
     assert result.city == mock_professional.city.name
     assert result.description == mock_professional.description
-    assert result.photo == mock_professional.photo
+    assert result.has_photo == mock_professional.has_photo
+    assert result.has_cv == mock_professional.has_cv
     assert result.active_application_count == mock_professional.active_application_count
     assert result.skills == []
     assert result.matched_ads == []
@@ -625,7 +727,8 @@ def test_updates_updatesAllFields_whenAllFieldsAreProvided(
 
     assert result.id == mock_professional.id
     assert result.email == mock_professional.email
-    assert result.photo == mock_professional.photo
+    assert result.has_photo == mock_professional.has_photo
+    assert result.has_cv == mock_professional.has_cv
     assert result.active_application_count == mock_professional.active_application_count
     assert result.skills == []
     assert result.matched_ads == []
@@ -672,7 +775,8 @@ def test_updatesNothing_whenNoFieldsAreProvided(
     assert result.email == mock_professional.email
     assert result.city == mock_professional.city.name
     assert result.description == mock_professional.description
-    assert result.photo == mock_professional.photo
+    assert result.has_photo == mock_professional.has_photo
+    assert result.has_cv == mock_professional.has_cv
     assert result.status == mock_professional.status
     assert result.active_application_count == mock_professional.active_application_count
     assert result.skills == []
@@ -689,9 +793,13 @@ def test_uploadPhoto_uploadsPhoto_whenFileIsValid(mocker, mock_db):
         return_value=mock_professional,
     )
     mock_commit = mocker.patch.object(mock_db, "commit")
+    mock_blob = mocker.Mock(hash="photo_hash", size=19, media_type="image/jpeg")
+    mock_store_upload = mocker.patch(
+        "app.services.professional_service.store_upload",
+        return_value=mock_blob,
+    )
 
     mock_photo = mocker.Mock()
-    mock_photo.file.read.return_value = b"valid_photo_content"
 
     # Act
     result = professional_service.upload_photo(
@@ -700,9 +808,14 @@ def test_uploadPhoto_uploadsPhoto_whenFileIsValid(mocker, mock_db):
 
     # Assert
     mock_get_by_id.assert_called_once_with(professional_id=professional_id, db=mock_db)
-    mock_photo.file.read.assert_called_once()
+    mock_store_upload.assert_called_once_with(
+        upload=mock_photo, max_size=ANY, signatures=IMAGE_SIGNATURES
+    )
     mock_commit.assert_called_once()
-    assert mock_professional.photo == b"valid_photo_content"
+    assert mock_professional.photo_hash == mock_blob.hash
+    assert mock_professional.photo_size == mock_blob.size
+    assert mock_professional.photo_media_type == mock_blob.media_type
+    assert mock_professional.photo is None
     assert result.message == "Photo successfully uploaded"
 
 
@@ -712,12 +825,16 @@ def test_downloadPhoto_returnsPhoto_whenPhotoExists(
     mock_professional,
 ) -> None:
     # Arrange
-    mock_professional.photo = b"somebinarydata"
+    mock_professional.photo_hash = "photo_hash"
+    mock_professional.photo_media_type = "image/png"
 
     mock_get_by_id = mocker.patch(
         "app.services.professional_service.get_professional_by_id",
         return_value=mock_professional,
     )
+    mock_blob_store = mocker.patch(
+        "app.services.professional_service.get_blob_store"
+    ).return_value
 
     # Act
     response = professional_service.download_photo(
@@ -728,8 +845,13 @@ def test_downloadPhoto_returnsPhoto_whenPhotoExists(
     mock_get_by_id.assert_called_once_with(
         professional_id=mock_professional.id, db=mock_db
     )
-    assert response.status_code == status.HTTP_200_OK
-    assert response.media_type == "image/png"
+    mock_blob_store.create_response.assert_called_once_with(
+        blob_hash="photo_hash",
+        media_type="image/png",
+        if_none_match=None,
+        range_header=None,
+    )
+    assert response == mock_blob_store.create_response.return_value
 
 
 def test_downloadPhoto_raisesHTTPException_whenPhotoNotFound(
@@ -738,7 +860,7 @@ def test_downloadPhoto_raisesHTTPException_whenPhotoNotFound(
     mock_professional,
 ) -> None:
     # Arrange
-    mock_professional.photo = None
+    mock_professional.photo_hash = None
 
     mock_get_by_id = mocker.patch(
         "app.services.professional_service.get_professional_by_id",
@@ -772,10 +894,13 @@ def test_uploadCv_uploadsCv_whenFileIsValid(
         return_value=mock_professional,
     )
     mock_commit = mocker.patch.object(mock_db, "commit")
+    mock_blob = mocker.Mock(hash="cv_hash", size=16, media_type="application/pdf")
+    mock_store_upload = mocker.patch(
+        "app.services.professional_service.store_upload",
+        return_value=mock_blob,
+    )
 
     mock_cv = mocker.Mock()
-    mock_cv.file.read.return_value = b"valid_cv_content"
-    mock_cv.content_type = "application/pdf"
 
     # Act
     result = professional_service.upload_cv(
@@ -786,9 +911,14 @@ def test_uploadCv_uploadsCv_whenFileIsValid(
     mock_get_by_id.assert_called_once_with(
         professional_id=mock_professional.id, db=mock_db
     )
-    mock_cv.file.read.assert_called_once()
+    mock_store_upload.assert_called_once_with(
+        upload=mock_cv, max_size=ANY, signatures=PDF_SIGNATURES
+    )
     mock_commit.assert_called_once()
-    assert mock_professional.cv == b"valid_cv_content"
+    assert mock_professional.cv_hash == mock_blob.hash
+    assert mock_professional.cv_size == mock_blob.size
+    assert mock_professional.cv_media_type == mock_blob.media_type
+    assert mock_professional.cv is None
     assert result.message == "CV successfully uploaded"
 
 
@@ -798,8 +928,7 @@ def test_downloadCv_returnsCv_whenCvExists(
     mock_professional,
 ) -> None:
     # Arrange
-    cv_data = b"somebinarycvdata"
-    mock_professional.cv = cv_data
+    mock_professional.cv_hash = "cv_hash"
     mock_streaming_response = mocker.Mock()
     mock_get_by_id = mocker.patch(
         "app.services.professional_service.get_professional_by_id",
@@ -820,7 +949,7 @@ def test_downloadCv_returnsCv_whenCvExists(
         professional_id=mock_professional.id, db=mock_db
     )
     mock_generate_cv_response.assert_called_once_with(
-        professional=mock_professional, cv=cv_data
+        professional=mock_professional, if_none_match=None, range_header=None
     )
     assert response == mock_streaming_response
 
@@ -831,7 +960,7 @@ def test_downloadCv_raisesHTTPException_whenCvNotFound(
     mock_professional,
 ) -> None:
     # Arrange
-    mock_professional.cv = None
+    mock_professional.cv_hash = None
 
     mock_get_by_id = mocker.patch(
         "app.services.professional_service.get_professional_by_id",
@@ -860,7 +989,8 @@ def test_deleteCv_deletesCv_whenCvExists(
     mock_professional,
 ) -> None:
     # Arrange
-    mock_professional.cv = b"some_cv_data"
+    mock_professional.cv_hash = "cv_hash"
+    mock_professional.has_cv = True
     mock_get_by_id = mocker.patch(
         "app.services.professional_service.get_professional_by_id",
         return_value=mock_professional,
@@ -877,6 +1007,9 @@ def test_deleteCv_deletesCv_whenCvExists(
     )
     mock_db.commit.assert_called_once()
     assert mock_professional.cv is None
+    assert mock_professional.cv_hash is None
+    assert mock_professional.cv_size is None
+    assert mock_professional.cv_media_type is None
     assert result.message == "CV deleted successfully"
 
 
@@ -886,7 +1019,8 @@ def test_deleteCv_raisesApplicationError_whenCvNotFound(
     mock_professional,
 ) -> None:
     # Arrange
-    mock_professional.cv = None
+    mock_professional.cv_hash = None
+    mock_professional.has_cv = False
     mock_get_by_id = mocker.patch(
         "app.services.professional_service.get_professional_by_id",
         return_value=mock_professional,
@@ -1078,10 +1212,10 @@ def test_getApplications_returnsApplications_whenApplicationsExist(
     mock_professional,
 ) -> None:
     # Arrange
-    mock_filter_params = mocker.Mock(offset=0, limit=10)
+    mock_filter_params = mocker.Mock(offset=0, limit=10, cursor=None)
     mock_application_response = mocker.Mock()
 
-    mock_query = mock_db.query.return_value
+    mock_query = mock_db.query.return_value.options.return_value
     mock_filter = mock_query.filter.return_value
     mock_offset = mock_filter.offset.return_value
     mock_limit = mock_offset.limit.return_value
@@ -1110,6 +1244,9 @@ def test_getApplications_returnsApplications_whenApplicationsExist(
         professional_id=td.VALID_PROFESSIONAL_ID, db=mock_db
     )
     mock_db.query.assert_called_once_with(JobApplication)
+    mock_db.query.return_value.options.assert_called_once_with(
+        *JOB_APPLICATION_RESPONSE_OPTIONS
+    )
     assert_filter_called_with(
         mock_query,
         (JobApplication.professional_id == td.VALID_PROFESSIONAL_ID)
@@ -1126,9 +1263,9 @@ def test_getApplications_returnsEmptyList_whenNoApplicationsExist(
     mock_professional,
 ) -> None:
     # Arrange
-    mock_filter_params = mocker.Mock(offset=0, limit=10)
+    mock_filter_params = mocker.Mock(offset=0, limit=10, cursor=None)
 
-    mock_query = mock_db.query.return_value
+    mock_query = mock_db.query.return_value.options.return_value
     mock_filter = mock_query.filter.return_value
     mock_offset = mock_filter.offset.return_value
     mock_limit = mock_offset.limit.return_value
@@ -1200,7 +1337,7 @@ def test_getApplication_returnsApplication_whenApplicationExists(
     mock_job_application = mocker.Mock(id=job_application_id)
     mock_application_response = mocker.Mock()
 
-    mock_query = mock_db.query.return_value
+    mock_query = mock_db.query.return_value.options.return_value
     mock_filter = mock_query.filter.return_value
     mock_filter.first.return_value = mock_job_application
 
@@ -1231,7 +1368,7 @@ def test_getApplication_raisesApplicationError_whenApplicationNotFound(mock_db)
     professional_id = td.VALID_PROFESSIONAL_ID
     job_application_id = td.VALID_JOB_APPLICATION_ID
 
-    mock_query = mock_db.query.return_value
+    mock_query = mock_db.query.return_value.options.return_value
     mock_filter = mock_query.filter.return_value
     mock_filter.first.return_value = None
 
@@ -1326,6 +1463,62 @@ def test_getSkills_returnsEmptyList_whenNoSkillsExist(
     assert result == []
 
 
+def test_getSkillsForProfessionals_returnsSkillsGroupedByProfessional(
+    mocker,
+    mock_db,
+) -> None:
+    # Arrange
+    professional_id_2 = td.NON_EXISTENT_ID
+    rows = [
+        (
+            td.VALID_PROFESSIONAL_ID,
+            td.VALID_SKILL_ID,
+            td.VALID_SKILL_NAME,
+            td.VALID_CATEGORY_ID,
+        ),
+        (
+            td.VALID_PROFESSIONAL_ID,
+            td.VALID_SKILL_ID_2,
+            td.VALID_SKILL_NAME_2,
+            td.VALID_CATEGORY_ID_2,
+        ),
+    ]
+
+    mock_query = mock_db.query.return_value
+    mock_join = mock_query.join.return_value.join.return_value
+    mock_distinct = mock_join.filter.return_value.distinct.return_value
+    mock_distinct.order_by.return_value.all.return_value = rows
+
+    # Act
+    result = professional_service.get_skills_for_professionals(
+        professional_ids=[td.VALID_PROFESSIONAL_ID, professional_id_2], db=mock_db
+    )
+
+    # Assert
+    mock_db.query.assert_called_once()
+    mock_distinct.order_by.assert_called_once_with(Skill.name)
+    assert list(result.keys()) == [td.VALID_PROFESSIONAL_ID, professional_id_2]
+    assert [skill.id for skill in result[td.VALID_PROFESSIONAL_ID]] == [
+        td.VALID_SKILL_ID,
+        td.VALID_SKILL_ID_2,
+    ]
+    assert result[td.VALID_PROFESSIONAL_ID][0].name == td.VALID_SKILL_NAME
+    assert result[professional_id_2] == []
+
+
+def test_getSkillsForProfessionals_returnsEmptyDict_whenNoProfessionalIds(
+    mock_db,
+) -> None:
+    # Act
+    result = professional_service.get_skills_for_professionals(
+        professional_ids=[], db=mock_db
+    )
+
+    # Assert
+    mock_db.query.assert_not_called()
+    assert result == {}
+
+
 def test_getMatchRequests_returnsMatchRequests_whenRequestsExist(
     mocker,
     mock_db,
@@ -1458,21 +1651,21 @@ def test_getSentMatchRequests_returnsEmptyList_whenNoRequestsExist(
 
 def test_getMatches_returnsJobAds_whenMatchesExist(mocker, mock_db, mock_professional):
     # Arrange
-    mock_job_ad_1 = mocker.Mock()
-    mock_job_ad_2 = mocker.Mock()
-    mock_job_ad_preview_1 = mocker.Mock()
-    mock_job_ad_preview_2 = mocker.Mock()
-
-    mock_query = mock_db.query.return_value
-    mock_join_match = mock_query.join.return_value
-    mock_join_job_app = mock_join_match.join.return_value
-    mock_filter = mock_join_job_app.filter.return_value
-    mock_filter.all.return_value = [mock_job_ad_1, mock_job_ad_2]
-
-    mocker.patch(
-        "app.services.professional_service.JobAdPreview.create",
-        side_effect=[mock_job_ad_preview_1, mock_job_ad_preview_2],
-    )
+    rows = [
+        mocker.Mock(
+            **td.JOB_AD,
+            category_name=td.VALID_CATEGORY_TITLE,
+            city_id=td.VALID_CITY_ID,
+            city_name=td.VALID_CITY_NAME,
+        ),
+        mocker.Mock(
+            **td.JOB_AD_2,
+            category_name=td.VALID_CATEGORY_TITLE,
+            city_id=td.VALID_CITY_ID,
+            city_name=td.VALID_CITY_NAME,
+        ),
+    ]
+    mock_db.execute.return_value.all.return_value = rows
 
     # Act
     result = professional_service._get_matches(
@@ -1480,26 +1673,27 @@ def test_getMatches_returnsJobAds_whenMatchesExist(mocker, mock_db, mock_profess
     )
 
     # Assert
-    mock_db.query.assert_called_once_with(JobAd)
-    mock_query.join.assert_called_once()
-    mock_join_match.join.assert_called_once()
-    assert_filter_called_with(
-        mock_join_job_app,
+    statement = mock_db.execute.call_args.args[0]
+    assert list(statement.selected_columns) == list(
+        select(*JOB_AD_PREVIEW_COLUMNS).selected_columns
+    )
+    assert statement.whereclause.compare(
         (JobApplication.professional_id == td.VALID_PROFESSIONAL_ID)
-        & (JobApplication.status == JobStatus.MATCHED),
+        & (JobApplication.status == JobStatus.MATCHED)
     )
-    assert result == [mock_job_ad_preview_1, mock_job_ad_preview_2]
+    assert [preview.title for preview in result] == [
+        td.VALID_JOB_AD_TITLE,
+        td.VALID_JOB_AD_TITLE_2,
+    ]
+    assert result[0].city.name == td.VALID_CITY_NAME
+    assert result[0].category_name == td.VALID_CATEGORY_TITLE
 
 
 def test_getMatches_returnsEmptyList_whenNoMatchesExist(
     mocker, mock_db, mock_professional
 ):
     # Arrange
-    mock_query = mock_db.query.return_value
-    mock_join_match = mock_query.join.return_value
-    mock_join_job_app = mock_join_match.join.return_value
-    mock_filter = mock_join_job_app.filter.return_value
-    mock_filter.all.return_value = []
+    mock_db.execute.return_value.all.return_value = []
 
     # Act
     result = professional_service._get_matches(
@@ -1507,36 +1701,39 @@ def test_getMatches_returnsEmptyList_whenNoMatchesExist(
     )
 
     # Assert
-    mock_db.query.assert_called_once_with(JobAd)
-    mock_query.join.assert_called_once()
-    mock_join_match.join.assert_called_once()
-    assert_filter_called_with(
-        mock_join_job_app,
-        (JobApplication.professional_id == td.VALID_PROFESSIONAL_ID)
-        & (JobApplication.status == JobStatus.MATCHED),
-    )
+    mock_db.execute.assert_called_once()
+    mock_db.query.assert_not_called()
     assert result == []
 
 
-def test_generateCvResponse_returnsStreamingResponse_withCorrectHeaders(
+def test_generateCvResponse_returnsFileResponse_withCorrectHeaders(
+    mocker,
     mock_professional,
 ) -> None:
     # Arrange
-    cv_content = b"sample_cv_content"
+    mock_professional.cv_hash = "cv_hash"
+    mock_professional.cv_media_type = "application/pdf"
+    mock_blob_store = mocker.patch(
+        "app.services.professional_service.get_blob_store"
+    ).return_value
     expected_filename = (
         f"{mock_professional.first_name}_{mock_professional.last_name}_CV.pdf"
     )
 
     # Act
     response = professional_service._generate_cv_response(
-        professional=mock_professional, cv=cv_content
+        professional=mock_professional
     )
 
     # Assert
-    assert response.status_code == status.HTTP_200_OK
-    assert response.media_type == "application/pdf"
-    assert (
-        response.headers["Content-Disposition"]
-        == f"attachment; filename={expected_filename}"
-    )
-    assert response.headers["Access-Control-Expose-Headers"] == "Content-Disposition"
+    mock_blob_store.create_response.assert_called_once_with(
+        blob_hash="cv_hash",
+        media_type="application/pdf",
+        headers={
+            "Content-Disposition": f"attachment; filename={expected_filename}",
+            "Access-Control-Expose-Headers": "Content-Disposition",
+        },
+        if_none_match=None,
+        range_header=None,
+    )
+    assert response == mock_blob_store.create_response.return_value
@@ -0,0 +1,76 @@
+import re
+from collections import Counter
+
+import pytest
+from sqlalchemy import select, text
+
+from app.schemas.common import FilterParams, SearchParams
+from app.schemas.job_ad import JobAdCreate
+from app.services import city_service, job_ad_service, professional_service
+from app.sql_app import Category, City, Company, Professional, Skill
+from app.sql_app.query_stats import track_queries
+from tests import test_data as td
+
+pytestmark = pytest.mark.integration
+
+_JOB_AD_UPDATES = text(
+    "SELECT coalesce(sum(n_tup_upd), 0) FROM pg_stat_xact_user_tables "
+    "WHERE relname = 'job_ad'"
+)
+_WRITTEN_TABLE = re.compile(r"^(?:INSERT INTO|UPDATE) (\w+)")
+
+
+def test_getAll_runsSingleQuery(db_session, assert_max_queries) -> None:
+    # Act
+    with assert_max_queries(1):
+        city_service.get_all(db=db_session)
+
+
+@pytest.mark.parametrize("page_size", [1, 10, 100])
+def test_getAllProfessionals_runsTwoQueries_regardlessOfPageSize(
+    db_session, assert_max_queries, page_size
+) -> None:
+    # Arrange
+    if db_session.scalar(select(Professional.id).limit(1)) is None:
+        pytest.skip("the database has no seed data")
+
+    # Act
+    with assert_max_queries(2):
+        professional_service.get_all(
+            db=db_session,
+            filter_params=FilterParams(limit=page_size),
+            search_params=SearchParams(),
+        )
+
+
+def test_createJobAd_linksSeveralSkills_withOneInsert_andOneJobAdUpdate(
+    mocker, db_session
+) -> None:
+    # Arrange
+    company_id = db_session.scalar(select(Company.id).limit(1))
+    city_id = db_session.scalar(select(City.id).limit(1))
+    category_id = db_session.scalar(select(Category.id).limit(1))
+    skill_names = db_session.scalars(select(Skill.name).limit(3)).all()
+    if None in (company_id, city_id, category_id) or len(skill_names) < 3:
+        pytest.skip("the database has no seed data")
+    job_ad_data = JobAdCreate(
+        **{**td.JOB_AD_CREATE, "category_id": category_id, "location_id": city_id},
+        company_id=company_id,
+        skills=skill_names,
+    )
+    # Keep the job ad in the transaction the fixture rolls back.
+    mocker.patch.object(db_session, "commit", db_session.flush)
+    job_ad_updates = db_session.scalar(_JOB_AD_UPDATES)
+
+    # Act
+    with track_queries() as stats:
+        job_ad_service.create(job_ad_data=job_ad_data, db=db_session)
+
+    # Assert
+    writes = Counter()
+    for shape, count in stats.shapes.items():
+        if match := _WRITTEN_TABLE.match(shape):
+            writes[match.group(1)] += count
+    assert writes == {"job_ad": 1, "job_ad_skill": 1, "company": 1}
+    # The skill_ids trigger rewrites the new job ad once for all three links.
+    assert db_session.scalar(_JOB_AD_UPDATES) - job_ad_updates == 1
@@ -0,0 +1,184 @@
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import status
+
+from app.exceptions.custom_exceptions import ApplicationError
+from app.services import recommendation_service
+from app.services.recommendation_service import (
+    JOB_ADS,
+    JOB_APPLICATIONS,
+    REFRESH_OVERLAP,
+    RecommendationEngine,
+)
+from app.sql_app.job_ad.job_ad_status import JobAdStatus
+from app.sql_app.job_application.job_application_status import JobStatus
+from tests import test_data as td
+
+PYTHON, SQL = uuid.uuid4(), uuid.uuid4()
+CHANGED_AT = datetime(2024, 6, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def mock_db(mocker):
+    return mocker.Mock()
+
+
+@pytest.fixture
+def engine(mocker) -> RecommendationEngine:
+    engine = RecommendationEngine()
+    mocker.patch("app.services.recommendation_service.recommendation_engine", engine)
+    return engine
+
+
+def _row(mocker, entry_id, skill_ids, status, changed_at=CHANGED_AT):
+    return mocker.Mock(
+        id=entry_id,
+        skill_ids=skill_ids,
+        min_salary=1000,
+        max_salary=2000,
+        location_id=td.VALID_CITY_ID,
+        category_id=td.VALID_CATEGORY_ID,
+        status=status,
+        changed_at=changed_at,
+    )
+
+
+def _patch_load_rows(mocker, job_ads=(), job_applications=()):
+    rows = {JOB_ADS: list(job_ads), JOB_APPLICATIONS: list(job_applications)}
+    return mocker.patch(
+        "app.services.recommendation_service._load_rows",
+        side_effect=lambda source, db, **kwargs: rows[source],
+    )
+
+
+def test_refresh_indexesOnlyActiveRows(mocker, mock_db, engine) -> None:
+    # Arrange
+    active_id, archived_id = uuid.uuid4(), uuid.uuid4()
+    _patch_load_rows(
+        mocker,
+        job_ads=[
+            _row(mocker, active_id, [PYTHON], JobAdStatus.ACTIVE),
+            _row(mocker, archived_id, [PYTHON], JobAdStatus.ARCHIVED),
+        ],
+    )
+
+    # Act
+    engine.refresh(db=mock_db)
+
+    # Assert
+    assert active_id in engine.job_ads
+    assert archived_id not in engine.job_ads
+
+
+def test_refresh_skipsReload_withinRefreshInterval(mocker, mock_db, engine) -> None:
+    # Arrange
+    mock_load_rows = _patch_load_rows(mocker)
+    engine.refresh(db=mock_db)
+
+    # Act
+    engine.refresh(db=mock_db)
+
+    # Assert
+    assert mock_load_rows.call_count == 2
+
+
+def test_refresh_loadsChangesSinceNewestChange_andDropsDeactivatedRows(
+    mocker,
+    mock_db,
+    engine,
+) -> None:
+    # Arrange
+    job_ad_id = uuid.uuid4()
+    _patch_load_rows(
+        mocker, job_ads=[_row(mocker, job_ad_id, [PYTHON], JobAdStatus.ACTIVE)]
+    )
+    engine.refresh(db=mock_db)
+    mock_load_rows = _patch_load_rows(
+        mocker, job_ads=[_row(mocker, job_ad_id, [PYTHON], JobAdStatus.ARCHIVED)]
+    )
+
+    # Act
+    engine.refresh(db=mock_db, force=True)
+
+    # Assert
+    mock_load_rows.assert_any_call(
+        source=JOB_ADS, db=mock_db, changed_since=CHANGED_AT - REFRESH_OVERLAP
+    )
+    assert job_ad_id not in engine.job_ads
+
+
+def test_getJobAdsForJobApplication_returnsBestMatchesFirst(
+    mocker,
+    mock_db,
+    engine,
+) -> None:
+    # Arrange
+    job_application_id = uuid.uuid4()
+    exact_id, partial_id = uuid.uuid4(), uuid.uuid4()
+    _patch_load_rows(
+        mocker,
+        job_ads=[
+            _row(mocker, partial_id, [PYTHON], JobAdStatus.ACTIVE),
+            _row(mocker, exact_id, [PYTHON, SQL], JobAdStatus.ACTIVE),
+        ],
+        job_applications=[
+            _row(mocker, job_application_id, [PYTHON, SQL], JobStatus.ACTIVE)
+        ],
+    )
+
+    # Act
+    result = recommendation_service.get_job_ads_for_job_application(
+        job_application_id=job_application_id,
+        limit=10,
+        similarity="jaccard",
+        db=mock_db,
+    )
+
+    # Assert
+    assert [recommendation.id for recommendation in result] == [exact_id, partial_id]
+    assert result[0].matched_skills == 2
+    assert result[1].skill_similarity == 0.5
+
+
+def test_getJobApplicationsForJobAd_loadsJobAd_whenItIsNotIndexed(
+    mocker,
+    mock_db,
+    engine,
+) -> None:
+    # Arrange
+    job_ad_id, job_application_id = uuid.uuid4(), uuid.uuid4()
+    archived_job_ad = _row(mocker, job_ad_id, [PYTHON], JobAdStatus.ARCHIVED)
+    mock_load_rows = _patch_load_rows(
+        mocker,
+        job_ads=[archived_job_ad],
+        job_applications=[_row(mocker, job_application_id, [PYTHON], JobStatus.ACTIVE)],
+    )
+
+    # Act
+    result = recommendation_service.get_job_applications_for_job_ad(
+        job_ad_id=job_ad_id, limit=10, similarity="jaccard", db=mock_db
+    )
+
+    # Assert
+    mock_load_rows.assert_called_with(source=JOB_ADS, db=mock_db, entry_id=job_ad_id)
+    assert [recommendation.id for recommendation in result] == [job_application_id]
+
+
+def test_getJobApplicationsForJobAd_raisesApplicationError_whenJobAdIsNotFound(
+    mocker,
+    mock_db,
+    engine,
+) -> None:
+    # Arrange
+    _patch_load_rows(mocker)
+
+    # Act
+    with pytest.raises(ApplicationError) as exc:
+        recommendation_service.get_job_applications_for_job_ad(
+            job_ad_id=td.VALID_JOB_AD_ID, limit=10, similarity="jaccard", db=mock_db
+        )
+
+    # Assert
+    assert exc.value.data.status == status.HTTP_404_NOT_FOUND
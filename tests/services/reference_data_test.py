@@ -0,0 +1,64 @@
+import pytest
+
+from app.services.reference_data import CityEntry, ReferenceTable
+from tests import test_data as td
+
+
+@pytest.fixture
+def mock_load(mocker):
+    return mocker.Mock(
+        return_value=[CityEntry(id=td.VALID_CITY_ID, name=td.VALID_CITY_NAME)]
+    )
+
+
+@pytest.fixture
+def table(mock_load) -> ReferenceTable[CityEntry]:
+    return ReferenceTable(name="cities", load=mock_load, name_of=lambda city: city.name)
+
+
+def test_get_loadsTableOnce_andIndexesRowsByIdAndName(mocker, mock_load, table):
+    # Arrange
+    mock_db = mocker.Mock()
+    table.get(db=mock_db)
+
+    # Act
+    snapshot = table.get(db=mock_db)
+
+    # Assert
+    mock_load.assert_called_once_with(mock_db)
+    assert snapshot.by_id[td.VALID_CITY_ID].name == td.VALID_CITY_NAME
+    assert snapshot.by_name[td.VALID_CITY_NAME].id == td.VALID_CITY_ID
+    stats = table.stats()
+    assert (stats.version, stats.rows, stats.hits, stats.misses) == (1, 1, 1, 1)
+
+
+def test_get_reloadsTable_whenSnapshotIsOlderThanTtl(mocker, mock_load, table):
+    # Arrange
+    mocker.patch(
+        "app.services.reference_data.get_settings",
+        return_value=mocker.Mock(REFERENCE_DATA_TTL=60),
+    )
+    mock_time = mocker.patch("app.services.reference_data.time")
+    mock_time.monotonic.side_effect = [100.0, 161.0, 161.0, 161.0]
+    table.get(db=mocker.Mock())
+
+    # Act
+    snapshot = table.get(db=mocker.Mock())
+
+    # Assert
+    assert mock_load.call_count == 2
+    assert snapshot.version == 2
+
+
+def test_invalidate_dropsSnapshot_soNextLookupReloads(mocker, mock_load, table):
+    # Arrange
+    table.get(db=mocker.Mock())
+
+    # Act
+    table.invalidate()
+    snapshot = table.get(db=mocker.Mock())
+
+    # Assert
+    assert mock_load.call_count == 2
+    assert snapshot.version == 2
+    assert table.stats().invalidations == 1
@@ -1,9 +1,11 @@
+import uuid
+
 import pytest
 from fastapi import status
 
 from app.exceptions.custom_exceptions import ApplicationError
 from app.schemas.skill import SkillCreate, SkillResponse
-from app.services import skill_service
+from app.services import reference_data, skill_service
 from app.sql_app.skill.skill import Skill
 from tests import test_data as td
 from tests.utils import assert_filter_called_with
@@ -26,35 +28,20 @@ def mock_skill(mocker):
     return _create_mock_skill
 
 
-def test_getAllForCategory_returnsListOfSkillResponse_whenSkillsExist(
-    mock_db, mock_skill
-):
+def test_getAllForCategory_returnsListOfSkillResponse_whenSkillsExist(mock_db):
     # Arrange
     category_id = td.VALID_CATEGORY_ID
-    skills = [
-        mock_skill(
-            id=td.VALID_SKILL_ID,
-            name=td.VALID_SKILL_NAME,
-            category_id=category_id,
-        ),
-        mock_skill(
-            id=td.VALID_SKILL_ID_2,
-            name=td.VALID_SKILL_NAME_2,
-            category_id=category_id,
-        ),
+    mock_db.query.return_value = [
+        (td.VALID_SKILL_ID, td.VALID_SKILL_NAME, category_id),
+        (td.VALID_SKILL_ID_2, td.VALID_SKILL_NAME_2, category_id),
+        (uuid.uuid4(), "Other", uuid.uuid4()),
     ]
 
-    mock_query = mock_db.query.return_value
-    mock_filter = mock_query.filter.return_value
-    mock_filter.all.return_value = skills
-
     # Act
     response = skill_service.get_all_for_category(category_id=category_id, db=mock_db)
 
     # Assert
-    mock_db.query.assert_called_once_with(Skill)
-    assert_filter_called_with(mock_query, Skill.category_id == category_id)
-    mock_filter.all.assert_called_once()
+    mock_db.query.assert_called_once_with(Skill.id, Skill.name, Skill.category_id)
     assert len(response) == 2
     assert response[0].id == td.VALID_SKILL_ID
     assert response[0].name == td.VALID_SKILL_NAME
@@ -66,19 +53,14 @@ def test_getAllForCategory_returnsListOfSkillResponse_whenSkillsExist(
 
 def test_getAllForCategory_returnsEmptyList_whenNoSkillsExist(mock_db):
     # Arrange
-    category_id = td.VALID_CATEGORY_ID
-
-    mock_query = mock_db.query.return_value
-    mock_filter = mock_query.filter.return_value
-    mock_filter.all.return_value = []
+    mock_db.query.return_value = []
 
     # Act
-    response = skill_service.get_all_for_category(category_id=category_id, db=mock_db)
+    response = skill_service.get_all_for_category(
+        category_id=td.VALID_CATEGORY_ID, db=mock_db
+    )
 
     # Assert
-    mock_db.query.assert_called_once_with(Skill)
-    assert_filter_called_with(mock_query, Skill.category_id == category_id)
-    mock_filter.all.assert_called_once()
     assert response == []
 
 
@@ -126,6 +108,66 @@ def test_getById_raisesError_whenSkillDoesNotExist(mock_db):
     assert exc.value.data.detail == f"Skill with id {skill_id} not found"
 
 
+def test_searchByName_returnsSkillsRankedBySimilarity_whenTrigramIsAvailable(
+    mocker, mock_db, mock_skill
+):
+    # Arrange
+    skill = mock_skill(
+        id=td.VALID_SKILL_ID,
+        name=td.VALID_SKILL_NAME,
+        category_id=td.VALID_CATEGORY_ID,
+    )
+    mocker.patch("app.services.skill_service.is_extension_available", return_value=True)
+    mock_query = mock_db.query.return_value
+    mock_limit = mock_query.filter.return_value.order_by.return_value.limit
+    mock_limit.return_value.all.return_value = [(skill, 0.71428)]
+
+    # Act
+    response = skill_service.search_by_name(name="Test Skil", limit=5, db=mock_db)
+
+    # Assert
+    assert "similarity" in str(mock_db.query.call_args.args[1])
+    mock_limit.assert_called_once_with(5)
+    assert len(response) == 1
+    assert response[0].id == td.VALID_SKILL_ID
+    assert response[0].similarity == 0.7143
+
+
+def test_searchByName_fallsBackToSubstringMatch_whenTrigramIsUnavailable(
+    mocker, mock_db, mock_skill
+):
+    # Arrange
+    skills = [
+        mock_skill(
+            id=td.VALID_SKILL_ID_2,
+            name=td.VALID_SKILL_NAME_2,
+            category_id=td.VALID_CATEGORY_ID,
+        ),
+        mock_skill(
+            id=td.VALID_SKILL_ID,
+            name=td.VALID_SKILL_NAME,
+            category_id=td.VALID_CATEGORY_ID,
+        ),
+    ]
+    mocker.patch(
+        "app.services.skill_service.is_extension_available", return_value=False
+    )
+    mock_query = mock_db.query.return_value
+    mock_query.filter.return_value.all.return_value = skills
+
+    # Act
+    response = skill_service.search_by_name(name="test skill", limit=1, db=mock_db)
+
+    # Assert
+    mock_db.query.assert_called_once_with(Skill)
+    assert_filter_called_with(
+        mock_query, Skill.name.icontains("test skill", autoescape=True)
+    )
+    assert len(response) == 1
+    assert response[0].id == td.VALID_SKILL_ID
+    assert response[0].similarity == 1.0
+
+
 def test_create_createsSkill_whenValidData(mocker, mock_db):
     # Arrange
     skill_data = SkillCreate(name=td.VALID_SKILL_NAME, category_id=td.VALID_CATEGORY_ID)
@@ -135,10 +177,13 @@ def test_create_createsSkill_whenValidData(mocker, mock_db):
         return_value=mock_response,
     )
 
+    mock_invalidate = mocker.patch.object(reference_data.skills, "invalidate")
+
     # Act
     response = skill_service.create(skill_data=skill_data, db=mock_db)
 
     # Assert
+    mock_invalidate.assert_called_once()
     mock_db.add.assert_called_once()
     mock_db.commit.assert_called_once()
     mock_db.refresh.assert_called_once()
@@ -0,0 +1,143 @@
+from datetime import datetime
+
+import pytest
+from fastapi import status
+
+from app.exceptions.custom_exceptions import ApplicationError
+from app.schemas.common import CursorPage, FilterParams
+from app.sql_app.job_ad.job_ad import JobAd
+from app.utils.pagination import Keyset
+from tests import test_data as td
+
+
+@pytest.fixture
+def keyset():
+    return Keyset(
+        name="job_ad:created_at:desc",
+        columns=(JobAd.created_at, JobAd.id),
+        order="desc",
+    )
+
+
+@pytest.fixture
+def rows(mocker):
+    return [
+        mocker.Mock(created_at=datetime(2024, 1, day), id=td.VALID_JOB_AD_ID)
+        for day in (3, 2, 1)
+    ]
+
+
+def test_apply_usesOffsetPagination_whenNoCursorIsGiven(mocker, keyset) -> None:
+    # Arrange
+    query = mocker.Mock()
+    filter_params = FilterParams(offset=20, limit=10)
+
+    # Act
+    result = keyset.apply(query=query, filter_params=filter_params)
+
+    # Assert
+    query.offset.assert_called_once_with(20)
+    query.offset.return_value.limit.assert_called_once_with(10)
+    assert result == query.offset.return_value.limit.return_value
+
+
+def test_apply_ordersByKeyAndFetchesExtraRow_whenCursorIsEmpty(
+    mocker,
+    keyset,
+) -> None:
+    # Arrange
+    query = mocker.Mock()
+    filter_params = FilterParams(limit=10, cursor="")
+    mock_ordered = query.order_by.return_value.order_by.return_value
+
+    # Act
+    result = keyset.apply(query=query, filter_params=filter_params)
+
+    # Assert
+    query.order_by.assert_called_once_with(None)
+    query.offset.assert_not_called()
+    mock_ordered.filter.assert_not_called()
+    mock_ordered.limit.assert_called_once_with(11)
+    assert result == mock_ordered.limit.return_value
+
+
+def test_page_returnsList_whenNoCursorIsGiven(keyset, rows) -> None:
+    # Arrange
+    filter_params = FilterParams(limit=10)
+
+    # Act
+    result = keyset.page(
+        rows=rows, filter_params=filter_params, create_items=lambda rows: rows
+    )
+
+    # Assert
+    assert result == rows
+
+
+def test_page_returnsNextCursor_whenMoreRowsExist(keyset, rows) -> None:
+    # Arrange
+    filter_params = FilterParams(limit=2, cursor="")
+
+    # Act
+    result = keyset.page(
+        rows=rows, filter_params=filter_params, create_items=lambda rows: rows
+    )
+
+    # Assert
+    assert isinstance(result, CursorPage)
+    assert result.items == rows[:2]
+    assert keyset._decode(result.next_cursor) == (
+        rows[1].created_at,
+        td.VALID_JOB_AD_ID,
+    )
+
+
+def test_page_returnsNoNextCursor_onLastPage(keyset, rows) -> None:
+    # Arrange
+    filter_params = FilterParams(limit=3, cursor="")
+
+    # Act
+    result = keyset.page(
+        rows=rows, filter_params=filter_params, create_items=lambda rows: rows
+    )
+
+    # Assert
+    assert result.items == rows
+    assert result.next_cursor is None
+
+
+def test_apply_raisesApplicationError_whenCursorIsMalformed(mocker, keyset) -> None:
+    # Arrange
+    filter_params = FilterParams(cursor="not-a-cursor")
+
+    # Act
+    with pytest.raises(ApplicationError) as exc:
+        keyset.apply(query=mocker.Mock(), filter_params=filter_params)
+
+    # Assert
+    assert exc.value.data.status == status.HTTP_400_BAD_REQUEST
+
+
+def test_apply_raisesApplicationError_whenCursorBelongsToAnotherOrdering(
+    mocker,
+    keyset,
+    rows,
+) -> None:
+    # Arrange
+    other_keyset = Keyset(
+        name="job_ad:updated_at:desc",
+        columns=(JobAd.updated_at, JobAd.id),
+        order="desc",
+    )
+    cursor = other_keyset.page(
+        rows=rows,
+        filter_params=FilterParams(limit=1, cursor=""),
+        create_items=lambda rows: rows,
+    ).next_cursor
+
+    # Act
+    with pytest.raises(ApplicationError) as exc:
+        keyset.apply(query=mocker.Mock(), filter_params=FilterParams(cursor=cursor))
+
+    # Assert
+    assert exc.value.data.status == status.HTTP_400_BAD_REQUEST
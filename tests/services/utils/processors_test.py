@@ -1,18 +1,53 @@
+import asyncio
 import json
+from datetime import datetime
+from uuid import UUID
 
 import pytest
 from fastapi import status
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 from app.exceptions.custom_exceptions import ApplicationError
 from app.utils.processors import (
+    ModelJSONResponse,
     _format_response,
+    process_async_db_transaction,
+    process_async_request,
     process_db_transaction,
     process_request,
 )
 
 
+class MockItem(BaseModel):
+    id: UUID
+    name: str
+    salary: float | None
+    created_at: datetime
+
+
+class MockPage(BaseModel):
+    items: list[MockItem]
+    next_cursor: str | None = None
+
+
+ITEMS = [
+    MockItem(
+        id=UUID("0b7ac8a5-8a0c-4b7e-9d5f-2f1d9a4c2e11"),
+        name='Ünïcödé — "quoted"\n',
+        salary=1500.5,
+        created_at=datetime(2024, 10, 1, 12, 30, 15, 123456),
+    ),
+    MockItem(
+        id=UUID("6f1c2d3e-4b5a-4c7d-8e9f-0a1b2c3d4e5f"),
+        name="Plain",
+        salary=None,
+        created_at=datetime(2024, 10, 2),
+    ),
+]
+
+
 @pytest.fixture
 def mock_db(mocker):
     return mocker.Mock()
@@ -26,15 +61,9 @@ def test_processRequest_returnsSuccessfulResponse_whenDataIsValid(
     get_entities_fn = mocker.Mock()
     status_code = status.HTTP_200_OK
     not_found_err_msg = "Entity not found"
-    mock_result = mocker.Mock()
-
     mock_process_db_transaction = mocker.patch(
         "app.utils.processors.process_db_transaction",
-        return_value=mock_result,
-    )
-    mock_format_response = mocker.patch(
-        "app.utils.processors._format_response",
-        return_value={"key": "value"},
+        return_value=ITEMS,
     )
 
     # Act
@@ -50,9 +79,9 @@ def test_processRequest_returnsSuccessfulResponse_whenDataIsValid(
         transaction_func=get_entities_fn,
         db=mock_db,
     )
-    mock_format_response.assert_called_once_with(mock_result)
+    assert isinstance(response, ModelJSONResponse)
     assert response.status_code == status_code
-    assert json.loads(response.body) == {"key": "value"}
+    assert response.body == JSONResponse(content=_format_response(ITEMS)).body
 
 
 def test_processRequest_handlesApplicationError(mocker, mock_db) -> None:
@@ -191,6 +220,109 @@ def test_process_db_transaction_handlesSQLAlchemyError(mocker, mock_db) -> None:
     assert exc_info.value.data.status == status.HTTP_500_INTERNAL_SERVER_ERROR
 
 
+def test_processAsyncRequest_returnsSuccessfulResponse_whenDataIsValid(
+    mocker,
+) -> None:
+    # Arrange
+    mock_db = mocker.AsyncMock()
+    get_entities_fn = mocker.AsyncMock(return_value={"key": "value"})
+
+    # Act
+    response = asyncio.run(
+        process_async_request(
+            get_entities_fn=get_entities_fn,
+            status_code=status.HTTP_200_OK,
+            not_found_err_msg="Entity not found",
+            db=mock_db,
+        )
+    )
+
+    # Assert
+    get_entities_fn.assert_awaited_once()
+    assert response.status_code == status.HTTP_200_OK
+    assert json.loads(response.body) == {"key": "value"}
+
+
+def test_processAsyncRequest_handlesApplicationError(mocker) -> None:
+    # Arrange
+    mock_db = mocker.AsyncMock()
+    get_entities_fn = mocker.AsyncMock(
+        side_effect=ApplicationError(
+            detail="Application error occurred",
+            status_code=status.HTTP_404_NOT_FOUND,
+        )
+    )
+
+    # Act
+    response = asyncio.run(
+        process_async_request(
+            get_entities_fn=get_entities_fn,
+            status_code=status.HTTP_200_OK,
+            not_found_err_msg="Entity not found",
+            db=mock_db,
+        )
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert json.loads(response.body) == {
+        "detail": {"error": "Application error occurred"}
+    }
+
+
+def test_processAsyncRequest_handlesTypeError(mocker) -> None:
+    # Arrange
+    mock_db = mocker.AsyncMock()
+    get_entities_fn = mocker.AsyncMock(side_effect=TypeError("Type error occurred"))
+
+    # Act
+    response = asyncio.run(
+        process_async_request(
+            get_entities_fn=get_entities_fn,
+            status_code=status.HTTP_200_OK,
+            not_found_err_msg="Entity not found",
+            db=mock_db,
+        )
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert json.loads(response.body) == {"detail": {"error": "Type error occurred"}}
+
+
+def test_processAsyncRequest_handlesSyntaxError(mocker) -> None:
+    # Arrange
+    mock_db = mocker.AsyncMock()
+    get_entities_fn = mocker.AsyncMock(side_effect=SyntaxError("Syntax error occurred"))
+
+    # Act
+    response = asyncio.run(
+        process_async_request(
+            get_entities_fn=get_entities_fn,
+            status_code=status.HTTP_200_OK,
+            not_found_err_msg="Entity not found",
+            db=mock_db,
+        )
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert json.loads(response.body) == {"detail": {"error": "Syntax error occurred"}}
+
+
+def test_processAsyncDbTransaction_handlesSQLAlchemyError(mocker) -> None:
+    # Arrange
+    mock_db = mocker.AsyncMock()
+    transaction_func = mocker.AsyncMock(side_effect=SQLAlchemyError("SQLAlchemy error"))
+
+    # Act & Assert
+    with pytest.raises(ApplicationError) as exc_info:
+        asyncio.run(process_async_db_transaction(transaction_func, mock_db))
+
+    mock_db.rollback.assert_awaited_once()
+    assert exc_info.value.data.status == status.HTTP_500_INTERNAL_SERVER_ERROR
+
+
 def test_formatResponse_withSingleModel() -> None:
     # Arrange
     class MockModel(BaseModel):
@@ -220,3 +352,35 @@ def test_formatResponse_withListOfModels() -> None:
 
     # Assert
     assert result == [{"key": "value1"}, {"key": "value2"}]
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        ITEMS[0],
+        ITEMS,
+        MockPage(items=ITEMS, next_cursor="cursor"),
+        [ITEMS[0], MockPage(items=[])],
+        [],
+        {"key": "value"},
+        None,
+    ],
+)
+def test_modelJsonResponse_rendersSameBytesAsJsonResponse(content) -> None:
+    # Act
+    response = ModelJSONResponse(content=content)
+
+    # Assert
+    assert response.body == JSONResponse(content=_format_response(content)).body
+    assert response.media_type == "application/json"
+
+
+def test_modelJsonResponse_doesNotDumpModels(mocker) -> None:
+    # Arrange
+    mock_format_response = mocker.patch("app.utils.processors._format_response")
+
+    # Act
+    ModelJSONResponse(content=ITEMS)
+
+    # Assert
+    mock_format_response.assert_not_called()
@@ -0,0 +1,143 @@
+import uuid
+
+import pytest
+
+from app.utils.skill_match import (
+    INITIAL_CAPACITY,
+    MatchEntry,
+    SkillMatchIndex,
+    Vocabulary,
+)
+
+PYTHON, SQL, DOCKER, JAVA = (uuid.uuid4() for _ in range(4))
+SOFIA, PLOVDIV = uuid.uuid4(), uuid.uuid4()
+IT = uuid.uuid4()
+
+
+def _entry(
+    skill_ids: list[uuid.UUID],
+    min_salary: float | None = 1000,
+    max_salary: float | None = 2000,
+    location_id: uuid.UUID | None = SOFIA,
+    category_id: uuid.UUID | None = IT,
+) -> MatchEntry:
+    return MatchEntry(
+        id=uuid.uuid4(),
+        skill_ids=skill_ids,
+        min_salary=min_salary,
+        max_salary=max_salary,
+        location_id=location_id,
+        category_id=category_id,
+    )
+
+
+@pytest.fixture
+def index() -> SkillMatchIndex:
+    return SkillMatchIndex(Vocabulary(), Vocabulary(), Vocabulary())
+
+
+def test_topK_ranksEntriesBySkillSimilarity(index) -> None:
+    # Arrange
+    exact = _entry([PYTHON, SQL])
+    partial = _entry([PYTHON, DOCKER])
+    unrelated = _entry([JAVA])
+    index.upsert([partial, unrelated, exact])
+
+    # Act
+    result = index.top_k(query=index.encode(_entry([PYTHON, SQL])), limit=10)
+
+    # Assert
+    assert [match.id for match in result] == [exact.id, partial.id]
+    assert result[0].matched_skills == 2
+    assert result[0].skill_similarity == 1.0
+    assert result[1].skill_similarity == pytest.approx(1 / 3)
+    assert result[0].score == pytest.approx(1.0)
+
+
+def test_topK_usesOverlapCoefficient_whenRequested(index) -> None:
+    # Arrange
+    superset = _entry([PYTHON, SQL, DOCKER, JAVA])
+    index.upsert([superset])
+
+    # Act
+    result = index.top_k(
+        query=index.encode(_entry([PYTHON, SQL])), limit=10, similarity="overlap"
+    )
+
+    # Assert
+    assert result[0].skill_similarity == 1.0
+
+
+def test_topK_scoresSalaryOverlapAndLocation(index) -> None:
+    # Arrange
+    same_city = _entry([PYTHON], min_salary=1500, max_salary=3000)
+    other_city = _entry([PYTHON], min_salary=1500, max_salary=3000, location_id=PLOVDIV)
+    no_salary = _entry([PYTHON], min_salary=None, max_salary=None, location_id=PLOVDIV)
+    index.upsert([other_city, no_salary, same_city])
+
+    # Act
+    result = index.top_k(query=index.encode(_entry([PYTHON])), limit=10)
+
+    # Assert
+    assert [match.id for match in result] == [same_city.id, other_city.id, no_salary.id]
+    assert result[0].salary_overlap == pytest.approx(0.5)
+    assert result[0].same_location
+    assert not result[1].same_location
+    assert result[2].salary_overlap == 0
+
+
+def test_topK_returnsAtMostLimitMatches(index) -> None:
+    # Arrange
+    index.upsert([_entry([PYTHON]) for _ in range(5)])
+
+    # Act
+    result = index.top_k(query=index.encode(_entry([PYTHON])), limit=3)
+
+    # Assert
+    assert len(result) == 3
+
+
+def test_upsert_replacesIndexedAttributes(index) -> None:
+    # Arrange
+    entry = _entry([JAVA])
+    index.upsert([entry])
+
+    # Act
+    index.upsert([MatchEntry(**{**entry.__dict__, "skill_ids": [PYTHON]})])
+
+    # Assert
+    result = index.top_k(query=index.encode(_entry([PYTHON])), limit=10)
+    assert [match.id for match in result] == [entry.id]
+    assert len(index) == 1
+
+
+def test_remove_dropsEntryAndReusesItsRow(index) -> None:
+    # Arrange
+    removed = _entry([PYTHON])
+    index.upsert([removed])
+
+    # Act
+    index.remove([removed.id])
+    added = _entry([PYTHON])
+    index.upsert([added])
+
+    # Assert
+    result = index.top_k(query=index.encode(_entry([PYTHON])), limit=10)
+    assert [match.id for match in result] == [added.id]
+    assert removed.id not in index
+
+
+def test_upsert_growsBeyondInitialCapacityAndSkillWidth(index) -> None:
+    # Arrange
+    skill_ids = [uuid.uuid4() for _ in range(200)]
+    entries = [_entry([skill_ids[i % 200]]) for i in range(INITIAL_CAPACITY + 10)]
+
+    # Act
+    index.upsert(entries)
+
+    # Assert
+    result = index.top_k(query=index.encode(_entry([skill_ids[199]])), limit=100)
+    assert len(index) == INITIAL_CAPACITY + 10
+    assert {match.id for match in result} == {
+        entry.id for i, entry in enumerate(entries) if i % 200 == 199
+    }
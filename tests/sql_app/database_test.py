@@ -0,0 +1,185 @@
+import asyncio
+
+import pytest
+
+from app.sql_app import database
+
+
+@pytest.fixture
+def mock_sessions(mocker):
+    session_local = mocker.patch("app.sql_app.database.SessionLocal")
+    read_session_local = mocker.patch("app.sql_app.database.ReadSessionLocal")
+    return session_local, read_session_local
+
+
+def test_getReadDb_usesPrimary_whenNoReplicasAreConfigured(
+    mocker, mock_sessions
+) -> None:
+    # Arrange
+    session_local, read_session_local = mock_sessions
+    mocker.patch("app.sql_app.database.read_engines", [])
+
+    # Act
+    db = next(database.get_read_db(x_read_primary=None))
+
+    # Assert
+    assert db == session_local.return_value
+    read_session_local.assert_not_called()
+
+
+def test_getReadDb_usesReplica_whenReplicasAreConfigured(mocker, mock_sessions) -> None:
+    # Arrange
+    session_local, read_session_local = mock_sessions
+    replica = mocker.Mock()
+    mocker.patch("app.sql_app.database.read_engines", [replica])
+
+    # Act
+    db = next(database.get_read_db(x_read_primary=None))
+
+    # Assert
+    assert db == read_session_local.return_value
+    read_session_local.assert_called_once_with(bind=replica)
+    session_local.assert_not_called()
+
+
+def test_getReadDb_usesPrimary_whenReadPrimaryHeaderIsSent(
+    mocker, mock_sessions
+) -> None:
+    # Arrange
+    session_local, read_session_local = mock_sessions
+    mocker.patch("app.sql_app.database.read_engines", [mocker.Mock()])
+
+    # Act
+    db = next(database.get_read_db(x_read_primary="1"))
+
+    # Assert
+    assert db == session_local.return_value
+    read_session_local.assert_not_called()
+
+
+def test_getReadDb_spreadsSessionsAcrossReplicas(mocker, mock_sessions) -> None:
+    # Arrange
+    _, read_session_local = mock_sessions
+    replicas = [mocker.Mock(), mocker.Mock()]
+    mocker.patch("app.sql_app.database.read_engines", replicas)
+
+    # Act
+    for _ in range(4):
+        next(database.get_read_db(x_read_primary=None))
+
+    # Assert
+    bound_engines = [call.kwargs["bind"] for call in read_session_local.call_args_list]
+    assert set(bound_engines) == set(replicas)
+    assert bound_engines.count(replicas[0]) == 2
+
+
+def test_getReadDb_closesReplicaSession(mocker, mock_sessions) -> None:
+    # Arrange
+    _, read_session_local = mock_sessions
+    mocker.patch("app.sql_app.database.read_engines", [mocker.Mock()])
+    dependency = database.get_read_db(x_read_primary=None)
+    db = next(dependency)
+
+    # Act
+    dependency.close()
+
+    # Assert
+    db.close.assert_called_once()
+
+
+def test_getAsyncReadDb_usesReplica_whenReplicasAreConfigured(mocker) -> None:
+    # Arrange
+    replica = mocker.Mock()
+    mocker.patch("app.sql_app.database.async_read_engines", [replica])
+    read_session_local = mocker.patch("app.sql_app.database.AsyncReadSessionLocal")
+    session = read_session_local.return_value.__aenter__.return_value
+
+    async def _first_session():
+        return await anext(database.get_async_read_db(x_read_primary=None))
+
+    # Act
+    db = asyncio.run(_first_session())
+
+    # Assert
+    assert db == session
+    read_session_local.assert_called_once_with(bind=replica)
+
+
+def test_initializeDatabase_takesAdvisoryLockBeforeCreatingSchema(mocker) -> None:
+    # Arrange
+    mock_engine = mocker.patch("app.sql_app.database.engine")
+    connection = mock_engine.begin.return_value.__enter__.return_value
+    create_tables = mocker.patch("app.sql_app.database.create_tables")
+    add_blob_reference_columns = mocker.patch(
+        "app.storage.migration.add_blob_reference_columns"
+    )
+    mocker.patch("app.sql_app.database.Session")
+    insert_data = mocker.patch("app.sql_app.init_data.insert_data")
+
+    # Act
+    database.initialize_database()
+
+    # Assert
+    lock_call = connection.execute.call_args_list[0]
+    assert "pg_advisory_xact_lock" in str(lock_call.args[0])
+    assert lock_call.args[1] == {"lock_id": database.BOOTSTRAP_LOCK_ID}
+    create_tables.assert_called_once_with(connection=connection)
+    add_blob_reference_columns.assert_called_once_with(connection=connection)
+    insert_data.assert_called_once()
+
+
+def test_initializeDatabase_skipsSeeding_whenSeedIsFalse(mocker) -> None:
+    # Arrange
+    mocker.patch("app.sql_app.database.engine")
+    mocker.patch("app.sql_app.database.create_tables")
+    mocker.patch("app.storage.migration.add_blob_reference_columns")
+    insert_data = mocker.patch("app.sql_app.init_data.insert_data")
+
+    # Act
+    database.initialize_database(seed=False)
+
+    # Assert
+    insert_data.assert_not_called()
+
+
+def test_disposeEngines_closesEveryPool(mocker) -> None:
+    # Arrange
+    mock_engine = mocker.patch("app.sql_app.database.engine")
+    read_engine = mocker.Mock()
+    mocker.patch("app.sql_app.database.read_engines", [read_engine])
+    mock_async_engine = mocker.patch(
+        "app.sql_app.database.async_engine", new_callable=mocker.AsyncMock
+    )
+    async_read_engine = mocker.AsyncMock()
+    mocker.patch("app.sql_app.database.async_read_engines", [async_read_engine])
+
+    # Act
+    asyncio.run(database.dispose_engines())
+
+    # Assert
+    mock_engine.dispose.assert_called_once()
+    read_engine.dispose.assert_called_once()
+    mock_async_engine.dispose.assert_awaited_once()
+    async_read_engine.dispose.assert_awaited_once()
+
+
+def test_addSkillIdArrays_createsStatementLevelTriggers_withTransitionTables(
+    mocker,
+) -> None:
+    # Arrange
+    connection = mocker.Mock()
+
+    # Act
+    database.add_skill_id_arrays(connection=connection)
+
+    # Assert
+    statements = [call.args[0].text for call in connection.execute.call_args_list]
+    triggers = [sql for sql in statements if sql.startswith("CREATE TRIGGER")]
+    assert len(triggers) == 3 * len(database.SKILL_ID_ARRAYS)
+    assert all("FOR EACH STATEMENT" in sql for sql in triggers)
+    assert (
+        "CREATE TRIGGER sync_skill_ids_insert AFTER INSERT ON job_ad_skill "
+        "REFERENCING NEW TABLE AS new_links "
+        "FOR EACH STATEMENT EXECUTE FUNCTION sync_job_ad_skill_ids()"
+    ) in triggers
+    assert "DROP TRIGGER IF EXISTS sync_skill_ids ON job_ad_skill" in statements
@@ -0,0 +1,170 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
+
+from app.sql_app import database
+from app.sql_app.pool_metrics import (
+    POOL_METRICS,
+    WAIT_TIME_BUCKETS_MS,
+    PoolMetrics,
+    instrument_pool,
+)
+
+
+@pytest.fixture
+def mock_engine(mocker):
+    mock_pool = mocker.Mock()
+    mock_pool.size.return_value = 5
+    mock_pool.checkedout.return_value = 7
+    mock_pool.checkedin.return_value = 0
+    mock_pool.overflow.return_value = 2
+    return mocker.Mock(pool=mock_pool)
+
+
+@pytest.fixture
+def instrumented_engine():
+    """
+    An in-memory SQLite engine with a one-connection QueuePool, instrumented like
+    the engines in app.sql_app.database, and its metrics.
+    """
+    engine = create_engine(
+        "sqlite://", poolclass=QueuePool, pool_size=1, max_overflow=0, pool_timeout=0.1
+    )
+    metrics = instrument_pool(name="test", engine=engine)
+    yield engine, metrics
+    POOL_METRICS.remove(metrics)
+    engine.dispose()
+
+
+def test_snapshot_reportsLivePoolState(mock_engine) -> None:
+    # Arrange
+    metrics = PoolMetrics(name="primary", engine=mock_engine)
+
+    # Act
+    result = metrics.snapshot()
+
+    # Assert
+    assert result.name == "primary"
+    assert result.pool_size == 5
+    assert result.checked_out == 7
+    assert result.checked_in == 0
+    assert result.overflow == 2
+    assert result.checkouts == 0
+    assert result.timeouts == 0
+
+
+def test_snapshot_reportsZeroOverflow_whenPoolIsNotFull(mock_engine) -> None:
+    # Arrange
+    mock_engine.pool.overflow.return_value = -3
+    metrics = PoolMetrics(name="primary", engine=mock_engine)
+
+    # Act
+    result = metrics.snapshot()
+
+    # Assert
+    assert result.overflow == 0
+
+
+def test_observeCheckout_fillsWaitTimeHistogram(mock_engine) -> None:
+    # Arrange
+    metrics = PoolMetrics(name="primary", engine=mock_engine)
+
+    # Act
+    metrics.observe_checkout(wait_time_ms=0.5, timed_out=False)
+    metrics.observe_checkout(wait_time_ms=30, timed_out=False)
+    metrics.observe_checkout(wait_time_ms=30000, timed_out=True)
+    result = metrics.snapshot()
+
+    # Assert
+    counts = {bucket.le_ms: bucket.count for bucket in result.wait_time_buckets}
+    assert len(result.wait_time_buckets) == len(WAIT_TIME_BUCKETS_MS) + 1
+    assert counts[1] == 1
+    assert counts[50] == 1
+    assert counts[None] == 1
+    assert result.checkouts == 2
+    assert result.timeouts == 1
+    assert result.wait_time_total_ms == 30030.5
+
+
+def test_reset_clearsCollectedStatistics(mock_engine) -> None:
+    # Arrange
+    metrics = PoolMetrics(name="primary", engine=mock_engine)
+    metrics.observe_checkout(wait_time_ms=3, timed_out=True)
+
+    # Act
+    metrics.reset()
+    result = metrics.snapshot()
+
+    # Assert
+    assert result.timeouts == 0
+    assert sum(bucket.count for bucket in result.wait_time_buckets) == 0
+
+
+def test_instrumentPool_recordsEveryCheckout(instrumented_engine) -> None:
+    # Arrange
+    engine, metrics = instrumented_engine
+
+    # Act
+    with sessionmaker(bind=engine)() as db:
+        db.execute(text("SELECT 1"))
+        db.commit()
+        db.execute(text("SELECT 1"))
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+    result = metrics.snapshot()
+
+    # Assert
+    assert result.checkouts == 3
+    assert result.timeouts == 0
+    assert sum(bucket.count for bucket in result.wait_time_buckets) == 3
+
+
+def test_instrumentPool_doesNotTimeSessionWorkBeforeCheckout(
+    mocker, instrumented_engine
+) -> None:
+    # Arrange
+    engine, metrics = instrumented_engine
+    clock = mocker.patch("app.sql_app.pool_metrics.time").perf_counter
+    clock.return_value = 0.0
+
+    # Act
+    with sessionmaker(bind=engine)() as db:
+        db.begin()
+        clock.return_value = 60.0
+        db.execute(text("SELECT 1"))
+    result = metrics.snapshot()
+
+    # Assert
+    assert result.checkouts == 1
+    assert result.wait_time_total_ms == 0
+
+
+def test_instrumentPool_recordsTimeout(instrumented_engine) -> None:
+    # Arrange
+    engine, metrics = instrumented_engine
+
+    # Act
+    with engine.connect(), sessionmaker(bind=engine)() as db:
+        with pytest.raises(PoolTimeoutError):
+            db.execute(text("SELECT 1"))
+    result = metrics.snapshot()
+
+    # Assert
+    assert result.checkouts == 1
+    assert result.timeouts == 1
+    assert result.wait_time_total_ms >= 100
+
+
+def test_database_instrumentsEveryEngine() -> None:
+    # Act
+    instrumented = {metrics.name: metrics.engine for metrics in POOL_METRICS}
+
+    # Assert
+    assert instrumented["primary"] is database.engine
+    assert instrumented["primary-async"] is database.async_engine.sync_engine
+    for i, engine in enumerate(database.read_engines, start=1):
+        assert instrumented[f"replica-{i}"] is engine
+    for i, engine in enumerate(database.async_read_engines, start=1):
+        assert instrumented[f"replica-{i}-async"] is engine.sync_engine
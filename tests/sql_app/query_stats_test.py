@@ -0,0 +1,211 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from app.sql_app.query_stats import (
+    QueryStats,
+    QueryStatsMiddleware,
+    _after_cursor_execute,
+    _before_cursor_execute,
+    instrument_engine,
+    statement_shape,
+    track_queries,
+)
+
+SELECT_CITY = "SELECT city.id, city.name FROM city WHERE city.id = %(pk_1)s"
+
+
+def _execute(conn, statement: str) -> None:
+    context = SimpleNamespace()
+    _before_cursor_execute(conn, None, statement, {}, context, False)
+    _after_cursor_execute(conn, None, statement, {}, context, False)
+
+
+@pytest.fixture
+def sqlite_engine():
+    """
+    An in-memory SQLite engine with the statement counting listeners, for tests
+    that need real SQLAlchemy events but no PostgreSQL.
+    """
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+    yield engine
+    engine.dispose()
+
+
+def test_statementShape_foldsParameterLists() -> None:
+    # Arrange
+    short_list = "SELECT skill.id FROM skill WHERE skill.id IN (%(id_1_1)s)"
+    long_list = """SELECT skill.id FROM skill
+        WHERE skill.id IN (%(id_1_1)s, %(id_1_2)s, %(id_1_3)s)"""
+
+    # Act
+    result = statement_shape(long_list)
+
+    # Assert
+    assert result == statement_shape(short_list)
+    assert result == "SELECT skill.id FROM skill WHERE skill.id IN (?)"
+
+
+def test_repeatedStatements_returnsStatementsAboveThreshold() -> None:
+    # Arrange
+    stats = QueryStats()
+    for _ in range(3):
+        stats.record(SELECT_CITY, duration_ms=1.0)
+    stats.record("SELECT category.id FROM category", duration_ms=1.0)
+
+    # Act
+    result = stats.repeated_statements(threshold=2)
+
+    # Assert
+    assert result == [(SELECT_CITY, 3)]
+    assert stats.count == 4
+    assert stats.duration_ms == 4.0
+
+
+def test_trackQueries_countsStatementsExecutedInsideBlock(mocker) -> None:
+    # Arrange
+    conn = mocker.Mock(info={})
+    _execute(conn, SELECT_CITY)
+
+    # Act
+    with track_queries() as stats:
+        _execute(conn, SELECT_CITY)
+        _execute(conn, SELECT_CITY)
+    _execute(conn, SELECT_CITY)
+
+    # Assert
+    assert stats.count == 2
+    assert stats.shapes[SELECT_CITY] == 2
+
+
+def test_queryStatsMiddleware_addsQueryHeaders(mocker) -> None:
+    # Arrange
+    conn = mocker.Mock(info={})
+    sent_messages = []
+
+    async def app(scope, receive, send):
+        _execute(conn, SELECT_CITY)
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+
+    async def send(message):
+        sent_messages.append(message)
+
+    middleware = QueryStatsMiddleware(app=app)
+    scope = {"type": "http", "method": "GET", "path": "/cities"}
+
+    # Act
+    asyncio.run(middleware(scope, mocker.Mock(), send))
+
+    # Assert
+    headers = dict(sent_messages[0]["headers"])
+    assert headers[b"x-db-queries"] == b"1"
+    assert headers[b"server-timing"].startswith(b"db;dur=")
+
+
+def test_queryStatsMiddleware_warnsAboutRepeatedStatements(mocker) -> None:
+    # Arrange
+    conn = mocker.Mock(info={})
+    mock_logger = mocker.patch("app.sql_app.query_stats.logger")
+
+    async def app(scope, receive, send):
+        for _ in range(3):
+            _execute(conn, SELECT_CITY)
+
+    middleware = QueryStatsMiddleware(app=app, repeat_threshold=2)
+    scope = {"type": "http", "method": "GET", "path": "/cities"}
+
+    # Act
+    asyncio.run(middleware(scope, mocker.Mock(), mocker.AsyncMock()))
+
+    # Assert
+    mock_logger.warning.assert_called_once()
+    assert "3 times" in mock_logger.warning.call_args.args[0]
+
+
+def test_trackQueries_countsStatementsOfInstrumentedEngine(sqlite_engine) -> None:
+    # Arrange
+    with sqlite_engine.connect() as connection:
+        # Act
+        with track_queries() as stats:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+
+    # Assert
+    assert stats.count == 2
+    assert stats.shapes == {"SELECT 1": 1, "SELECT 2": 1}
+    assert stats.duration_ms >= 0
+
+
+def test_trackQueries_timesStatementsAfterFailedStatement(sqlite_engine) -> None:
+    # Arrange
+    with sqlite_engine.connect() as connection:
+        with pytest.raises(OperationalError):
+            connection.execute(text("SELECT * FROM missing_table"))
+
+        # Act
+        with track_queries() as stats:
+            connection.execute(text("SELECT 1"))
+
+        # Assert
+        assert stats.count == 1
+        assert 0 <= stats.duration_ms < 1000
+        assert "query_start_times" not in connection.info
+
+
+def test_assertMaxQueries_passes_whenWithinLimit(
+    sqlite_engine, assert_max_queries
+) -> None:
+    # Act
+    with sqlite_engine.connect() as connection:
+        with assert_max_queries(2) as stats:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 1"))
+
+    # Assert
+    assert stats.count == 2
+
+
+def test_assertMaxQueries_fails_listingStatements_whenOverLimit(
+    sqlite_engine, assert_max_queries
+) -> None:
+    # Act
+    with pytest.raises(AssertionError) as exc_info:
+        with sqlite_engine.connect() as connection:
+            with assert_max_queries(1):
+                connection.execute(text("SELECT 1"))
+                connection.execute(text("SELECT 1"))
+
+    # Assert
+    assert "Expected at most 1 queries, got 2" in str(exc_info.value)
+    assert "2x SELECT 1" in str(exc_info.value)
+
+
+def test_queryStatsMiddleware_countsStatementsOfInstrumentedEngine(
+    mocker, sqlite_engine
+) -> None:
+    # Arrange
+    sent_messages = []
+
+    async def app(scope, receive, send):
+        with sqlite_engine.connect() as connection:
+            for _ in range(3):
+                connection.execute(text("SELECT 1"))
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+
+    async def send(message):
+        sent_messages.append(message)
+
+    middleware = QueryStatsMiddleware(app=app)
+    scope = {"type": "http", "method": "GET", "path": "/cities"}
+
+    # Act
+    asyncio.run(middleware(scope, mocker.Mock(), send))
+
+    # Assert
+    headers = dict(sent_messages[0]["headers"])
+    assert headers[b"x-db-queries"] == b"3"
+    assert b'desc="3 queries"' in headers[b"server-timing"]
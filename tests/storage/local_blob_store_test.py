@@ -0,0 +1,196 @@
+import asyncio
+import hashlib
+import io
+
+import pytest
+from fastapi import status
+from fastapi.responses import FileResponse
+
+from app.storage.local_blob_store import LocalBlobStore
+
+
+@pytest.fixture
+def blob_store(tmp_path):
+    return LocalBlobStore(root=tmp_path)
+
+
+def _read_body(response) -> bytes:
+    async def _read():
+        return b"".join([chunk async for chunk in response.body_iterator])
+
+    return asyncio.run(_read())
+
+
+def test_put_storesContentUnderItsHash_whenContentIsNew(blob_store) -> None:
+    # Arrange
+    content = b"valid_photo_content"
+    expected_hash = hashlib.sha256(content).hexdigest()
+
+    # Act
+    result = blob_store.put(io.BytesIO(content), media_type="image/png")
+
+    # Assert
+    assert result.hash == expected_hash
+    assert result.size == len(content)
+    assert result.media_type == "image/png"
+    assert blob_store.exists(expected_hash)
+    assert blob_store.path(expected_hash).read_bytes() == content
+
+
+def test_put_keepsSingleCopy_whenContentIsStoredTwice(blob_store, tmp_path) -> None:
+    # Arrange
+    content = b"valid_cv_content"
+
+    # Act
+    first = blob_store.put(io.BytesIO(content), media_type="application/pdf")
+    second = blob_store.put(io.BytesIO(content), media_type="application/pdf")
+
+    # Assert
+    assert first.hash == second.hash
+    assert [path for path in tmp_path.rglob("*") if path.is_file()] == [
+        blob_store.path(first.hash)
+    ]
+
+
+def test_open_returnsStoredContent_whenBlobExists(blob_store) -> None:
+    # Arrange
+    content = b"valid_logo_content"
+    blob = blob_store.put(io.BytesIO(content), media_type="image/png")
+
+    # Act
+    with blob_store.open(blob.hash) as file:
+        result = file.read()
+
+    # Assert
+    assert result == content
+
+
+def test_exists_returnsFalse_whenBlobIsMissing(blob_store) -> None:
+    # Act & Assert
+    assert not blob_store.exists(hashlib.sha256(b"missing").hexdigest())
+
+
+def test_createResponse_returnsFileResponse_withHeaders(blob_store) -> None:
+    # Arrange
+    blob = blob_store.put(io.BytesIO(b"valid_cv_content"), media_type="application/pdf")
+    headers = {"Content-Disposition": "attachment; filename=cv.pdf"}
+
+    # Act
+    response = blob_store.create_response(
+        blob_hash=blob.hash, media_type="application/pdf", headers=headers
+    )
+
+    # Assert
+    assert isinstance(response, FileResponse)
+    assert response.path == blob_store.path(blob.hash)
+    assert response.media_type == "application/pdf"
+    assert response.headers["Content-Disposition"] == headers["Content-Disposition"]
+    assert response.headers["ETag"] == f'"{blob.hash}"'
+    assert "Cache-Control" in response.headers
+
+
+def test_createResponse_returnsNotModified_whenIfNoneMatchMatches(
+    mocker,
+    blob_store,
+) -> None:
+    # Arrange
+    blob = blob_store.put(io.BytesIO(b"valid_logo_content"), media_type="image/png")
+    mock_open = mocker.patch.object(blob_store, "open")
+
+    # Act
+    response = blob_store.create_response(
+        blob_hash=blob.hash,
+        media_type="image/png",
+        if_none_match=f'W/"other", "{blob.hash}"',
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["ETag"] == f'"{blob.hash}"'
+    assert response.body == b""
+    mock_open.assert_not_called()
+
+
+def test_createResponse_returnsContent_whenIfNoneMatchDiffers(blob_store) -> None:
+    # Arrange
+    blob = blob_store.put(io.BytesIO(b"valid_logo_content"), media_type="image/png")
+
+    # Act
+    response = blob_store.create_response(
+        blob_hash=blob.hash, media_type="image/png", if_none_match='"other"'
+    )
+
+    # Assert
+    assert isinstance(response, FileResponse)
+    assert response.status_code == status.HTTP_200_OK
+
+
+def test_createResponse_returnsPartialContent_whenSingleRangeRequested(
+    blob_store,
+) -> None:
+    # Arrange
+    blob = blob_store.put(io.BytesIO(b"0123456789"), media_type="application/pdf")
+
+    # Act
+    response = blob_store.create_response(
+        blob_hash=blob.hash, media_type="application/pdf", range_header="bytes=2-5"
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_206_PARTIAL_CONTENT
+    assert response.headers["Content-Range"] == "bytes 2-5/10"
+    assert response.headers["Content-Length"] == "4"
+    assert response.headers["Accept-Ranges"] == "bytes"
+    assert _read_body(response) == b"2345"
+
+
+def test_createResponse_returnsMultipartByteranges_whenSeveralRangesRequested(
+    blob_store,
+) -> None:
+    # Arrange
+    blob = blob_store.put(io.BytesIO(b"0123456789"), media_type="application/pdf")
+
+    # Act
+    response = blob_store.create_response(
+        blob_hash=blob.hash,
+        media_type="application/pdf",
+        range_header="bytes=0-1,-2",
+    )
+
+    # Assert
+    body = _read_body(response)
+    assert response.status_code == status.HTTP_206_PARTIAL_CONTENT
+    assert response.media_type.startswith("multipart/byteranges; boundary=")
+    assert response.headers["Content-Length"] == str(len(body))
+    assert b"Content-Range: bytes 0-1/10\r\n\r\n01\r\n" in body
+    assert b"Content-Range: bytes 8-9/10\r\n\r\n89\r\n" in body
+
+
+def test_createResponse_returnsRangeNotSatisfiable_whenRangeIsOutOfBounds(
+    blob_store,
+) -> None:
+    # Arrange
+    blob = blob_store.put(io.BytesIO(b"0123456789"), media_type="application/pdf")
+
+    # Act
+    response = blob_store.create_response(
+        blob_hash=blob.hash, media_type="application/pdf", range_header="bytes=20-"
+    )
+
+    # Assert
+    assert response.status_code == status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+    assert response.headers["Content-Range"] == "bytes */10"
+
+
+def test_createResponse_returnsFullContent_whenRangeIsMalformed(blob_store) -> None:
+    # Arrange
+    blob = blob_store.put(io.BytesIO(b"0123456789"), media_type="application/pdf")
+
+    # Act
+    response = blob_store.create_response(
+        blob_hash=blob.hash, media_type="application/pdf", range_header="bytes=5-2"
+    )
+
+    # Assert
+    assert isinstance(response, FileResponse)
+    assert response.status_code == status.HTTP_200_OK
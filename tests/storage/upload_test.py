@@ -0,0 +1,79 @@
+import io
+
+import pytest
+from fastapi import status
+
+from app.exceptions.custom_exceptions import ApplicationError
+from app.storage.local_blob_store import LocalBlobStore
+from app.storage.upload import IMAGE_SIGNATURES, PDF_SIGNATURES, store_upload
+
+PNG_CONTENT = b"\x89PNG\r\n\x1a\n" + b"\x00" * 100
+
+
+@pytest.fixture
+def blob_store(mocker, tmp_path):
+    blob_store = LocalBlobStore(root=tmp_path)
+    mocker.patch("app.storage.upload.get_blob_store", return_value=blob_store)
+    return blob_store
+
+
+def _upload(mocker, content: bytes, size: int | None = None):
+    return mocker.Mock(file=io.BytesIO(content), size=size)
+
+
+def test_storeUpload_storesFile_whenSignatureMatches(mocker, blob_store) -> None:
+    # Arrange
+    upload = _upload(mocker, PNG_CONTENT)
+
+    # Act
+    result = store_upload(upload=upload, max_size=1024, signatures=IMAGE_SIGNATURES)
+
+    # Assert
+    assert result.media_type == "image/png"
+    assert result.size == len(PNG_CONTENT)
+    assert blob_store.path(result.hash).read_bytes() == PNG_CONTENT
+
+
+def test_storeUpload_raisesApplicationError_whenSignatureDoesNotMatch(
+    mocker,
+    blob_store,
+) -> None:
+    # Arrange
+    upload = _upload(mocker, PNG_CONTENT)
+
+    # Act & Assert
+    with pytest.raises(ApplicationError) as exc:
+        store_upload(upload=upload, max_size=1024, signatures=PDF_SIGNATURES)
+
+    assert exc.value.data.status == status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+
+
+def test_storeUpload_raisesApplicationError_whenDeclaredSizeExceedsLimit(
+    mocker,
+    blob_store,
+) -> None:
+    # Arrange
+    upload = mocker.Mock(size=2048)
+
+    # Act & Assert
+    with pytest.raises(ApplicationError) as exc:
+        store_upload(upload=upload, max_size=1024, signatures=IMAGE_SIGNATURES)
+
+    assert exc.value.data.status == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    upload.file.read.assert_not_called()
+
+
+def test_storeUpload_raisesApplicationError_andKeepsNoFile_whenContentExceedsLimit(
+    mocker,
+    blob_store,
+    tmp_path,
+) -> None:
+    # Arrange
+    upload = _upload(mocker, PNG_CONTENT)
+
+    # Act & Assert
+    with pytest.raises(ApplicationError) as exc:
+        store_upload(upload=upload, max_size=50, signatures=IMAGE_SIGNATURES)
+
+    assert exc.value.data.status == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    assert not any(path.is_file() for path in tmp_path.rglob("*"))
@@ -109,7 +109,8 @@ PROFESSIONAL_RESPONSE = {
     "email": VALID_PROFESSIONAL_EMAIL,
     "city": VALID_CITY_NAME,
     "description": VALID_PROFESSIONAL_DESCRIPTION,
-    "photo": None,
+    "has_photo": False,
+    "has_cv": False,
     "status": ProfessionalStatus.ACTIVE,
     "active_application_count": VALID_PROFESSIONAL_ACTIVE_APPLICATION_COUNT,
     "has_private_matches": False,
@@ -122,7 +123,8 @@ PROFESSIONAL_MODEL = {
     "password_hash": HASHED_PASSWORD,
     "description": VALID_PROFESSIONAL_DESCRIPTION,
     "email": VALID_PROFESSIONAL_EMAIL,
-    "photo": None,
+    "has_photo": False,
+    "has_cv": False,
     "status": ProfessionalStatus.ACTIVE,
     "active_application_count": VALID_PROFESSIONAL_ACTIVE_APPLICATION_COUNT,
     "first_name": VALID_PROFESSIONAL_FIRST_NAME,